@@ -27,8 +27,19 @@ from adapters.base_adapter import (
     Balance,
     Order,
 )
+from adapters.credential_manager import CredentialManager
+from adapters.order_journal import (
+    OrderJournal,
+    read_journal,
+    set_default_journal,
+    get_default_journal,
+)
+from adapters.fill_store import FillStore
+from adapters.normalizers import OrderNormalizer, OrderArrays
+from adapters.instruments import Instrument, InstrumentRegistry, get_default_registry
 from adapters.factory import (
     create_adapter,
+    get_adapter_class,
     register_adapter,
     get_available_exchanges,
 )
@@ -51,5 +62,19 @@ __all__ = [
     
     # 工厂函数
     "register_adapter",
+    "get_adapter_class",
     "get_available_exchanges",
+    
+    # 工具
+    "CredentialManager",
+    "OrderJournal",
+    "read_journal",
+    "set_default_journal",
+    "get_default_journal",
+    "FillStore",
+    "OrderNormalizer",
+    "OrderArrays",
+    "Instrument",
+    "InstrumentRegistry",
+    "get_default_registry",
 ]
@@ -5,11 +5,17 @@ This module provides a base adapter interface for integrating different
 perpetual futures exchanges. All exchange-specific adapters should inherit
 from BasePerpAdapter and implement the required methods.
 """
+import functools
+import inspect
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 from enum import Enum
 
+from adapters.order_journal import get_default_journal
+
 
 class OrderSide(Enum):
     """订单方向"""
@@ -44,6 +50,17 @@ class OrderStatus(Enum):
 
 class Position:
     """持仓信息"""
+    __slots__ = (
+        "symbol",
+        "size",
+        "side",
+        "entry_price",
+        "mark_price",
+        "unrealized_pnl",
+        "leverage",
+        "margin_mode",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -80,6 +97,15 @@ class Position:
 
 class Balance:
     """账户余额信息"""
+    __slots__ = (
+        "total_balance",
+        "available_balance",
+        "equity",
+        "unrealized_pnl",
+        "margin_used",
+        "margin_available",
+    )
+
     def __init__(
         self,
         total_balance: Decimal,
@@ -109,7 +135,32 @@ class Balance:
 
 
 class Order:
-    """订单信息"""
+    """
+    订单信息
+
+    price_ticks / quantity_lots / filled_lots 是可选的整数表示（价格 = price_ticks × 最小价格单位，
+    数量 = quantity_lots × 最小数量单位），由 adapters.normalizers.OrderNormalizer 在指定精度时填充，
+    便于策略直接用整数比较和分组，不再经过 Decimal/float。
+    """
+    __slots__ = (
+        "order_id",
+        "symbol",
+        "side",
+        "order_type",
+        "quantity",
+        "price",
+        "filled_quantity",
+        "status",
+        "time_in_force",
+        "reduce_only",
+        "client_order_id",
+        "created_at",
+        "updated_at",
+        "price_ticks",
+        "quantity_lots",
+        "filled_lots",
+    )
+
     def __init__(
         self,
         order_id: str,
@@ -125,6 +176,9 @@ class Order:
         client_order_id: Optional[str] = None,
         created_at: Optional[int] = None,
         updated_at: Optional[int] = None,
+        price_ticks: Optional[int] = None,
+        quantity_lots: Optional[int] = None,
+        filled_lots: Optional[int] = None,
     ):
         self.order_id = order_id
         self.symbol = symbol
@@ -139,6 +193,15 @@ class Order:
         self.client_order_id = client_order_id
         self.created_at = created_at
         self.updated_at = updated_at
+        self.price_ticks = price_ticks
+        self.quantity_lots = quantity_lots
+        self.filled_lots = filled_lots
+
+    def __repr__(self) -> str:
+        return (
+            f"Order({self.order_id}, {self.symbol}, {self.side}, {self.quantity} @ {self.price}, "
+            f"filled={self.filled_quantity}, {self.status})"
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -159,13 +222,118 @@ class Order:
         }
 
 
+# 子类实现的这些方法会被自动包装，调用结果写入订单日志（见 adapters/order_journal.py）
+JOURNALED_METHODS = ("place_order", "cancel_order", "cancel_all_orders", "cancel_orders_by_ids")
+
+# 当前线程是否已在记录日志的调用中（如 cancel_orders_by_ids 内部逐个调用 cancel_order），嵌套调用只记录最外层
+_journal_state = threading.local()
+
+
+def _journaled(name: str, fn):
+    """包装下单/撤单方法：记录参数、结果、耗时和异常，日志未启用时直接调用"""
+    params = list(inspect.signature(fn).parameters)[1:]
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        journal = getattr(self, "journal", None)
+        if journal is None or getattr(_journal_state, "active", False):
+            return fn(self, *args, **kwargs)
+
+        call = dict(zip(params, args))
+        call.update(kwargs)
+        start = time.perf_counter_ns()
+        _journal_state.active = True
+        try:
+            result = fn(self, *args, **kwargs)
+        except Exception as e:
+            journal.record(
+                name,
+                exchange=self.exchange_name,
+                symbol=call.get("symbol"),
+                side=call.get("side"),
+                order_type=call.get("order_type"),
+                quantity=call.get("quantity"),
+                price=call.get("price"),
+                order_id=call.get("order_id"),
+                client_order_id=call.get("client_order_id"),
+                status="error",
+                latency_us=(time.perf_counter_ns() - start) // 1000,
+                error=repr(e),
+                extra=call.get("order_id_list") or call.get("cl_ord_id_list"),
+            )
+            raise
+        finally:
+            _journal_state.active = False
+
+        latency_us = (time.perf_counter_ns() - start) // 1000
+        if isinstance(result, Order):
+            journal.record(
+                name,
+                exchange=self.exchange_name,
+                symbol=result.symbol or call.get("symbol"),
+                side=result.side,
+                order_type=result.order_type,
+                quantity=result.quantity,
+                price=result.price,
+                order_id=result.order_id,
+                client_order_id=result.client_order_id or call.get("client_order_id"),
+                status=result.status,
+                latency_us=latency_us,
+            )
+        else:
+            journal.record(
+                name,
+                exchange=self.exchange_name,
+                symbol=call.get("symbol"),
+                order_id=call.get("order_id"),
+                client_order_id=call.get("client_order_id"),
+                status="ok" if result is not False else "failed",
+                latency_us=latency_us,
+                extra=call.get("order_id_list") or call.get("cl_ord_id_list"),
+            )
+        return result
+
+    wrapper.__journaled__ = True
+    return wrapper
+
+
+def _shared_ticker(fn):
+    """包装 get_ticker：配置了 market_table 时优先读取共享行情表，表不可用或行情过期时调用原方法"""
+
+    @functools.wraps(fn)
+    def wrapper(self, symbol, *args, **kwargs):
+        ticker = self.read_shared_ticker(symbol)
+        if ticker is not None:
+            return ticker
+        return fn(self, symbol, *args, **kwargs)
+
+    wrapper.__shared_ticker__ = True
+    return wrapper
+
+
 class BasePerpAdapter(ABC):
     """
     永续合约交易所适配器基类
     
     所有交易所适配器都应该继承此类并实现所有抽象方法。
     这样可以确保不同交易所的接口统一，方便策略编写。
+
+    子类的下单/撤单方法（JOURNALED_METHODS）会自动写入订单日志，
+    日志默认取 get_default_journal()，也可以直接设置 adapter.journal。
+
+    配置了 market_table（行情网关的共享内存名称，见 adapters/market_gateway.py）时，
+    子类的 get_ticker 先读取共享行情表，行情超过 market_table_max_age 秒（默认 2）或网关未运行时才请求交易所。
     """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in JOURNALED_METHODS:
+            fn = cls.__dict__.get(name)
+            if fn is not None and callable(fn) and not getattr(fn, "__journaled__", False):
+                setattr(cls, name, _journaled(name, fn))
+        fn = cls.__dict__.get("get_ticker")
+        if fn is not None and callable(fn) and not getattr(fn, "__shared_ticker__", False):
+            cls.get_ticker = _shared_ticker(fn)
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -176,6 +344,43 @@ class BasePerpAdapter(ABC):
         """
         self.config = config
         self.exchange_name = config.get("exchange_name", "unknown")
+        self.journal = get_default_journal()
+        self.market_table = config.get("market_table") or None
+        self.market_table_max_age = float(config.get("market_table_max_age", 2.0))
+        self._market_reader = None
+        self._market_reader_retry_at = 0.0
+        self._market_reader_warned = False
+    
+    def read_shared_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        从共享行情表读取 get_ticker 格式的最新行情
+        
+        Returns:
+            Dict 或 None（未配置 market_table / 网关未运行 / 没有该交易对 / 行情过期）
+        """
+        if not self.market_table:
+            return None
+        reader = self._market_reader
+        if reader is None:
+            now = time.time()
+            if now < self._market_reader_retry_at:
+                return None
+            self._market_reader_retry_at = now + 5.0
+            try:
+                from adapters.market_table import MarketTableReader
+                reader = self._market_reader = MarketTableReader(self.market_table)
+            except Exception as e:
+                if not self._market_reader_warned:
+                    self._market_reader_warned = True
+                    print(f"[{self.exchange_name}] 共享行情表 {self.market_table} 不可用，改为请求交易所: {e}")
+                return None
+        ticker = reader.ticker(self.exchange_name, symbol, self.market_table_max_age)
+        if ticker is None and time.time() >= self._market_reader_retry_at:
+            # 网关重启会重建共享内存，旧映射不再更新：行情过期时定期重新打开
+            reader.close()
+            self._market_reader = None
+            return self.read_shared_ticker(symbol)
+        return ticker
     
     @abstractmethod
     def connect(self) -> bool:
@@ -506,6 +711,31 @@ class BasePerpAdapter(ABC):
                 reduce_only=True,
             )
     
+    def load_instruments(self) -> List[Any]:
+        """
+        从交易所加载全部合约的精度信息（子类实现）
+        
+        Returns:
+            List[Instrument]: 见 adapters/instruments.py
+        """
+        raise NotImplementedError(f"{self.exchange_name} 未实现合约精度加载")
+    
+    def get_instrument(self, symbol: str):
+        """
+        获取合约精度（价格 tick、数量 lot），首次调用加载并缓存整个交易所的合约
+        
+        Args:
+            symbol: 交易对符号
+            
+        Returns:
+            Instrument: 合约精度信息
+            
+        Raises:
+            KeyError: 合约不存在
+        """
+        from adapters.instruments import get_default_registry
+        return get_default_registry().get(self.exchange_name, symbol, loader=self.load_instruments)
+    
     def __repr__(self) -> str:
         """字符串表示"""
         return f"<{self.__class__.__name__}(exchange={self.exchange_name})>"
@@ -0,0 +1,222 @@
+"""
+Credential Manager
+
+后台维护各交易所的认证凭证（StandX JWT、GRVT session cookie 等）。
+
+凭证在过期前由后台线程提前刷新，并通过引用替换的方式原子地切换，
+交易路径只读取当前凭证，永远不会因为认证往返而阻塞。
+
+使用示例:
+    manager = CredentialManager()
+    manager.register(
+        "grvt_cookie",
+        refresh_fn=lambda: (cookie, cookie["expires"]),
+        refresh_ahead=60,
+        on_refresh=client.set_cookie,
+    )
+    manager.refresh_now("grvt_cookie")  # 启动阶段同步获取一次
+    manager.start()
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# refresh_fn 返回 (凭证, 过期时间戳秒)；过期时间未知时返回 None
+RefreshResult = Tuple[Any, Optional[float]]
+
+
+class Credential:
+    """不可变的凭证快照"""
+    __slots__ = ("value", "expires_at", "refreshed_at")
+
+    def __init__(self, value: Any, expires_at: Optional[float], refreshed_at: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.refreshed_at = refreshed_at
+
+    def ttl(self, now: Optional[float] = None) -> Optional[float]:
+        """剩余有效时间（秒），过期时间未知时返回 None"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - (now if now is not None else time.time())
+
+
+class _Entry:
+    """单个凭证的刷新配置与状态"""
+
+    def __init__(
+        self,
+        name: str,
+        refresh_fn: Callable[[], RefreshResult],
+        refresh_ahead: float,
+        on_refresh: Optional[Callable[[Any], None]],
+    ):
+        self.name = name
+        self.refresh_fn = refresh_fn
+        self.refresh_ahead = refresh_ahead
+        self.on_refresh = on_refresh
+        self.credential: Optional[Credential] = None
+        self.retry_at: Optional[float] = None
+        self.failures = 0
+
+    def next_refresh_at(self) -> Optional[float]:
+        """下一次需要刷新的时间点，None 表示无需自动刷新"""
+        if self.retry_at is not None:
+            return self.retry_at
+        if self.credential is None:
+            return 0.0
+        if self.credential.expires_at is None:
+            return None
+        return self.credential.expires_at - self.refresh_ahead
+
+
+class CredentialManager:
+    """
+    凭证生命周期管理器
+
+    - register: 注册凭证及其刷新函数
+    - get: 无阻塞读取当前凭证
+    - start/stop: 启动/停止后台刷新线程
+    """
+
+    def __init__(self, retry_interval: float = 5.0, max_retry_interval: float = 60.0):
+        """
+        Args:
+            retry_interval: 刷新失败后的首次重试间隔（秒）
+            max_retry_interval: 重试间隔上限（秒），失败后按指数退避
+        """
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self._entries: Dict[str, _Entry] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def register(
+        self,
+        name: str,
+        refresh_fn: Callable[[], RefreshResult],
+        refresh_ahead: float = 60.0,
+        on_refresh: Optional[Callable[[Any], None]] = None,
+        initial: Optional[Any] = None,
+        initial_expires_at: Optional[float] = None,
+    ) -> None:
+        """
+        注册凭证
+
+        Args:
+            name: 凭证名称
+            refresh_fn: 获取新凭证的函数，返回 (凭证, 过期时间戳)
+            refresh_ahead: 提前多少秒刷新
+            on_refresh: 新凭证生效时的回调，用于把凭证写回客户端
+            initial: 已有的凭证（如 connect 时已获取），可避免重复登录
+            initial_expires_at: 已有凭证的过期时间戳
+        """
+        entry = _Entry(name, refresh_fn, refresh_ahead, on_refresh)
+        if initial is not None:
+            entry.credential = Credential(initial, initial_expires_at, time.time())
+        with self._cond:
+            self._entries[name] = entry
+            self._cond.notify_all()
+
+    def get(self, name: str) -> Optional[Any]:
+        """无阻塞读取当前凭证值，未就绪时返回 None"""
+        entry = self._entries.get(name)
+        if entry is None or entry.credential is None:
+            return None
+        return entry.credential.value
+
+    def get_credential(self, name: str) -> Optional[Credential]:
+        """读取当前凭证快照（包含过期时间）"""
+        entry = self._entries.get(name)
+        return entry.credential if entry is not None else None
+
+    def refresh_now(self, name: str) -> Any:
+        """
+        立即同步刷新凭证（仅用于启动阶段或手动恢复，交易路径不应调用）
+
+        Raises:
+            KeyError: 凭证未注册
+            Exception: 刷新失败时抛出 refresh_fn 的异常
+        """
+        entry = self._entries[name]
+        self._refresh(entry, raise_on_error=True)
+        return entry.credential.value
+
+    def start(self) -> None:
+        """启动后台刷新线程（重复调用无副作用）"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="credential-manager", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """停止后台刷新线程"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def _refresh(self, entry: _Entry, raise_on_error: bool = False) -> bool:
+        """刷新单个凭证，成功后原子替换并触发回调"""
+        try:
+            value, expires_at = entry.refresh_fn()
+            if value is None:
+                raise ValueError("refresh_fn 返回空凭证")
+        except Exception as e:
+            entry.failures += 1
+            delay = min(
+                self.retry_interval * (2 ** (entry.failures - 1)),
+                self.max_retry_interval,
+            )
+            entry.retry_at = time.time() + delay
+            print(f"[CredentialManager] 刷新 {entry.name} 失败: {e}，{delay:.0f} 秒后重试")
+            if raise_on_error:
+                raise
+            return False
+
+        # 整体替换快照引用，读取方要么看到旧凭证要么看到新凭证
+        entry.credential = Credential(value, expires_at, time.time())
+        entry.failures = 0
+        entry.retry_at = None
+        if entry.on_refresh is not None:
+            try:
+                entry.on_refresh(value)
+            except Exception as e:
+                print(f"[CredentialManager] {entry.name} 回调失败: {e}")
+        return True
+
+    def _run(self) -> None:
+        """后台线程：睡眠到最近的刷新时间点，刷新到期的凭证"""
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                now = time.time()
+                due = []
+                next_at: Optional[float] = None
+                for entry in self._entries.values():
+                    at = entry.next_refresh_at()
+                    if at is None:
+                        continue
+                    if at <= now:
+                        due.append(entry)
+                    elif next_at is None or at < next_at:
+                        next_at = at
+                if not due:
+                    self._cond.wait(None if next_at is None else next_at - now)
+                    continue
+            # 在锁外执行网络请求，避免阻塞 register/stop
+            for entry in due:
+                self._refresh(entry)
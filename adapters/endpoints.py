@@ -0,0 +1,224 @@
+"""
+Endpoint Manager
+接入点测速、选择与连接预热
+
+启动时和之后每隔 interval 秒，通过共享的 requests.Session 依次请求每组候选地址（HEAD 或 GET 一个轻量路径），
+记录往返时间（RTT），每组选出 p50 最低的地址；当前地址仍可用时，新地址要快 switch_margin 以上才切换，避免来回抖动。
+探测请求走的就是客户端下单使用的同一个连接池，所以探测本身也在保持连接（DNS + TCP + TLS 只在第一次付出），
+空闲后的第一笔订单不再需要重新握手。
+
+使用示例:
+    manager = EndpointManager(interval=30)
+    manager.add_group(
+        "standx",
+        ["https://perps.standx.com", "https://perps-ap.standx.com"],
+        path="/api/health",
+        on_switch=lambda url: setattr(http_client, "base_url", url),
+    )
+    http_client.session = manager.session
+    manager.start()                 # 同步探测一轮后启动后台线程
+    manager.best("standx")          # 当前最快的地址
+    manager.stats()                 # {"standx": {url: {"p50": ..., "p99": ..., "connect_ms": ..., "best": True}}}
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from adapters.metrics import percentile
+
+
+class _Endpoint:
+    """单个候选地址的探测记录"""
+    __slots__ = ("url", "rtts", "probes", "errors", "last_error", "connect_ms", "probed_at")
+
+    def __init__(self, url: str, history: int):
+        self.url = url
+        self.rtts = deque(maxlen=history)
+        self.probes = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self.connect_ms: Optional[float] = None  # 第一次探测（含 DNS/TCP/TLS）的耗时
+        self.probed_at: Optional[float] = None
+
+    def p50(self) -> Optional[float]:
+        return percentile(list(self.rtts), 0.5)
+
+
+class _Group:
+    __slots__ = ("name", "endpoints", "path", "method", "on_switch", "best", "switches")
+
+    def __init__(self, name, endpoints, path, method, on_switch):
+        self.name = name
+        self.endpoints: List[_Endpoint] = endpoints
+        self.path = path
+        self.method = method
+        self.on_switch = on_switch
+        self.best: _Endpoint = endpoints[0]
+        self.switches = 0
+
+
+class EndpointManager:
+    """
+    接入点管理（测速 + 选择 + 预热）
+
+    Args:
+        interval: 探测间隔（秒），同时是连接保活间隔，应小于服务端空闲断开时间（通常 60 秒以上）
+        timeout: 单次探测超时（秒）
+        history: 每个地址保留的 RTT 样本数
+        switch_margin: 新地址的 p50 至少快这个比例才切换
+        session: 共享的 requests.Session（默认新建），客户端应使用同一个 Session 才能用上预热的连接
+    """
+
+    def __init__(
+        self,
+        interval: float = 30.0,
+        timeout: float = 2.0,
+        history: int = 200,
+        switch_margin: float = 0.2,
+        session: Optional[requests.Session] = None,
+    ):
+        self.interval = interval
+        self.timeout = timeout
+        self.history = history
+        self.switch_margin = switch_margin
+        self.session = session or requests.Session()
+        self.groups: Dict[str, _Group] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_group(
+        self,
+        name: str,
+        urls: List[str],
+        path: str = "/",
+        method: str = "HEAD",
+        on_switch: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """
+        添加一组可互相替代的候选地址
+
+        Args:
+            urls: 候选地址（协议 + 主机，不含路径），第一个为初始地址
+            path: 探测路径（轻量、无需认证的接口）
+            method: 探测方法，HEAD 或 GET（任何 HTTP 响应都算可达，只有网络错误/超时算失败）
+            on_switch: 最快地址变化时的回调，参数为新地址
+        """
+        urls = [url.rstrip("/") for url in urls if url]
+        if not urls:
+            raise ValueError(f"接入点组 {name} 没有候选地址")
+        endpoints = [_Endpoint(url, self.history) for url in dict.fromkeys(urls)]
+        with self._lock:
+            self.groups[name] = _Group(name, endpoints, path, method.upper(), on_switch)
+
+    def best(self, name: str) -> str:
+        return self.groups[name].best.url
+
+    # ---------- 探测 ----------
+
+    def _probe_endpoint(self, group: _Group, endpoint: _Endpoint) -> None:
+        started = time.perf_counter()
+        try:
+            response = self.session.request(group.method, endpoint.url + group.path, timeout=self.timeout)
+            response.close()
+        except Exception as e:
+            with self._lock:
+                endpoint.probes += 1
+                endpoint.errors += 1
+                endpoint.last_error = str(e)
+                endpoint.probed_at = time.time()
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            endpoint.probes += 1
+            endpoint.probed_at = time.time()
+            if endpoint.connect_ms is None:
+                # 第一次请求包含建立连接，不计入 RTT 样本
+                endpoint.connect_ms = round(elapsed, 3)
+            else:
+                endpoint.rtts.append(elapsed)
+                endpoint.last_error = None
+
+    def probe(self, name: Optional[str] = None) -> None:
+        """探测一组（或全部）地址，并按结果更新最快地址"""
+        groups = [self.groups[name]] if name else list(self.groups.values())
+        for group in groups:
+            for endpoint in group.endpoints:
+                self._probe_endpoint(group, endpoint)
+                if endpoint.connect_ms is not None and not endpoint.rtts:
+                    # 新建连接后立即再测一次，启动时即有 RTT 样本
+                    self._probe_endpoint(group, endpoint)
+            self._select(group)
+
+    def _select(self, group: _Group) -> None:
+        with self._lock:
+            current = group.best
+            healthy = [e for e in group.endpoints if e.rtts and e.last_error is None]
+            if not healthy:
+                return
+            fastest = min(healthy, key=lambda e: e.p50())
+            if fastest is current:
+                return
+            current_p50 = current.p50() if current in healthy else None
+            if current_p50 is not None and fastest.p50() > current_p50 * (1 - self.switch_margin):
+                return
+            group.best = fastest
+            group.switches += 1
+        print(f"[接入点] {group.name} 切换到 {fastest.url}（p50 {fastest.p50()}ms）")
+        if group.on_switch is not None:
+            try:
+                group.on_switch(fastest.url)
+            except Exception as e:
+                print(f"[接入点] {group.name} 切换回调失败: {e}")
+
+    # ---------- 生命周期 ----------
+
+    def start(self) -> None:
+        """同步探测一轮（选出初始地址并建立连接），再启动后台定期探测"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.probe()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="endpoint-manager", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.probe()
+            except Exception as e:
+                print(f"[接入点] 探测失败: {e}")
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # ---------- 指标 ----------
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """每组每个地址的 RTT 分位数（毫秒）、首次连接耗时、错误数和是否为当前地址"""
+        result = {}
+        with self._lock:
+            for group in self.groups.values():
+                entries = {}
+                for endpoint in group.endpoints:
+                    rtts = list(endpoint.rtts)
+                    entries[endpoint.url] = {
+                        "p50": percentile(rtts, 0.5),
+                        "p90": percentile(rtts, 0.9),
+                        "p99": percentile(rtts, 0.99),
+                        "max": round(max(rtts), 3) if rtts else None,
+                        "samples": len(rtts),
+                        "connect_ms": endpoint.connect_ms,
+                        "probes": endpoint.probes,
+                        "errors": endpoint.errors,
+                        "last_error": endpoint.last_error,
+                        "best": endpoint is group.best,
+                    }
+                result[group.name] = entries
+        return result
@@ -0,0 +1,583 @@
+"""
+Execution Algorithms
+客户端执行算法（TWAP / 冰山 / POV）
+
+一个调度线程驱动任意数量、任意适配器上的母单（ParentOrder）。每个调度周期:
+    1. 对活跃母单涉及的每个 (适配器, 交易对) 只取一次 BBO（get_ticker，配置了 market_table 时读共享行情表）
+       和一次未成交订单（get_open_orders）
+    2. 子单已不在未成交列表中：通过 get_order 确认最终成交数量，计入母单；查不到时保留子单、按 client_order_id
+       重试，超过 lookup_timeout 仍查不到则母单标记为 failed（子单可能已成交，不能重新拆单）
+    3. 子单价格偏离当前应挂价格 replace_ticks 个 tick 以上：撤单，确认后按新价格重挂（cancel/replace）
+    4. 没有子单时按算法计算下一笔子单（数量、价格、是否主动吃单）并下单
+
+挂单价格: 被动时挂在己方最优价（买单挂买一、卖单挂卖一），进度落后时主动吃单（买单按卖一、卖单按买一，IOC）；
+limit_price 为价格上限（买）/下限（卖）。价格和数量在内部都是整数 tick / lot（见 adapters/instruments.py）。
+
+成交价按子单限价计（主动子单的实际成交价只会更好），滑点 = 成交均价相对开始时中间价的不利偏离（bps，正数为不利）。
+
+使用示例:
+    engine = ExecutionEngine(tick_interval=0.5)
+    engine.start()
+    twap = engine.submit(Twap(adapter, "BTC-USD", "sell", Decimal("0.5"), duration=300, slices=10, reduce_only=True))
+    iceberg = engine.submit(Iceberg(grvt, "BTC_USDT_Perp", "buy", Decimal("2"), display_qty=Decimal("0.1"),
+                                    limit_price=Decimal("68000")))
+    pov = engine.submit(Pov(adapter, "BTC-USD", "buy", Decimal("1"), participation=0.1))
+    engine.on_trade(adapter, "BTC-USD", Decimal("0.3"))      # POV 的市场成交量来源（成交推送回调中调用）
+    ...
+    print(engine.stats())
+    engine.cancel(twap.id)
+    engine.stop()
+"""
+import itertools
+import random
+import threading
+import time
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from adapters.base_adapter import BasePerpAdapter
+from adapters.instruments import ROUND_DOWN, ROUND_UP
+
+FINAL_STATUSES = ("filled", "cancelled", "rejected")
+
+_ids = itertools.count(1)
+
+
+def _decimal(value: Any) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _client_order_id() -> str:
+    # GRVT 要求 client_order_id 为 uint32 范围内的整数，StandX 接受任意字符串
+    return str(random.randint(1, 2**32 - 1))
+
+
+def _ticks_to_float(instrument, ticks: Optional[float]) -> Optional[float]:
+    """非整数 tick（均价、中间价）换算为价格，仅用于统计"""
+    if not ticks:
+        return None
+    return round(ticks * float(instrument.price_tick), instrument.price_decimals + 2)
+
+
+class ChildOrder:
+    """母单当前在交易所的子单"""
+    __slots__ = ("client_order_id", "price_ticks", "lots", "filled_lots", "aggressive", "placed_at", "cancel_at")
+
+    def __init__(self, client_order_id: str, price_ticks: int, lots: int, aggressive: bool, placed_at: float):
+        self.client_order_id = client_order_id
+        self.price_ticks = price_ticks
+        self.lots = lots
+        self.filled_lots = 0
+        self.aggressive = aggressive
+        self.placed_at = placed_at
+        self.cancel_at: Optional[float] = None
+
+
+class ParentOrder:
+    """
+    母单基类（子类实现 target / child_lots / aggressive）
+
+    Args:
+        adapter: 下单使用的适配器
+        symbol: 交易对
+        side: "buy" 或 "sell"
+        quantity: 总数量
+        limit_price: 限价（买单不高于、卖单不低于），None 表示不限
+        reduce_only: 子单是否只减仓
+        replace_ticks: 子单价格与应挂价格相差多少 tick 时撤单重挂
+    """
+
+    algo = "base"
+
+    def __init__(
+        self,
+        adapter: BasePerpAdapter,
+        symbol: str,
+        side: str,
+        quantity: Any,
+        limit_price: Any = None,
+        reduce_only: bool = False,
+        replace_ticks: int = 1,
+    ):
+        side = side.lower()
+        if side not in ("buy", "sell", "long", "short"):
+            raise ValueError(f"不支持的方向: {side}")
+        self.id = f"{self.algo}-{next(_ids)}"
+        self.adapter = adapter
+        self.symbol = symbol
+        self.side = "buy" if side in ("buy", "long") else "sell"
+        self.instrument = adapter.get_instrument(symbol)
+        self.lots = self.instrument.qty_to_lots(_decimal(quantity))
+        if self.lots <= 0:
+            raise ValueError(f"数量 {quantity} 小于 {symbol} 的最小数量单位")
+        self.limit_ticks = None
+        if limit_price is not None:
+            rounding = ROUND_DOWN if self.side == "buy" else ROUND_UP
+            self.limit_ticks = self.instrument.price_to_ticks(_decimal(limit_price), rounding)
+        self.reduce_only = reduce_only
+        self.replace_ticks = max(1, replace_ticks)
+
+        self.status = "pending"  # pending -> running -> done / cancelled / failed
+        self.filled_lots = 0
+        self.filled_value = 0  # sum(price_ticks * lots)
+        self.arrival_ticks: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.child: Optional[ChildOrder] = None
+        self.children = 0
+        self.replaces = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    # ---------- 算法接口 ----------
+
+    def target(self, now: float, engine: "ExecutionEngine") -> int:
+        """截至 now 计划累计成交的 lot 数"""
+        return self.lots
+
+    def child_lots(self, now: float, engine: "ExecutionEngine") -> int:
+        """下一笔子单的 lot 数（0 表示暂不下单）"""
+        return self.target(now, engine) - self.filled_lots
+
+    def aggressive(self, now: float, engine: "ExecutionEngine") -> bool:
+        """是否主动吃单（进度落后时）"""
+        return False
+
+    # ---------- 公共 ----------
+
+    @property
+    def remaining_lots(self) -> int:
+        return self.lots - self.filled_lots
+
+    @property
+    def active(self) -> bool:
+        return self.status in ("pending", "running")
+
+    def price_ticks(self, bid_ticks: int, ask_ticks: int, aggressive: bool) -> int:
+        """子单价格：被动挂己方最优价，主动按对手价，并受 limit_price 约束"""
+        if self.side == "buy":
+            price = ask_ticks if aggressive else bid_ticks
+            return min(price, self.limit_ticks) if self.limit_ticks is not None else price
+        price = bid_ticks if aggressive else ask_ticks
+        return max(price, self.limit_ticks) if self.limit_ticks is not None else price
+
+    def record_fill(self, child: ChildOrder, filled_lots: int) -> None:
+        """子单新增成交（按子单限价计价）"""
+        new_lots = min(filled_lots, child.lots) - child.filled_lots
+        if new_lots > 0:
+            child.filled_lots += new_lots
+            self.filled_lots += new_lots
+            self.filled_value += new_lots * child.price_ticks
+
+    def stats(self) -> Dict[str, Any]:
+        inst = self.instrument
+        avg_ticks = self.filled_value / self.filled_lots if self.filled_lots else None
+        slippage = None
+        if avg_ticks is not None and self.arrival_ticks:
+            sign = 1 if self.side == "buy" else -1
+            slippage = round(sign * (avg_ticks - self.arrival_ticks) / self.arrival_ticks * 1e4, 2)
+        end = self.finished_at or time.monotonic()
+        return {
+            "id": self.id,
+            "algo": self.algo,
+            "symbol": self.symbol,
+            "side": self.side,
+            "status": self.status,
+            "quantity": inst.lots_to_str(self.lots),
+            "filled": inst.lots_to_str(self.filled_lots),
+            "fill_ratio": round(self.filled_lots / self.lots, 4),
+            "avg_price": _ticks_to_float(inst, avg_ticks),
+            "arrival_price": _ticks_to_float(inst, self.arrival_ticks),
+            "slippage_bps": slippage,
+            "children": self.children,
+            "replaces": self.replaces,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "elapsed": round(end - self.started_at, 3) if self.started_at else 0.0,
+        }
+
+
+class Twap(ParentOrder):
+    """
+    TWAP：在 duration 秒内分 slices 笔均匀成交
+
+    每个时间片挂出截至本片结束应完成的数量（含之前未成交的部分）；落后线性进度一整片以上或到期后主动吃单。
+    """
+
+    algo = "twap"
+
+    def __init__(self, adapter, symbol, side, quantity, duration: float, slices: int = 10, **kwargs):
+        super().__init__(adapter, symbol, side, quantity, **kwargs)
+        if duration <= 0 or slices < 1:
+            raise ValueError("duration 必须大于 0，slices 至少为 1")
+        self.duration = duration
+        self.slices = slices
+
+    def _elapsed(self, now: float) -> float:
+        return now - self.started_at
+
+    def target(self, now, engine):
+        # 截至当前时间片结束应完成的数量
+        k = min(int(self._elapsed(now) / self.duration * self.slices) + 1, self.slices)
+        return self.lots * k // self.slices
+
+    def aggressive(self, now, engine):
+        elapsed = self._elapsed(now)
+        if elapsed >= self.duration:
+            return True
+        linear = self.lots * elapsed / self.duration
+        return linear - self.filled_lots >= self.lots / self.slices
+
+
+class Iceberg(ParentOrder):
+    """冰山单：始终只挂 display_qty，成交后补挂，价格随己方最优价移动（受 limit_price 约束），不主动吃单"""
+
+    algo = "iceberg"
+
+    def __init__(self, adapter, symbol, side, quantity, display_qty: Any, **kwargs):
+        super().__init__(adapter, symbol, side, quantity, **kwargs)
+        self.display_lots = max(self.instrument.qty_to_lots(_decimal(display_qty)), 1)
+
+    def child_lots(self, now, engine):
+        return min(self.display_lots, self.remaining_lots)
+
+
+class Pov(ParentOrder):
+    """
+    POV：按市场成交量的 participation 比例跟随成交
+
+    市场成交量来自 ExecutionEngine.on_trade（由调用方在成交推送回调中喂入）。
+    累计目标 = participation × 开始以来的市场成交量；落后超过 max_lag_qty 时主动吃单（None 不主动）。
+    """
+
+    algo = "pov"
+
+    def __init__(self, adapter, symbol, side, quantity, participation: float, max_lag_qty: Any = None, **kwargs):
+        super().__init__(adapter, symbol, side, quantity, **kwargs)
+        if not 0 < participation <= 1:
+            raise ValueError("participation 必须在 (0, 1] 之间")
+        self.participation = Decimal(str(participation))
+        self.max_lag_lots = self.instrument.qty_to_lots(_decimal(max_lag_qty)) if max_lag_qty is not None else None
+        self.volume_at_start: Optional[Decimal] = None
+
+    def target(self, now, engine):
+        traded = engine.market_volume(self.adapter, self.symbol) - (self.volume_at_start or 0)
+        return min(self.instrument.qty_to_lots(traded * self.participation), self.lots)
+
+    def aggressive(self, now, engine):
+        if self.max_lag_lots is None:
+            return False
+        return self.target(now, engine) - self.filled_lots > self.max_lag_lots
+
+    def stats(self):
+        stats = super().stats()
+        stats["participation"] = float(self.participation)
+        return stats
+
+
+class ExecutionEngine:
+    """
+    执行算法调度器（单线程驱动全部母单）
+
+    Args:
+        tick_interval: 调度周期（秒）
+        ack_grace: 子单下单后多久内不在未成交列表中仍视为在途（秒，REST 查询可能滞后）
+        max_errors: 单个母单连续出错多少次后标记为 failed
+        lookup_timeout: 子单下单后多久内 get_order 查不到仍继续重试（秒），超过后母单标记为 failed
+    """
+
+    def __init__(
+        self,
+        tick_interval: float = 0.5,
+        ack_grace: float = 2.0,
+        max_errors: int = 10,
+        lookup_timeout: float = 30.0,
+    ):
+        self.tick_interval = tick_interval
+        self.ack_grace = ack_grace
+        self.max_errors = max_errors
+        self.lookup_timeout = lookup_timeout
+        self.parents: Dict[str, ParentOrder] = {}
+        self._volumes: Dict[tuple, Decimal] = defaultdict(Decimal)
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.ticks = 0
+        self.tick_seconds = 0.0
+
+    # ---------- 母单管理 ----------
+
+    def submit(self, parent: ParentOrder) -> ParentOrder:
+        """提交母单（下一个调度周期开始执行）"""
+        with self._cond:
+            self.parents[parent.id] = parent
+            self._cond.notify()
+        return parent
+
+    def cancel(self, parent_id: str) -> bool:
+        """停止母单：撤销在途子单，已成交部分保留；返回母单是否仍在执行"""
+        with self._cond:
+            parent = self.parents.get(parent_id)
+            if parent is None or not parent.active:
+                return False
+            parent.status = "cancelling"
+            self._cond.notify()
+        return True
+
+    def on_trade(self, adapter: BasePerpAdapter, symbol: str, qty: Any) -> None:
+        """市场成交量（POV 使用），在成交推送回调中调用"""
+        with self._cond:
+            self._volumes[(id(adapter), symbol)] += abs(_decimal(qty))
+
+    def market_volume(self, adapter: BasePerpAdapter, symbol: str) -> Decimal:
+        return self._volumes[(id(adapter), symbol)]
+
+    def close_position(self, adapter: BasePerpAdapter, symbol: str, algo: str = "twap", **kwargs) -> Optional[ParentOrder]:
+        """按当前持仓提交只减仓的母单（algo: twap / iceberg / pov），无持仓返回 None"""
+        position = adapter.get_position(symbol)
+        if position is None or not position.size:
+            return None
+        side = "sell" if position.side in ("long", "buy") else "buy"
+        algos = {"twap": Twap, "iceberg": Iceberg, "pov": Pov}
+        return self.submit(algos[algo](adapter, symbol, side, abs(position.size), reduce_only=True, **kwargs))
+
+    # ---------- 生命周期 ----------
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="execution-engine", daemon=True)
+        self._thread.start()
+
+    def stop(self, cancel_all: bool = True, timeout: Optional[float] = 10.0) -> None:
+        """停止调度线程；cancel_all 时先撤销所有在途子单"""
+        if cancel_all:
+            for parent_id in list(self.parents):
+                self.cancel(parent_id)
+            deadline = time.monotonic() + (timeout or 0)
+            while any(p.status == "cancelling" for p in self.parents.values()) and time.monotonic() < deadline:
+                time.sleep(self.tick_interval / 2)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def wait(self, parent_id: str, timeout: Optional[float] = None) -> bool:
+        """等待母单结束，返回是否已结束"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        parent = self.parents[parent_id]
+        while parent.active or parent.status == "cancelling":
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(min(self.tick_interval, 0.1))
+        return True
+
+    def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                self.step()
+            except Exception as e:
+                print(f"❌ [执行] 调度周期异常: {e}")
+            with self._cond:
+                if self._stopping:
+                    return
+                self._cond.wait(max(self.tick_interval - (time.monotonic() - started), 0))
+                if self._stopping:
+                    return
+
+    # ---------- 调度 ----------
+
+    def step(self) -> None:
+        """执行一个调度周期（通常由调度线程调用）"""
+        started = time.monotonic()
+        with self._cond:
+            parents = [p for p in self.parents.values() if p.active or p.status == "cancelling"]
+        if not parents:
+            return
+        groups: Dict[tuple, List[ParentOrder]] = defaultdict(list)
+        for parent in parents:
+            groups[(id(parent.adapter), parent.symbol)].append(parent)
+        for group in groups.values():
+            adapter, symbol = group[0].adapter, group[0].symbol
+            try:
+                quote = self._quote(adapter, symbol, group[0].instrument)
+                open_ids = None
+                if any(p.child is not None for p in group):
+                    open_ids = {}
+                    for order in adapter.get_open_orders(symbol):
+                        for key in (order.client_order_id, order.order_id):
+                            if key:
+                                open_ids[str(key)] = order
+            except Exception as e:
+                for parent in group:
+                    self._error(parent, f"获取行情/挂单失败: {e}")
+                continue
+            for parent in group:
+                try:
+                    self._step_parent(parent, quote, open_ids, time.monotonic())
+                except Exception as e:
+                    self._error(parent, str(e))
+        self.ticks += 1
+        self.tick_seconds += time.monotonic() - started
+
+    @staticmethod
+    def _quote(adapter, symbol, instrument):
+        ticker = adapter.get_ticker(symbol)
+        bid, ask = ticker.get("bid_price"), ticker.get("ask_price")
+        if not bid or not ask:
+            raise Exception(f"{symbol} 没有有效的买一/卖一")
+        return (
+            instrument.price_to_ticks(bid, ROUND_DOWN),
+            instrument.price_to_ticks(ask, ROUND_UP),
+        )
+
+    def _error(self, parent: ParentOrder, message: str) -> None:
+        parent.errors += 1
+        parent.last_error = message
+        print(f"❌ [执行] {parent.id} {parent.symbol}: {message}")
+        if parent.errors >= self.max_errors and parent.child is None:
+            self._finish(parent, "failed")
+
+    def _finish(self, parent: ParentOrder, status: str) -> None:
+        parent.status = status
+        parent.finished_at = time.monotonic()
+        print(
+            f"[执行] {parent.id} {parent.side} {parent.symbol} {status}: 成交 "
+            f"{parent.instrument.lots_to_str(parent.filled_lots)}/{parent.instrument.lots_to_str(parent.lots)}"
+        )
+
+    def _step_parent(self, parent: ParentOrder, quote, open_ids, now: float) -> None:
+        bid_ticks, ask_ticks = quote
+        if parent.status == "pending":
+            parent.status = "running"
+            parent.started_at = now
+            parent.arrival_ticks = (bid_ticks + ask_ticks) / 2
+            if isinstance(parent, Pov):
+                parent.volume_at_start = self.market_volume(parent.adapter, parent.symbol)
+
+        child = parent.child
+        if child is not None:
+            live = open_ids.get(child.client_order_id) if open_ids is not None else None
+            if live is not None:
+                parent.record_fill(child, parent.instrument.qty_to_lots(live.filled_quantity or 0))
+            elif not self._settle(parent, child, now):
+                return
+            if parent.child is not None and child.cancel_at is None:
+                # cancel/replace：停止中、已无剩余、或价格偏离应挂价格
+                if parent.status == "cancelling" or parent.remaining_lots <= 0:
+                    self._cancel_child(parent, child, now)
+                else:
+                    aggressive = parent.aggressive(now, self)
+                    wanted = parent.price_ticks(bid_ticks, ask_ticks, aggressive)
+                    if abs(wanted - child.price_ticks) >= parent.replace_ticks:
+                        self._cancel_child(parent, child, now)
+                        parent.replaces += 1
+            if parent.child is not None:
+                return
+
+        if parent.status == "cancelling":
+            self._finish(parent, "cancelled")
+            return
+        if parent.remaining_lots <= 0:
+            self._finish(parent, "done")
+            return
+
+        lots = min(parent.child_lots(now, self), parent.remaining_lots)
+        if lots < max(parent.instrument.min_lots, 1):
+            if parent.remaining_lots < parent.instrument.min_lots:
+                # 剩余不足最小下单量，无法继续
+                self._finish(parent, "done")
+            return
+        aggressive = parent.aggressive(now, self)
+        price_ticks = parent.price_ticks(bid_ticks, ask_ticks, aggressive)
+        client_order_id = _client_order_id()
+        parent.adapter.place_order(
+            symbol=parent.symbol,
+            side=parent.side,
+            order_type="limit",
+            quantity=parent.instrument.lots_to_qty(lots),
+            price=parent.instrument.ticks_to_price(price_ticks),
+            time_in_force="ioc" if aggressive else "gtc",
+            reduce_only=parent.reduce_only,
+            client_order_id=client_order_id,
+        )
+        parent.child = ChildOrder(client_order_id, price_ticks, lots, aggressive, now)
+        parent.children += 1
+        parent.errors = 0
+
+    def _cancel_child(self, parent: ParentOrder, child: ChildOrder, now: float) -> None:
+        child.cancel_at = now
+        try:
+            parent.adapter.cancel_order(symbol=parent.symbol, client_order_id=child.client_order_id)
+        except Exception as e:
+            # 可能已成交或已撤销，下个周期按最终状态确认
+            parent.last_error = f"撤单失败: {e}"
+
+    def _settle(self, parent: ParentOrder, child: ChildOrder, now: float) -> bool:
+        """
+        子单不在未成交列表中：确认最终成交并清除子单
+
+        Returns:
+            是否已结束（False 表示仍在途，等待下个周期）
+        """
+        if now - child.placed_at < self.ack_grace and child.cancel_at is None and not child.aggressive:
+            return False
+        try:
+            order = parent.adapter.get_order(symbol=parent.symbol, client_order_id=child.client_order_id)
+        except NotImplementedError:
+            order = None
+            if child.cancel_at is None:
+                # 无法查询订单：未撤单而消失的子单视为全部成交
+                parent.record_fill(child, child.lots)
+            parent.child = None
+            return True
+        if order is None:
+            if now - child.placed_at < self.lookup_timeout:
+                # 查询滞后或子单已超出交易所返回的最近订单范围：保留子单，下个周期按 client_order_id 重试
+                return False
+            # 成交数量未知（子单可能已成交），重新拆单可能超量成交：母单停止并标记为 failed
+            parent.errors += 1
+            parent.last_error = f"子单 {child.client_order_id} 超过 {self.lookup_timeout}s 仍查不到，成交数量未知"
+            print(f"❌ [执行] {parent.id} {parent.symbol}: {parent.last_error}")
+            self._finish(parent, "failed")
+            return False
+        parent.record_fill(child, parent.instrument.qty_to_lots(order.filled_quantity or 0))
+        if order.status in FINAL_STATUSES:
+            parent.child = None
+            return True
+        return False
+
+    # ---------- 指标 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """每个母单的成交/滑点，以及按算法汇总"""
+        with self._cond:
+            parents = list(self.parents.values())
+        orders = [p.stats() for p in parents]
+        by_algo: Dict[str, Dict[str, Any]] = {}
+        for parent, stats in zip(parents, orders):
+            summary = by_algo.setdefault(
+                parent.algo, {"orders": 0, "active": 0, "filled_ratio": 0.0, "slippage_bps": None, "_weight": 0}
+            )
+            summary["orders"] += 1
+            summary["active"] += parent.active
+            summary["filled_ratio"] += stats["fill_ratio"]
+            if stats["slippage_bps"] is not None:
+                weight = parent.filled_lots
+                total = (summary["slippage_bps"] or 0) * summary["_weight"] + stats["slippage_bps"] * weight
+                summary["_weight"] += weight
+                summary["slippage_bps"] = round(total / summary["_weight"], 2)
+        for summary in by_algo.values():
+            summary["filled_ratio"] = round(summary["filled_ratio"] / summary["orders"], 4)
+            del summary["_weight"]
+        return {
+            "ticks": self.ticks,
+            "avg_tick_ms": round(self.tick_seconds / self.ticks * 1000, 3) if self.ticks else None,
+            "algos": by_algo,
+            "orders": orders,
+        }
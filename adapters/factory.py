@@ -3,20 +3,45 @@ Adapter Factory
 
 This module provides a factory function to create exchange adapters based on configuration.
 """
-from typing import Dict, Any, Type
+import importlib
+from typing import Dict, Any, Type, Union
 from adapters.base_adapter import BasePerpAdapter
-from adapters.standx_adapter import StandXAdapter
-from adapters.grvt_adapter import GrvtAdapter
 
 # 注册所有可用的适配器
-_ADAPTER_REGISTRY: Dict[str, Type[BasePerpAdapter]] = {
-    "standx": StandXAdapter,
-    "grvt": GrvtAdapter,
+# 值为 "模块:类名" 时在 create_adapter 首次用到该交易所时才导入，
+# 只用一个交易所时不会加载其他交易所的 SDK（web3 / eth_account / GRVT pysdk 等）
+_ADAPTER_REGISTRY: Dict[str, Union[str, Type[BasePerpAdapter]]] = {
+    "standx": "adapters.standx_adapter:StandXAdapter",
+    "grvt": "adapters.grvt_adapter:GrvtAdapter",
     # 未来可以添加更多交易所适配器
-    # "nado": NadoAdapter,
+    # "nado": "adapters.nado_adapter:NadoAdapter",
 }
 
 
+def get_adapter_class(exchange_name: str) -> Type[BasePerpAdapter]:
+    """
+    获取交易所的适配器类，延迟注册的适配器在此时导入
+    
+    Raises:
+        ValueError: 交易所未注册
+    """
+    exchange_name = exchange_name.lower()
+    entry = _ADAPTER_REGISTRY.get(exchange_name)
+    if entry is None:
+        available = ", ".join(_ADAPTER_REGISTRY.keys())
+        raise ValueError(
+            f"不支持的交易所: {exchange_name}. "
+            f"支持的交易所: {available}"
+        )
+    if isinstance(entry, str):
+        module_name, _, class_name = entry.partition(":")
+        entry = getattr(importlib.import_module(module_name), class_name)
+        if not issubclass(entry, BasePerpAdapter):
+            raise ValueError(f"适配器类必须继承自 BasePerpAdapter: {module_name}.{class_name}")
+        _ADAPTER_REGISTRY[exchange_name] = entry
+    return entry
+
+
 def create_adapter(config: Dict[str, Any]) -> BasePerpAdapter:
     """
     根据配置创建适配器实例
@@ -44,16 +69,7 @@ def create_adapter(config: Dict[str, Any]) -> BasePerpAdapter:
     if not exchange_name:
         raise ValueError("配置中必须包含 'exchange_name' 字段")
     
-    exchange_name = exchange_name.lower()
-    
-    if exchange_name not in _ADAPTER_REGISTRY:
-        available = ", ".join(_ADAPTER_REGISTRY.keys())
-        raise ValueError(
-            f"不支持的交易所: {exchange_name}. "
-            f"支持的交易所: {available}"
-        )
-    
-    adapter_class = _ADAPTER_REGISTRY[exchange_name]
+    adapter_class = get_adapter_class(exchange_name)
     
     try:
         return adapter_class(config)
@@ -61,21 +77,26 @@ def create_adapter(config: Dict[str, Any]) -> BasePerpAdapter:
         raise ValueError(f"创建适配器失败: {e}")
 
 
-def register_adapter(exchange_name: str, adapter_class: Type[BasePerpAdapter]):
+def register_adapter(exchange_name: str, adapter_class: Union[str, Type[BasePerpAdapter]]):
     """
     注册新的适配器类
     
     Args:
         exchange_name: 交易所名称（小写）
-        adapter_class: 适配器类，必须继承自 BasePerpAdapter
+        adapter_class: 适配器类（必须继承自 BasePerpAdapter），
+            或 "模块:类名" 字符串（首次创建该交易所的适配器时才导入）
         
     Example:
         >>> from adapters.base_adapter import BasePerpAdapter
         >>> class MyExchangeAdapter(BasePerpAdapter):
         ...     pass
         >>> register_adapter("myexchange", MyExchangeAdapter)
+        >>> register_adapter("other", "my_package.other_adapter:OtherAdapter")
     """
-    if not issubclass(adapter_class, BasePerpAdapter):
+    if isinstance(adapter_class, str):
+        if ":" not in adapter_class:
+            raise ValueError("延迟注册的适配器格式应为 '模块:类名'")
+    elif not issubclass(adapter_class, BasePerpAdapter):
         raise ValueError(f"适配器类必须继承自 BasePerpAdapter")
     
     _ADAPTER_REGISTRY[exchange_name.lower()] = adapter_class
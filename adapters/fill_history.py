@@ -0,0 +1,165 @@
+"""
+成交历史同步与统计工具
+
+使用示例:
+    # 按策略配置同步 GRVT / StandX 账户的成交和订单（只拉取新记录）
+    python -m adapters.fill_history sync --db logs/fills.db --config strategys/strategy_common/config.yaml
+
+    # 同步 Nado 子账户（只读，不需要私钥）
+    python -m adapters.fill_history sync --db logs/fills.db --nado-address 0x... --nado-products 2:BTC-PERP,4:ETH-PERP
+
+    # 统计
+    python -m adapters.fill_history report --db logs/fills.db --since 2026-01-01 --symbol BTC_USDT_Perp
+    python -m adapters.fill_history report --db logs/fills.db --daily --venue grvt
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+from typing import List, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+for sdk_path in (project_root, os.path.join(project_root, 'exchange', 'exchange_nado')):
+    if sdk_path not in sys.path:
+        sys.path.insert(0, sdk_path)
+
+from adapters.fill_store import (
+    FillStore,
+    GrvtFillSource,
+    NadoFillSource,
+    StandXFillSource,
+)
+from adapters.transport import get_default_transport
+
+
+def _format_ns(ts_ns) -> str:
+    if not ts_ns:
+        return "-"
+    return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+
+
+def build_sources(args) -> list:
+    """根据配置文件和命令行参数创建数据源"""
+    sources = []
+    if args.config:
+        import yaml
+        from adapters.factory import create_adapter
+
+        with open(args.config, "r", encoding="utf-8") as f:
+            exchanges = (yaml.safe_load(f) or {}).get("exchanges", {})
+        for name, config in exchanges.items():
+            if args.exchanges and name not in args.exchanges:
+                continue
+            try:
+                adapter = create_adapter(config)
+                adapter.connect()
+            except Exception as e:
+                print(f"❌ 连接 {name} 失败: {e}")
+                continue
+            if name == "grvt":
+                sources.append(GrvtFillSource(adapter.grvt_client))
+            elif name == "standx":
+                sources.append(
+                    StandXFillSource(
+                        adapter.http_client,
+                        token_getter=lambda a=adapter: a.token,
+                        account=getattr(adapter, "wallet_address", "") or "",
+                    )
+                )
+            else:
+                print(f"⚠️ {name} 暂不支持成交同步")
+
+    if args.nado_address:
+        from nado_protocol.indexer_client import IndexerClientOpts, IndexerQueryClient
+        from nado_protocol.utils.backend import NadoBackendURL
+        from nado_protocol.utils.bytes32 import subaccount_to_hex
+
+        products = {}
+        for item in (args.nado_products or "").split(","):
+            if item.strip():
+                pid, _, symbol = item.partition(":")
+                products[int(pid)] = symbol.strip() or f"product_{pid.strip()}"
+        if not products:
+            print("❌ --nado-address 需要配合 --nado-products 使用")
+        else:
+            indexer = IndexerQueryClient(
+                IndexerClientOpts(url=args.nado_indexer or NadoBackendURL.MAINNET_INDEXER.value),
+                session=get_default_transport().session(query=True),
+            )
+            subaccount = subaccount_to_hex(args.nado_address, args.nado_subaccount)
+            sources.append(NadoFillSource(indexer, subaccount, products))
+    return sources
+
+
+def cmd_sync(args) -> None:
+    sources = build_sources(args)
+    if not sources:
+        print("没有可同步的数据源")
+        sys.exit(1)
+    with FillStore(args.db) as store:
+        for source in sources:
+            counts = store.sync(source)
+            print(f"{source.venue}: {sum(counts.values())} 条新记录 {counts}")
+
+
+def cmd_report(args) -> None:
+    filters = dict(venue=args.venue, symbol=args.symbol, since=args.since, until=args.until)
+    with FillStore(args.db) as store:
+        if args.daily:
+            print(f"{'日期':<12}{'交易所':<8}{'交易对':<18}{'成交数':>8}{'成交额':>16}{'手续费':>12}{'已实现盈亏':>14}")
+            for row in store.daily_pnl(**filters):
+                print(
+                    f"{row['day']:<12}{row['venue']:<8}{row['symbol']:<18}{row['fills']:>8}"
+                    f"{row['notional']:>16.2f}{row['fees']:>12.4f}{row['realized_pnl']:>14.4f}"
+                )
+            return
+
+        print(f"{'交易所':<8}{'交易对':<18}{'成交数':>8}{'成交额':>16}{'手续费':>12}{'已实现盈亏':>14}{'净盈亏':>14}  时间范围")
+        for row in store.pnl_summary(**filters):
+            print(
+                f"{row['venue']:<8}{row['symbol']:<18}{row['fills']:>8}{row['notional']:>16.2f}"
+                f"{row['fees']:>12.4f}{row['realized_pnl']:>14.4f}{row['net_pnl']:>14.4f}"
+                f"  {_format_ns(row['first_ns'])} ~ {_format_ns(row['last_ns'])}"
+            )
+
+        rates = store.fill_rate(**filters)
+        if rates:
+            print(f"\n{'交易所':<8}{'交易对':<18}{'订单数':>8}{'有成交':>8}{'订单成交率':>12}{'数量成交率':>12}")
+            for row in rates:
+                qty_rate = f"{row['qty_fill_rate']:.2%}" if row["qty_fill_rate"] is not None else "-"
+                print(
+                    f"{row['venue']:<8}{row['symbol']:<18}{row['orders']:>8}{row['filled_orders']:>8}"
+                    f"{row['order_fill_rate']:>12.2%}{qty_rate:>12}"
+                )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="成交历史同步与统计")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sync = sub.add_parser("sync", help="增量同步成交和订单")
+    sync.add_argument("--db", default=os.path.join("logs", "fills.db"), help="SQLite 数据库路径")
+    sync.add_argument("--config", help="策略配置文件（读取 exchanges 段）")
+    sync.add_argument("--exchanges", type=lambda s: [e.strip() for e in s.split(",") if e.strip()],
+                      help="只同步这些交易所（逗号分隔）")
+    sync.add_argument("--nado-address", help="Nado 钱包地址")
+    sync.add_argument("--nado-subaccount", default="default", help="Nado 子账户名")
+    sync.add_argument("--nado-products", help="Nado 产品，如 2:BTC-PERP,4:ETH-PERP")
+    sync.add_argument("--nado-indexer", help="Nado indexer 地址（默认主网）")
+    sync.set_defaults(func=cmd_sync)
+
+    report = sub.add_parser("report", help="盈亏、手续费和成交率统计")
+    report.add_argument("--db", default=os.path.join("logs", "fills.db"), help="SQLite 数据库路径")
+    report.add_argument("--venue", help="交易所")
+    report.add_argument("--symbol", help="交易对")
+    report.add_argument("--since", help="起始时间，如 2026-01-01T08:00:00（UTC）")
+    report.add_argument("--until", help="结束时间")
+    report.add_argument("--daily", action="store_true", help="按日汇总")
+    report.set_defaults(func=cmd_report)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
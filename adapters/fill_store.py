@@ -0,0 +1,738 @@
+"""
+Fill Store
+
+本地 SQLite 成交/订单历史库，按交易所增量同步。
+
+每个 (交易所, 账户, 数据流) 在 sync_state 表里保存一个高水位（GRVT 为成交时间纳秒、
+Nado 为 submission_idx、StandX 为成交 ID），同步时只拉取高水位之后的新记录，
+按批在单个事务里 executemany 写入；高水位随最后一批一起提交，中途失败下次会从旧水位
+重新拉取（主键去重，重复写入无副作用）。订单的 ID 水位之前同步到的挂单/部分成交订单，之后的成交、
+撤单不会再出现在增量结果里，所以每次同步订单前先按数据源的 refresh_orders 重新拉取库里尚未结束的订单
+（GRVT 的订单水位是更新时间，不需要）。fills / orders 表在 (symbol, ts_ns) 上建索引，
+几个月数据上的盈亏、手续费、成交率统计都在毫秒级。
+
+使用示例:
+    store = FillStore("logs/fills.db")
+    store.sync(GrvtFillSource(grvt_client, account="123456"))
+    store.sync(NadoFillSource(indexer, subaccount, products={2: "BTC-PERP"}))
+    store.sync(StandXFillSource(http_client, token_getter=lambda: adapter.token))
+
+    for row in store.pnl_summary(since="2026-01-01"):
+        print(row)
+    print(store.fill_rate(venue="grvt", symbol="BTC_USDT_Perp"))
+
+命令行工具见 adapters/fill_history.py。
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+FILL_COLUMNS = (
+    "venue",
+    "account",
+    "fill_id",
+    "symbol",
+    "ts_ns",
+    "side",
+    "price",
+    "qty",
+    "fee",
+    "realized_pnl",
+    "order_id",
+    "client_order_id",
+    "is_taker",
+)
+
+ORDER_COLUMNS = (
+    "venue",
+    "account",
+    "order_id",
+    "client_order_id",
+    "symbol",
+    "ts_ns",
+    "updated_ns",
+    "side",
+    "price",
+    "qty",
+    "filled_qty",
+    "avg_price",
+    "status",
+)
+
+STREAM_FILLS = "fills"
+STREAM_ORDERS = "orders"
+
+# 订单结束状态（不会再变化），其余状态的订单在每次同步时重新拉取
+FINAL_ORDER_STATUSES = ("filled", "cancelled", "canceled", "rejected", "expired")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fills (
+    venue TEXT NOT NULL,
+    account TEXT NOT NULL,
+    fill_id TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    ts_ns INTEGER NOT NULL,
+    side TEXT NOT NULL,
+    price REAL NOT NULL,
+    qty REAL NOT NULL,
+    fee REAL,
+    realized_pnl REAL,
+    order_id TEXT,
+    client_order_id TEXT,
+    is_taker INTEGER,
+    PRIMARY KEY (venue, account, fill_id)
+);
+CREATE INDEX IF NOT EXISTS fills_symbol_ts ON fills (symbol, ts_ns);
+CREATE INDEX IF NOT EXISTS fills_venue_symbol_ts ON fills (venue, symbol, ts_ns);
+
+CREATE TABLE IF NOT EXISTS orders (
+    venue TEXT NOT NULL,
+    account TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    client_order_id TEXT,
+    symbol TEXT NOT NULL,
+    ts_ns INTEGER NOT NULL,
+    updated_ns INTEGER,
+    side TEXT,
+    price REAL,
+    qty REAL,
+    filled_qty REAL,
+    avg_price REAL,
+    status TEXT,
+    PRIMARY KEY (venue, account, order_id)
+);
+CREATE INDEX IF NOT EXISTS orders_symbol_ts ON orders (symbol, ts_ns);
+CREATE INDEX IF NOT EXISTS orders_venue_symbol_ts ON orders (venue, symbol, ts_ns);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    venue TEXT NOT NULL,
+    account TEXT NOT NULL,
+    stream TEXT NOT NULL,
+    hwm INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (venue, account, stream)
+);
+"""
+
+_FILL_INSERT = (
+    f"INSERT OR IGNORE INTO fills ({', '.join(FILL_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(FILL_COLUMNS))})"
+)
+# 订单状态会变化（部分成交 -> 成交/撤单），以最新记录为准
+_ORDER_INSERT = (
+    f"INSERT OR REPLACE INTO orders ({', '.join(ORDER_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(ORDER_COLUMNS))})"
+)
+
+
+def to_ns(value: Any) -> Optional[int]:
+    """
+    把时间统一转换为纳秒整数
+
+    支持 None、纳秒/毫秒/秒整数（按量级判断）、datetime、ISO 8601 字符串（如
+    "2026-01-01" 或 "2026-01-01T08:00:00Z"，无时区时按 UTC）。
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        dt = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        return int(dt.timestamp() * 1_000_000_000)
+    if isinstance(value, str):
+        text = value.strip()
+        if not text.lstrip("-").isdigit():
+            return to_ns(datetime.fromisoformat(text.replace("Z", "+00:00")))
+        value = int(text)
+    value = int(value)
+    if abs(value) < 10**11:  # 秒
+        return value * 1_000_000_000
+    if abs(value) < 10**14:  # 毫秒
+        return value * 1_000_000
+    return value
+
+
+def _float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+class FillSource:
+    """
+    成交/订单历史数据源基类
+
+    子类实现 fetch(stream, hwm)：按批返回高水位之后的记录，每批为
+    (行列表, 本批最大水位)，行按 FILL_COLUMNS / ORDER_COLUMNS 顺序组成元组。
+    订单水位不随订单更新推进的数据源还要实现 refresh_orders，重新拉取尚未结束的订单。
+    """
+
+    venue = ""
+    streams: Tuple[str, ...] = (STREAM_FILLS, STREAM_ORDERS)
+
+    def __init__(self, account: str = ""):
+        self.account = str(account or "")
+
+    def fetch(self, stream: str, hwm: Optional[int]) -> Iterator[Tuple[List[tuple], int]]:
+        raise NotImplementedError
+
+    def refresh_orders(self, orders: List[Dict[str, Any]]) -> Iterator[List[tuple]]:
+        """
+        重新拉取库里尚未结束的订单
+
+        Args:
+            orders: 订单表中的行（含 order_id、symbol、ts_ns）
+
+        Yields:
+            List[tuple]: ORDER_COLUMNS 顺序的最新订单行，找不到的订单不返回
+        """
+        return iter(())
+
+
+class GrvtFillSource(FillSource):
+    """
+    GRVT 数据源
+
+    成交通过 fetch_my_trades(since=水位+1) 按 cursor 翻页；订单历史接口不支持时间过滤，
+    从最新一页往回翻，遇到整页都不晚于水位时停止。水位为纳秒时间戳。
+
+    Args:
+        grvt: 已认证的 GrvtCcxt 实例
+        account: 交易账户 ID（用于区分多个账户）
+        page_size: 每页条数（GRVT 上限 1000）
+    """
+
+    venue = "grvt"
+
+    def __init__(self, grvt, account: str = "", page_size: int = 500):
+        super().__init__(account or grvt.get_trading_account_id())
+        self.grvt = grvt
+        self.page_size = page_size
+
+    def fetch(self, stream, hwm):
+        if stream == STREAM_FILLS:
+            return self._fetch_fills(hwm)
+        return self._fetch_orders(hwm)
+
+    def _fetch_fills(self, hwm):
+        since = hwm + 1 if hwm is not None else None
+        cursor = None
+        while True:
+            params = {"cursor": cursor} if cursor else {}
+            response = self.grvt.fetch_my_trades(since=since, limit=self.page_size, params=params)
+            trades = response.get("result") or []
+            rows = [self._fill_row(t) for t in trades]
+            if rows:
+                yield rows, max(r[4] for r in rows)
+            cursor = response.get("next")
+            if not cursor or len(trades) < self.page_size:
+                return
+
+    def _fill_row(self, trade: Dict[str, Any]) -> tuple:
+        return (
+            self.venue,
+            self.account,
+            str(trade["trade_id"]),
+            trade.get("instrument", ""),
+            int(trade["event_time"]),
+            "buy" if trade.get("is_buyer") else "sell",
+            float(trade["price"]),
+            float(trade["size"]),
+            _float(trade.get("fee")),
+            _float(trade.get("realized_pnl")),
+            trade.get("order_id"),
+            str(trade["client_order_id"]) if trade.get("client_order_id") else None,
+            1 if trade.get("is_taker") else 0,
+        )
+
+    def _fetch_orders(self, hwm):
+        cursor = None
+        while True:
+            params = {"limit": self.page_size}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.grvt.fetch_order_history(params=params)
+            orders = response.get("result") or []
+            rows = [self._order_row(o) for o in orders]
+            fresh = [r for r in rows if hwm is None or r[6] > hwm]
+            if fresh:
+                yield fresh, max(r[6] for r in fresh)
+            cursor = response.get("next")
+            if not cursor or len(orders) < self.page_size or len(fresh) < len(rows):
+                return
+
+    def _order_row(self, order: Dict[str, Any]) -> tuple:
+        leg = (order.get("legs") or [{}])[0]
+        metadata = order.get("metadata") or {}
+        state = order.get("state") or {}
+        created = int(metadata.get("create_time") or 0)
+        traded = state.get("traded_size") or [None]
+        avg_price = state.get("avg_fill_price") or [None]
+        return (
+            self.venue,
+            self.account,
+            str(order.get("order_id")),
+            str(metadata["client_order_id"]) if metadata.get("client_order_id") else None,
+            leg.get("instrument", ""),
+            created,
+            int(state.get("update_time") or created),
+            "buy" if leg.get("is_buying_asset") else "sell",
+            _float(leg.get("limit_price")),
+            _float(leg.get("size")),
+            _float(traded[0]),
+            _float(avg_price[0]),
+            str(state.get("status", "")).lower(),
+        )
+
+
+class NadoFillSource(FillSource):
+    """
+    Nado 数据源
+
+    成交按产品各用一个 indexer 分页器（paginate_matches，后台预取下一页），
+    每个产品单独记水位（数据流名 fills:<product_id>）；订单取 indexer 历史订单。
+    水位为 submission_idx（下单时确定，之后的成交不会推进），未结束的订单按 digest 重新查询。
+
+    Args:
+        indexer: IndexerQueryClient / IndexerClient 实例
+        subaccount: 子账户 bytes32 十六进制（nado_protocol.utils.bytes32.subaccount_to_hex）
+        products: {product_id: 交易对名称}，只同步这些产品的成交
+        page_size: 每页条数
+    """
+
+    venue = "nado"
+
+    def __init__(self, indexer, subaccount: str, products: Dict[int, str], page_size: int = 500):
+        super().__init__(subaccount)
+        self.indexer = indexer
+        self.subaccount = subaccount
+        self.products = dict(products)
+        self.page_size = page_size
+        self.streams = tuple(f"{STREAM_FILLS}:{pid}" for pid in self.products) + (STREAM_ORDERS,)
+
+    def _symbol(self, product_id: int) -> str:
+        return self.products.get(product_id, f"product_{product_id}")
+
+    def fetch(self, stream, hwm):
+        if stream == STREAM_ORDERS:
+            return self._fetch_orders(hwm)
+        return self._fetch_fills(int(stream.split(":", 1)[1]), hwm)
+
+    def _fetch_fills(self, product_id, hwm):
+        from nado_protocol.indexer_client.types.query import IndexerMatchesParams
+
+        paginator = self.indexer.paginate_matches(
+            IndexerMatchesParams(
+                subaccounts=[self.subaccount],
+                product_ids=[product_id],
+                limit=self.page_size,
+            )
+        )
+        symbol = self._symbol(product_id)
+        for page in paginator.pages():
+            rows = [self._fill_row(m, symbol) for m in page.items]
+            fresh = [r for r in rows if hwm is None or int(r[2].split(":", 1)[0]) > hwm]
+            if fresh:
+                yield fresh, max(int(r[2].split(":", 1)[0]) for r in fresh)
+            if len(fresh) < len(rows):
+                return
+
+    def _fill_row(self, match, symbol: str) -> tuple:
+        base = int(match.base_filled)
+        quote = int(match.quote_filled)
+        return (
+            self.venue,
+            self.account,
+            f"{match.submission_idx}:{match.digest}",
+            symbol,
+            to_ns(match.timestamp) or 0,
+            "buy" if base > 0 else "sell",
+            abs(quote / base) if base else 0.0,
+            abs(base) / 1e18,
+            int(match.fee) / 1e18,
+            None,
+            match.digest,
+            None,
+            None,
+        )
+
+    def _fetch_orders(self, hwm):
+        from nado_protocol.indexer_client.types.query import (
+            IndexerSubaccountHistoricalOrdersParams,
+        )
+
+        paginator = self.indexer.paginate_subaccount_historical_orders(
+            IndexerSubaccountHistoricalOrdersParams(
+                subaccounts=[self.subaccount],
+                limit=self.page_size,
+            )
+        )
+        for page in paginator.pages():
+            fresh = [o for o in page.items if hwm is None or int(o.submission_idx) > hwm]
+            if fresh:
+                yield [self._order_row(o) for o in fresh], max(int(o.submission_idx) for o in fresh)
+            if len(fresh) < len(page.items):
+                return
+
+    def refresh_orders(self, orders):
+        digests = [o["order_id"] for o in orders]
+        for i in range(0, len(digests), self.page_size):
+            data = self.indexer.get_historical_orders_by_digest(digests[i:i + self.page_size])
+            rows = [self._order_row(o) for o in data.orders]
+            if rows:
+                yield rows
+
+    def _order_row(self, order) -> tuple:
+        amount = int(order.amount)
+        base = int(order.base_filled)
+        quote = int(order.quote_filled)
+        filled = abs(base) / 1e18
+        if filled == 0:
+            status = "cancelled"
+        elif abs(base) >= abs(amount):
+            status = "filled"
+        else:
+            status = "partially_filled"
+        ts = to_ns(order.timestamp) or 0
+        return (
+            self.venue,
+            self.account,
+            order.digest,
+            None,
+            self._symbol(order.product_id),
+            ts,
+            ts,
+            "buy" if amount > 0 else "sell",
+            int(order.price_x18) / 1e18,
+            abs(amount) / 1e18,
+            filled,
+            abs(quote / base) if base else None,
+            status,
+        )
+
+
+class StandXFillSource(FillSource):
+    """
+    StandX 数据源
+
+    成交和订单历史都按 ID 从新到旧用 last_id 翻页，遇到不大于水位的 ID 时停止。
+    水位为成交 / 订单 ID；订单 ID 不随更新变化，未结束的订单从最新一页往回翻到其中最早的 ID 重新拉取。
+
+    Args:
+        http: StandXPerpHTTP 实例
+        token_getter: 返回当前 JWT 的函数（适配器会后台刷新 token，所以每页都重新取）
+        account: 钱包地址（用于区分多个账户）
+        page_size: 每页条数
+    """
+
+    venue = "standx"
+
+    def __init__(self, http, token_getter: Callable[[], str], account: str = "", page_size: int = 500):
+        super().__init__(account)
+        self.http = http
+        self.token_getter = token_getter
+        self.page_size = page_size
+
+    def fetch(self, stream, hwm):
+        if stream == STREAM_FILLS:
+            return self._paginate(self.http.query_trades, self._fill_row, hwm)
+        return self._paginate(self.http.query_orders, self._order_row, hwm)
+
+    def _paginate(self, query, to_row, hwm):
+        last_id = None
+        while True:
+            response = query(token=self.token_getter(), last_id=last_id, limit=self.page_size)
+            records = response.get("result") or []
+            fresh = [r for r in records if hwm is None or int(r["id"]) > hwm]
+            if fresh:
+                yield [to_row(r) for r in fresh], max(int(r["id"]) for r in fresh)
+            if len(records) < self.page_size or len(fresh) < len(records):
+                return
+            last_id = min(int(r["id"]) for r in records)
+
+    def refresh_orders(self, orders):
+        wanted = {str(o["order_id"]) for o in orders}
+        oldest = min(int(order_id) for order_id in wanted)
+        last_id = None
+        while wanted:
+            response = self.http.query_orders(token=self.token_getter(), last_id=last_id, limit=self.page_size)
+            records = response.get("result") or []
+            found = [r for r in records if str(r["id"]) in wanted]
+            if found:
+                wanted.difference_update(str(r["id"]) for r in found)
+                yield [self._order_row(r) for r in found]
+            if not records or len(records) < self.page_size:
+                return
+            last_id = min(int(r["id"]) for r in records)
+            if last_id <= oldest:
+                return
+
+    def _fill_row(self, trade: Dict[str, Any]) -> tuple:
+        return (
+            self.venue,
+            self.account,
+            str(trade["id"]),
+            trade.get("symbol", ""),
+            to_ns(trade.get("created_at")) or 0,
+            str(trade.get("side", "")).lower(),
+            float(trade["price"]),
+            float(trade["qty"]),
+            _float(trade.get("fee_qty")),
+            _float(trade.get("pnl")),
+            str(trade["order_id"]) if trade.get("order_id") is not None else None,
+            None,
+            None,
+        )
+
+    def _order_row(self, order: Dict[str, Any]) -> tuple:
+        created = to_ns(order.get("created_at")) or 0
+        return (
+            self.venue,
+            self.account,
+            str(order["id"]),
+            order.get("cl_ord_id"),
+            order.get("symbol", ""),
+            created,
+            to_ns(order.get("updated_at")) or created,
+            str(order.get("side", "")).lower(),
+            _float(order.get("price")),
+            _float(order.get("qty")),
+            _float(order.get("fill_qty")),
+            _float(order.get("fill_avg_price")),
+            str(order.get("status", "")).lower(),
+        )
+
+
+class FillStore:
+    """
+    SQLite 成交/订单历史库
+
+    Args:
+        path: 数据库文件路径（":memory:" 为内存库）
+        batch_size: 每个写事务最多写入的行数
+        open_order_max_age: 只重新拉取下单时间在这么多秒以内的未结束订单（默认 7 天），
+            交易所查不到的订单不会无限期地被重复查询
+    """
+
+    def __init__(self, path: str, batch_size: int = 5000, open_order_max_age: float = 7 * 86400):
+        self.path = path
+        self.batch_size = batch_size
+        self.open_order_max_age = open_order_max_age
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory and path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- 写入 ----------
+
+    def get_hwm(self, venue: str, account: str, stream: str) -> Optional[int]:
+        """读取高水位，从未同步过返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hwm FROM sync_state WHERE venue=? AND account=? AND stream=?",
+                (venue, account, stream),
+            ).fetchone()
+        return row[0] if row else None
+
+    def write(
+        self,
+        fills: Sequence[tuple] = (),
+        orders: Sequence[tuple] = (),
+        hwm: Optional[Tuple[str, str, str, int]] = None,
+    ):
+        """
+        在一个事务里批量写入成交、订单，并可同时推进一个高水位
+
+        Args:
+            fills: FILL_COLUMNS 顺序的元组列表（重复 fill_id 忽略）
+            orders: ORDER_COLUMNS 顺序的元组列表（同 order_id 覆盖）
+            hwm: (venue, account, stream, 水位)
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if fills:
+                    self._conn.executemany(_FILL_INSERT, fills)
+                if orders:
+                    self._conn.executemany(_ORDER_INSERT, orders)
+                if hwm is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO sync_state (venue, account, stream, hwm, synced_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (*hwm, time.time()),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def sync(self, source: FillSource, streams: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        从数据源增量同步
+
+        每个数据流从当前水位开始拉取，攒够 batch_size 行写一次；最后一批和新水位在
+        同一事务提交。订单数据流先重新拉取库里尚未结束的订单（见 FillSource.refresh_orders）。
+        某个数据流失败只打印错误，不影响其他数据流。
+
+        Returns:
+            {数据流: 新写入/更新的行数}
+        """
+        counts = {}
+        for stream in streams or source.streams:
+            hwm = self.get_hwm(source.venue, source.account, stream)
+            is_fills = stream.split(":", 1)[0] == STREAM_FILLS
+            started = time.time()
+            pending: List[tuple] = []
+            new_hwm = hwm
+            total = 0
+            try:
+                if not is_fills:
+                    total += self._refresh_orders(source)
+                for rows, page_hwm in source.fetch(stream, hwm):
+                    pending.extend(rows)
+                    new_hwm = page_hwm if new_hwm is None else max(new_hwm, page_hwm)
+                    if len(pending) >= self.batch_size:
+                        self._write_rows(is_fills, pending)
+                        total += len(pending)
+                        pending = []
+                state = None
+                if new_hwm is not None and new_hwm != hwm:
+                    state = (source.venue, source.account, stream, new_hwm)
+                self._write_rows(is_fills, pending, state)
+                total += len(pending)
+            except Exception as e:
+                print(f"[FillStore] 同步 {source.venue}/{stream} 失败（已写入 {total} 条，水位未推进）: {e}")
+            counts[stream] = total
+            if total:
+                print(
+                    f"[FillStore] {source.venue}/{stream}: 新增 {total} 条，"
+                    f"水位 {hwm} -> {new_hwm}，耗时 {time.time() - started:.2f}s"
+                )
+        return counts
+
+    def _refresh_orders(self, source: FillSource) -> int:
+        """重新拉取并覆盖写入尚未结束的订单，返回更新的行数"""
+        since_ns = time.time_ns() - int(self.open_order_max_age * 1_000_000_000)
+        open_orders = self._query(
+            "SELECT order_id, symbol, ts_ns FROM orders WHERE venue = ? AND account = ? AND ts_ns >= ?"
+            f" AND COALESCE(status, '') NOT IN ({', '.join('?' * len(FINAL_ORDER_STATUSES))})",
+            (source.venue, source.account, since_ns, *FINAL_ORDER_STATUSES),
+        )
+        total = 0
+        if open_orders:
+            for rows in source.refresh_orders(open_orders):
+                self.write(orders=rows)
+                total += len(rows)
+        return total
+
+    def _write_rows(self, is_fills: bool, rows: List[tuple], hwm=None):
+        if not rows and hwm is None:
+            return
+        if is_fills:
+            self.write(fills=rows, hwm=hwm)
+        else:
+            self.write(orders=rows, hwm=hwm)
+
+    # ---------- 查询 ----------
+
+    @staticmethod
+    def _where(venue=None, account=None, symbol=None, since=None, until=None) -> Tuple[str, list]:
+        clauses, args = [], []
+        for column, value in (("venue", venue), ("account", account), ("symbol", symbol)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        if since is not None:
+            clauses.append("ts_ns >= ?")
+            args.append(to_ns(since))
+        if until is not None:
+            clauses.append("ts_ns < ?")
+            args.append(to_ns(until))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def _query(self, sql: str, args: Sequence[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.execute(sql, args)
+            names = [d[0] for d in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    def fills(self, venue=None, account=None, symbol=None, since=None, until=None, limit=None) -> List[Dict[str, Any]]:
+        """按时间顺序返回成交明细"""
+        where, args = self._where(venue, account, symbol, since, until)
+        sql = f"SELECT * FROM fills{where} ORDER BY ts_ns"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        return self._query(sql, args)
+
+    def pnl_summary(self, venue=None, account=None, symbol=None, since=None, until=None) -> List[Dict[str, Any]]:
+        """
+        按交易所和交易对汇总成交
+
+        Returns:
+            每行包含 venue, symbol, fills, buy_qty, sell_qty, notional,
+            fees, realized_pnl, net_pnl（realized_pnl - fees）, first_ns, last_ns
+        """
+        where, args = self._where(venue, account, symbol, since, until)
+        return self._query(
+            "SELECT venue, symbol, COUNT(*) AS fills,"
+            " SUM(CASE WHEN side = 'buy' THEN qty ELSE 0 END) AS buy_qty,"
+            " SUM(CASE WHEN side = 'sell' THEN qty ELSE 0 END) AS sell_qty,"
+            " SUM(price * qty) AS notional,"
+            " COALESCE(SUM(fee), 0) AS fees,"
+            " COALESCE(SUM(realized_pnl), 0) AS realized_pnl,"
+            " COALESCE(SUM(realized_pnl), 0) - COALESCE(SUM(fee), 0) AS net_pnl,"
+            " MIN(ts_ns) AS first_ns, MAX(ts_ns) AS last_ns"
+            f" FROM fills{where} GROUP BY venue, symbol ORDER BY venue, symbol",
+            args,
+        )
+
+    def daily_pnl(self, venue=None, account=None, symbol=None, since=None, until=None) -> List[Dict[str, Any]]:
+        """按 UTC 日期汇总成交量、手续费和已实现盈亏"""
+        where, args = self._where(venue, account, symbol, since, until)
+        return self._query(
+            "SELECT date(ts_ns / 1000000000, 'unixepoch') AS day, venue, symbol,"
+            " COUNT(*) AS fills, SUM(price * qty) AS notional,"
+            " COALESCE(SUM(fee), 0) AS fees, COALESCE(SUM(realized_pnl), 0) AS realized_pnl"
+            f" FROM fills{where} GROUP BY day, venue, symbol ORDER BY day, venue, symbol",
+            args,
+        )
+
+    def fill_rate(self, venue=None, account=None, symbol=None, since=None, until=None) -> List[Dict[str, Any]]:
+        """
+        按交易所和交易对统计订单成交率
+
+        Returns:
+            每行包含 venue, symbol, orders, filled_orders（有成交的订单数）,
+            order_fill_rate（有成交订单占比）, qty, filled_qty, qty_fill_rate（成交数量占比）
+        """
+        where, args = self._where(venue, account, symbol, since, until)
+        return self._query(
+            "SELECT venue, symbol, COUNT(*) AS orders,"
+            " SUM(CASE WHEN filled_qty > 0 THEN 1 ELSE 0 END) AS filled_orders,"
+            " 1.0 * SUM(CASE WHEN filled_qty > 0 THEN 1 ELSE 0 END) / COUNT(*) AS order_fill_rate,"
+            " SUM(qty) AS qty, SUM(filled_qty) AS filled_qty,"
+            " SUM(filled_qty) / NULLIF(SUM(qty), 0) AS qty_fill_rate"
+            f" FROM orders{where} GROUP BY venue, symbol ORDER BY venue, symbol",
+            args,
+        )
+
+    def sync_state(self) -> List[Dict[str, Any]]:
+        """所有数据流的高水位和最后同步时间"""
+        return self._query("SELECT * FROM sync_state ORDER BY venue, account, stream", ())
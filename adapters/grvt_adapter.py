@@ -14,6 +14,11 @@ project_root = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, project_root)
 
 from adapters.base_adapter import BasePerpAdapter, Balance, Position, Order
+from adapters.credential_manager import CredentialManager
+from adapters.instruments import Instrument, instruments_from_grvt
+from adapters.normalizers import OrderNormalizer
+from adapters.metadata_cache import get_default_metadata_cache
+from adapters.transport import get_default_transport
 
 # 导入 GRVT 相关模块
 # 注意：将 src 目录添加到 sys.path 后直接导入模块名
@@ -22,7 +27,10 @@ if grvt_sdk_path not in sys.path:
     sys.path.insert(0, grvt_sdk_path)
 
 from pysdk.grvt_ccxt import GrvtCcxt
-from pysdk.grvt_ccxt_env import GrvtEnv
+from pysdk.grvt_ccxt_env import GrvtEnv, get_grvt_endpoint
+from pysdk.grvt_ccxt_utils import get_cookie_with_expiration, rand_uint32
+
+_ORDER_NORMALIZER = OrderNormalizer("grvt")
 
 
 class GrvtAdapter(BasePerpAdapter):
@@ -39,6 +47,19 @@ class GrvtAdapter(BasePerpAdapter):
                 - api_key: API Key（下单需要）
                 - trading_account_id: 交易账户ID（下单需要）
                 - private_key: 私钥（下单需要）
+                - auth_auto_refresh: 是否在后台提前刷新 session cookie（可选，默认 True）
+                - auth_refresh_ahead: 提前刷新的秒数（可选，默认 60）
+                - order_entry: 下单/撤单通道，"rest"（默认）或 "ws"（交易 RPC WebSocket，
+                  连接不可用或超时时自动回退 REST）
+                - ws_rpc_timeout: WS 请求等待确认的超时秒数（可选，默认 2）
+                - ws_connect_timeout: connect() 等待 WS 连接建立的秒数（可选，默认 10）
+                - endpoint_probe_interval: REST 接入点测速/保活间隔秒数（可选，默认 0 不启用）
+                - endpoints: 各类接入点的候选地址（可选），如
+                  {"trade_data": ["https://trades.grvt.io", ...], "market_data": [...], "edge": [...]}，
+                  按 RTT 选择最快的地址
+                - http2: REST 是否走 HTTP/2（可选，默认 False，需要 httpx[http2]）
+                - metadata_cache: 是否使用合约列表磁盘缓存（可选，默认 True），启用后创建客户端不再请求合约列表，
+                  过期的缓存在后台刷新
         """
         super().__init__(config)
         env_str = config.get("env", "prod").lower()
@@ -58,17 +79,136 @@ class GrvtAdapter(BasePerpAdapter):
         }
         
         # 初始化 GRVT 客户端
-        self.grvt_client = GrvtCcxt(env=self.env, parameters=parameters)
+        self.metadata_cache = get_default_metadata_cache() if config.get("metadata_cache", True) else None
+        # Session 带本账户的 cookie，每个客户端单独一个；连接池由共享传输层提供
+        self.grvt_client = GrvtCcxt(
+            env=self.env,
+            parameters=parameters,
+            session=get_default_transport().session(http2=bool(config.get("http2", False))),
+            metadata_cache=self.metadata_cache,
+        )
+        
+        self.auth_auto_refresh = bool(config.get("auth_auto_refresh", True))
+        self.auth_refresh_ahead = float(config.get("auth_refresh_ahead", 60))
+        self.credential_manager: Optional[CredentialManager] = None
+        
+        self.order_entry = str(config.get("order_entry", "rest")).lower()
+        if self.order_entry not in ("rest", "ws"):
+            raise ValueError(f"不支持的 order_entry: {self.order_entry}（可选 rest / ws）")
+        self.ws_orders = None  # GrvtWsOrderEntry，connect() 时创建
+        self.endpoint_probe_interval = float(config.get("endpoint_probe_interval", 0) or 0)
+        self.endpoints = None  # EndpointManager，connect() 时创建
     
     def connect(self) -> bool:
         """
         连接到 GRVT（获取价格不需要认证，直接返回成功）
         
+        配置了 api_key 时启动后台 cookie 刷新，下单/撤单不再同步等待认证。
+        
         Returns:
             bool: 连接是否成功
         """
+        if self.endpoint_probe_interval > 0 and self.endpoints is None:
+            self._start_endpoints()
+        if self.auth_auto_refresh and self.config.get("api_key") and self.credential_manager is None:
+            self._start_cookie_refresh()
+        if self.order_entry == "ws" and self.config.get("api_key") and self.ws_orders is None:
+            self._start_ws_orders()
         return True
     
+    def _start_endpoints(self):
+        """测速并预热 edge / trades / market-data 接入点（共用 SDK 的 Session），之后后台定期探测保活"""
+        from adapters.endpoints import EndpointManager
+        
+        from pysdk.grvt_ccxt_env import GrvtEndpointType, get_grvt_endpoint_domains, set_grvt_endpoint_domain
+        
+        candidates = self.config.get("endpoints") or {}
+        defaults = get_grvt_endpoint_domains(self.env.value)
+        manager = EndpointManager(interval=self.endpoint_probe_interval, session=self.grvt_client._session)
+        for key, endpoint_type in (
+            ("edge", GrvtEndpointType.EDGE),
+            ("trade_data", GrvtEndpointType.TRADE_DATA),
+            ("market_data", GrvtEndpointType.MARKET_DATA),
+        ):
+            urls = candidates.get(key) or [defaults[endpoint_type]]
+            # 测速前先使用第一个候选地址，与 EndpointManager 的初始选择一致
+            set_grvt_endpoint_domain(self.env.value, endpoint_type, urls[0])
+            manager.add_group(
+                key,
+                urls,
+                on_switch=lambda url, t=endpoint_type: set_grvt_endpoint_domain(self.env.value, t, url),
+            )
+        try:
+            manager.start()
+        except Exception as e:
+            print(f"[GRVT] 接入点测速启动失败: {e}")
+            return
+        self.endpoints = manager
+    
+    def _start_ws_orders(self):
+        """建立交易 RPC WebSocket 长连接，失败时继续使用 REST"""
+        from adapters.grvt_ws_orders import GrvtWsOrderEntry
+        
+        parameters = {
+            "api_key": self.config.get("api_key", ""),
+            "trading_account_id": self.config.get("trading_account_id", ""),
+            "private_key": self.config.get("private_key", ""),
+        }
+        self.ws_orders = GrvtWsOrderEntry(
+            self.env,
+            parameters,
+            timeout=float(self.config.get("ws_rpc_timeout", 2.0)),
+            connect_timeout=float(self.config.get("ws_connect_timeout", 10.0)),
+            metadata_cache=self.metadata_cache,
+        )
+        try:
+            connected = self.ws_orders.start()
+        except Exception as e:
+            print(f"[GRVT] WS 下单通道启动失败，使用 REST: {e}")
+            self.ws_orders = None
+            return
+        if connected:
+            print("[GRVT] WS 下单通道已连接")
+        else:
+            print("[GRVT] WS 下单通道尚未连接，后台重连中，期间使用 REST")
+    
+    def _fetch_cookie(self):
+        """获取新的 session cookie，返回 (cookie, 过期时间戳)"""
+        path = get_grvt_endpoint(self.env, "AUTH")
+        cookie = get_cookie_with_expiration(path, self.config.get("api_key", ""))
+        if not cookie:
+            raise Exception("GRVT 获取 cookie 失败")
+        return cookie, cookie.get("expires")
+    
+    def _start_cookie_refresh(self):
+        """把 cookie 生命周期交给后台凭证管理器"""
+        manager = CredentialManager()
+        current = self.grvt_client._cookie
+        manager.register(
+            "grvt_cookie",
+            refresh_fn=self._fetch_cookie,
+            refresh_ahead=self.auth_refresh_ahead,
+            on_refresh=self.grvt_client.set_cookie,
+            initial=current,
+            initial_expires_at=current.get("expires") if current else None,
+        )
+        self.grvt_client.set_external_cookie_refresh(True)
+        manager.start()
+        self.credential_manager = manager
+    
+    def close(self):
+        """停止后台凭证刷新（恢复请求前同步刷新 cookie）和接入点探测，关闭 WS 下单通道"""
+        if self.endpoints is not None:
+            self.endpoints.stop()
+            self.endpoints = None
+        if self.ws_orders is not None:
+            self.ws_orders.close()
+            self.ws_orders = None
+        if self.credential_manager is not None:
+            self.credential_manager.stop()
+            self.credential_manager = None
+            self.grvt_client.set_external_cookie_refresh(False)
+    
     def get_balance(self) -> Balance:
         """查询账户余额"""
         raise NotImplementedError("GRVT 余额查询功能待实现")
@@ -173,22 +313,55 @@ class GrvtAdapter(BasePerpAdapter):
         params = {"reduce_only": reduce_only}
         if client_order_id:
             params["client_order_id"] = client_order_id
+        elif self.ws_orders is not None:
+            # WS 超时回退 REST 时沿用同一个 client_order_id，交易所会拒绝重复订单，不会重复下单
+            params["client_order_id"] = rand_uint32()
         
-        # 下单
-        if order_type.lower() == "limit":
+        grvt_type = order_type.lower()
+        if grvt_type == "limit":
             if price is None:
                 raise ValueError("限价单必须提供价格")
-            result = self.grvt_client.create_limit_order(symbol, grvt_side, str(quantity), str(price), params)
-        elif order_type.lower() == "market":
-            result = self.grvt_client.create_order(symbol, "market", grvt_side, str(quantity), None, params)
+            price_str = str(price)
+        elif grvt_type == "market":
+            price_str = None
         else:
             raise ValueError(f"不支持的订单类型: {order_type}")
         
+        result = None
+        if self.ws_orders is not None:
+            result = self._place_order_ws(symbol, grvt_type, grvt_side, str(quantity), price_str, params)
+        if result is None:
+            result = self.grvt_client.create_order(symbol, grvt_type, grvt_side, str(quantity), price_str, params)
+        
         if not result:
             raise Exception("下单失败：返回结果为空")
         
         return self._grvt_order_to_order(result, symbol)
     
+    def _place_order_ws(self, symbol, order_type, side, quantity, price, params) -> Optional[dict]:
+        """
+        通过 WS 下单，返回订单；连接不可用或结果未知（超时）时返回 None 由调用方回退 REST
+        
+        交易所拒单（GrvtRpcError）直接抛出，不回退。
+        """
+        from adapters.grvt_ws_orders import GrvtRpcError, GrvtRpcTimeout, GrvtRpcUnavailable
+        
+        try:
+            return self.ws_orders.create_order(symbol, order_type, side, quantity, price, params)
+        except GrvtRpcError as e:
+            raise Exception(f"GRVT 下单被拒绝: {e}")
+        except GrvtRpcTimeout as e:
+            print(f"[GRVT] WS 下单超时，按 client_order_id 确认后回退 REST: {e}")
+            try:
+                existing = self.grvt_client.fetch_order(params={"client_order_id": params["client_order_id"]})
+            except Exception:
+                existing = None
+            if existing and existing.get("result"):
+                return existing["result"]
+        except GrvtRpcUnavailable as e:
+            print(f"[GRVT] WS 下单通道不可用，回退 REST: {e}")
+        return None
+    
     def cancel_order(
         self,
         order_id: Optional[str] = None,
@@ -198,6 +371,9 @@ class GrvtAdapter(BasePerpAdapter):
         """撤单
         
         注意：GRVT 的 order_id 实际上是 client_order_id，所以优先使用 client_order_id
+        
+        Returns:
+            bool: 交易所确认撤单时返回 True，拒绝或未确认时返回 False（WS 与 REST 通道相同）
         """
         params = {}
         # 优先使用 client_order_id，如果没有则使用 order_id（在 GRVT 中，order_id 就是 client_order_id）
@@ -206,8 +382,29 @@ class GrvtAdapter(BasePerpAdapter):
         elif order_id:
             params["client_order_id"] = order_id
         
+        if self.ws_orders is not None:
+            acked = self._cancel_ws(self.ws_orders.cancel_order, params)
+            if acked is not None:
+                return acked
         return self.grvt_client.cancel_order(id=None, symbol=symbol, params=params)
     
+    def _cancel_ws(self, cancel_fn, params: dict) -> Optional[bool]:
+        """
+        通过 WS 撤单，返回交易所是否确认；连接不可用或超时时返回 None 由调用方回退 REST（撤单可安全重发）
+        
+        交易所拒绝（GrvtRpcError）时返回 False，与 REST 未确认时的返回值一致，不回退 REST。
+        """
+        from adapters.grvt_ws_orders import GrvtRpcError, GrvtRpcUnavailable
+        
+        try:
+            return cancel_fn(params)
+        except GrvtRpcError as e:
+            print(f"[GRVT] WS 撤单被拒绝: {e}")
+            return False
+        except GrvtRpcUnavailable as e:
+            print(f"[GRVT] WS 撤单失败，回退 REST: {e}")
+            return None
+    
     def cancel_orders_by_ids(
         self,
         order_id_list: List[int],
@@ -233,7 +430,7 @@ class GrvtAdapter(BasePerpAdapter):
         self,
         symbol: Optional[str] = None,
     ) -> bool:
-        """撤销所有订单"""
+        """撤销所有订单（交易所拒绝或未确认时返回 False，同 cancel_order）"""
         params = {}
         if symbol:
             # 从 symbol 中提取 base 和 quote，例如 "BTC_USDT_Perp" -> base="BTC", quote="USDT"
@@ -243,6 +440,10 @@ class GrvtAdapter(BasePerpAdapter):
                 params["quote"] = parts[1]
             params["kind"] = "PERPETUAL"
         
+        if self.ws_orders is not None:
+            acked = self._cancel_ws(self.ws_orders.cancel_all_orders, params)
+            if acked is not None:
+                return acked
         return self.grvt_client.cancel_all_orders(params=params)
     
     def get_order(
@@ -251,7 +452,7 @@ class GrvtAdapter(BasePerpAdapter):
         symbol: Optional[str] = None,
         client_order_id: Optional[str] = None,
     ) -> Optional[Order]:
-        """查询订单状态"""
+        """查询订单状态（含成交数量和状态），订单不存在时返回 None"""
         params = {}
         if client_order_id:
             params["client_order_id"] = client_order_id
@@ -261,23 +462,14 @@ class GrvtAdapter(BasePerpAdapter):
             return None
         
         order_data = result.get("result", {})
-        legs = order_data.get("legs", [])
-        if not legs:
+        if not order_data.get("legs"):
             return None
-        
-        leg = legs[0]
-        metadata = order_data.get("metadata", {})
-        
-        return Order(
-            order_id=str(metadata.get("client_order_id", order_id or "")),
-            symbol=leg.get("instrument", symbol or ""),
-            side="buy" if leg.get("is_buying_asset") else "sell",
-            order_type="market" if order_data.get("is_market") else "limit",
-            quantity=Decimal(str(leg.get("size", 0))),
-            price=Decimal(str(leg.get("limit_price", 0))) if leg.get("limit_price") else None,
-            status="pending",  # 可以根据订单状态进一步判断
-            created_at=int(time.time() * 1000),
-        )
+        return _ORDER_NORMALIZER.order(order_data)
+    
+    def load_instruments(self) -> List[Instrument]:
+        """从 GRVT 永续合约列表加载精度（tick_size / min_size）"""
+        markets = self.grvt_client.markets or self.grvt_client.load_markets()
+        return instruments_from_grvt(markets)
     
     def get_open_orders(
         self,
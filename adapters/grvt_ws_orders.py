@@ -0,0 +1,181 @@
+"""
+GRVT WebSocket Order Entry
+
+通过 GRVT 交易 RPC WebSocket（TRADE_DATA_RPC_FULL）下单/撤单：一条 WS 消息发出、一条 WS 消息确认，
+省去 REST 每次请求的 HTTP 往返。
+
+后台线程（LoopThread）运行独立的事件循环，持有一个已认证（session cookie）的 GrvtCcxtWS 长连接（SDK 负责断线重连，
+本模块定期检查 cookie 过期并刷新，保证重连时带有效 cookie）。请求按 JSON-RPC id 与响应对应
+（GrvtCcxtWS.rpc_call），同步调用方通过 run_coroutine_threadsafe 等待结果。
+
+失败语义（由调用方决定是否回退 REST）:
+    GrvtRpcError        交易所返回错误（参数、保证金不足等），不应回退重试
+    GrvtRpcUnavailable  连接不可用或已断开，请求未送达或结果未知
+    GrvtRpcTimeout      超时未收到响应（GrvtRpcUnavailable 的子类），请求可能已被执行
+
+使用示例:
+    entry = GrvtWsOrderEntry(GrvtEnv.PROD, {"api_key": ..., "trading_account_id": ..., "private_key": ...})
+    entry.start()
+    order = entry.create_order("BTC_USDT_Perp", "limit", "buy", "0.01", "68000", {"client_order_id": 123})
+    entry.cancel_order({"client_order_id": 123})
+    entry.close()
+"""
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Optional
+
+project_root = os.path.join(os.path.dirname(__file__), '..')
+grvt_sdk_path = os.path.join(project_root, 'exchange', 'exchange_grvt', 'src')
+if grvt_sdk_path not in sys.path:
+    sys.path.insert(0, grvt_sdk_path)
+
+from pysdk.grvt_ccxt_env import GrvtEnv, GrvtWSEndpointType
+from pysdk.grvt_ccxt_types import GrvtRpcError, GrvtRpcTimeout, GrvtRpcUnavailable
+from pysdk.grvt_ccxt_ws import GrvtCcxtWS
+
+from adapters.loop_thread import LoopThread
+from adapters.transport import get_default_transport
+
+RPC_ENDPOINT = GrvtWSEndpointType.TRADE_DATA_RPC_FULL
+
+__all__ = ["GrvtWsOrderEntry", "GrvtRpcError", "GrvtRpcTimeout", "GrvtRpcUnavailable"]
+
+
+def _unwrap(result: Any) -> Dict[str, Any]:
+    """RPC 响应的 result 与 REST 响应体一致，形如 {"result": {...}}"""
+    if not isinstance(result, dict):
+        return {}
+    inner = result.get("result")
+    return inner if isinstance(inner, dict) else result
+
+
+class GrvtWsOrderEntry:
+    """
+    GRVT WS 下单通道（后台线程 + 事件循环 + 单条交易 RPC 连接）
+
+    Args:
+        env: GRVT 环境
+        parameters: api_key / trading_account_id / private_key（与 GrvtCcxt 相同）
+        timeout: 单个请求等待确认的超时（秒）
+        connect_timeout: start() 等待连接建立的超时（秒）
+        cookie_check_interval: 检查 cookie 过期的间隔（秒）
+        metadata_cache: 元数据缓存（可选），有缓存时初始化不再请求合约列表
+    """
+
+    def __init__(
+        self,
+        env: GrvtEnv,
+        parameters: Dict[str, Any],
+        timeout: float = 2.0,
+        connect_timeout: float = 10.0,
+        cookie_check_interval: float = 5.0,
+        metadata_cache: Any = None,
+    ):
+        self.env = env
+        self.parameters = dict(parameters, endpoint_types=[RPC_ENDPOINT])
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.cookie_check_interval = cookie_check_interval
+        self.metadata_cache = metadata_cache
+        self.client: Optional[GrvtCcxtWS] = None
+        self._loop_thread = LoopThread("grvt-ws-orders")
+
+    # ---------- 生命周期 ----------
+
+    def start(self) -> bool:
+        """启动后台线程并等待交易 RPC 连接建立，返回是否已连接（未连接时 SDK 仍会在后台重连）"""
+        if self._loop_thread.running:
+            return self.connected
+        deadline = time.time() + self.connect_timeout
+        self._loop_thread.start()
+        try:
+            self._loop_thread.run(self._create_client(), self.connect_timeout)
+        except BaseException:
+            self._loop_thread.stop()
+            raise
+        self._loop_thread.submit(self._maintain())
+        while not self.connected and time.time() < deadline:
+            time.sleep(0.05)
+        return self.connected
+
+    async def _create_client(self) -> None:
+        # GrvtCcxtWS 构造时同步获取 cookie，并创建 aiohttp 会话和读消息任务，需要在运行中的 loop 内执行
+        self.client = GrvtCcxtWS(
+            self.env,
+            asyncio.get_running_loop(),
+            parameters=self.parameters,
+            session=get_default_transport().async_session(),
+            metadata_cache=self.metadata_cache,
+        )
+
+    async def _maintain(self) -> None:
+        """加载合约（签名需要）并启动 SDK 重连循环，之后定期刷新 cookie"""
+        while True:
+            try:
+                await self.client.initialize()
+                break
+            except Exception as e:
+                print(f"[GRVT-WS] 初始化失败，稍后重试: {e}")
+                await asyncio.sleep(self.cookie_check_interval)
+        while True:
+            await asyncio.sleep(self.cookie_check_interval)
+            try:
+                await self.client.refresh_cookie()
+            except Exception as e:
+                print(f"[GRVT-WS] 刷新 cookie 失败: {e}")
+
+    @property
+    def connected(self) -> bool:
+        """交易 RPC 连接是否可用（合约已加载且连接已打开）"""
+        client = self.client
+        return client is not None and bool(client.markets) and client.is_connection_open(RPC_ENDPOINT)
+
+    def close(self) -> None:
+        """关闭连接并停止后台线程（SDK 的读消息/重连任务随之取消）"""
+        if self._loop_thread.running:
+            self._loop_thread.stop(self._shutdown() if self.client is not None else None)
+
+    async def _shutdown(self) -> None:
+        """在事件循环内关闭连接和 HTTP 会话"""
+        await self.client._close_connection(RPC_ENDPOINT)
+        await self.client._session.close()
+
+    # ---------- 请求 ----------
+
+    def _call(self, coro_fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """在后台事件循环上执行 RPC 并同步等待结果"""
+        if not self.connected:
+            raise GrvtRpcUnavailable("GRVT 交易 RPC 连接不可用")
+        try:
+            # rpc_call 自身在 timeout 后抛出 GrvtRpcTimeout，这里多留一点余量给线程切换
+            return self._loop_thread.run(coro_fn(*args, timeout=self.timeout, **kwargs), self.timeout + 1.0)
+        except TimeoutError as e:
+            raise GrvtRpcTimeout(f"GRVT 交易 RPC {self.timeout}s 内未响应") from e
+
+    def create_order(
+        self,
+        symbol: str,
+        order_type: str,
+        side: str,
+        amount: Any,
+        price: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """下单，返回交易所确认的订单（与 REST create_order 的返回格式相同）"""
+        result = self._call(self.client.rpc_create_order, symbol, order_type, side, amount, price, params or {})
+        order = _unwrap(result)
+        if not order:
+            raise GrvtRpcError(f"下单响应为空: {result}")
+        return order
+
+    def cancel_order(self, params: Dict[str, Any], order_id: Optional[str] = None) -> bool:
+        """撤单（params 中给 client_order_id 或传 order_id），返回交易所是否确认"""
+        result = self._call(self.client.rpc_cancel_order, order_id, None, params)
+        return bool(_unwrap(result).get("ack"))
+
+    def cancel_all_orders(self, params: Optional[Dict[str, Any]] = None) -> bool:
+        """撤销子账户全部订单（params 同 REST cancel_all_orders），返回交易所是否确认"""
+        result = self._call(self.client.rpc_cancel_all_orders, params or {})
+        return bool(_unwrap(result).get("ack"))
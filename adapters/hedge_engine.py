@@ -0,0 +1,574 @@
+"""
+Cross-Venue Hedge Engine
+跨交易所对冲引擎
+
+基于 BasePerpAdapter 的 API 对冲：主腿（primary）上的成交改变持仓后，立即在对冲腿（hedge）上
+下反向市价单，使 ratio * 主腿持仓 + 对冲腿持仓 回到 0。取代 nado_var.check_and_adjust_hedge
+那种从浏览器页面抓取持仓文本再点击调整的方式。
+
+净敞口视图:
+    positions[venue]  两条腿的最新持仓（带符号），由持仓推送（on_position，绝对值）或成交回调（on_fill，增量）更新
+    in_flight         已发出、尚未在对冲腿持仓中体现的对冲数量（带符号），避免重复下单
+    缺口 = -ratio * 主腿持仓 - (对冲腿持仓 + in_flight)，按对冲腿合约的 lot 向下取整，不足最小下单量时不下单
+
+推送事件只唤醒后台线程，下单在后台线程中执行，不阻塞推送回调；定期通过 REST get_positions 校准
+（推送丢失、部分成交时由校准补齐）。REST 持仓可能落后于推送：取数期间该腿有推送/成交时丢弃该腿的结果，
+对冲腿只在最近一笔对冲单发出超过 settle 秒后才采用 REST 持仓，此时仍未体现的 in_flight 视为已失效。
+
+对冲延迟指标（stats()，毫秒）:
+    feed     交易所事件时间 -> 引擎收到（推送带时间戳时）
+    react    引擎收到 -> 发出对冲单
+    ack      发出对冲单 -> 交易所确认
+    total    引擎收到 -> 交易所确认
+
+使用示例:
+    engine = HedgeEngine(standx_adapter, grvt_adapter, "BTC-USD", "BTC_USDT_Perp")
+    engine.start()                                   # 读取初始持仓，启动对冲线程
+    feeds = [
+        StandXPositionFeed(engine, "primary", standx_adapter, "BTC-USD"),
+        GrvtPositionFeed(engine, "hedge", grvt_adapter, "BTC_USDT_Perp"),
+    ]
+    for feed in feeds:
+        feed.start()
+    ...
+    print(engine.stats())
+    engine.stop()
+
+命令行（在项目根目录，读取策略配置 exchanges 段）:
+    python -m adapters.hedge_engine --config strategys/strategy_common/config.yaml \\
+        --primary standx:BTC-USD --hedge grvt:BTC_USDT_Perp
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from adapters.base_adapter import BasePerpAdapter
+from adapters.loop_thread import LoopThread
+from adapters.metrics import percentile
+from adapters.transport import get_default_transport
+
+VENUES = ("primary", "hedge")
+ZERO = Decimal("0")
+
+
+def _decimal(value: Any) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _signed(position) -> Decimal:
+    """Position（size 为绝对值）-> 带符号的持仓"""
+    if position is None:
+        return ZERO
+    size = abs(_decimal(position.size))
+    return -size if position.side in ("short", "sell") else size
+
+
+class HedgeEngine:
+    """
+    跨交易所对冲引擎（主腿成交 -> 对冲腿反向市价单）
+
+    Args:
+        primary: 主腿适配器（策略下单的交易所）
+        hedge: 对冲腿适配器（引擎下单的交易所）
+        primary_symbol: 主腿交易对
+        hedge_symbol: 对冲腿交易对（默认与主腿相同）
+        ratio: 对冲比例，对冲腿目标持仓 = -ratio * 主腿持仓
+        max_order_qty: 单笔对冲单的最大数量（None 不限制），超过时分多笔
+        settle: 对冲单发出后等待持仓推送体现的时间（秒），未超过时校准不采用对冲腿的 REST 持仓，超过时 in_flight 清零
+        reconcile_interval: REST 校准持仓的间隔（秒），0 表示不校准
+        retry_delay: 下单失败后的重试间隔（秒）
+        history: 保留的延迟样本数
+    """
+
+    def __init__(
+        self,
+        primary: BasePerpAdapter,
+        hedge: BasePerpAdapter,
+        primary_symbol: str,
+        hedge_symbol: Optional[str] = None,
+        ratio: Any = 1,
+        max_order_qty: Any = None,
+        settle: float = 2.0,
+        reconcile_interval: float = 5.0,
+        retry_delay: float = 0.5,
+        history: int = 1000,
+    ):
+        self.adapters = {"primary": primary, "hedge": hedge}
+        self.symbols = {"primary": primary_symbol, "hedge": hedge_symbol or primary_symbol}
+        self.ratio = _decimal(ratio)
+        self.max_order_qty = _decimal(max_order_qty) if max_order_qty is not None else None
+        self.settle = settle
+        self.reconcile_interval = reconcile_interval
+        self.retry_delay = retry_delay
+        self.instrument = hedge.get_instrument(self.symbols["hedge"])
+
+        self.positions: Dict[str, Decimal] = {venue: ZERO for venue in VENUES}
+        self._seqs: Dict[str, int] = {venue: 0 for venue in VENUES}   # 每条腿的持仓变化次数，校准时判断 REST 是否过期
+        self.in_flight = ZERO
+        self._in_flight_at = 0.0
+        self._event_at: Optional[float] = None   # 最早一个尚未处理的持仓变化的收到时间
+        self._exposed_since: Optional[float] = None
+        self._retry_at = 0.0
+        self._dirty = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self.orders = 0
+        self.errors = 0
+        self.events = 0
+        self.reconciles = 0
+        self.last_error: Optional[str] = None
+        self._lags = {name: deque(maxlen=history) for name in ("feed", "react", "ack", "total")}
+
+    # ---------- 事件输入（任意线程） ----------
+
+    def on_position(self, venue: str, size: Any, event_time: Optional[float] = None) -> None:
+        """
+        持仓推送：venue 的最新持仓（带符号，空头为负）
+
+        Args:
+            event_time: 交易所事件时间（Unix 秒），用于统计推送延迟
+        """
+        now = time.monotonic()
+        size = _decimal(size)
+        with self._cond:
+            delta = size - self.positions[venue]
+            if not delta:
+                return
+            self.positions[venue] = size
+            self._apply(venue, delta, now, event_time)
+
+    def on_fill(self, venue: str, side: str, qty: Any, event_time: Optional[float] = None) -> None:
+        """成交回调：venue 上一笔成交（side 为 buy/sell 或 long/short）"""
+        now = time.monotonic()
+        qty = abs(_decimal(qty))
+        delta = -qty if side.lower() in ("sell", "short") else qty
+        if not delta:
+            return
+        with self._cond:
+            self.positions[venue] += delta
+            self._apply(venue, delta, now, event_time)
+
+    def _apply(self, venue: str, delta: Decimal, now: float, event_time: Optional[float]) -> None:
+        """持仓变化后更新 in_flight、记录事件时间并唤醒对冲线程（持有锁时调用）"""
+        self.events += 1
+        self._seqs[venue] += 1
+        if event_time:
+            self._lags["feed"].append(max(time.time() - event_time, 0.0) * 1000)
+        if venue == "hedge" and self.in_flight and (delta > 0) == (self.in_flight > 0):
+            # 对冲腿的持仓变化先抵扣在途的对冲单
+            consumed = min(abs(delta), abs(self.in_flight))
+            self.in_flight -= consumed if self.in_flight > 0 else -consumed
+        if self._event_at is None:
+            self._event_at = now
+        self._dirty = True
+        self._cond.notify()
+
+    # ---------- 净敞口 ----------
+
+    def _gap(self) -> Decimal:
+        """对冲腿还需要成交的数量（带符号，持有锁时调用）"""
+        target = -self.ratio * self.positions["primary"]
+        return target - self.positions["hedge"] - self.in_flight
+
+    def net_exposure(self) -> Decimal:
+        """当前净敞口（以对冲腿数量计，不含在途对冲单）"""
+        with self._cond:
+            return self.ratio * self.positions["primary"] + self.positions["hedge"]
+
+    # ---------- 生命周期 ----------
+
+    def start(self) -> None:
+        """读取两条腿的初始持仓并启动对冲线程（初始已有的敞口也会被对冲）"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.reconcile(force=True)
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="hedge-engine", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def reconcile(self, force: bool = False) -> None:
+        """
+        通过 REST 校准两条腿的持仓；force 时同时清空 in_flight
+
+        取数期间有持仓推送/成交的腿丢弃本次 REST 结果（推送更新）；对冲腿在最近一笔对冲单发出后
+        settle 秒内不采用 REST 持仓，否则对冲单的成交推送先到、REST 还未体现时会重新打开缺口、重复下单。
+        """
+        with self._cond:
+            seqs = dict(self._seqs)
+            started = time.monotonic()
+        fetched = {}
+        for venue in VENUES:
+            symbol = self.symbols[venue]
+            fetched[venue] = _signed(self.adapters[venue].get_position(symbol))
+        now = time.monotonic()
+        with self._cond:
+            self.reconciles += 1
+            # 取数期间发出的对冲单会把 _in_flight_at 推到 started 之后
+            settled = force or started - self._in_flight_at >= self.settle
+            if settled:
+                self.in_flight = ZERO
+            for venue in VENUES:
+                if self._seqs[venue] != seqs[venue] or (venue == "hedge" and not settled):
+                    continue
+                if fetched[venue] != self.positions[venue]:
+                    self.positions[venue] = fetched[venue]
+                    self._event_at = self._event_at or now
+            self._dirty = True
+            self._cond.notify()
+
+    # ---------- 对冲线程 ----------
+
+    def _run(self) -> None:
+        next_reconcile = time.monotonic() + self.reconcile_interval
+        while True:
+            with self._cond:
+                while not self._stopping:
+                    now = time.monotonic()
+                    wake_at = next_reconcile if self.reconcile_interval > 0 else None
+                    if self._dirty:
+                        if now >= self._retry_at:
+                            break
+                        wake_at = min(wake_at, self._retry_at) if wake_at else self._retry_at
+                    if wake_at is not None and now >= wake_at:
+                        break
+                    self._cond.wait(None if wake_at is None else wake_at - now)
+                if self._stopping:
+                    return
+                order = self._next_order() if time.monotonic() >= self._retry_at else None
+            if order is not None:
+                self._send(*order)
+            if self.reconcile_interval > 0 and time.monotonic() >= next_reconcile:
+                next_reconcile = time.monotonic() + self.reconcile_interval
+                try:
+                    self.reconcile()
+                except Exception as e:
+                    self.last_error = f"校准持仓失败: {e}"
+                    print(f"[对冲] {self.last_error}")
+
+    def _next_order(self):
+        """计算下一笔对冲单，并在发出前计入 in_flight（持有锁时调用）"""
+        self._dirty = False
+        gap = self._gap()
+        lots = self.instrument.qty_to_lots(abs(gap))
+        if self.max_order_qty is not None:
+            lots = min(lots, self.instrument.qty_to_lots(self.max_order_qty))
+        now = time.monotonic()
+        if lots < max(self.instrument.min_lots, 1):
+            # 剩余缺口不足一笔最小下单量，视为已对冲
+            self._event_at = None
+            self._exposed_since = None
+            return None
+        if self._exposed_since is None:
+            self._exposed_since = self._event_at or now
+        qty = self.instrument.lots_to_qty(lots)
+        side = "buy" if gap > 0 else "sell"
+        self.in_flight += qty if gap > 0 else -qty
+        self._in_flight_at = now
+        event_at, self._event_at = self._event_at, None
+        # 一次只下一笔，剩余缺口（分笔 / 期间新成交）在下一轮处理
+        self._dirty = True
+        return side, qty, event_at or now
+
+    def _send(self, side: str, qty: Decimal, event_at: float) -> None:
+        sent_at = time.monotonic()
+        try:
+            self.adapters["hedge"].place_order(
+                symbol=self.symbols["hedge"],
+                side=side,
+                order_type="market",
+                quantity=qty,
+                time_in_force="ioc",
+            )
+        except Exception as e:
+            with self._cond:
+                self.in_flight -= qty if side == "buy" else -qty
+                self.errors += 1
+                self.last_error = str(e)
+                self._event_at = self._event_at or event_at
+                self._retry_at = time.monotonic() + self.retry_delay
+                self._dirty = True
+            print(f"❌ [对冲] {side} {qty} {self.symbols['hedge']} 失败: {e}")
+            return
+        acked_at = time.monotonic()
+        with self._cond:
+            self.orders += 1
+            self._in_flight_at = acked_at
+            self._lags["react"].append((sent_at - event_at) * 1000)
+            self._lags["ack"].append((acked_at - sent_at) * 1000)
+            self._lags["total"].append((acked_at - event_at) * 1000)
+
+    # ---------- 指标 ----------
+
+    def stats(self) -> Dict[str, Any]:
+        """净敞口、计数和对冲延迟分位数（毫秒）"""
+        with self._cond:
+            lags = {name: list(values) for name, values in self._lags.items()}
+            exposed_since = self._exposed_since
+            result = {
+                "primary_position": str(self.positions["primary"]),
+                "hedge_position": str(self.positions["hedge"]),
+                "in_flight": str(self.in_flight),
+                "net_exposure": str(self.ratio * self.positions["primary"] + self.positions["hedge"]),
+                "orders": self.orders,
+                "errors": self.errors,
+                "events": self.events,
+                "reconciles": self.reconciles,
+                "last_error": self.last_error,
+            }
+        result["unhedged_for"] = round(time.monotonic() - exposed_since, 3) if exposed_since else 0.0
+        for name, values in lags.items():
+            result[f"{name}_ms"] = {
+                "p50": percentile(values, 0.5),
+                "p99": percentile(values, 0.99),
+                "max": round(max(values), 3) if values else None,
+                "count": len(values),
+            }
+        return result
+
+
+# ---------- 持仓推送 ----------
+
+class StandXPositionFeed:
+    """
+    StandX 持仓推送（ws-stream position 频道）-> HedgeEngine.on_position
+
+    Args:
+        engine: 对冲引擎
+        venue: "primary" 或 "hedge"
+        adapter: 已 connect 的 StandXAdapter（使用其 JWT，刷新后重连时自动使用新 token）
+        symbol: 交易对
+        url: 行情 WebSocket 地址（默认由适配器 base_url 推导）
+    """
+
+    def __init__(self, engine: HedgeEngine, venue: str, adapter, symbol: str, url: Optional[str] = None):
+        from exchange.exchange_standx.standx_protocol.perps_wss import StandXMarketStream
+
+        if not url:
+            host = adapter.base_url.rstrip("/").split("://", 1)[-1]
+            url = f"{'ws' if adapter.base_url.startswith('http://') else 'wss'}://{host}/ws-stream/v1"
+        self.engine = engine
+        self.venue = venue
+        self.adapter = adapter
+        self.symbol = symbol
+        # position 是私有频道，队列不设上限，每条持仓更新都会按顺序送达
+        self.stream = StandXMarketStream(url, token_getter=lambda: adapter.token)
+        self._loop_thread = LoopThread("standx-positions")
+
+    def start(self, timeout: float = 10.0) -> None:
+        self._loop_thread.start()
+        try:
+            self._loop_thread.run(self._connect(), timeout)
+        except BaseException:
+            self._loop_thread.stop(self.stream.close())
+            raise
+
+    async def _connect(self) -> None:
+        await self.stream.connect()
+        await self.stream.authenticate(self.adapter.token)
+        await self.stream.subscribe("position", self.symbol, self._on_position)
+
+    def _on_position(self, message: Dict[str, Any]) -> None:
+        data = message.get("data") or {}
+        if data.get("symbol", self.symbol) != self.symbol:
+            return
+        self.engine.on_position(self.venue, data.get("qty") or "0")
+
+    def close(self) -> None:
+        if self._loop_thread.running:
+            self._loop_thread.stop(self.stream.close())
+
+
+class GrvtPositionFeed:
+    """
+    GRVT 持仓推送（TRADE_DATA position 流）-> HedgeEngine.on_position
+
+    Args:
+        engine: 对冲引擎
+        venue: "primary" 或 "hedge"
+        adapter: GrvtAdapter（使用其环境和 API Key 配置）
+        instrument: 合约，如 BTC_USDT_Perp
+        cookie_check_interval: 检查 cookie 过期的间隔（秒）
+    """
+
+    def __init__(self, engine: HedgeEngine, venue: str, adapter, instrument: str, cookie_check_interval: float = 5.0):
+        self.engine = engine
+        self.venue = venue
+        self.adapter = adapter
+        self.instrument = instrument
+        self.cookie_check_interval = cookie_check_interval
+        self.client = None
+        self._loop_thread = LoopThread("grvt-positions")
+
+    def start(self, timeout: float = 10.0) -> None:
+        self._loop_thread.start()
+        try:
+            self._loop_thread.run(self._connect(), timeout)
+        except BaseException:
+            self._loop_thread.stop()
+            raise
+        self._loop_thread.submit(self._maintain())
+
+    async def _connect(self) -> None:
+        from pysdk.grvt_ccxt_env import GrvtWSEndpointType
+        from pysdk.grvt_ccxt_ws import GrvtCcxtWS
+
+        config = self.adapter.config
+        self.client = GrvtCcxtWS(
+            self.adapter.env,
+            asyncio.get_running_loop(),
+            parameters={
+                "api_key": config.get("api_key", ""),
+                "trading_account_id": config.get("trading_account_id", ""),
+                "private_key": config.get("private_key", ""),
+                "endpoint_types": [GrvtWSEndpointType.TRADE_DATA],
+            },
+            session=get_default_transport().async_session(),
+            metadata_cache=self.adapter.metadata_cache,
+        )
+        await self.client.initialize()
+        await self.client.subscribe("position", self._on_position, params={"instrument": self.instrument})
+
+    async def _maintain(self) -> None:
+        """定期刷新 cookie，保证 SDK 重连时带有效 cookie"""
+        while True:
+            await asyncio.sleep(self.cookie_check_interval)
+            try:
+                await self.client.refresh_cookie()
+            except Exception as e:
+                print(f"[对冲] GRVT 刷新 cookie 失败: {e}")
+
+    async def _on_position(self, message: Dict[str, Any]) -> None:
+        feed = message.get("feed") or {}
+        if feed.get("instrument", self.instrument) != self.instrument:
+            return
+        event_time = feed.get("event_time")
+        self.engine.on_position(
+            self.venue,
+            feed.get("size") or "0",
+            event_time=int(event_time) / 1e9 if event_time else None,
+        )
+
+    def close(self) -> None:
+        if self._loop_thread.running:
+            self._loop_thread.stop(self._shutdown() if self.client is not None else None)
+
+    async def _shutdown(self) -> None:
+        from pysdk.grvt_ccxt_env import GrvtWSEndpointType
+
+        await self.client._close_connection(GrvtWSEndpointType.TRADE_DATA)
+        await self.client._session.close()
+
+
+def position_feed(engine: HedgeEngine, venue: str):
+    """按适配器类型创建持仓推送（不支持的交易所返回 None，只靠 REST 校准）"""
+    adapter = engine.adapters[venue]
+    symbol = engine.symbols[venue]
+    if adapter.exchange_name == "standx":
+        return StandXPositionFeed(engine, venue, adapter, symbol)
+    if adapter.exchange_name == "grvt":
+        return GrvtPositionFeed(engine, venue, adapter, symbol)
+    return None
+
+
+# ---------- 命令行 ----------
+
+def _leg(value: str):
+    name, _, symbol = value.partition(":")
+    if not symbol:
+        raise argparse.ArgumentTypeError(f"格式应为 交易所:交易对，如 standx:BTC-USD（收到 {value}）")
+    return name, symbol
+
+
+def main():
+    import yaml
+    from adapters.factory import create_adapter
+
+    parser = argparse.ArgumentParser(description="跨交易所对冲：主腿成交 -> 对冲腿反向市价单")
+    parser.add_argument('--config', default="strategys/strategy_common/config.yaml", help="策略配置文件（读取 exchanges 段）")
+    parser.add_argument('--primary', type=_leg, required=True, help="主腿，如 standx:BTC-USD")
+    parser.add_argument('--hedge', type=_leg, required=True, help="对冲腿，如 grvt:BTC_USDT_Perp")
+    parser.add_argument('--ratio', default="1", help="对冲比例")
+    parser.add_argument('--max-order-qty', default=None, help="单笔对冲单最大数量")
+    parser.add_argument('--reconcile-interval', type=float, default=5.0, help="REST 校准持仓间隔（秒）")
+    parser.add_argument('--stats-interval', type=float, default=60, help="打印统计的间隔（秒）")
+    args = parser.parse_args()
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        exchanges = (yaml.safe_load(f) or {}).get("exchanges", {})
+    adapters = {}
+    for venue, (name, _) in (("primary", args.primary), ("hedge", args.hedge)):
+        if name not in exchanges:
+            raise SystemExit(f"配置中没有交易所 {name}")
+        adapters[venue] = create_adapter(exchanges[name])
+        adapters[venue].connect()
+
+    engine = HedgeEngine(
+        adapters["primary"],
+        adapters["hedge"],
+        args.primary[1],
+        args.hedge[1],
+        ratio=args.ratio,
+        max_order_qty=args.max_order_qty,
+        reconcile_interval=args.reconcile_interval,
+    )
+    engine.start()
+    feeds = []
+    for venue in VENUES:
+        feed = position_feed(engine, venue)
+        if feed is None:
+            print(f"⚠️ {adapters[venue].exchange_name} 没有持仓推送，只按 {args.reconcile_interval}s 间隔校准")
+            continue
+        try:
+            feed.start()
+            feeds.append(feed)
+        except Exception as e:
+            print(f"❌ {adapters[venue].exchange_name} 持仓推送启动失败，只靠 REST 校准: {e}")
+    print(f"[对冲] {args.primary[0]}:{args.primary[1]} -> {args.hedge[0]}:{args.hedge[1]} 已启动")
+    try:
+        while True:
+            time.sleep(args.stats_interval)
+            stats = engine.stats()
+            print(
+                f"[对冲] {time.strftime('%H:%M:%S')} 净敞口 {stats['net_exposure']} 在途 {stats['in_flight']} "
+                f"下单 {stats['orders']} 失败 {stats['errors']} "
+                f"延迟 p50/p99 {stats['total_ms']['p50']}/{stats['total_ms']['p99']}ms"
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for feed in feeds:
+            feed.close()
+        engine.stop()
+        for adapter in adapters.values():
+            close = getattr(adapter, "close", None)
+            if close:
+                close()
+        print("[对冲] 已停止")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+"""
+Instrument Registry
+
+各交易所合约精度（价格 tick、数量 lot、最小下单量）的缓存，以及价格/数量与整数 tick/lot 的换算。
+
+价格在内部表示为 ``units = 价格 × 10^price_decimals`` 的整数，tick 为 ``tick_units`` 个 unit，
+所以 ``price_ticks = units // tick_units``；数量同理。换算只在进入策略（行情价、挂单价）和
+离开策略（下单）时各做一次，网格生成、挂单对比、被动价校验全部是整数运算。
+
+使用示例:
+    inst = adapter.get_instrument("BTC-USD")           # 首次调用从交易所加载整个交易所的合约并缓存
+    mid = inst.price_to_ticks(ticker["last_price"])    # 68012.37 -> 6801237（tick=0.01）
+    bid = inst.floor_to_step(mid - spread_ticks, step_ticks)
+    adapter.place_order(..., price=inst.ticks_to_price(bid), quantity=inst.lots_to_qty(lots))
+
+加载函数:
+    instruments_from_grvt(markets)       GrvtCcxt.load_markets() 的结果
+    instruments_from_standx(infos)       StandXPerpHTTP.query_symbol_info() 的结果
+    instruments_from_nado(symbols)       EngineQueryClient.get_symbols(product_type="perp") 的结果
+"""
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from adapters.normalizers import scaled_int
+
+
+ROUND_DOWN = "down"
+ROUND_UP = "up"
+ROUND_NEAREST = "nearest"
+
+
+def _decimals_of(step: Decimal) -> int:
+    """步长的小数位数，如 0.05 -> 2，10 -> 0"""
+    exponent = step.normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def _divide(units: int, step_units: int, rounding: str) -> int:
+    if rounding == ROUND_DOWN:
+        return units // step_units
+    if rounding == ROUND_UP:
+        return -(-units // step_units)
+    if rounding == ROUND_NEAREST:
+        return (2 * units + step_units) // (2 * step_units)
+    raise ValueError(f"不支持的取整方式: {rounding}")
+
+
+def _format_units(units: int, decimals: int) -> str:
+    """整数 units 格式化为十进制字符串（不经过 float/Decimal）"""
+    if decimals == 0:
+        return str(units)
+    sign = "-" if units < 0 else ""
+    digits = str(abs(units)).rjust(decimals + 1, "0")
+    return f"{sign}{digits[:-decimals]}.{digits[-decimals:]}"
+
+
+class Instrument:
+    """
+    单个合约的精度信息
+
+    Attributes:
+        venue: 交易所名称
+        symbol: 交易所格式的交易对
+        price_tick: 最小价格变动（Decimal）
+        qty_step: 最小数量变动（Decimal）
+        min_qty: 最小下单数量（Decimal）
+        price_decimals / qty_decimals: 价格/数量的小数位
+        tick_units / lot_units: 一个 tick/lot 对应的整数 unit 数
+    """
+
+    __slots__ = (
+        "venue",
+        "symbol",
+        "price_tick",
+        "qty_step",
+        "min_qty",
+        "price_decimals",
+        "qty_decimals",
+        "tick_units",
+        "lot_units",
+        "min_lots",
+        "extra",
+    )
+
+    def __init__(
+        self,
+        venue: str,
+        symbol: str,
+        price_tick: Any,
+        qty_step: Any,
+        min_qty: Any = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.venue = venue
+        self.symbol = symbol
+        self.price_tick = Decimal(str(price_tick))
+        self.qty_step = Decimal(str(qty_step))
+        if self.price_tick <= 0 or self.qty_step <= 0:
+            raise ValueError(f"{venue}:{symbol} 的 tick/lot 必须大于 0")
+        self.min_qty = Decimal(str(min_qty)) if min_qty is not None else self.qty_step
+        self.price_decimals = _decimals_of(self.price_tick)
+        self.qty_decimals = _decimals_of(self.qty_step)
+        self.tick_units = scaled_int(str(self.price_tick), self.price_decimals)
+        self.lot_units = scaled_int(str(self.qty_step), self.qty_decimals)
+        self.min_lots = self.qty_to_lots(self.min_qty, ROUND_UP)
+        self.extra = extra or {}
+
+    def __repr__(self) -> str:
+        return f"Instrument({self.venue}:{self.symbol}, tick={self.price_tick}, lot={self.qty_step}, min={self.min_qty})"
+
+    # ---------- 价格 ----------
+
+    def price_to_ticks(self, price: Any, rounding: str = ROUND_NEAREST) -> int:
+        """价格（字符串/Decimal/float/int）换算为整数 tick"""
+        return _divide(scaled_int(price, self.price_decimals), self.tick_units, rounding)
+
+    def ticks_to_price(self, ticks: int) -> Decimal:
+        """整数 tick 换算为 Decimal 价格（用于下单）"""
+        return Decimal(ticks * self.tick_units).scaleb(-self.price_decimals)
+
+    def ticks_to_str(self, ticks: int) -> str:
+        """整数 tick 格式化为价格字符串"""
+        return _format_units(ticks * self.tick_units, self.price_decimals)
+
+    def price_distance_to_ticks(self, distance: Any, minimum: int = 1) -> int:
+        """价格距离（如网格间距、价差）换算为 tick 数，四舍五入且不少于 minimum"""
+        return max(minimum, self.price_to_ticks(distance, ROUND_NEAREST))
+
+    # ---------- 数量 ----------
+
+    def qty_to_lots(self, qty: Any, rounding: str = ROUND_DOWN) -> int:
+        """数量换算为整数 lot（默认向下取整，避免超出可用数量）"""
+        return _divide(scaled_int(qty, self.qty_decimals), self.lot_units, rounding)
+
+    def lots_to_qty(self, lots: int) -> Decimal:
+        """整数 lot 换算为 Decimal 数量（用于下单）"""
+        return Decimal(lots * self.lot_units).scaleb(-self.qty_decimals)
+
+    def lots_to_str(self, lots: int) -> str:
+        return _format_units(lots * self.lot_units, self.qty_decimals)
+
+    # ---------- 整数网格工具 ----------
+
+    @staticmethod
+    def floor_to_step(ticks: int, step: int) -> int:
+        """向下取整到 step 的整数倍"""
+        return ticks // step * step
+
+    @staticmethod
+    def ceil_to_step(ticks: int, step: int) -> int:
+        """向上取整到 step 的整数倍"""
+        return -(-ticks // step) * step
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "venue": self.venue,
+            "symbol": self.symbol,
+            "price_tick": str(self.price_tick),
+            "qty_step": str(self.qty_step),
+            "min_qty": str(self.min_qty),
+            "extra": self.extra,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Instrument":
+        return cls(
+            data["venue"],
+            data["symbol"],
+            data["price_tick"],
+            data["qty_step"],
+            data.get("min_qty"),
+            data.get("extra"),
+        )
+
+
+# ---------- 各交易所加载函数 ----------
+
+def instruments_from_grvt(markets: Any) -> List[Instrument]:
+    """GRVT: load_markets() 返回的 {instrument: 字典} 或 fetch_markets() 的列表"""
+    items = markets.values() if isinstance(markets, dict) else markets
+    result = []
+    for market in items:
+        symbol = market.get("instrument")
+        if not symbol or not market.get("tick_size") or not market.get("min_size"):
+            continue
+        result.append(
+            Instrument(
+                "grvt",
+                symbol,
+                market["tick_size"],
+                market["min_size"],
+                market["min_size"],
+                extra={"base_decimals": market.get("base_decimals")},
+            )
+        )
+    return result
+
+
+def instruments_from_standx(infos: Iterable[Dict[str, Any]]) -> List[Instrument]:
+    """StandX: query_symbol_info() 返回的列表（price_tick_decimals / qty_tick_decimals）"""
+    result = []
+    for info in infos:
+        symbol = info.get("symbol")
+        if not symbol or info.get("price_tick_decimals") is None or info.get("qty_tick_decimals") is None:
+            continue
+        price_tick = Decimal(1).scaleb(-int(info["price_tick_decimals"]))
+        qty_step = Decimal(1).scaleb(-int(info["qty_tick_decimals"]))
+        result.append(
+            Instrument("standx", symbol, price_tick, qty_step, info.get("min_order_qty") or qty_step)
+        )
+    return result
+
+
+def instruments_from_nado(symbols: Any) -> List[Instrument]:
+    """Nado: get_symbols() 返回的 SymbolsData（x18 精度），额外保存 product_id"""
+    entries = symbols.symbols.values() if hasattr(symbols, "symbols") else symbols
+    result = []
+    for entry in entries:
+        x18 = Decimal(10) ** 18
+        result.append(
+            Instrument(
+                "nado",
+                entry.symbol,
+                (Decimal(entry.price_increment_x18) / x18).normalize(),
+                (Decimal(entry.size_increment) / x18).normalize(),
+                (Decimal(entry.min_size) / x18).normalize(),
+                extra={"product_id": int(entry.product_id)},
+            )
+        )
+    return result
+
+
+# ---------- 注册表 ----------
+
+class InstrumentRegistry:
+    """
+    合约精度缓存，按交易所整体加载，过期后下次访问时重新加载
+
+    Args:
+        ttl: 缓存有效期（秒），<= 0 表示永不过期
+    """
+
+    def __init__(self, ttl: float = 3600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._venues: Dict[str, Dict[str, Instrument]] = {}
+        self._loaded_at: Dict[str, float] = {}
+
+    def load(self, venue: str, loader: Callable[[], Iterable[Instrument]]) -> Dict[str, Instrument]:
+        """调用 loader 重新加载某个交易所的全部合约"""
+        instruments = {inst.symbol: inst for inst in loader()}
+        with self._lock:
+            self._venues[venue] = instruments
+            self._loaded_at[venue] = time.time()
+        print(f"[Instruments] 已加载 {venue} 合约 {len(instruments)} 个")
+        return instruments
+
+    def put(self, instrument: Instrument) -> None:
+        """手动登记合约（如配置文件中给定的精度）"""
+        with self._lock:
+            self._venues.setdefault(instrument.venue, {})[instrument.symbol] = instrument
+            self._loaded_at.setdefault(instrument.venue, time.time())
+
+    def _expired(self, venue: str) -> bool:
+        loaded_at = self._loaded_at.get(venue)
+        if loaded_at is None:
+            return True
+        return self.ttl > 0 and time.time() - loaded_at > self.ttl
+
+    def get(
+        self,
+        venue: str,
+        symbol: str,
+        loader: Optional[Callable[[], Iterable[Instrument]]] = None,
+    ) -> Instrument:
+        """
+        获取合约精度，缓存缺失或过期时用 loader 重新加载
+
+        Raises:
+            KeyError: 合约不存在
+        """
+        instruments = self._venues.get(venue)
+        if loader is not None and (instruments is None or symbol not in instruments or self._expired(venue)):
+            try:
+                instruments = self.load(venue, loader)
+            except Exception as e:
+                if not instruments or symbol not in instruments:
+                    raise
+                print(f"[Instruments] 刷新 {venue} 合约失败，继续使用缓存: {e}")
+        if not instruments or symbol not in instruments:
+            raise KeyError(f"未找到合约 {venue}:{symbol}")
+        return instruments[symbol]
+
+    def instruments(self, venue: str) -> List[Instrument]:
+        return list(self._venues.get(venue, {}).values())
+
+
+_DEFAULT_REGISTRY = InstrumentRegistry()
+
+
+def get_default_registry() -> InstrumentRegistry:
+    """进程内共用的合约精度缓存（适配器的 get_instrument 使用）"""
+    return _DEFAULT_REGISTRY
@@ -0,0 +1,63 @@
+"""
+订单日志查询工具
+
+使用示例:
+    python -m adapters.journal_query logs/journal --symbol BTC-USD --event place_order --limit 50
+    python -m adapters.journal_query logs/journal --status error --since 2026-01-01T08:00:00
+    python -m adapters.journal_query logs/journal --order-id 123456 --output json
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from datetime import datetime
+from typing import List, Optional
+
+from adapters.order_journal import JOURNAL_FIELDS, read_journal
+
+
+def _format_ts(ts_ns: int) -> str:
+    return datetime.fromtimestamp(ts_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="查询订单日志")
+    parser.add_argument("directory", help="日志目录")
+    parser.add_argument("--prefix", default="orders", help="文件名前缀（默认: orders）")
+    parser.add_argument("--since", help="起始时间，如 2026-01-01T08:00:00")
+    parser.add_argument("--until", help="结束时间")
+    for field in ("exchange", "event", "symbol", "side", "order_id", "client_order_id", "status"):
+        parser.add_argument(f"--{field.replace('_', '-')}", dest=field)
+    parser.add_argument("--limit", type=int, default=0, help="只显示最后 N 条")
+    parser.add_argument("--output", choices=("table", "csv", "json"), default="table")
+    args = parser.parse_args(argv)
+
+    filters = {
+        k: getattr(args, k)
+        for k in ("exchange", "event", "symbol", "side", "order_id", "client_order_id", "status")
+    }
+    rows = read_journal(args.directory, args.prefix, since=args.since, until=args.until, **filters)
+    if args.limit:
+        rows = deque(rows, maxlen=args.limit)
+
+    if args.output == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=JOURNAL_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    elif args.output == "json":
+        for row in rows:
+            print(json.dumps(row, ensure_ascii=False))
+    else:
+        for row in rows:
+            latency = f"{row['latency_us']}us" if row["latency_us"] is not None else "-"
+            error = f" {row['error']}" if row["error"] else ""
+            print(
+                f"{_format_ts(row['ts_ns'])} {row['exchange']:<8} {row['event']:<20} {row['symbol']:<14} "
+                f"{row['side']:<5} {row['quantity']:>10} @ {row['price']:<12} "
+                f"id={row['order_id'] or '-'} {row['status']} {latency}{error}"
+            )
+
+
+if __name__ == "__main__":
+    main()
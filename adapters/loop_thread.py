@@ -0,0 +1,95 @@
+"""
+Loop Thread
+
+在后台线程中运行一个 asyncio 事件循环，供同步的适配器/策略代码调用异步 SDK（WS 下单通道等）。
+
+使用示例:
+    loop_thread = LoopThread("standx-ws-orders")
+    loop_thread.start()
+    result = loop_thread.run(client.request(...), timeout=2.0)   # 同步等待协程结果
+    loop_thread.submit(client.relogin(token))                     # 只提交，不等待
+    loop_thread.stop(client.close())
+"""
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Optional
+
+
+class LoopThread:
+    """
+    后台事件循环线程
+
+    Args:
+        name: 线程名
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self.loop is not None and self.loop.is_running()
+
+    def start(self) -> None:
+        """启动线程并等待事件循环开始运行"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        loop.call_soon(self._started.set)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """提交协程到事件循环，返回 concurrent.futures.Future（不等待）"""
+        if self.loop is None:
+            raise RuntimeError(f"{self.name} 事件循环未启动")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        在事件循环上执行协程并同步等待结果
+
+        Raises:
+            TimeoutError: timeout 秒内未完成（协程会被取消）
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"{self.name}: {timeout}s 内未完成")
+
+    def stop(self, shutdown: Optional[Awaitable] = None, timeout: float = 5.0) -> None:
+        """执行可选的关闭协程，取消剩余任务并停止线程"""
+        loop, thread = self.loop, self._thread
+        if loop is None or thread is None or loop.is_closed():
+            return
+        try:
+            self.run(self._shutdown(shutdown), timeout)
+        except Exception as e:
+            print(f"[{self.name}] 关闭失败: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        self._thread = None
+
+    @staticmethod
+    async def _shutdown(shutdown: Optional[Awaitable]) -> None:
+        if shutdown is not None:
+            await shutdown
+        current = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is not current:
+                task.cancel()
@@ -0,0 +1,269 @@
+"""
+Market Data Gateway
+行情网关进程
+
+常驻进程，统一持有各交易所的行情连接，把每个交易对的最新 BBO / 标记价 / 指数价 / 最新价写入共享行情表
+（adapters/market_table.py），本机任意数量的策略进程无锁读取，不再各自轮询 REST 或各开一条 WebSocket：
+- StandX: StandXMarketStream 订阅 price 频道
+- GRVT:   GrvtCcxtWS 订阅 ticker.s（只连接行情端点，不需要 API Key）
+- Nado:   SDK 没有行情推送，按间隔通过 NadoMarketData 一次请求批量拉取盘口（market_prices）
+
+策略侧在交易所配置中加入 market_table: <名称>，适配器的 get_ticker 会先读共享行情表。
+
+运行（在项目根目录）:
+    python -m adapters.market_gateway --standx BTC-USD,ETH-USD --grvt BTC_USDT_Perp --nado BTC,ETH
+    python -m adapters.market_gateway --name market_bbo --standx BTC-USD --stats-interval 30
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+for sdk_path in (
+    project_root,
+    os.path.join(project_root, 'exchange', 'exchange_grvt', 'src'),
+):
+    if sdk_path not in sys.path:
+        sys.path.insert(0, sdk_path)
+
+from adapters.market_table import MarketTable
+from adapters.metadata_cache import get_default_metadata_cache
+from adapters.transport import get_default_transport
+
+DEFAULT_TABLE = "market_bbo"
+
+
+def _float(value):
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class StandXFeed:
+    """StandX price 频道 -> 行情表"""
+
+    exchange = "standx"
+
+    def __init__(self, table: MarketTable, symbols, url: str = "wss://perps.standx.com/ws-stream/v1"):
+        from exchange.exchange_standx.standx_protocol.perps_wss import StandXMarketStream
+
+        self.table = table
+        self.symbols = symbols
+        self.stream = StandXMarketStream(url)
+        self.updates = 0
+
+    async def start(self):
+        await self.stream.connect()
+        for symbol in self.symbols:
+            await self.stream.subscribe("price", symbol, self._on_price)
+
+    def _on_price(self, message):
+        data = message.get("data") or {}
+        symbol = data.get("symbol") or message.get("symbol")
+        if not symbol:
+            return
+        spread = data.get("spread")
+        if isinstance(spread, (list, tuple)) and len(spread) == 2:
+            bid, ask = spread
+        else:
+            bid, ask = data.get("spread_bid"), data.get("spread_ask")
+        self.table.update(
+            self.exchange,
+            symbol,
+            bid=_float(bid),
+            ask=_float(ask),
+            mark=_float(data.get("mark_price")),
+            index=_float(data.get("index_price")),
+            last=_float(data.get("last_price")),
+        )
+        self.updates += 1
+
+    def stats(self):
+        stats = self.stream.stats()
+        return (
+            f"更新 {self.updates}，重连 {stats['reconnects']}，丢弃 {stats['dropped']}，延迟 {stats['lagging']}"
+        )
+
+    async def close(self):
+        await self.stream.close()
+
+
+class GrvtFeed:
+    """GRVT ticker.s -> 行情表"""
+
+    exchange = "grvt"
+
+    def __init__(self, table: MarketTable, instruments, env: str = "prod"):
+        self.table = table
+        self.instruments = instruments
+        self.env = env
+        self.client = None
+        self.updates = 0
+
+    async def start(self):
+        from pysdk.grvt_ccxt_env import GrvtEnv, GrvtWSEndpointType
+        from pysdk.grvt_ccxt_ws import GrvtCcxtWS
+
+        # SDK 负责断线重连和重新订阅
+        self.client = GrvtCcxtWS(
+            GrvtEnv(self.env),
+            asyncio.get_running_loop(),
+            parameters={"endpoint_types": [GrvtWSEndpointType.MARKET_DATA]},
+            session=get_default_transport().async_session(),
+            metadata_cache=get_default_metadata_cache(),
+        )
+        await self.client.initialize()
+        for instrument in self.instruments:
+            await self.client.subscribe("ticker.s", self._on_ticker, params={"instrument": instrument})
+
+    async def _on_ticker(self, message):
+        feed = message.get("feed") or {}
+        instrument = feed.get("instrument")
+        if not instrument:
+            return
+        self.table.update(
+            self.exchange,
+            instrument,
+            bid=_float(feed.get("best_bid_price")),
+            ask=_float(feed.get("best_ask_price")),
+            mark=_float(feed.get("mark_price")),
+            index=_float(feed.get("index_price")),
+            last=_float(feed.get("last_price")),
+        )
+        self.updates += 1
+
+    def stats(self):
+        return f"更新 {self.updates}"
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.__aexit__()
+            await self.client._session.close()
+
+
+class NadoFeed:
+    """Nado 盘口轮询（一次 market_prices 请求覆盖所有交易对）-> 行情表"""
+
+    exchange = "nado"
+
+    def __init__(self, table: MarketTable, symbols, interval: float = 0.5):
+        self.table = table
+        self.symbols = symbols
+        self.interval = interval
+        self.task = None
+        self.updates = 0
+        self.errors = 0
+
+    async def start(self):
+        from morelogin.nado.nado_market import NadoMarketData
+
+        # 价格缓存时间设为 0：每次轮询都请求最新盘口
+        self.market = NadoMarketData(price_ttl=0)
+        self.product_ids = await asyncio.to_thread(self._resolve_products)
+        self.task = asyncio.create_task(self._poll())
+
+    def _resolve_products(self):
+        product_ids = {}
+        for symbol in self.symbols:
+            product_id = self.market.get_product_id(symbol, "perp")
+            if product_id is None:
+                print(f"[网关] Nado 未找到交易对 {symbol}")
+            else:
+                product_ids[product_id] = symbol
+        return product_ids
+
+    async def _poll(self):
+        while True:
+            started = time.monotonic()
+            try:
+                prices = await asyncio.to_thread(self.market.get_market_prices, list(self.product_ids))
+                for product_id, price in prices.items():
+                    self.table.update(
+                        self.exchange,
+                        self.product_ids[product_id],
+                        bid=int(price.bid_x18) / 1e18,
+                        ask=int(price.ask_x18) / 1e18,
+                    )
+                    self.updates += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"[网关] Nado 拉取盘口失败: {e}")
+            await asyncio.sleep(max(self.interval - (time.monotonic() - started), 0))
+
+    def stats(self):
+        return f"更新 {self.updates}，失败 {self.errors}"
+
+    async def close(self):
+        if self.task is not None:
+            self.task.cancel()
+
+
+def _split(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+async def run(args):
+    try:
+        # kill / systemd stop 时同样走 finally 清理（关闭连接、删除共享内存）
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass
+    table = MarketTable.create(args.name, capacity=args.capacity)
+    print(f"[网关] 共享行情表 {table.name}（容量 {table.capacity}）")
+    feeds = []
+    if _split(args.standx):
+        feeds.append(StandXFeed(table, _split(args.standx), args.standx_url))
+    if _split(args.grvt):
+        feeds.append(GrvtFeed(table, _split(args.grvt), args.grvt_env))
+    if _split(args.nado):
+        feeds.append(NadoFeed(table, _split(args.nado), args.nado_interval))
+    if not feeds:
+        table.close()
+        raise SystemExit("未配置任何交易对（--standx / --grvt / --nado）")
+
+    try:
+        for feed in feeds:
+            try:
+                await feed.start()
+                print(f"[网关] {feed.exchange} 行情已启动")
+            except Exception as e:
+                print(f"❌ {feed.exchange} 行情启动失败: {e}")
+        while True:
+            await asyncio.sleep(args.stats_interval)
+            print(f"[网关] {time.strftime('%H:%M:%S')} " + "；".join(f"{f.exchange}: {f.stats()}" for f in feeds))
+    finally:
+        for feed in feeds:
+            try:
+                await feed.close()
+            except Exception as e:
+                print(f"[网关] 关闭 {feed.exchange} 失败: {e}")
+        table.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="行情网关：交易所行情 -> 共享内存行情表")
+    parser.add_argument('--name', default=DEFAULT_TABLE, help="共享内存名称（策略配置 market_table）")
+    parser.add_argument('--capacity', type=int, default=256, help="最多容纳的交易对数")
+    parser.add_argument('--standx', default="", help="StandX 交易对，逗号分隔，如 BTC-USD,ETH-USD")
+    parser.add_argument('--standx-url', default="wss://perps.standx.com/ws-stream/v1", help="StandX 行情 WebSocket 地址")
+    parser.add_argument('--grvt', default="", help="GRVT 合约，逗号分隔，如 BTC_USDT_Perp")
+    parser.add_argument('--grvt-env', default="prod", help="GRVT 环境: prod, testnet, staging, dev")
+    parser.add_argument('--nado', default="", help="Nado 交易对，逗号分隔，如 BTC,ETH")
+    parser.add_argument('--nado-interval', type=float, default=0.5, help="Nado 盘口轮询间隔（秒）")
+    parser.add_argument('--stats-interval', type=float, default=60, help="打印统计的间隔（秒）")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("[网关] 已停止")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+"""
+Shared Market Table
+
+跨进程共享的最新行情表（BBO / 标记价 / 指数价 / 最新价），基于 multiprocessing.shared_memory。
+
+行情网关进程（adapters/market_gateway.py）是唯一的写入方，持有各交易所的行情 WebSocket，
+把每个 (exchange, symbol) 的最新行情写入固定槽位；任意数量的本机策略进程通过 MarketTableReader
+无锁读取，不再各自轮询 REST 或各开一条 WebSocket。
+
+内存布局（小端）:
+    表头 64 字节: magic(4s) version(I) capacity(I) count(I)
+    槽位 128 字节 * capacity:
+        key(48s)      "exchange:symbol"，分配后不再改变
+        seq(Q)        版本号，写入中为奇数
+        bid ask mark index last (5d)  未知的字段为 NaN
+        updated_ns(q) 写入时的 time.time_ns()
+
+并发（seqlock）: 写入方先把 seq 加一（奇数），写字段，再把 seq 加一（偶数）；
+读取方一次读出 seq 和字段，再读一次 seq，两次相同且为偶数才采用，否则让出 CPU 后重试（写入方可能在写入中途被调度走）。
+写入方只有一个，读取方不加锁、不阻塞写入方。字段写入和读取都是逐字节拷贝，依赖 x86/ARM64
+上对齐的 8 字节读写不会被拆分，以及 CPython 按程序顺序执行内存访问。
+
+使用示例:
+    table = MarketTable.create("standx_bbo", capacity=256)      # 网关进程
+    table.update("standx", "BTC-USD", bid=68000.1, ask=68000.2, mark=68000.15)
+
+    reader = MarketTableReader("standx_bbo")                     # 策略进程
+    quote = reader.get("standx", "BTC-USD")                      # Quote 或 None
+    ticker = reader.ticker("standx", "BTC-USD", max_age=2.0)     # get_ticker 格式，过期返回 None
+"""
+import math
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, NamedTuple, Optional
+
+MAGIC = b"MKT1"
+VERSION = 1
+HEADER_SIZE = 64
+SLOT_SIZE = 128
+KEY_SIZE = 48
+
+_HEADER = struct.Struct("<4sIII")
+_COUNT = struct.Struct("<I")
+_COUNT_OFFSET = 12
+_KEY = struct.Struct(f"<{KEY_SIZE}s")
+_SEQ = struct.Struct("<Q")
+_SEQ_OFFSET = KEY_SIZE
+_FIELDS = struct.Struct("<5dq")
+_FIELDS_OFFSET = KEY_SIZE + _SEQ.size
+_RECORD = struct.Struct("<Q5dq")  # seq + 字段，读取方一次读出
+
+NAN = float("nan")
+
+# 本进程（及 fork 出的子进程）创建的行情表，同进程树内的读取方不能注销它们的 resource_tracker 记录
+_CREATED = set()
+
+
+class Quote(NamedTuple):
+    """单个交易对的最新行情（价格未知时为 None）"""
+    exchange: str
+    symbol: str
+    bid: Optional[float]
+    ask: Optional[float]
+    mark: Optional[float]
+    index: Optional[float]
+    last: Optional[float]
+    updated_ns: int
+    seq: int
+
+    @property
+    def mid(self) -> Optional[float]:
+        if self.bid is None or self.ask is None:
+            return None
+        return (self.bid + self.ask) / 2
+
+    @property
+    def age(self) -> float:
+        """距离写入的秒数"""
+        return (time.time_ns() - self.updated_ns) / 1e9
+
+
+def _key(exchange: str, symbol: str) -> bytes:
+    key = f"{exchange}:{symbol}".encode()
+    if len(key) > KEY_SIZE:
+        raise ValueError(f"交易对名称过长: {exchange}:{symbol}")
+    return key
+
+
+def _price(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class MarketTable:
+    """
+    行情表写入方（单写入者）
+
+    Args:
+        shm: 已创建的 SharedMemory
+        owner: 是否由本对象创建（close 时删除共享内存）
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool = False):
+        self.shm = shm
+        self.buf = shm.buf
+        self.owner = owner
+        magic, version, self.capacity, count = _HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"共享内存 {shm.name} 不是行情表（magic={magic!r} version={version}）")
+        self._slots: Dict[bytes, int] = {}
+        for index in range(count):
+            self._slots[_read_key(self.buf, index)] = index
+
+    @classmethod
+    def create(cls, name: str, capacity: int = 256) -> "MarketTable":
+        """创建行情表（同名共享内存已存在时删除重建，用于网关崩溃后重启）"""
+        size = HEADER_SIZE + SLOT_SIZE * capacity
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, capacity, 0)
+        _CREATED.add(shm.name)
+        return cls(shm, owner=True)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def _slot(self, exchange: str, symbol: str) -> int:
+        key = _key(exchange, symbol)
+        index = self._slots.get(key)
+        if index is None:
+            index = len(self._slots)
+            if index >= self.capacity:
+                raise ValueError(f"行情表已满（{self.capacity}）")
+            offset = HEADER_SIZE + index * SLOT_SIZE
+            _KEY.pack_into(self.buf, offset, key)
+            _SEQ.pack_into(self.buf, offset + _SEQ_OFFSET, 0)
+            _FIELDS.pack_into(self.buf, offset + _FIELDS_OFFSET, NAN, NAN, NAN, NAN, NAN, 0)
+            # 槽位初始化完成后再发布 count，读取方只会看到完整的 key
+            _COUNT.pack_into(self.buf, _COUNT_OFFSET, index + 1)
+            self._slots[key] = index
+        return index
+
+    def update(
+        self,
+        exchange: str,
+        symbol: str,
+        bid: Optional[float] = None,
+        ask: Optional[float] = None,
+        mark: Optional[float] = None,
+        index: Optional[float] = None,
+        last: Optional[float] = None,
+    ) -> None:
+        """写入一个交易对的最新行情；为 None 的字段保留上一次的值"""
+        offset = HEADER_SIZE + self._slot(exchange, symbol) * SLOT_SIZE
+        buf = self.buf
+        seq = _SEQ.unpack_from(buf, offset + _SEQ_OFFSET)[0]
+        old = _FIELDS.unpack_from(buf, offset + _FIELDS_OFFSET)
+        _SEQ.pack_into(buf, offset + _SEQ_OFFSET, seq + 1)
+        _FIELDS.pack_into(
+            buf,
+            offset + _FIELDS_OFFSET,
+            old[0] if bid is None else bid,
+            old[1] if ask is None else ask,
+            old[2] if mark is None else mark,
+            old[3] if index is None else index,
+            old[4] if last is None else last,
+            time.time_ns(),
+        )
+        _SEQ.pack_into(buf, offset + _SEQ_OFFSET, seq + 2)
+
+    def close(self) -> None:
+        """关闭映射；由本对象创建时同时删除共享内存"""
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            _CREATED.discard(self.shm.name)
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _read_key(buf, index: int) -> bytes:
+    return _KEY.unpack_from(buf, HEADER_SIZE + index * SLOT_SIZE)[0].rstrip(b"\0")
+
+
+class MarketTableReader:
+    """
+    行情表读取方（无锁，可在任意数量的进程中同时使用）
+
+    Args:
+        name: 共享内存名称（与网关 --name 一致）
+        max_retries: seqlock 读取冲突时的最大重试次数（每次重试前让出 CPU）
+    """
+
+    def __init__(self, name: str, max_retries: int = 1000):
+        self.shm = shared_memory.SharedMemory(name=name)
+        # Python < 3.13 的 resource_tracker 会在读取进程退出时删除共享内存，读取方不应拥有它
+        if self.shm.name not in _CREATED:
+            try:
+                resource_tracker.unregister(self.shm._name, "shared_memory")
+            except Exception:
+                pass
+        self.buf = self.shm.buf
+        self.max_retries = max_retries
+        magic, version, self.capacity, _ = _HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"共享内存 {name} 不是行情表（magic={magic!r} version={version}）")
+        self._offsets: Dict[tuple, int] = {}  # (exchange, symbol) -> seq 的偏移
+        self._known = 0
+
+    def _offset(self, exchange: str, symbol: str) -> Optional[int]:
+        offset = self._offsets.get((exchange, symbol))
+        if offset is None:
+            # 新的交易对：扫描写入方新分配的槽位
+            count = _COUNT.unpack_from(self.buf, _COUNT_OFFSET)[0]
+            for i in range(self._known, count):
+                key = tuple(_read_key(self.buf, i).decode().split(":", 1))
+                self._offsets[key] = HEADER_SIZE + i * SLOT_SIZE + _SEQ_OFFSET
+            self._known = count
+            offset = self._offsets.get((exchange, symbol))
+        return offset
+
+    def read(self, exchange: str, symbol: str):
+        """
+        读取原始字段 (seq, bid, ask, mark, index, last, updated_ns)，价格未知时为 NaN
+
+        Returns:
+            tuple 或 None（交易对不存在 / 从未写入）
+
+        Raises:
+            RuntimeError: 重试 max_retries 次仍与写入冲突
+        """
+        offset = self._offsets.get((exchange, symbol)) or self._offset(exchange, symbol)
+        if offset is None:
+            return None
+        buf = self.buf
+        for _ in range(self.max_retries):
+            record = _RECORD.unpack_from(buf, offset)
+            seq = record[0]
+            if not seq & 1 and _SEQ.unpack_from(buf, offset)[0] == seq:
+                return record if seq else None
+            os.sched_yield()
+        raise RuntimeError(f"读取 {exchange}:{symbol} 时与写入冲突")
+
+    def get(self, exchange: str, symbol: str) -> Optional[Quote]:
+        """读取最新行情"""
+        raw = self.read(exchange, symbol)
+        if raw is None:
+            return None
+        seq, bid, ask, mark, index, last, updated_ns = raw
+        return Quote(
+            exchange, symbol, _price(bid), _price(ask), _price(mark), _price(index), _price(last), updated_ns, seq
+        )
+
+    def ticker(self, exchange: str, symbol: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        以 BasePerpAdapter.get_ticker 的格式返回最新行情
+
+        Args:
+            max_age: 最大允许的行情年龄（秒），超过时返回 None（由调用方回退 REST）
+        """
+        quote = self.get(exchange, symbol)
+        if quote is None or (max_age is not None and quote.age > max_age):
+            return None
+        return {
+            "symbol": symbol,
+            "bid_price": quote.bid,
+            "ask_price": quote.ask,
+            "mid_price": quote.mid,
+            "last_price": quote.last,
+            "mark_price": quote.mark,
+            "index_price": quote.index,
+            "timestamp": quote.updated_ns // 1_000_000,
+        }
+
+    def symbols(self) -> list:
+        """当前表中所有 (exchange, symbol)"""
+        count = _COUNT.unpack_from(self.buf, _COUNT_OFFSET)[0]
+        keys = [_read_key(self.buf, i).decode() for i in range(count)]
+        return [tuple(key.split(":", 1)) for key in keys]
+
+    def close(self) -> None:
+        self.buf = None
+        self.shm.close()
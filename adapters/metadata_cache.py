@@ -0,0 +1,228 @@
+"""
+Metadata Cache
+合约/市场元数据的磁盘缓存（StandX / GRVT / Nado SDK 共用）
+
+合约列表、精度、合约地址这类数据很少变化，却在每次创建客户端时都要请求一遍。
+缓存按 key 保存为目录下的一个 JSON 文件（带格式版本和数据版本，版本不符视为未命中）：
+- 新鲜期（ttl）内直接返回，不发请求
+- 过了新鲜期但未超过 max_stale：先返回旧数据，同时在后台线程重新加载并写回（同一 key 只有一个后台任务）
+- 没有缓存或超过 max_stale：同步加载后写入
+所以除了第一次运行，创建客户端时不再需要任何元数据请求，刷新也不会阻塞交易路径。
+loader 抛异常或返回空值时不写缓存；后台刷新失败时继续使用旧数据。
+
+SDK 不依赖本模块，只约定鸭子类型接口：get(key, loader) / peek(key) / put(key, value)。
+
+使用示例:
+    cache = get_default_metadata_cache()
+    grvt = GrvtCcxt(env, parameters=parameters, metadata_cache=cache)      # 合约列表走缓存
+    nado = create_nado_client(mode, signer, metadata_cache=cache)          # 合约地址走缓存
+    infos = cache.get("standx/symbol_info", http_client.query_symbol_info) # 任意元数据
+    cache.invalidate("standx/symbol_info")                                 # 上新合约后手动失效
+"""
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# 缓存文件格式版本，文件结构变化时递增，旧文件自动失效
+CACHE_FORMAT_VERSION = 1
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _file_name(key: str) -> str:
+    """key 转为文件名，如 'grvt/prod/markets' -> 'grvt_prod_markets.json'"""
+    return _UNSAFE_CHARS.sub("_", key).strip("_") + ".json"
+
+
+class MetadataCache:
+    """
+    元数据磁盘缓存（带 TTL 和后台重新加载）
+
+    Args:
+        directory: 缓存目录
+        ttl: 新鲜期（秒），过期后先返回旧数据并在后台刷新
+        max_stale: 最长可用时间（秒），超过后同步重新加载，<= 0 表示旧数据一直可用
+    """
+
+    def __init__(self, directory: str = "logs/metadata", ttl: float = 3600, max_stale: float = 7 * 86400):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Dict[str, Any]] = {}  # key -> 文件内容
+        self._refreshing: set = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    # ---------- 读写 ----------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, _file_name(key))
+
+    def _read(self, key: str, version: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if not isinstance(entry, dict) or entry.get("key") != key:
+                return None
+            with self._lock:
+                self._memory[key] = entry
+        if entry.get("format") != CACHE_FORMAT_VERSION or entry.get("version") != version:
+            return None
+        return entry
+
+    def put(self, key: str, value: Any, version: int = 1) -> None:
+        """写入缓存（先写临时文件再替换，多进程共用目录也不会读到半个文件）"""
+        entry = {
+            "format": CACHE_FORMAT_VERSION,
+            "version": version,
+            "key": key,
+            "saved_at": time.time(),
+            "value": value,
+        }
+        with self._lock:
+            self._memory[key] = entry
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            # 写盘失败不影响本进程使用内存中的数据
+            print(f"[元数据缓存] 写入 {key} 失败: {e}")
+
+    def peek(self, key: str, version: int = 1) -> Optional[Tuple[Any, bool]]:
+        """
+        只读缓存，不加载
+
+        Returns:
+            (value, fresh)：fresh 为 False 表示已过新鲜期、调用方应安排刷新；
+            没有缓存、版本不符或超过 max_stale 时返回 None
+        """
+        entry = self._read(key, version)
+        if entry is None:
+            return None
+        age = time.time() - float(entry.get("saved_at", 0))
+        if self.max_stale > 0 and age > self.max_stale:
+            return None
+        return entry["value"], age <= self.ttl
+
+    def get(self, key: str, loader: Callable[[], Any], version: int = 1) -> Any:
+        """
+        读取元数据：新鲜直接返回；过期先返回旧数据并后台刷新；没有时同步调用 loader 加载
+
+        Args:
+            key: 缓存键，建议带上交易所和环境，如 'grvt/prod/markets'
+            loader: 加载函数，返回值必须能 JSON 序列化
+            version: 数据版本，数据结构变化时递增
+        """
+        cached = self.peek(key, version)
+        if cached is not None:
+            value, fresh = cached
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self.revalidate(key, loader, version)
+            return value
+        self.misses += 1
+        return self.refresh(key, loader, version)
+
+    def refresh(self, key: str, loader: Callable[[], Any], version: int = 1) -> Any:
+        """同步调用 loader 重新加载并写入缓存（loader 返回空值时不写入）"""
+        value = loader()
+        self.refreshes += 1
+        if value:
+            self.put(key, value, version)
+        return value
+
+    def revalidate(self, key: str, loader: Callable[[], Any], version: int = 1) -> bool:
+        """
+        在后台线程重新加载，同一 key 同时只有一个刷新任务
+
+        Returns:
+            是否启动了新的刷新任务
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.refresh(key, loader, version)
+            except Exception as e:
+                self.errors += 1
+                print(f"[元数据缓存] 后台刷新 {key} 失败，继续使用旧数据: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"metadata-refresh-{key}", daemon=True).start()
+        return True
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """删除一个 key（或全部）的缓存"""
+        with self._lock:
+            keys = [key] if key is not None else list(self._memory.keys())
+            for k in keys:
+                self._memory.pop(k, None)
+        if key is None:
+            try:
+                names = [n for n in os.listdir(self.directory) if n.endswith(".json")]
+            except OSError:
+                return
+            paths = [os.path.join(self.directory, n) for n in names]
+        else:
+            paths = [self._path(key)]
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            refreshing = sorted(self._refreshing)
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "refreshing": refreshing,
+        }
+
+
+_default_cache: Optional[MetadataCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_metadata_cache() -> MetadataCache:
+    """进程内共用的元数据缓存（目录 logs/metadata，可用环境变量 METADATA_CACHE_DIR 修改）"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = MetadataCache(os.environ.get("METADATA_CACHE_DIR", "logs/metadata"))
+    return _default_cache
+
+
+def set_default_metadata_cache(cache: Optional[MetadataCache]) -> None:
+    """替换默认缓存（传 None 则下次使用时按默认参数重新创建）"""
+    global _default_cache
+    with _default_lock:
+        _default_cache = cache
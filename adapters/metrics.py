@@ -0,0 +1,22 @@
+"""
+Metrics
+延迟统计的公共工具（对冲引擎、接入点测速、压测脚本共用）
+"""
+from typing import Optional, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """
+    最近秩分位数，保留 3 位小数
+
+    Args:
+        values: 样本（无需排序）
+        q: 分位（0~1），例如 0.99
+
+    Returns:
+        Optional[float]: 没有样本时返回 None
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(int(len(ordered) * q), len(ordered) - 1)], 3)
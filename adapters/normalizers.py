@@ -0,0 +1,338 @@
+"""
+Order Normalizers
+
+把各交易所返回的原始订单字典转换为统一的 Order / OrderArrays。
+
+状态映射、字段名和精度在创建 OrderNormalizer 时一次性确定，逐单循环里只做字典取值和
+构造对象；价格/数量字符串直接构造 Decimal（不再经过 str()），时间戳用模块级导入的
+datetime.fromisoformat 解析。指定 price_decimals / qty_decimals 时额外输出整数表示
+（价格 tick、数量 lot），由字符串直接换算，不经过 Decimal/float。
+
+使用示例:
+    normalizer = OrderNormalizer("standx", price_decimals=2, qty_decimals=4)
+    orders = normalizer.orders(response["result"], open_only=True)     # List[Order]
+    arrays = normalizer.arrays(response["result"], open_only=True)     # OrderArrays
+    long_levels = arrays.ids_by_price(side=1)                          # {price_ticks: [order_id, ...]}
+"""
+from array import array
+from datetime import datetime
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+from adapters.base_adapter import Order
+
+
+OPEN_STATUSES = frozenset(("pending", "open", "partially_filled"))
+
+STANDX_STATUS = {
+    "new": "open",
+    "open": "open",
+    "pending": "pending",
+    "partially_filled": "partially_filled",
+    "filled": "filled",
+    "cancelled": "cancelled",
+    "canceled": "cancelled",
+    "rejected": "rejected",
+}
+
+GRVT_STATUS = {
+    "PENDING": "pending",
+    "OPEN": "open",
+    "FILLED": "filled",
+    "REJECTED": "rejected",
+    "CANCELLED": "cancelled",
+}
+
+# OrderArrays.status 列的编码
+STATUS_CODES = {
+    "pending": 0,
+    "open": 1,
+    "partially_filled": 2,
+    "filled": 3,
+    "cancelled": 4,
+    "rejected": 5,
+}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+_ZERO = Decimal("0")
+
+
+def scaled_int(value: Any, decimals: int) -> int:
+    """
+    把十进制数（字符串/数字）换算为 value × 10^decimals 的整数
+
+    普通十进制字符串直接按小数点拆分拼接，不构造 Decimal；超出精度或科学计数法时回退到
+    Decimal 并按银行家舍入。
+
+    Examples:
+        scaled_int("3012.5", 2) -> 301250
+        scaled_int("-0.015", 3) -> -15
+    """
+    text = value if isinstance(value, str) else str(value)
+    if "e" in text or "E" in text:
+        return int(Decimal(text).scaleb(decimals).to_integral_value(ROUND_HALF_EVEN))
+    sign = 1
+    if text[:1] == "-":
+        sign, text = -1, text[1:]
+    elif text[:1] == "+":
+        text = text[1:]
+    whole, _, frac = text.partition(".")
+    if len(frac) > decimals:
+        if frac[decimals:].strip("0"):
+            return sign * int(Decimal(text).scaleb(decimals).to_integral_value(ROUND_HALF_EVEN))
+        frac = frac[:decimals]
+    return sign * int((whole or "0") + frac + "0" * (decimals - len(frac)))
+
+
+def _decimal(value: Any) -> Decimal:
+    return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+
+
+def _scaled_decimal(value: Decimal, scale: int) -> int:
+    """已构造的 Decimal 换算为 value × scale 的整数（与 scaled_int 相同的舍入），免去重新解析字符串"""
+    scaled = value * scale
+    result = int(scaled)
+    if result != scaled:
+        result = int(scaled.to_integral_value(ROUND_HALF_EVEN))
+    return result
+
+
+def iso_to_ms(text: Optional[str]) -> Optional[int]:
+    """ISO 8601 时间字符串转毫秒时间戳，解析失败返回 None"""
+    if not text:
+        return None
+    try:
+        if text[-1] == "Z":
+            text = text[:-1] + "+00:00"
+        return int(datetime.fromisoformat(text).timestamp() * 1000)
+    except (ValueError, TypeError):
+        return None
+
+
+class OrderArrays:
+    """
+    列式存储的订单集合
+
+    每个字段一列，数值列用 array（连续内存，无逐单 Python 对象），适合按价格分组、
+    与网格价格做集合差等批量操作。
+
+    Attributes:
+        order_ids: 订单 ID 列表
+        side: array('b')，1 为买/做多，-1 为卖/做空
+        price_ticks: array('q')，价格 tick（无价格的市价单为 0）
+        qty_lots: array('q')，数量 lot
+        filled_lots: array('q')，已成交 lot
+        status: array('B')，见 STATUS_CODES
+    """
+
+    __slots__ = ("order_ids", "side", "price_ticks", "qty_lots", "filled_lots", "status")
+
+    def __init__(self):
+        self.order_ids: List[str] = []
+        self.side = array("b")
+        self.price_ticks = array("q")
+        self.qty_lots = array("q")
+        self.filled_lots = array("q")
+        self.status = array("B")
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+    def ids_by_price(self, side: int) -> Dict[int, List[str]]:
+        """某个方向上 price_ticks -> 订单 ID 列表"""
+        levels: Dict[int, List[str]] = {}
+        for order_id, s, ticks in zip(self.order_ids, self.side, self.price_ticks):
+            if s == side:
+                levels.setdefault(ticks, []).append(order_id)
+        return levels
+
+    def has_status(self, status: str) -> bool:
+        return STATUS_CODES[status] in self.status
+
+
+class OrderNormalizer:
+    """
+    单个交易所的订单转换器（创建一次，反复使用）
+
+    先只读取状态，open_only 时跳过已结束的订单，其余字段（含时间戳解析）只对保留的订单计算。
+
+    Args:
+        venue: "standx" 或 "grvt"
+        price_decimals: 价格精度（小数位），指定后填充 price_ticks
+        qty_decimals: 数量精度（小数位），指定后填充 quantity_lots / filled_lots
+    """
+
+    __slots__ = ("venue", "price_decimals", "qty_decimals", "_price_scale", "_qty_scale", "_status", "_fields", "_build")
+
+    def __init__(self, venue: str, price_decimals: Optional[int] = None, qty_decimals: Optional[int] = None):
+        handlers = {
+            "standx": (_standx_status, _standx_fields),
+            "grvt": (_grvt_status, _grvt_fields),
+        }.get(venue)
+        if handlers is None:
+            raise ValueError(f"不支持的交易所: {venue}")
+        self.venue = venue
+        self.price_decimals = price_decimals
+        self.qty_decimals = qty_decimals
+        self._price_scale = 10 ** price_decimals if price_decimals is not None else None
+        self._qty_scale = 10 ** qty_decimals if qty_decimals is not None else None
+        self._status, self._fields = handlers
+        self._build = self._build_plain if price_decimals is None and qty_decimals is None else self._build_ticks
+
+    @staticmethod
+    def _build_plain(f: tuple) -> Order:
+        price = f[5]
+        return Order(
+            f[0], f[1], f[2], f[3],
+            _decimal(f[4]),
+            _decimal(price) if price is not None else None,
+            _decimal(f[6]) if f[6] != "0" else _ZERO,
+            f[7], f[8], f[9], f[10], f[11], f[12],
+        )
+
+    def _build_ticks(self, f: tuple) -> Order:
+        # 整数 ticks/lots 由已构造的 Decimal 换算，每个数值只解析一次
+        price = _decimal(f[5]) if f[5] is not None else None
+        qty = _decimal(f[4])
+        filled = _decimal(f[6]) if f[6] != "0" else _ZERO
+        price_scale, qty_scale = self._price_scale, self._qty_scale
+        return Order(
+            f[0], f[1], f[2], f[3], qty, price, filled,
+            f[7], f[8], f[9], f[10], f[11], f[12],
+            _scaled_decimal(price, price_scale) if price_scale is not None and price is not None else None,
+            _scaled_decimal(qty, qty_scale) if qty_scale is not None else None,
+            _scaled_decimal(filled, qty_scale) if qty_scale is not None else None,
+        )
+
+    def order(self, data: Dict[str, Any]) -> Order:
+        """转换单个订单"""
+        return self._build(self._fields(data, self._status(data)))
+
+    def orders(self, records: Iterable[Dict[str, Any]], open_only: bool = False) -> List[Order]:
+        """批量转换；open_only 时只保留 OPEN_STATUSES 状态的订单"""
+        status_of, fields, build = self._status, self._fields, self._build
+        result = []
+        append = result.append
+        for data in records:
+            status = status_of(data)
+            if open_only and status not in OPEN_STATUSES:
+                continue
+            append(build(fields(data, status)))
+        return result
+
+    def arrays(self, records: Iterable[Dict[str, Any]], open_only: bool = False) -> OrderArrays:
+        """
+        批量转换为 OrderArrays（不创建 Order 对象、不解析时间戳），需要指定 price_decimals 和 qty_decimals
+        """
+        pd, qd = self.price_decimals, self.qty_decimals
+        if pd is None or qd is None:
+            raise ValueError("OrderArrays 需要指定 price_decimals 和 qty_decimals")
+        out = OrderArrays()
+        status_of, numbers = self._status, _NUMBERS[self.venue]
+        ids, sides, prices, qtys, filleds, statuses = (
+            out.order_ids, out.side, out.price_ticks, out.qty_lots, out.filled_lots, out.status
+        )
+        for data in records:
+            status = status_of(data)
+            if open_only and status not in OPEN_STATUSES:
+                continue
+            order_id, is_buy, price, qty, filled = numbers(data)
+            ids.append(order_id)
+            sides.append(1 if is_buy else -1)
+            prices.append(scaled_int(price, pd) if price else 0)
+            qtys.append(scaled_int(qty, qd))
+            filleds.append(scaled_int(filled, qd))
+            statuses.append(STATUS_CODES[status])
+        return out
+
+
+# 每个交易所三个函数:
+#   status(data)          -> 统一状态
+#   fields(data, status)  -> (order_id, symbol, side, order_type, qty, price, filled, status,
+#                             tif, reduce_only, cl_ord_id, created_at, updated_at)
+#   numbers(data)         -> (order_id, is_buy, price, qty, filled)，供 OrderArrays 使用
+# 数值保持交易所返回的原始字符串，由调用方决定转换为 Decimal 还是整数
+
+def _standx_status(data: Dict[str, Any]) -> str:
+    return STANDX_STATUS.get(data.get("status", "").lower(), "pending")
+
+
+def _standx_fields(data: Dict[str, Any], status: str) -> tuple:
+    get = data.get
+    return (
+        str(get("id", "")),
+        get("symbol", ""),
+        get("side", "").lower(),
+        get("order_type", "").lower(),
+        get("qty") or "0",
+        get("price") or None,
+        get("fill_qty") or "0",
+        status,
+        (get("time_in_force") or "gtc").lower(),
+        get("reduce_only", False),
+        get("cl_ord_id"),
+        iso_to_ms(get("created_at")),
+        iso_to_ms(get("updated_at")),
+    )
+
+
+def _standx_numbers(data: Dict[str, Any]) -> tuple:
+    get = data.get
+    return (
+        str(get("id", "")),
+        get("side", "").lower() in ("buy", "long"),
+        get("price"),
+        get("qty") or "0",
+        get("fill_qty") or "0",
+    )
+
+
+def _grvt_status(data: Dict[str, Any]) -> str:
+    state = data.get("state")
+    return GRVT_STATUS.get(state.get("status"), "pending") if state else "pending"
+
+
+def _grvt_leg(data: Dict[str, Any]) -> Dict[str, Any]:
+    legs = data.get("legs")
+    if not legs:
+        raise ValueError("GRVT 订单格式错误：缺少 legs")
+    return legs[0]
+
+
+def _grvt_fields(data: Dict[str, Any], status: str) -> tuple:
+    leg = _grvt_leg(data)
+    metadata = data.get("metadata") or {}
+    state = data.get("state") or {}
+    traded = state.get("traded_size")
+    created = metadata.get("create_time")
+    return (
+        # 与 GrvtAdapter 一致：GRVT 用 client_order_id 作为订单标识
+        str(metadata.get("client_order_id", "")),
+        leg.get("instrument", ""),
+        "buy" if leg.get("is_buying_asset") else "sell",
+        "market" if data.get("is_market") else "limit",
+        leg.get("size") or "0",
+        leg.get("limit_price") or None,
+        traded[0] if traded else "0",
+        status,
+        str(data.get("time_in_force", "gtc")).lower(),
+        bool(data.get("reduce_only", False)),
+        metadata.get("client_order_id"),
+        int(created) // 1_000_000 if created else None,
+        int(state["update_time"]) // 1_000_000 if state.get("update_time") else None,
+    )
+
+
+def _grvt_numbers(data: Dict[str, Any]) -> tuple:
+    leg = _grvt_leg(data)
+    traded = (data.get("state") or {}).get("traded_size")
+    return (
+        str((data.get("metadata") or {}).get("client_order_id", "")),
+        bool(leg.get("is_buying_asset")),
+        leg.get("limit_price"),
+        leg.get("size") or "0",
+        traded[0] if traded else "0",
+    )
+
+
+_NUMBERS = {"standx": _standx_numbers, "grvt": _grvt_numbers}
@@ -0,0 +1,441 @@
+"""
+Order Journal
+
+所有适配器共用的订单/事件审计日志。
+
+交易路径只做一次 deque.append（CPython 下原子、无锁），不做任何磁盘 IO；
+后台写线程按批取出记录，写入按日期和大小滚动的文件（CSV 或紧凑二进制格式），
+并按 fsync 策略落盘。队列积压超过上限时丢弃新记录并计数，永远不会阻塞下单。
+
+使用示例:
+    journal = OrderJournal("logs/journal", fmt="csv", fsync="interval")
+    journal.start()
+    set_default_journal(journal)      # 之后创建的适配器自动记录所有下单/撤单调用
+
+    journal.record("place_order", exchange="grvt", symbol="BTC_USDT_Perp", side="buy",
+                   quantity=Decimal("0.01"), price=Decimal("68000"), order_id="0x01")
+
+    for row in read_journal("logs/journal", symbol="BTC_USDT_Perp", event="place_order"):
+        print(row)
+
+查询工具见 adapters/journal_query.py。
+"""
+import csv
+import io
+import os
+import struct
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+
+JOURNAL_FIELDS = (
+    "ts_ns",
+    "exchange",
+    "event",
+    "symbol",
+    "side",
+    "order_type",
+    "quantity",
+    "price",
+    "order_id",
+    "client_order_id",
+    "status",
+    "latency_us",
+    "error",
+    "extra",
+)
+
+FORMATS = ("csv", "bin")
+FSYNC_POLICIES = ("none", "batch", "interval")
+
+# 二进制格式: 文件头 + 若干条记录
+# 每条记录: <I 负载长度> + <q ts_ns> + <q latency_us(-1 表示空)> + 其余字段依次为 <I 长度> + UTF-8
+# （按长度切分，错误信息等自由文本中出现任何字符都不影响解析）
+_BIN_MAGIC = b"ORDJRNL2"
+_BIN_LEN = struct.Struct("<I")
+_BIN_HEAD = struct.Struct("<qq")
+_STR_FIELDS = JOURNAL_FIELDS[1:11] + JOURNAL_FIELDS[12:]
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if hasattr(value, "value") and not isinstance(value, (str, bytes)):
+        value = value.value  # Enum
+    return str(value)
+
+
+class OrderJournal:
+    """
+    缓冲式异步订单日志
+
+    - record: 交易路径调用，只入队，不阻塞
+    - start/stop: 启动/停止后台写线程，stop 会先写完队列中的记录
+    - flush: 等待当前队列写入磁盘（用于退出前或测试）
+    """
+
+    def __init__(
+        self,
+        directory: str = "logs/journal",
+        fmt: str = "csv",
+        prefix: str = "orders",
+        max_bytes: int = 64 * 1024 * 1024,
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+        flush_interval: float = 0.2,
+        batch_size: int = 1024,
+        max_pending: int = 100_000,
+    ):
+        """
+        Args:
+            directory: 日志目录
+            fmt: 文件格式，"csv" 或 "bin"（紧凑二进制）
+            prefix: 文件名前缀，文件名形如 orders-20260101-000.csv
+            max_bytes: 单个文件大小上限，超过后滚动到新文件（同时按日期滚动）
+            fsync: 落盘策略，"none" 只写入系统缓存，"batch" 每批写完都 fsync，
+                   "interval" 最多每 fsync_interval 秒 fsync 一次
+            fsync_interval: fsync="interval" 时的间隔（秒）
+            flush_interval: 写线程空闲时的轮询间隔（秒）
+            batch_size: 每批最多写入的记录数
+            max_pending: 队列积压上限，超过后丢弃新记录
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"不支持的日志格式: {fmt}，可选: {', '.join(FORMATS)}")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"不支持的 fsync 策略: {fsync}，可选: {', '.join(FSYNC_POLICIES)}")
+        self.directory = directory
+        self.fmt = fmt
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self._queue: deque = deque()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._file_day: Optional[str] = None
+        self._file_seq = 0
+        self._last_fsync = 0.0
+        self._enqueued = 0
+        self._written = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "OrderJournal":
+        """从配置字典创建（如 YAML 中的 order_journal 段），忽略 enable 等无关键"""
+        keys = (
+            "directory", "fmt", "prefix", "max_bytes", "fsync", "fsync_interval",
+            "flush_interval", "batch_size", "max_pending",
+        )
+        return cls(**{k: config[k] for k in keys if k in config})
+
+    # ---------- 交易路径 ----------
+
+    def record(
+        self,
+        event: str,
+        exchange: str = "",
+        symbol: Optional[str] = None,
+        side: Any = None,
+        order_type: Any = None,
+        quantity: Any = None,
+        price: Any = None,
+        order_id: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+        status: Any = "ok",
+        latency_us: Optional[int] = None,
+        error: Optional[str] = None,
+        extra: Any = None,
+    ) -> bool:
+        """
+        记录一条订单事件（只入队，格式化和写盘都在后台线程完成）
+
+        Returns:
+            bool: 是否入队成功，队列积压超过上限时返回 False
+        """
+        if len(self._queue) >= self.max_pending:
+            self.dropped += 1
+            return False
+        self._queue.append((
+            time.time_ns(), exchange, event, symbol, side, order_type, quantity, price,
+            order_id, client_order_id, status, latency_us, error, extra,
+        ))
+        self._enqueued += 1
+        return True
+
+    @property
+    def pending(self) -> int:
+        """队列中尚未写入的记录数"""
+        return len(self._queue)
+
+    # ---------- 生命周期 ----------
+
+    def start(self) -> "OrderJournal":
+        """启动后台写线程（重复调用无副作用）"""
+        if self._running:
+            return self
+        os.makedirs(self.directory, exist_ok=True)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="order-journal", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """停止写线程，写完队列中剩余的记录并关闭文件"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """等待已入队的记录全部写入，返回是否在超时前完成"""
+        target = self._enqueued
+        deadline = time.time() + timeout
+        while self._written + self.errors < target:
+            if not self._running or time.time() > deadline:
+                return False
+            time.sleep(min(self.flush_interval, 0.01))
+        return True
+
+    def __enter__(self) -> "OrderJournal":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ---------- 写线程 ----------
+
+    def _run(self) -> None:
+        try:
+            while True:
+                batch = self._drain()
+                if batch:
+                    self._write_batch(batch)
+                elif not self._running:
+                    return
+                else:
+                    time.sleep(self.flush_interval)
+        finally:
+            self._close_file()
+
+    def _drain(self) -> List[tuple]:
+        queue = self._queue
+        batch = []
+        while queue and len(batch) < self.batch_size:
+            batch.append(queue.popleft())
+        return batch
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        try:
+            f = self._current_file(batch[0][0])
+            if self.fmt == "csv":
+                buf = io.StringIO()
+                writer = csv.writer(buf)
+                for rec in batch:
+                    writer.writerow([_text(v) for v in rec])
+                f.write(buf.getvalue().encode("utf-8"))
+            else:
+                f.write(b"".join(_encode_bin(rec) for rec in batch))
+            f.flush()
+            self._sync(f)
+            self._written += len(batch)
+        except Exception as e:
+            # 写日志失败不能影响交易，丢弃本批并继续
+            self.errors += len(batch)
+            print(f"[OrderJournal] 写入失败，丢弃 {len(batch)} 条记录: {e}")
+            self._close_file()
+
+    def _sync(self, f) -> None:
+        if self.fsync == "none":
+            return
+        now = time.time()
+        if self.fsync == "batch" or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(f.fileno())
+            self._last_fsync = now
+
+    def _current_file(self, ts_ns: int):
+        day = datetime.fromtimestamp(ts_ns / 1e9).strftime("%Y%m%d")
+        if self._file is not None and day == self._file_day and self._file.tell() < self.max_bytes:
+            return self._file
+
+        if day != self._file_day:
+            self._file_day = day
+            self._file_seq = _last_seq(self.directory, self.prefix, day, self.fmt)
+        elif self._file is not None:
+            self._file_seq += 1
+        self._close_file()
+
+        path = _journal_path(self.directory, self.prefix, day, self._file_seq, self.fmt)
+        if os.path.exists(path) and os.path.getsize(path) >= self.max_bytes:
+            self._file_seq += 1
+            path = _journal_path(self.directory, self.prefix, day, self._file_seq, self.fmt)
+
+        f = open(path, "ab")
+        if f.tell() == 0:
+            if self.fmt == "csv":
+                f.write((",".join(JOURNAL_FIELDS) + "\r\n").encode("utf-8"))
+            else:
+                f.write(_BIN_MAGIC)
+        self._file = f
+        return f
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            if self.fsync != "none":
+                os.fsync(self._file.fileno())
+            self._file.close()
+        except Exception as e:
+            print(f"[OrderJournal] 关闭文件失败: {e}")
+        self._file = None
+
+
+def _journal_path(directory: str, prefix: str, day: str, seq: int, fmt: str) -> str:
+    return os.path.join(directory, f"{prefix}-{day}-{seq:03d}.{fmt}")
+
+
+def _last_seq(directory: str, prefix: str, day: str, fmt: str) -> int:
+    """当天已有文件的最大序号（重启后继续追加），没有则为 0"""
+    head = f"{prefix}-{day}-"
+    seqs = [0]
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return 0
+    for name in names:
+        if name.startswith(head) and name.endswith(f".{fmt}"):
+            seq = name[len(head):-len(fmt) - 1]
+            if seq.isdigit():
+                seqs.append(int(seq))
+    return max(seqs)
+
+
+def _encode_bin(rec: tuple) -> bytes:
+    latency = rec[11]
+    parts = [_BIN_HEAD.pack(rec[0], -1 if latency is None else int(latency))]
+    for i in (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13):
+        field = _text(rec[i]).encode("utf-8")
+        parts.append(_BIN_LEN.pack(len(field)))
+        parts.append(field)
+    payload = b"".join(parts)
+    return _BIN_LEN.pack(len(payload)) + payload
+
+
+def _decode_bin(payload: bytes) -> Dict[str, Any]:
+    ts_ns, latency = _BIN_HEAD.unpack_from(payload)
+    offset = _BIN_HEAD.size
+    row: Dict[str, Any] = {}
+    for name in _STR_FIELDS:
+        (size,) = _BIN_LEN.unpack_from(payload, offset)
+        offset += _BIN_LEN.size
+        row[name] = payload[offset:offset + size].decode("utf-8")
+        offset += size
+    row["ts_ns"] = ts_ns
+    row["latency_us"] = None if latency < 0 else latency
+    return row
+
+
+def _iter_bin(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as f:
+        if f.read(len(_BIN_MAGIC)) != _BIN_MAGIC:
+            raise ValueError(f"不是订单日志二进制文件: {path}")
+        while True:
+            head = f.read(_BIN_LEN.size)
+            if len(head) < _BIN_LEN.size:
+                return
+            (size,) = _BIN_LEN.unpack(head)
+            payload = f.read(size)
+            if len(payload) < size:
+                return  # 末尾未写完整的记录
+            yield _decode_bin(payload)
+
+
+def _iter_csv(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            row["ts_ns"] = int(row["ts_ns"])
+            row["latency_us"] = int(row["latency_us"]) if row["latency_us"] else None
+            yield row
+
+
+def journal_files(directory: str, prefix: str = "orders") -> List[str]:
+    """按时间顺序返回目录下的日志文件"""
+    files = [
+        name for name in os.listdir(directory)
+        if name.startswith(f"{prefix}-") and name.rsplit(".", 1)[-1] in FORMATS
+    ]
+    return [os.path.join(directory, name) for name in sorted(files)]
+
+
+def _to_ns(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1e9)
+    if isinstance(value, (int, float)):
+        return int(value * 1e9)  # 秒级时间戳
+    return int(datetime.fromisoformat(str(value)).timestamp() * 1e9)
+
+
+def read_journal(
+    directory: str,
+    prefix: str = "orders",
+    since: Any = None,
+    until: Any = None,
+    **filters: Any,
+) -> Iterator[Dict[str, Any]]:
+    """
+    读取订单日志
+
+    Args:
+        directory: 日志目录
+        prefix: 文件名前缀
+        since / until: 时间范围，datetime、秒级时间戳或 ISO 格式字符串
+        **filters: 按字段精确匹配，如 symbol="BTC-USD", event="place_order", status="error"
+
+    Yields:
+        Dict[str, Any]: 单条记录，ts_ns / latency_us 为整数，其余字段为字符串
+    """
+    since_ns = _to_ns(since)
+    until_ns = _to_ns(until)
+    for key in filters:
+        if key not in JOURNAL_FIELDS:
+            raise ValueError(f"未知字段: {key}")
+    wanted = {k: str(v) for k, v in filters.items() if v is not None}
+
+    for path in journal_files(directory, prefix):
+        rows = _iter_bin(path) if path.endswith(".bin") else _iter_csv(path)
+        for row in rows:
+            if since_ns is not None and row["ts_ns"] < since_ns:
+                continue
+            if until_ns is not None and row["ts_ns"] > until_ns:
+                continue
+            if any(row.get(k) != v for k, v in wanted.items()):
+                continue
+            yield row
+
+
+# ---------- 默认日志 ----------
+
+_DEFAULT_JOURNAL: Optional[OrderJournal] = None
+
+
+def set_default_journal(journal: Optional[OrderJournal]) -> None:
+    """设置进程内默认日志，之后创建的适配器都会写入该日志（传 None 关闭）"""
+    global _DEFAULT_JOURNAL
+    _DEFAULT_JOURNAL = journal
+
+
+def get_default_journal() -> Optional[OrderJournal]:
+    """获取进程内默认日志，未设置返回 None"""
+    return _DEFAULT_JOURNAL
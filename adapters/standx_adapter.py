@@ -8,6 +8,7 @@ import os
 import time
 import base64
 import base58
+import uuid
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
 
@@ -16,6 +17,11 @@ project_root = os.path.join(os.path.dirname(__file__), '..')
 sys.path.insert(0, project_root)
 
 from adapters.base_adapter import BasePerpAdapter, Balance, Position, Order
+from adapters.credential_manager import CredentialManager
+from adapters.instruments import Instrument, instruments_from_standx
+from adapters.normalizers import OrderNormalizer
+from adapters.metadata_cache import get_default_metadata_cache
+from adapters.transport import get_default_transport
 
 # 导入 StandX 相关模块
 import sys
@@ -25,9 +31,10 @@ sys.path.insert(0, project_root)
 
 from exchange.exchange_standx.standx_protocol.perps_auth import StandXAuth
 from exchange.exchange_standx.standx_protocol.perp_http import StandXPerpHTTP
-from eth_account.messages import encode_defunct
-from eth_account import Account
-from web3 import Web3
+# eth_account 导入较慢（约 1 秒），只在钱包私钥方式下才导入，见 _wallet_account
+
+
+_ORDER_NORMALIZER = OrderNormalizer("standx")
 
 
 class StandXAdapter(BasePerpAdapter):
@@ -46,6 +53,22 @@ class StandXAdapter(BasePerpAdapter):
                     - private_key: 钱包私钥
                     - chain: 链名称，如 "bsc" 或 "solana"
                 - base_url: API 基础 URL（可选，默认 https://perps.standx.com）
+                - geo_url: 签名时间戳所用 geo 服务地址（可选，默认 https://geo.standx.com）
+                - auth_auto_refresh: 钱包方式下是否在 JWT 过期前后台重新登录（可选，默认 True）
+                - auth_refresh_ahead: 提前刷新的秒数（可选，默认 3600）
+                - order_entry: 下单/撤单通道，"rest"（默认）或 "ws"（订单 WebSocket ws-api/v1，
+                  连接不可用或超时时自动回退 REST）
+                - ws_url: 订单 WebSocket 地址（可选，默认由 base_url 推导）
+                - ws_rpc_timeout: WS 请求等待响应的超时秒数（可选，默认 2）
+                - ws_max_in_flight: WS 最大在途请求数（可选，默认 64）
+                - ws_connect_timeout: connect() 等待 WS 连接并登录的秒数（可选，默认 10）
+                - ws_lookup_timeout: WS 下单超时后按 cl_ord_id 查询订单的最长秒数（可选，默认 5），
+                  超过后仍查不到则抛出异常，不回退 REST 重发
+                - endpoint_probe_interval: REST 接入点测速/保活间隔秒数（可选，默认 0 不启用），
+                  启用后 connect() 时预先建立连接，之后定期探测保持连接不被空闲断开
+                - endpoints: 候选 REST 地址列表（可选，默认只有 base_url），按 RTT 选择最快的地址
+                - http2: REST 是否走 HTTP/2（可选，默认 False，需要 httpx[http2]）
+                - metadata_cache: 是否使用交易对信息磁盘缓存（可选，默认 True），过期的缓存在后台刷新
         """
         super().__init__(config)
         
@@ -72,18 +95,39 @@ class StandXAdapter(BasePerpAdapter):
         # chain 字段有默认值 "bsc"，所以即使不提供也可以工作
         
         base_url = config.get("base_url", "https://perps.standx.com")
-        self.http_client = StandXPerpHTTP(base_url=base_url)
+        self.metadata_cache = get_default_metadata_cache() if config.get("metadata_cache", True) else None
+        # REST 请求走进程共享的传输层（共享连接池、统一超时/重试、快速 JSON）
+        self.http_client = StandXPerpHTTP(
+            base_url=base_url,
+            geo_url=config.get("geo_url", "https://geo.standx.com"),
+            session=get_default_transport().session(http2=bool(config.get("http2", False))),
+            metadata_cache=self.metadata_cache,
+        )
+        self.base_url = base_url
+        
+        self.auth_auto_refresh = bool(config.get("auth_auto_refresh", True))
+        self.auth_refresh_ahead = float(config.get("auth_refresh_ahead", 3600))
+        self.credential_manager: Optional[CredentialManager] = None
+        
+        self.order_entry = str(config.get("order_entry", "rest")).lower()
+        if self.order_entry not in ("rest", "ws"):
+            raise ValueError(f"不支持的 order_entry: {self.order_entry}（可选 rest / ws）")
+        self.ws_orders = None  # StandXWsOrderEntry，connect() 时创建
+        self.ws_lookup_timeout = float(config.get("ws_lookup_timeout", 5.0))
+        self.ws_lookup_interval = 0.5
+        self.endpoint_probe_interval = float(config.get("endpoint_probe_interval", 0) or 0)
+        self.endpoints = None  # EndpointManager，connect() 时创建
         
         # 根据配置选择认证方式
         if self.api_key:
             # API Token 方式：使用提供的 signing_key 初始化 StandXAuth
             signing_key_bytes = self._parse_signing_key(self.signing_key)
-            self.auth = StandXAuth(private_key=signing_key_bytes)
+            self.auth = StandXAuth(private_key=signing_key_bytes, session=self.http_client.session)
             self.use_api_token = True
             self.token = self.api_key  # API Token 直接作为 token 使用
         else:
             # 钱包私钥方式：生成新的 Ed25519 密钥对用于请求签名
-            self.auth = StandXAuth()
+            self.auth = StandXAuth(session=self.http_client.session)
             self.use_api_token = False
             
             # 获取钱包地址
@@ -92,8 +136,8 @@ class StandXAdapter(BasePerpAdapter):
             else:
                 private_key = self.private_key
             
-            account = Web3().eth.account.from_key(private_key)
-            self.wallet_address = account.address
+            self._wallet_account = self._load_wallet_account(private_key)
+            self.wallet_address = self._wallet_account.address
             self.token: Optional[str] = None
     
     def _parse_signing_key(self, signing_key: str) -> bytes:
@@ -153,40 +197,142 @@ class StandXAdapter(BasePerpAdapter):
         
         raise ValueError(f"无法解析 signing_key，支持的格式：base64、hex、base58。当前长度: {len(signing_key)}")
     
+    @staticmethod
+    def _load_wallet_account(private_key: str):
+        """从钱包私钥创建 eth_account 账户（延迟导入 eth_account）"""
+        from eth_account import Account
+        return Account.from_key(private_key)
+    
     def _sign_message(self, message: str) -> str:
         """签名消息"""
-        private_key = self.private_key
-        if private_key.startswith('0x'):
-            private_key = private_key[2:]
+        from eth_account.messages import encode_defunct
         
-        account = Account.from_key(private_key)
         message_encoded = encode_defunct(text=message)
-        signed = account.sign_message(message_encoded)
+        signed = self._wallet_account.sign_message(message_encoded)
         return "0x" + signed.signature.hex()
     
+    def _token_expires_at(self, token: str) -> Optional[float]:
+        """从 JWT 的 exp 字段解析过期时间戳，无法解析时返回 None"""
+        try:
+            exp = self.auth._parse_jwt(token).get("exp")
+            return float(exp) if exp else None
+        except Exception:
+            return None
+    
+    def _login(self):
+        """钱包签名登录，返回 (token, 过期时间戳)"""
+        login_response = self.auth.authenticate(
+            chain=self.chain,
+            wallet_address=self.wallet_address,
+            sign_message=self._sign_message
+        )
+        if not login_response.token:
+            raise Exception("登录响应中缺少 token")
+        return login_response.token, self._token_expires_at(login_response.token)
+    
+    def _set_token(self, token: str):
+        """原子替换当前 token（单次属性赋值），WS 下单通道随之重新登录"""
+        self.token = token
+        if self.ws_orders is not None:
+            self.ws_orders.relogin(token)
+    
     def connect(self) -> bool:
         """连接到 StandX 并完成认证"""
+        if self.endpoint_probe_interval > 0 and self.endpoints is None:
+            self._start_endpoints()
         try:
             if self.use_api_token:
                 # API Token 方式：直接使用 API Token，无需登录
                 # token 已经在 __init__ 中设置为 api_key
+                expires_at = self._token_expires_at(self.token)
+                if expires_at is not None and expires_at - time.time() < self.auth_refresh_ahead:
+                    print(f"[StandX] 警告: API Token 将在 {max(expires_at - time.time(), 0):.0f} 秒后过期")
+                if self.order_entry == "ws" and self.ws_orders is None:
+                    self._start_ws_orders()
                 return True
             else:
                 # 钱包私钥方式：需要先登录获取 token
-                def sign_message(msg: str) -> str:
-                    return self._sign_message(msg)
-                
-                login_response = self.auth.authenticate(
-                    chain=self.chain,
-                    wallet_address=self.wallet_address,
-                    sign_message=sign_message
-                )
+                token, expires_at = self._login()
+                self.token = token
                 
-                self.token = login_response.token
+                # JWT 过期前由后台线程重新登录，交易调用只读取 self.token
+                if self.auth_auto_refresh and self.credential_manager is None:
+                    manager = CredentialManager()
+                    manager.register(
+                        "standx_jwt",
+                        refresh_fn=self._login,
+                        refresh_ahead=self.auth_refresh_ahead,
+                        on_refresh=self._set_token,
+                        initial=token,
+                        initial_expires_at=expires_at,
+                    )
+                    manager.start()
+                    self.credential_manager = manager
+                if self.order_entry == "ws" and self.ws_orders is None:
+                    self._start_ws_orders()
                 return True
         except Exception as e:
             raise Exception(f"StandX 认证失败: {e}")
     
+    def _start_endpoints(self):
+        """测速并预热 REST 接入点（最快的地址作为 base_url），之后后台定期探测保活"""
+        from adapters.endpoints import EndpointManager
+        
+        urls = self.config.get("endpoints") or [self.base_url]
+        self._switch_base_url(urls[0].rstrip("/"))
+        manager = EndpointManager(interval=self.endpoint_probe_interval, session=self.http_client.session)
+        manager.add_group(
+            "standx",
+            urls,
+            path="/api/health",
+            method="GET",
+            on_switch=self._switch_base_url,
+        )
+        # 签名时间戳每次下单都请求 geo 服务，同样需要保持连接
+        manager.add_group("standx-geo", [self.http_client.geo_url], path="/v1/region", method="GET")
+        try:
+            manager.start()
+        except Exception as e:
+            print(f"[StandX] 接入点测速启动失败: {e}")
+            return
+        self.endpoints = manager
+    
+    def _switch_base_url(self, url: str):
+        self.base_url = url
+        self.http_client.base_url = url
+    
+    def _start_ws_orders(self):
+        """建立订单 WebSocket 长连接并登录，失败时继续使用 REST"""
+        from adapters.standx_ws_orders import StandXWsOrderEntry, ws_api_url
+        
+        ws_orders = StandXWsOrderEntry(
+            self.config.get("ws_url") or ws_api_url(self.base_url),
+            self.auth,
+            token_getter=lambda: self.token,
+            timeout=float(self.config.get("ws_rpc_timeout", 2.0)),
+            max_in_flight=int(self.config.get("ws_max_in_flight", 64)),
+            connect_timeout=float(self.config.get("ws_connect_timeout", 10.0)),
+        )
+        try:
+            ws_orders.start()
+        except Exception as e:
+            print(f"[StandX] WS 下单通道启动失败，使用 REST: {e}")
+            return
+        self.ws_orders = ws_orders
+        print("[StandX] WS 下单通道已连接")
+    
+    def close(self):
+        """停止后台凭证刷新和接入点探测，关闭 WS 下单通道"""
+        if self.endpoints is not None:
+            self.endpoints.stop()
+            self.endpoints = None
+        if self.credential_manager is not None:
+            self.credential_manager.stop()
+            self.credential_manager = None
+        if self.ws_orders is not None:
+            self.ws_orders.close()
+            self.ws_orders = None
+    
     def get_balance(self) -> Balance:
         """查询账户余额"""
         if not self.token:
@@ -283,19 +429,30 @@ class StandXAdapter(BasePerpAdapter):
             else:
                 side_str = side
             
-            response = self.http_client.place_order(
-                token=self.token,
-                symbol=symbol,
-                side=side_str,
-                order_type=order_type,
-                qty=str(quantity),
-                price=str(price) if price else None,
-                time_in_force=time_in_force,
-                reduce_only=reduce_only,
-                cl_ord_id=client_order_id,
-                auth=self.auth,
-                **kwargs
-            )
+            response = None
+            # margin_mode / leverage 等额外参数只走 REST
+            if self.ws_orders is not None and not kwargs:
+                if not client_order_id:
+                    # WS 超时后按 cl_ord_id 确认订单是否已创建，避免重复下单
+                    client_order_id = uuid.uuid4().hex
+                response = self._place_order_ws(
+                    symbol, side_str, order_type, str(quantity), str(price) if price else None,
+                    time_in_force, reduce_only, client_order_id,
+                )
+            if response is None:
+                response = self.http_client.place_order(
+                    token=self.token,
+                    symbol=symbol,
+                    side=side_str,
+                    order_type=order_type,
+                    qty=str(quantity),
+                    price=str(price) if price else None,
+                    time_in_force=time_in_force,
+                    reduce_only=reduce_only,
+                    cl_ord_id=client_order_id,
+                    auth=self.auth,
+                    **kwargs
+                )
             
             if response.get("code") != 0:
                 raise Exception(f"下单失败: {response.get('message', '未知错误')}")
@@ -318,6 +475,77 @@ class StandXAdapter(BasePerpAdapter):
         except Exception as e:
             raise Exception(f"下单失败: {e}")
     
+    def _place_order_ws(
+        self, symbol, side, order_type, qty, price, time_in_force, reduce_only, cl_ord_id
+    ) -> Optional[Dict[str, Any]]:
+        """
+        通过 WS 下单，返回服务端响应；连接不可用时返回 None 由调用方回退 REST
+        
+        服务端拒单（StandXRpcError）直接抛出，不回退。超时后在 ws_lookup_timeout 内按 cl_ord_id
+        查询订单，查到则返回，仍查不到则抛出异常（StandX 不保证拒绝重复的 cl_ord_id，重发可能重复下单）。
+        """
+        from adapters.standx_ws_orders import StandXRpcError, StandXRpcTimeout, StandXRpcUnavailable
+        
+        try:
+            return self.ws_orders.new_order(
+                symbol=symbol,
+                side=side,
+                order_type=order_type,
+                qty=qty,
+                price=price,
+                time_in_force=time_in_force,
+                reduce_only=reduce_only,
+                cl_ord_id=cl_ord_id,
+            )
+        except StandXRpcError as e:
+            raise Exception(f"StandX 下单被拒绝: {e}")
+        except StandXRpcTimeout as e:
+            print(f"[StandX] WS 下单超时，按 cl_ord_id 确认订单状态: {e}")
+            return self._lookup_timed_out_order(symbol, cl_ord_id)
+        except StandXRpcUnavailable as e:
+            print(f"[StandX] WS 下单通道不可用，回退 REST: {e}")
+        return None
+    
+    def _lookup_timed_out_order(self, symbol: str, cl_ord_id: str) -> Dict[str, Any]:
+        """在最近订单中按 cl_ord_id 查找超时的 WS 订单，ws_lookup_timeout 内查不到则抛出异常"""
+        deadline = time.monotonic() + self.ws_lookup_timeout
+        while True:
+            try:
+                recent = self.http_client.query_orders(token=self.token, symbol=symbol, limit=50)
+            except Exception as e:
+                print(f"[StandX] 查询最近订单失败: {e}")
+                recent = {}
+            for order in recent.get("result") or []:
+                if order.get("cl_ord_id") == cl_ord_id:
+                    return {"code": 0, "request_id": order.get("id", "")}
+            if time.monotonic() >= deadline:
+                raise Exception(
+                    f"WS 下单超时且 {self.ws_lookup_timeout}s 内查不到订单 {cl_ord_id}，状态未知，未重发"
+                )
+            time.sleep(self.ws_lookup_interval)
+    
+    def _cancel_orders(
+        self,
+        order_id_list: Optional[List[int]] = None,
+        cl_ord_id_list: Optional[List[str]] = None,
+    ):
+        """撤单：优先走 WS，连接不可用或超时时回退 REST（撤单可安全重发）"""
+        if self.ws_orders is not None:
+            from adapters.standx_ws_orders import StandXRpcError, StandXRpcUnavailable
+            
+            try:
+                return self.ws_orders.cancel_order(order_id_list, cl_ord_id_list)
+            except StandXRpcError as e:
+                raise Exception(f"StandX 撤单被拒绝: {e}")
+            except StandXRpcUnavailable as e:
+                print(f"[StandX] WS 撤单失败，回退 REST: {e}")
+        return self.http_client.cancel_orders(
+            token=self.token,
+            order_id_list=order_id_list,
+            cl_ord_id_list=cl_ord_id_list,
+            auth=self.auth
+        )
+    
     def cancel_order(
         self,
         order_id: Optional[str] = None,
@@ -355,12 +583,7 @@ class StandXAdapter(BasePerpAdapter):
             if client_order_id:
                 cl_ord_id_list = [client_order_id]
             
-            result = self.http_client.cancel_orders(
-                token=self.token,
-                order_id_list=order_id_list,
-                cl_ord_id_list=cl_ord_id_list,
-                auth=self.auth
-            )
+            result = self._cancel_orders(order_id_list, cl_ord_id_list)
             
             # API 返回空数组表示成功
             return True
@@ -405,11 +628,7 @@ class StandXAdapter(BasePerpAdapter):
                 return True  # 没有有效的订单ID
             
             # 批量撤单
-            result = self.http_client.cancel_orders(
-                token=self.token,
-                order_id_list=order_id_list,
-                auth=self.auth
-            )
+            result = self._cancel_orders(order_id_list)
             
             return True
         except Exception as e:
@@ -437,12 +656,7 @@ class StandXAdapter(BasePerpAdapter):
             raise ValueError("必须提供 order_id_list 或 cl_ord_id_list")
         
         try:
-            result = self.http_client.cancel_orders(
-                token=self.token,
-                order_id_list=order_id_list,
-                cl_ord_id_list=cl_ord_id_list,
-                auth=self.auth
-            )
+            result = self._cancel_orders(order_id_list, cl_ord_id_list)
             return True
         except Exception as e:
             raise Exception(f"批量撤单失败: {e}")
@@ -454,12 +668,30 @@ class StandXAdapter(BasePerpAdapter):
         client_order_id: Optional[str] = None,
     ) -> Optional[Order]:
         """
-        查询订单状态
+        查询订单状态（在最近的订单历史中按 order_id 或 cl_ord_id 查找）
         
-        注意: 需要根据 StandX API 文档实现
+        Returns:
+            Optional[Order]: 订单信息（含成交数量和状态），未找到时返回 None
         """
-        # TODO: 实现订单查询
-        raise NotImplementedError("StandX 订单查询功能待实现")
+        if not self.token:
+            raise Exception("未认证，请先调用 connect()")
+        if not order_id and not client_order_id:
+            raise ValueError("必须提供 order_id 或 client_order_id")
+        
+        try:
+            recent = self.http_client.query_orders(token=self.token, symbol=symbol, limit=100)
+        except Exception as e:
+            raise Exception(f"查询订单失败: {e}")
+        for data in recent.get("result") or []:
+            if (order_id and str(data.get("id")) == str(order_id)) or (
+                client_order_id and data.get("cl_ord_id") == client_order_id
+            ):
+                return _ORDER_NORMALIZER.order(data)
+        return None
+    
+    def load_instruments(self) -> List[Instrument]:
+        """从 StandX 交易对信息加载精度（price_tick_decimals / qty_tick_decimals）"""
+        return instruments_from_standx(self.http_client.load_symbol_info())
     
     def get_open_orders(
         self,
@@ -484,59 +716,7 @@ class StandXAdapter(BasePerpAdapter):
                 limit=1200
             )
             
-            orders = []
-            for order_data in orders_data.get("result", []):
-                # 映射订单状态
-                status_map = {
-                    "new": "open",
-                    "pending": "pending",
-                    "partially_filled": "partially_filled",
-                    "filled": "filled",
-                    "cancelled": "cancelled",
-                    "rejected": "rejected"
-                }
-                status = status_map.get(order_data.get("status", "").lower(), "pending")
-                
-                # 只返回未成交的订单
-                if status not in ["open", "pending", "partially_filled"]:
-                    continue
-                
-                # 解析时间戳
-                created_at = None
-                updated_at = None
-                if order_data.get("created_at"):
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(order_data["created_at"].replace("Z", "+00:00"))
-                        created_at = int(dt.timestamp() * 1000)
-                    except:
-                        pass
-                if order_data.get("updated_at"):
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(order_data["updated_at"].replace("Z", "+00:00"))
-                        updated_at = int(dt.timestamp() * 1000)
-                    except:
-                        pass
-                
-                order = Order(
-                    order_id=str(order_data.get("id", "")),
-                    symbol=order_data.get("symbol", ""),
-                    side=order_data.get("side", "").lower(),
-                    order_type=order_data.get("order_type", "").lower(),
-                    quantity=Decimal(str(order_data.get("qty", "0"))),
-                    price=Decimal(str(order_data.get("price", "0"))) if order_data.get("price") else None,
-                    filled_quantity=Decimal(str(order_data.get("fill_qty", "0"))),
-                    status=status,
-                    time_in_force=order_data.get("time_in_force", "gtc").lower(),
-                    reduce_only=order_data.get("reduce_only", False),
-                    client_order_id=order_data.get("cl_ord_id"),
-                    created_at=created_at,
-                    updated_at=updated_at,
-                )
-                orders.append(order)
-            
-            return orders
+            return _ORDER_NORMALIZER.orders(orders_data.get("result", []), open_only=True)
         except Exception as e:
             raise Exception(f"查询未成交订单失败: {e}")
     
@@ -0,0 +1,140 @@
+"""
+StandX WebSocket Order Entry
+
+通过 StandX 订单 WebSocket（ws-api/v1）下单/撤单的同步封装，供 StandXAdapter 和同步的策略循环使用。
+
+StandXOrderStream 运行在后台线程（LoopThread）的事件循环上，自带请求超时、在途请求上限、断线重连和
+重新登录（通过 token_getter 读取适配器当前的 JWT，后台刷新 JWT 后自动生效）。
+
+失败语义（由调用方决定是否回退 REST）:
+    StandXRpcError        服务端拒绝（code != 0），不应回退重试
+    StandXRpcUnavailable  未连接 / 连接断开 / 在途请求已满，请求未送达或结果未知
+    StandXRpcTimeout      超时未收到响应（StandXRpcUnavailable 的子类），请求可能已被执行
+
+使用示例:
+    entry = StandXWsOrderEntry("wss://perps.standx.com/ws-api/v1", auth, token_getter=lambda: adapter.token)
+    entry.start()
+    entry.new_order(symbol="BTC-USD", side="buy", order_type="limit", qty="0.01", price="68000",
+                    time_in_force="gtc", reduce_only=False, cl_ord_id="grid-1")
+    entry.cancel_order(cl_ord_id_list=["grid-1"])
+    entry.close()
+"""
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from exchange.exchange_standx.standx_protocol.perps_wss import (
+    StandXOrderStream,
+    StandXRpcError,
+    StandXRpcTimeout,
+    StandXRpcUnavailable,
+)
+
+from adapters.loop_thread import LoopThread
+
+__all__ = ["StandXWsOrderEntry", "StandXRpcError", "StandXRpcTimeout", "StandXRpcUnavailable", "ws_api_url"]
+
+
+def ws_api_url(base_url: str) -> str:
+    """REST 地址推导订单 WebSocket 地址，如 https://perps.standx.com -> wss://perps.standx.com/ws-api/v1"""
+    host = base_url.rstrip("/").split("://", 1)[-1]
+    scheme = "ws" if base_url.startswith("http://") else "wss"
+    return f"{scheme}://{host}/ws-api/v1"
+
+
+class StandXWsOrderEntry:
+    """
+    StandX WS 下单通道（后台线程 + 事件循环 + StandXOrderStream）
+
+    Args:
+        url: 订单 WebSocket 地址
+        auth: StandXAuth 实例（请求签名）
+        token_getter: 返回当前 JWT 的函数（登录和重连后重新登录使用）
+        timeout: 单个请求的超时（秒）
+        max_in_flight: 最大在途请求数
+        connect_timeout: start() 连接并登录的超时（秒）
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth: Any,
+        token_getter: Callable[[], Optional[str]],
+        timeout: float = 2.0,
+        max_in_flight: int = 64,
+        connect_timeout: float = 10.0,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.stream = StandXOrderStream(
+            url,
+            timeout=timeout,
+            max_in_flight=max_in_flight,
+            token_getter=token_getter,
+        )
+        self.stream.auth = auth
+        self._loop_thread = LoopThread("standx-ws-orders")
+
+    @property
+    def connected(self) -> bool:
+        return self._loop_thread.running and self.stream.connected
+
+    def start(self) -> bool:
+        """启动后台线程，连接并登录；失败时抛出异常"""
+        if self._loop_thread.running:
+            return self.connected
+        self._loop_thread.start()
+        try:
+            self._loop_thread.run(self.stream.connect(), self.connect_timeout)
+        except BaseException:
+            self._loop_thread.stop(self.stream.close())
+            raise
+        return self.connected
+
+    def relogin(self, token: str) -> None:
+        """JWT 刷新后在当前连接上重新登录（不等待结果，失败时下次重连会再次登录）"""
+        if self.connected:
+            self._loop_thread.submit(self.stream.login(token))
+
+    def close(self) -> None:
+        """关闭连接并停止后台线程"""
+        if self._loop_thread.running:
+            self._loop_thread.stop(self.stream.close())
+
+    def _call(self, coro) -> Dict[str, Any]:
+        if not self._loop_thread.running:
+            coro.close()
+            raise StandXRpcUnavailable("StandX 订单流未启动")
+        try:
+            # 请求自身在 timeout 后抛出 StandXRpcTimeout，这里多留一点余量给线程切换
+            return self._loop_thread.run(coro, self.timeout + 1.0)
+        except TimeoutError as e:
+            raise StandXRpcTimeout(f"StandX 订单流 {self.timeout}s 内未响应") from e
+
+    def new_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        time_in_force: str,
+        reduce_only: bool,
+        price: Optional[str] = None,
+        cl_ord_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """下单，返回服务端响应（code / message / request_id）"""
+        return self._call(
+            self.stream.new_order(symbol, side, order_type, qty, time_in_force, reduce_only, price, cl_ord_id)
+        )
+
+    def cancel_order(
+        self,
+        order_id_list: Optional[List[int]] = None,
+        cl_ord_id_list: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """撤单，返回服务端响应"""
+        return self._call(self.stream.cancel_order(order_id_list, cl_ord_id_list))
@@ -0,0 +1,440 @@
+"""
+HTTP Transport
+StandX / GRVT / Nado SDK 共用的 HTTP 传输层
+
+- 共享连接池：所有客户端的 Session 挂载同一组连接适配器，同一主机的请求复用同一批 keep-alive 连接
+- 同步接口：session() 返回 requests.Session 子类，SDK 原有的 session.get/post 调用方式不变；
+  每个客户端一个 Session（cookie、账户请求头各自独立），连接池共享
+- 异步接口：async_session() 返回 aiohttp.ClientSession，同一事件循环内共享一个 TCPConnector
+- HTTP/2：同步接口可对支持的主机走 HTTP/2（一个连接上多路复用并发请求），需要可选依赖 httpx[http2]，
+  未安装时回退到 HTTP/1.1
+- 统一超时：请求未指定 timeout 时使用传输层默认值（SDK 自己传了 timeout 的以 SDK 为准）
+- 统一重试：连接失败（请求未发出，任何方法都安全）重试；502/503/504 只对幂等方法（GET/HEAD/OPTIONS）重试；
+  读超时不重试（服务端可能已处理），直接抛出 requests.Timeout。下单等 POST 请求不会因为重试而重复提交
+- 查询 Session：session(query=True) 给只发只读查询的客户端（Nado engine/indexer 的查询走 POST），
+  429/5xx 和读超时对所有方法退避重试，这类 Session 之间共享另一组连接池
+- 快速 JSON：默认有 orjson 时用 orjson 编解码 json= 请求体和 response.json()，
+  orjson 处理不了的值（超过 64 位的整数、Decimal 等）自动回退到标准库 json
+
+使用示例:
+    transport = get_default_transport()
+    client = StandXPerpHTTP(base_url, session=transport.session())
+    grvt = GrvtCcxt(env, parameters=parameters, session=transport.session(http2=True))
+    nado = create_nado_client(mode, signer, session=transport.session())
+    market = EngineQueryClient(EngineClientOpts(url=gateway_url), session=transport.session(query=True))
+
+    async def main():
+        ws = GrvtCcxtWS(env, asyncio.get_running_loop(), parameters=parameters,
+                        session=transport.async_session())
+"""
+import asyncio
+import json
+import re
+import threading
+import weakref
+from http.client import HTTPMessage
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+Timeout = Union[float, Tuple[float, float]]
+
+# HTTP/2 禁止出现的逐跳请求头（requests 默认会带 Connection: keep-alive）
+_HOP_BY_HOP_HEADERS = frozenset(
+    ("connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade", "host")
+)
+
+
+# ---------- JSON ----------
+
+class JsonCodec:
+    """JSON 编解码器：loads 接受 bytes/str，dumps 返回 bytes"""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# 20 位以上的数字串：可能超出 64 位整数范围，orjson 会把这类整数解析成 float（丢精度）
+_LONG_DIGITS = re.compile(rb"\d{20}|-\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{20}|-\d{19}")
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson 编解码，orjson 无法精确处理的数据回退到标准库"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        pattern = _LONG_DIGITS_STR if isinstance(data, str) else _LONG_DIGITS
+        if pattern.search(data):
+            # 可能含大整数（如 Nado 的 x18 数值），用标准库保证精确
+            return json.loads(data)
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            # 超过 64 位的整数（Nado 的 x18 数值）、Decimal、非字符串键等
+            return super().dumps(obj)
+
+
+def make_json_codec(codec: Union[str, JsonCodec, None] = "auto") -> JsonCodec:
+    """
+    选择 JSON 编解码器
+
+    Args:
+        codec: "auto"（有 orjson 用 orjson，否则标准库）、"orjson"、"json"，或自定义的 JsonCodec 实例
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec in (None, "auto"):
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JsonCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "json":
+        return JsonCodec()
+    raise ValueError(f"未知的 JSON 编解码器: {codec}")
+
+
+# ---------- HTTP/2 ----------
+
+def _split_timeout(timeout) -> Tuple[Optional[float], Optional[float]]:
+    if isinstance(timeout, tuple):
+        return timeout[0], timeout[1]
+    return timeout, timeout
+
+
+class _RawHttp2:
+    """给 requests 提取 Set-Cookie 用的最小 raw 对象（requests 从 raw._original_response.msg 读取响应头）"""
+
+    version = 20
+
+    def __init__(self, msg: HTTPMessage):
+        self._original_response = self
+        self.msg = msg
+
+    def close(self) -> None:
+        pass
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    基于 httpx 的 HTTP/2 连接适配器，挂载到 requests.Session 上使用
+
+    同一主机的并发请求在一个连接上多路复用；服务端不支持 HTTP/2 时 httpx 通过 ALPN 自动降级为 HTTP/1.1。
+    只在连接阶段失败时重试（httpx 的 retries 语义与上面的 HTTP/1.1 适配器一致）。
+    """
+
+    def __init__(self, pool_maxsize: int = 32, retries: int = 2):
+        super().__init__()
+        import httpx
+
+        self._httpx = httpx
+        self._transport = httpx.HTTPTransport(
+            http2=True,
+            retries=retries,
+            limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+        )
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self._httpx
+        connect, read = _split_timeout(timeout)
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        headers = [(k, v) for k, v in request.headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS]
+        hx_request = httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=body or b"",
+            extensions={"timeout": {"connect": connect, "read": read, "write": read, "pool": connect}},
+        )
+        try:
+            hx_response = self._transport.handle_request(hx_request)
+            try:
+                content = hx_response.read()
+            finally:
+                hx_response.close()
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        msg = HTTPMessage()
+        for key, value in hx_response.headers.multi_items():
+            msg[key] = value
+        response = requests.Response()
+        response.status_code = hx_response.status_code
+        response.reason = hx_response.reason_phrase
+        response.headers = CaseInsensitiveDict(hx_response.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _RawHttp2(msg)
+        response._content = content
+        response._content_consumed = True
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+# ---------- 同步 Session ----------
+
+class TransportSession(requests.Session):
+    """
+    挂载共享连接池的 requests.Session
+
+    每个客户端各自一个（cookie、请求头独立），close() 不关闭共享的连接池。
+    """
+
+    def __init__(self, transport: "HttpTransport", timeout: Timeout, http2: bool, query: bool = False):
+        super().__init__()
+        for adapter in self.adapters.values():
+            adapter.close()
+        self.adapters.clear()
+        if query:
+            self.mount("https://", transport.query_adapter)
+            self.mount("http://", transport.query_adapter)
+        else:
+            self.mount("https://", transport.https_adapter(http2))
+            self.mount("http://", transport.http_adapter)
+        self.timeout = timeout
+        self.codec = transport.codec
+
+    def request(self, method, url, **kwargs):
+        payload = kwargs.get("json")
+        if payload is not None and kwargs.get("data") is None:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **(kwargs.get("headers") or {})}
+        return super().request(method, url, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        response = super().send(request, **kwargs)
+        response.json = _FastJson(response, self.codec)
+        return response
+
+    def close(self) -> None:
+        # 连接池属于 HttpTransport，由 HttpTransport.close() 关闭
+        self.adapters.clear()
+
+
+class _FastJson:
+    """替换 response.json：先用快速解码器，失败（或带参数调用）时走 requests 原实现以保持原有异常类型"""
+
+    __slots__ = ("response", "codec")
+
+    def __init__(self, response: requests.Response, codec: JsonCodec):
+        self.response = response
+        self.codec = codec
+
+    def __call__(self, **kwargs):
+        if not kwargs:
+            try:
+                return self.codec.loads(self.response.content)
+            except Exception:
+                pass
+        return requests.Response.json(self.response, **kwargs)
+
+
+# ---------- 传输层 ----------
+
+class HttpTransport:
+    """
+    共享 HTTP 传输层
+
+    Args:
+        timeout: 默认超时（秒），可为 (连接超时, 读超时)
+        retries: 连接失败重试次数；幂等请求的 502/503/504 也按此次数重试
+        backoff: 重试退避系数（秒）
+        query_retries: 查询 Session（session(query=True)）在 429/5xx/读超时时的重试次数
+        query_backoff: 查询 Session 的重试退避系数（秒）
+        pool_maxsize: 每个主机保持的连接数
+        http2: session() 默认是否走 HTTP/2（需要 httpx[http2]）
+        json_codec: "auto" / "orjson" / "json" 或 JsonCodec 实例
+    """
+
+    def __init__(
+        self,
+        timeout: Timeout = (3.05, 10.0),
+        retries: int = 2,
+        backoff: float = 0.05,
+        pool_maxsize: int = 32,
+        http2: bool = False,
+        json_codec: Union[str, JsonCodec, None] = "auto",
+        query_retries: int = 5,
+        query_backoff: float = 0.5,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.pool_maxsize = pool_maxsize
+        self.http2 = http2
+        self.codec = make_json_codec(json_codec)
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=False,
+            status=retries,
+            backoff_factor=backoff,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(("GET", "HEAD", "OPTIONS")),
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        self.http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+        query_retry = Retry(
+            total=query_retries,
+            backoff_factor=query_backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,  # 查询也可能走 POST
+            raise_on_status=False,
+        )
+        self.query_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=query_retry)
+        self._http2_adapter: Optional[BaseAdapter] = None
+        self._http2_unavailable = False
+        self._lock = threading.Lock()
+        # 事件循环 -> 共享的 aiohttp TCPConnector
+        self._connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+    def https_adapter(self, http2: Optional[bool] = None) -> BaseAdapter:
+        """https 请求使用的连接适配器；请求 HTTP/2 但缺少 httpx/h2 时回退到 HTTP/1.1"""
+        if not (self.http2 if http2 is None else http2) or self._http2_unavailable:
+            return self.http_adapter
+        with self._lock:
+            if self._http2_adapter is None and not self._http2_unavailable:
+                try:
+                    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+
+                    self._http2_adapter = Http2Adapter(self.pool_maxsize, self.retries)
+                except ImportError:
+                    self._http2_unavailable = True
+                    print("[传输层] 未安装 httpx[http2]，HTTP/2 不可用，使用 HTTP/1.1")
+        return self._http2_adapter or self.http_adapter
+
+    def session(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Timeout] = None,
+        http2: Optional[bool] = None,
+        query: bool = False,
+    ) -> TransportSession:
+        """
+        新建一个挂载共享连接池的同步 Session
+
+        Args:
+            headers: 该 Session 的默认请求头
+            timeout: 覆盖传输层的默认超时
+            http2: 覆盖传输层的 HTTP/2 默认值
+            query: 只发只读查询（429/5xx/读超时对所有方法重试，始终为 HTTP/1.1），不能用于下单
+        """
+        session = TransportSession(
+            self,
+            self.timeout if timeout is None else timeout,
+            bool(self.http2 if http2 is None else http2),
+            query,
+        )
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    def async_session(self, headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        """
+        新建一个共享当前事件循环连接池的 aiohttp.ClientSession，必须在运行中的事件循环内调用
+
+        aiohttp 不支持 HTTP/2，异步接口始终为 HTTP/1.1；Session 关闭时不会关闭共享的连接池。
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        connector = self._connectors.get(loop)
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.pool_maxsize,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+            self._connectors[loop] = connector
+        connect, read = _split_timeout(self.timeout if timeout is None else timeout)
+        codec = self.codec
+        return aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=False,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=None, connect=connect, sock_read=read),
+            json_serialize=lambda obj: codec.dumps(obj).decode("utf-8"),
+        )
+
+    async def close_async(self) -> None:
+        """关闭当前事件循环的共享连接池"""
+        connector = self._connectors.pop(asyncio.get_running_loop(), None)
+        if connector is not None:
+            await connector.close()
+
+    def close(self) -> None:
+        """关闭同步连接池（HTTP/1.1、查询与 HTTP/2）"""
+        self.http_adapter.close()
+        self.query_adapter.close()
+        if self._http2_adapter is not None:
+            self._http2_adapter.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """连接池概况：各主机累计建立的连接数（远小于请求数说明连接在复用）"""
+        pools = {}
+        for adapter in (self.http_adapter, self.query_adapter):
+            for key in list(adapter.poolmanager.pools.keys()):
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is not None:
+                    name = f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+                    pools[name] = pools.get(name, 0) + pool.num_connections
+        return {
+            "json": self.codec.name,
+            "http2": self._http2_adapter is not None,
+            "pools": pools,
+            "async_loops": len(self._connectors),
+        }
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """进程内共享的默认传输层"""
+    global _default_transport
+    if _default_transport is None:
+        with _default_lock:
+            if _default_transport is None:
+                _default_transport = HttpTransport()
+    return _default_transport
+
+
+def configure_default_transport(**kwargs) -> HttpTransport:
+    """用新参数替换默认传输层（应在创建任何客户端之前调用），参数同 HttpTransport"""
+    global _default_transport
+    with _default_lock:
+        _default_transport = HttpTransport(**kwargs)
+    return _default_transport
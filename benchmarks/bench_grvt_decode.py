@@ -0,0 +1,135 @@
+"""
+GRVT 原始响应解码基准测试
+
+对比 dacite.from_dict 与 pysdk.grvt_raw_decode.from_dict 在录制的响应样本上的
+解码吞吐（条/秒）和峰值内存（tracemalloc），并对比 slots 与普通 dataclass 的内存占用。
+
+运行:
+    python benchmarks/bench_grvt_decode.py
+    python benchmarks/bench_grvt_decode.py --repeat 2000 --rounds 5
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from enum import Enum
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+grvt_sdk_path = os.path.join(project_root, 'exchange', 'exchange_grvt', 'src')
+if grvt_sdk_path not in sys.path:
+    sys.path.insert(0, grvt_sdk_path)
+
+from dacite import Config
+from dacite import from_dict as dacite_from_dict
+
+from pysdk import grvt_raw_types
+from pysdk.grvt_raw_decode import from_dict as fast_from_dict
+
+PAYLOADS_PATH = os.path.join(os.path.dirname(__file__), 'data', 'grvt_raw_payloads.json')
+DACITE_CONFIG = Config(cast=[Enum])
+
+
+def load_payloads(path=PAYLOADS_PATH):
+    """读取录制的响应样本，返回 [(响应类型, payload)]"""
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    return [(getattr(grvt_raw_types, name), payload) for name, payload in raw.items()]
+
+
+def _decode_all(decode, samples, repeat):
+    out = []
+    for _ in range(repeat):
+        for data_class, payload in samples:
+            out.append(decode(data_class, payload))
+    return out
+
+
+def bench_throughput(name, decode, samples, repeat, rounds):
+    """多轮取最快一轮，返回每秒解码的响应数"""
+    best = None
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        _decode_all(decode, samples, repeat)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    total = repeat * len(samples)
+    rate = total / best
+    print(f"  {name:<10} {rate:>12,.0f} 条/秒  ({best * 1000:.1f}ms / {total} 条)")
+    return rate
+
+
+def bench_peak_memory(name, decode, samples, repeat):
+    """解码并保留全部结果时的峰值内存（字节）"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = _decode_all(decode, samples, repeat)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    print(f"  {name:<10} {peak / 1024 / 1024:>10.2f} MiB")
+    return peak
+
+
+def _without_slots(data_class, cache):
+    """生成同字段的普通（带 __dict__）dataclass，用于对比 slots 的内存占用"""
+    if data_class in cache:
+        return cache[data_class]
+    cls = dataclasses.make_dataclass(
+        data_class.__name__,
+        [(f.name, f.type, f) for f in dataclasses.fields(data_class)],
+    )
+    cache[data_class] = cls
+    return cls
+
+
+def _dacite_decode(data_class, payload):
+    return dacite_from_dict(data_class, payload, DACITE_CONFIG)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GRVT 响应解码基准测试")
+    parser.add_argument('--repeat', type=int, default=1000, help="每轮重复解码样本的次数")
+    parser.add_argument('--rounds', type=int, default=3, help="吞吐测试轮数（取最快一轮）")
+    parser.add_argument('--payloads', default=PAYLOADS_PATH, help="录制的响应样本文件")
+    args = parser.parse_args()
+
+    samples = load_payloads(args.payloads)
+    print(f"样本: {', '.join(c.__name__ for c, _ in samples)}，每轮 x{args.repeat}")
+
+    # 两种解码结果必须一致
+    for data_class, payload in samples:
+        assert fast_from_dict(data_class, payload) == _dacite_decode(data_class, payload), data_class
+
+    print("\n吞吐:")
+    slow = bench_throughput("dacite", _dacite_decode, samples, args.repeat, args.rounds)
+    fast = bench_throughput("fast", fast_from_dict, samples, args.repeat, args.rounds)
+    print(f"  提升 {fast / slow:.1f}x")
+
+    print("\n峰值内存（保留全部解码结果）:")
+    bench_peak_memory("dacite", _dacite_decode, samples, args.repeat)
+    bench_peak_memory("fast", fast_from_dict, samples, args.repeat)
+
+    # 只替换顶层响应类型无法去掉嵌套对象的 __dict__，这里直接对比最常见的叶子类型
+    leaf_cache = {}
+    fills = [f for c, p in samples if c is grvt_raw_types.ApiFillHistoryResponse for f in p['result']]
+    if fills:
+        fill_cls = grvt_raw_types.Fill
+        dict_fill_cls = _without_slots(fill_cls, leaf_cache)
+        leaf_samples = [(fill_cls, f) for f in fills]
+        dict_samples = [(dict_fill_cls, f) for f in fills]
+        print("\nFill 单条对象（slots vs __dict__）:")
+        a = bench_peak_memory("slots", fast_from_dict, leaf_samples, args.repeat * 10)
+        b = bench_peak_memory("__dict__", fast_from_dict, dict_samples, args.repeat * 10)
+        print(f"  节省 {(1 - a / b) * 100:.0f}%")
+
+
+if __name__ == '__main__':
+    main()
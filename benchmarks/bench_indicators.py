@@ -0,0 +1,170 @@
+"""
+技术指标基准测试
+
+对比三种实现在 [品种数 × K线数] 随机K线上的耗时与结果差异:
+- numpy:  risk.indicators_np，一次向量化计算整个品种池
+- python: exchange_grvt/tests/risk_script.py 的 calculate_rsi / calculate_adx，逐品种纯 Python 循环
+- talib:  原 IndicatorTool 的做法，逐品种构造 DataFrame 后调用 talib（未安装 TA-Lib 时跳过）
+
+安装了 TA-Lib 时会校验 NumPy 实现与 talib.RSI / ATR / ADX / PLUS_DI / MINUS_DI / BBANDS 的最大误差。
+
+运行:
+    python benchmarks/bench_indicators.py
+    python benchmarks/bench_indicators.py --symbols 500 --bars 1000 --period 14
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+grvt_root = os.path.join(project_root, 'exchange', 'exchange_grvt')
+for path in (project_root, grvt_root):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from risk import indicators_np as ind
+
+try:
+    from tests.risk_script import calculate_adx, calculate_rsi
+except ImportError as e:
+    print(f"跳过 risk_script 对比（导入失败: {e}）")
+    calculate_adx = calculate_rsi = None
+
+try:
+    import pandas as pd
+    import talib
+except ImportError:
+    talib = None
+
+# 与 TA-Lib 对照的容许误差
+TOLERANCE = 1e-6
+
+
+def make_universe(symbols, bars, seed=7):
+    """生成随机游走K线，返回 (high, low, close)，形状 [symbols, bars]"""
+    rng = np.random.default_rng(seed)
+    vol = rng.uniform(0.002, 0.02, size=(symbols, 1))
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1, (symbols, bars)) * vol, axis=1))
+    spread = np.abs(rng.normal(0, 1, (symbols, bars))) * vol * close
+    high = close + spread * rng.uniform(0, 1, (symbols, bars))
+    low = close - spread * rng.uniform(0, 1, (symbols, bars))
+    return high, low, close
+
+
+def timed(fn, rounds):
+    best = None
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_numpy(high, low, close, period):
+    return {
+        'rsi': ind.rsi(close, period)[:, -1],
+        'adx': ind.adx(high, low, close, period)[:, -1],
+    }
+
+
+def run_python(high, low, close, period):
+    rsi_values, adx_values = [], []
+    for h, l, c in zip(high.tolist(), low.tolist(), close.tolist()):
+        rsi_values.append(calculate_rsi(c, period))
+        adx_values.append(calculate_adx(h, l, c, period))
+    return {'rsi': np.array(rsi_values, dtype=float), 'adx': np.array(adx_values, dtype=float)}
+
+
+def run_talib(high, low, close, period):
+    rsi_values, adx_values = [], []
+    for h, l, c in zip(high, low, close):
+        df = pd.DataFrame({'high': h, 'low': l, 'close': c})
+        rsi_values.append(talib.RSI(df['close'], timeperiod=period).iloc[-1])
+        adx_values.append(talib.ADX(df['high'], df['low'], df['close'], timeperiod=period).iloc[-1])
+    return {'rsi': np.array(rsi_values), 'adx': np.array(adx_values)}
+
+
+def _max_err(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    if not np.array_equal(np.isnan(a), np.isnan(b)):
+        return float('inf')
+    mask = ~np.isnan(a)
+    return float(np.max(np.abs(a[mask] - b[mask]))) if mask.any() else 0.0
+
+
+def check_against_talib(high, low, close, period):
+    """逐品种对比完整序列，返回 {指标: 最大绝对误差}"""
+    ours = {
+        'RSI': ind.rsi(close, period),
+        'ATR': ind.atr(high, low, close, period),
+        'PLUS_DI': ind.plus_di(high, low, close, period),
+        'MINUS_DI': ind.minus_di(high, low, close, period),
+        'DX': ind.dx(high, low, close, period),
+        'ADX': ind.adx(high, low, close, period),
+        'BBANDS': ind.bbands(close, 20, 2.0, 2.0)[0],
+    }
+    errors = {name: 0.0 for name in ours}
+    for i in range(close.shape[0]):
+        h, l, c = high[i], low[i], close[i]
+        ref = {
+            'RSI': talib.RSI(c, timeperiod=period),
+            'ATR': talib.ATR(h, l, c, timeperiod=period),
+            'PLUS_DI': talib.PLUS_DI(h, l, c, timeperiod=period),
+            'MINUS_DI': talib.MINUS_DI(h, l, c, timeperiod=period),
+            'DX': talib.DX(h, l, c, timeperiod=period),
+            'ADX': talib.ADX(h, l, c, timeperiod=period),
+            'BBANDS': talib.BBANDS(c, timeperiod=20, nbdevup=2.0, nbdevdn=2.0, matype=0)[0],
+        }
+        for name, values in ref.items():
+            errors[name] = max(errors[name], _max_err(ours[name][i], values))
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="技术指标基准测试")
+    parser.add_argument('--symbols', type=int, default=200, help="品种数")
+    parser.add_argument('--bars', type=int, default=500, help="每个品种的K线数")
+    parser.add_argument('--period', type=int, default=14, help="指标周期")
+    parser.add_argument('--rounds', type=int, default=3, help="测试轮数（取最快一轮）")
+    args = parser.parse_args()
+
+    high, low, close = make_universe(args.symbols, args.bars)
+    print(f"品种 {args.symbols} × K线 {args.bars}，周期 {args.period}（RSI + ADX，取最新值）\n")
+
+    np_time, np_result = timed(lambda: run_numpy(high, low, close, args.period), args.rounds)
+    print(f"  numpy   {np_time * 1000:>10.2f} ms")
+
+    if calculate_rsi is not None:
+        py_time, py_result = timed(lambda: run_python(high, low, close, args.period), args.rounds)
+        print(f"  python  {py_time * 1000:>10.2f} ms  ({py_time / np_time:.1f}x)")
+        print(
+            f"          与 numpy 差异: RSI {_max_err(py_result['rsi'], np_result['rsi']):.2e}, "
+            f"ADX {_max_err(py_result['adx'], np_result['adx']):.2e}"
+        )
+
+    if talib is None:
+        print("  talib   未安装，跳过")
+        return
+
+    ta_time, ta_result = timed(lambda: run_talib(high, low, close, args.period), args.rounds)
+    print(f"  talib   {ta_time * 1000:>10.2f} ms  ({ta_time / np_time:.1f}x)")
+
+    print("\n与 TA-Lib 对照（完整序列最大绝对误差）:")
+    errors = check_against_talib(high, low, close, args.period)
+    failed = False
+    for name, err in errors.items():
+        ok = err <= TOLERANCE
+        failed |= not ok
+        print(f"  {name:<9} {err:.2e} {'OK' if ok else '超出容差'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
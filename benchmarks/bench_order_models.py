@@ -0,0 +1,219 @@
+"""
+订单模型与转换基准测试
+
+在 N 条（默认 10000）StandX 格式的随机订单上对比:
+- legacy:  原 StandXAdapter.get_open_orders 的循环（每单重建 status_map、函数内 import datetime、
+           Decimal(str(...))），构造带 __dict__ 的普通订单对象
+- slots:   OrderNormalizer.orders，构造 __slots__ 版 Order
+- ticks:   OrderNormalizer.orders 同时输出整数 price_ticks / quantity_lots
+- arrays:  OrderNormalizer.arrays，直接写入列式 OrderArrays，不构造订单对象
+
+各方式轮流执行（每轮依次跑一遍所有方式，机器负载的波动对各方式影响相同），计时期间关闭 GC，
+输出每种方式的耗时中位数与结果对象的内存占用（tracemalloc），并校验结果一致。
+
+运行:
+    python benchmarks/bench_order_models.py
+    python benchmarks/bench_order_models.py --orders 50000 --rounds 21
+"""
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from adapters.normalizers import OrderNormalizer
+
+PRICE_DECIMALS = 2
+QTY_DECIMALS = 4
+
+
+class LegacyOrder:
+    """改造前的 Order（普通类，每个实例带 __dict__）"""
+
+    def __init__(self, order_id, symbol, side, order_type, quantity, price=None,
+                 filled_quantity=Decimal("0"), status="pending", time_in_force=None,
+                 reduce_only=False, client_order_id=None, created_at=None, updated_at=None):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.side = side
+        self.order_type = order_type
+        self.quantity = quantity
+        self.price = price
+        self.filled_quantity = filled_quantity
+        self.status = status
+        self.time_in_force = time_in_force
+        self.reduce_only = reduce_only
+        self.client_order_id = client_order_id
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+def make_orders(n, seed=7):
+    """生成 StandX query_open_orders 格式的订单"""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    statuses = ["new", "new", "new", "partially_filled", "filled", "cancelled"]
+    records = []
+    for i in range(n):
+        qty = rng.randint(1, 5000)
+        created = start + timedelta(milliseconds=rng.randint(0, 86_400_000))
+        records.append({
+            "id": 100_000_000 + i,
+            "cl_ord_id": f"cl-{i}",
+            "symbol": "ETH-USD",
+            "side": rng.choice(["buy", "sell"]),
+            "order_type": "limit",
+            "price": f"{rng.randint(250_000, 350_000) / 100:.2f}",
+            "qty": f"{qty / 10_000:.4f}",
+            "fill_qty": f"{rng.randint(0, qty) / 10_000:.4f}",
+            "status": rng.choice(statuses),
+            "time_in_force": "gtc",
+            "reduce_only": False,
+            "created_at": created.isoformat().replace("+00:00", "Z"),
+            "updated_at": (created + timedelta(seconds=1)).isoformat().replace("+00:00", "Z"),
+        })
+    return records
+
+
+def legacy_orders(records):
+    """原 StandXAdapter.get_open_orders 的转换循环"""
+    orders = []
+    for order_data in records:
+        status_map = {
+            "new": "open",
+            "pending": "pending",
+            "partially_filled": "partially_filled",
+            "filled": "filled",
+            "cancelled": "cancelled",
+            "rejected": "rejected"
+        }
+        status = status_map.get(order_data.get("status", "").lower(), "pending")
+        if status not in ["open", "pending", "partially_filled"]:
+            continue
+        created_at = None
+        updated_at = None
+        if order_data.get("created_at"):
+            try:
+                from datetime import datetime
+                dt = datetime.fromisoformat(order_data["created_at"].replace("Z", "+00:00"))
+                created_at = int(dt.timestamp() * 1000)
+            except:
+                pass
+        if order_data.get("updated_at"):
+            try:
+                from datetime import datetime
+                dt = datetime.fromisoformat(order_data["updated_at"].replace("Z", "+00:00"))
+                updated_at = int(dt.timestamp() * 1000)
+            except:
+                pass
+        orders.append(LegacyOrder(
+            order_id=str(order_data.get("id", "")),
+            symbol=order_data.get("symbol", ""),
+            side=order_data.get("side", "").lower(),
+            order_type=order_data.get("order_type", "").lower(),
+            quantity=Decimal(str(order_data.get("qty", "0"))),
+            price=Decimal(str(order_data.get("price", "0"))) if order_data.get("price") else None,
+            filled_quantity=Decimal(str(order_data.get("fill_qty", "0"))),
+            status=status,
+            time_in_force=order_data.get("time_in_force", "gtc").lower(),
+            reduce_only=order_data.get("reduce_only", False),
+            client_order_id=order_data.get("cl_ord_id"),
+            created_at=created_at,
+            updated_at=updated_at,
+        ))
+    return orders
+
+
+def timed(cases, rounds):
+    """各方式轮流执行 rounds 轮，返回 {名称: (耗时中位数, 最后一次结果)}"""
+    samples = {name: [] for name, _ in cases}
+    results = {}
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            for name, fn in cases:
+                start = time.perf_counter()
+                results[name] = fn()
+                samples[name].append(time.perf_counter() - start)
+                gc.collect()
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return {name: (statistics.median(samples[name]), results[name]) for name, _ in cases}
+
+
+def retained_bytes(fn):
+    """fn 返回结果所占用的内存（tracemalloc 统计，结果对象保持存活时的增量）"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def check(legacy, slots, ticks, arrays):
+    """校验各实现结果一致"""
+    assert len(legacy) == len(slots) == len(ticks) == len(arrays), "订单数量不一致"
+    fields = ("order_id", "symbol", "side", "quantity", "price", "filled_quantity", "status", "created_at", "updated_at")
+    for old, new in zip(legacy, slots):
+        for field in fields:
+            assert getattr(old, field) == getattr(new, field), f"{field}: {getattr(old, field)} != {getattr(new, field)}"
+    scale_p, scale_q = 10 ** PRICE_DECIMALS, 10 ** QTY_DECIMALS
+    for i, order in enumerate(ticks):
+        assert order.price_ticks == int(order.price * scale_p) == arrays.price_ticks[i]
+        assert order.quantity_lots == int(order.quantity * scale_q) == arrays.qty_lots[i]
+        assert order.filled_lots == int(order.filled_quantity * scale_q) == arrays.filled_lots[i]
+        assert order.order_id == arrays.order_ids[i]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="订单模型与转换基准测试")
+    parser.add_argument('--orders', type=int, default=10_000, help="订单数")
+    parser.add_argument('--rounds', type=int, default=15, help="测试轮数（取中位数）")
+    args = parser.parse_args()
+
+    records = make_orders(args.orders)
+    slots = OrderNormalizer("standx")
+    ticks = OrderNormalizer("standx", price_decimals=PRICE_DECIMALS, qty_decimals=QTY_DECIMALS)
+
+    cases = [
+        ("legacy", lambda: legacy_orders(records)),
+        ("slots", lambda: slots.orders(records, open_only=True)),
+        ("ticks", lambda: ticks.orders(records, open_only=True)),
+        ("arrays", lambda: ticks.arrays(records, open_only=True)),
+    ]
+
+    results = {}
+    base = None
+    timings = timed(cases, args.rounds)
+    print(f"{args.orders} 条订单（保留未成交订单），{args.rounds} 轮中位数\n")
+    print(f"  {'方式':<8}{'耗时 ms':>10}{'加速':>8}{'订单/秒':>12}{'结果内存 KB':>14}")
+    for name, fn in cases:
+        elapsed, results[name] = timings[name]
+        memory = retained_bytes(fn)
+        base = base or elapsed
+        print(
+            f"  {name:<8}{elapsed * 1000:>10.2f}{base / elapsed:>7.1f}x"
+            f"{args.orders / elapsed:>12,.0f}{memory / 1024:>14,.0f}"
+        )
+
+    check(results["legacy"], results["slots"], results["ticks"], results["arrays"])
+    print(f"\n结果一致（未成交订单 {len(results['slots'])} 条）")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+启动耗时（导入时间）基准测试
+
+每个场景在新的子进程里用 ``python -X importtime`` 执行一次导入，统计:
+- 进程总耗时（含解释器启动，取最快一轮）
+- 导入总耗时（-X importtime 顶层模块累计耗时之和）
+- 最慢的顶层模块
+
+场景:
+- adapters:    import adapters（不加载任何交易所 SDK）
+- standx:      解析 StandX 适配器类（API Token 方式启动的导入量）
+- grvt:        解析 GRVT 适配器类（GRVT pysdk 的 EIP-712 签名依赖 eth_account，
+               其中 eth_keyfile -> py_ecc 约 1 秒无法在本仓库内避免），作为参考，不参与达标判断
+- notrade_mm:  导入网格策略模块（崩溃后重启到 connect 之前的导入量）
+- eager:       改造前的导入集合（所有适配器 + web3/eth_account + 风控模块），作为对照，不参与达标判断
+
+运行:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --rounds 5 --top 8 --target 1.0
+    python benchmarks/bench_startup.py --scenario notrade_mm
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+strategy_dir = os.path.join(project_root, 'strategys', 'strategy_common')
+
+SCENARIOS = {
+    "adapters": "import adapters",
+    "standx": "from adapters import get_adapter_class; get_adapter_class('standx')",
+    "grvt": "from adapters import get_adapter_class; get_adapter_class('grvt')",
+    "notrade_mm": "import notrade_mm",
+    "eager": (
+        "import adapters.standx_adapter, adapters.grvt_adapter, eth_account, web3, "
+        "risk.indicators, risk.regime_scanner, notrade_mm"
+    ),
+}
+
+# 不参与达标判断的场景: 对照 / 受第三方 SDK 限制的参考
+BASELINES = {"eager": "对照", "grvt": "参考"}
+
+
+def parse_importtime(stderr: str):
+    """
+    解析 -X importtime 输出
+
+    Returns:
+        (导入总耗时秒, [(累计微秒, 模块名), ...] 顶层模块)
+    """
+    top_level = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, self_us, cumulative_us, name = (part for part in line.replace("import time:", "|", 1).split("|"))
+        # 顶层模块的名字前只有一个空格，子模块每层多缩进两个空格
+        if name.startswith(" ") and not name.startswith("   "):
+            top_level.append((int(cumulative_us), name.strip()))
+    return sum(us for us, _ in top_level) / 1e6, top_level
+
+
+def run_scenario(code: str):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [strategy_dir, project_root, env.get("PYTHONPATH")]))
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=project_root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "子进程失败")
+    import_total, modules = parse_importtime(proc.stderr)
+    return wall, import_total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="启动耗时（导入时间）基准测试")
+    parser.add_argument('--rounds', type=int, default=3, help="测试轮数（取最快一轮）")
+    parser.add_argument('--top', type=int, default=5, help="列出最慢的顶层模块数")
+    parser.add_argument('--target', type=float, default=1.0, help="进程总耗时目标（秒）")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help="只运行指定场景（可重复）")
+    args = parser.parse_args()
+
+    names = args.scenario or list(SCENARIOS)
+    failed = []
+    print(f"Python {sys.version.split()[0]}，取 {args.rounds} 轮最快，目标 < {args.target:.2f}s\n")
+    print(f"  {'场景':<12}{'进程 ms':>10}{'导入 ms':>10}  结果")
+    details = {}
+    for name in names:
+        best = None
+        try:
+            for _ in range(args.rounds):
+                result = run_scenario(SCENARIOS[name])
+                if best is None or result[0] < best[0]:
+                    best = result
+        except RuntimeError as e:
+            print(f"  {name:<12}{'-':>10}{'-':>10}  ❌ 导入失败: {e}")
+            failed.append(name)
+            continue
+        wall, import_total, modules = best
+        details[name] = modules
+        if name in BASELINES:
+            verdict = BASELINES[name]
+        elif wall < args.target:
+            verdict = "✅"
+        else:
+            verdict = "❌ 超出目标"
+            failed.append(name)
+        print(f"  {name:<12}{wall * 1000:>10.1f}{import_total * 1000:>10.1f}  {verdict}")
+
+    for name, modules in details.items():
+        print(f"\n[{name}] 最慢的顶层模块:")
+        for us, module in sorted(modules, reverse=True)[:args.top]:
+            print(f"  {us / 1000:>9.1f} ms  {module}")
+
+    if failed:
+        print(f"\n未达标: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,381 @@
+"""
+端到端下单吞吐/延迟测试（本地模拟交易所）
+
+启动 benchmarks/mock_exchange.py 中的模拟交易所（或连接 --url 指定的已启动实例），
+对每种适配器配置循环执行 下单 -> 等待确认 -> 撤单 -> 等待确认，统计:
+- 吞吐:   每秒完成的下单+撤单轮数（orders/s）
+- 延迟:   下单确认、撤单确认、整轮（下单到撤单确认）的 p50 / p90 / p99 / max（毫秒）
+- 错误:   失败的轮数（模拟交易所注入的错误/丢弃、超时等）
+StandX 配置同时订阅 ws-stream 的 order 频道，统计下单到收到推送的延迟。
+
+走的是真实的适配器/SDK 代码路径（签名、序列化、连接池、WS 下单通道、超时回退 REST），
+所以可以用来比较 REST 与 WS 下单、观察延迟抖动和错误注入下的回退行为。
+
+配置:
+- standx-rest:  StandXAdapter，order_entry=rest
+- standx-ws:    StandXAdapter，order_entry=ws（订单 WebSocket ws-api/v1）
+- grvt-rest:    GrvtAdapter，order_entry=rest
+- grvt-ws:      GrvtAdapter，order_entry=ws（交易 RPC WebSocket）
+- nado:         Nado EngineClient（仓库中没有 Nado 适配器，直接调用 SDK 的 /execute 下单和撤单）
+
+GRVT SDK（eth-account >= 0.13、pydantic 2）与 Nado SDK（eth-account 0.8、pydantic 1）的依赖版本互斥，
+当前环境加载不了的配置会跳过并打印原因，分别在两个环境里运行即可。
+
+运行:
+    python benchmarks/load_driver.py                                    # 内置模拟交易所，依次测试所有配置
+    python benchmarks/load_driver.py --only standx-rest standx-ws --orders 2000 --concurrency 4
+    python benchmarks/load_driver.py --latency 5 --jitter 3 --error-rate 0.01 --drop-rate 0.005
+    python benchmarks/load_driver.py --url http://127.0.0.1:18080       # 连接 mock_exchange.py 启动的实例
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from decimal import Decimal
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+grvt_sdk_path = os.path.join(project_root, 'exchange', 'exchange_grvt', 'src')
+nado_sdk_path = os.path.join(project_root, 'exchange', 'exchange_nado')
+for path in (project_root, grvt_sdk_path, nado_sdk_path):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from adapters.metrics import percentile
+from benchmarks.mock_exchange import MockExchange, grvt_domains, ws_url
+
+# 仅用于测试的固定私钥（不对应任何真实账户）
+TEST_EVM_KEY = "0x" + "4c" * 32
+TEST_ED25519_KEY = bytes(range(32))
+
+# 下单价格远离模拟价格，订单不会成交
+STANDX_SYMBOL, STANDX_PRICE = "BTC-USD", Decimal("90000.0")
+GRVT_SYMBOL, GRVT_PRICE = "BTC_USDT_Perp", Decimal("90000.0")
+NADO_PRODUCT_ID, NADO_PRICE = 2, 90_000
+QUANTITY = Decimal("0.001")
+
+
+def summarize(values):
+    """毫秒延迟列表 -> {"p50", "p90", "p99", "max"}"""
+    return {
+        "p50": percentile(values, 0.5),
+        "p90": percentile(values, 0.9),
+        "p99": percentile(values, 0.99),
+        "max": round(max(values), 3) if values else None,
+    }
+
+
+# ---------- 客户端 ----------
+# 每种配置一个客户端：place() 下单并返回撤单所需的句柄，cancel(handle) 撤单，close() 释放资源
+
+
+class AdapterClient:
+    """BasePerpAdapter：place_order 返回即已确认，按 client_order_id 撤单"""
+
+    def __init__(self, adapter, symbol: str, price: Decimal, stream_url: str = None):
+        self.adapter = adapter
+        self.symbol = symbol
+        self.price = price
+        self.pushes = []  # 下单到收到 order 频道推送的延迟（毫秒）
+        self._sent = {}  # cl_ord_id -> 下单时间
+        self._stream = None
+        self._loop_thread = None
+        if stream_url:
+            self._start_stream(stream_url)
+
+    def _start_stream(self, url: str):
+        """订阅 StandX ws-stream 的 order 频道（需要认证），统计下单到推送的延迟"""
+        from adapters.loop_thread import LoopThread
+        from exchange.exchange_standx.standx_protocol.perps_wss import StandXMarketStream
+
+        def on_order(message):
+            sent = self._sent.pop(message.get("data", {}).get("cl_ord_id"), None)
+            if sent is not None:
+                self.pushes.append((time.perf_counter() - sent) * 1000)
+
+        async def start():
+            await self._stream.connect()
+            await self._stream.authenticate(self.adapter.token, [{"channel": "order"}])
+            await self._stream.subscribe("order", callback=on_order)
+
+        self._loop_thread = LoopThread("load-driver-stream")
+        self._loop_thread.start()
+        self._stream = StandXMarketStream(url, reconnect=False)
+        try:
+            self._loop_thread.run(start(), 10)
+        except Exception as e:
+            print(f"  order 频道订阅失败，不统计推送延迟: {e}")
+            self._loop_thread.stop(self._stream.close())
+            self._loop_thread = self._stream = None
+
+    def place(self):
+        client_order_id = uuid.uuid4().hex
+        if self._stream is not None:
+            self._sent[client_order_id] = time.perf_counter()
+        order = self.adapter.place_order(
+            self.symbol, "buy", "limit", QUANTITY, self.price, client_order_id=client_order_id,
+        )
+        # GRVT 的 order_id 就是 client_order_id
+        return order.client_order_id or order.order_id
+
+    def cancel(self, client_order_id):
+        if not self.adapter.cancel_order(symbol=self.symbol, client_order_id=client_order_id):
+            raise Exception("撤单未确认")
+
+    def close(self):
+        if self._loop_thread is not None:
+            self._loop_thread.stop(self._stream.close())
+        self.adapter.close()
+
+
+def make_standx(url: str, order_entry: str) -> AdapterClient:
+    import base64
+
+    from adapters.standx_adapter import StandXAdapter
+
+    adapter = StandXAdapter({
+        "exchange_name": "standx",
+        "api_key": "mock-token",
+        "signing_key": base64.b64encode(TEST_ED25519_KEY).decode(),
+        "base_url": url,
+        "geo_url": url,
+        "order_entry": order_entry,
+        "metadata_cache": False,
+    })
+    adapter.connect()
+    if order_entry == "ws" and adapter.ws_orders is None:
+        adapter.close()
+        raise RuntimeError("WS 下单通道未连接")
+    return AdapterClient(adapter, STANDX_SYMBOL, STANDX_PRICE, stream_url=f"{ws_url(url)}/ws-stream/v1")
+
+
+class GrvtClient(AdapterClient):
+    """GRVT 下单时由 SDK 生成 client_order_id（必须是整数），不使用 AdapterClient 的 uuid"""
+
+    def place(self):
+        order = self.adapter.place_order(self.symbol, "buy", "limit", QUANTITY, self.price)
+        return order.order_id
+
+
+def make_grvt(url: str, order_entry: str) -> GrvtClient:
+    from pysdk.grvt_ccxt_env import (
+        GrvtEndpointType,
+        GrvtEnv,
+        GrvtWSEndpointType,
+        set_grvt_endpoint_domain,
+        set_grvt_ws_endpoint,
+    )
+
+    from adapters.grvt_adapter import GrvtAdapter
+
+    # 只改 testnet 环境的地址，不影响同进程内其他 prod 客户端
+    env = GrvtEnv.TESTNET.value
+    domains = grvt_domains(url)
+    set_grvt_endpoint_domain(env, GrvtEndpointType.EDGE, domains["edge"])
+    set_grvt_endpoint_domain(env, GrvtEndpointType.TRADE_DATA, domains["trade_data"])
+    set_grvt_endpoint_domain(env, GrvtEndpointType.MARKET_DATA, domains["market_data"])
+    set_grvt_ws_endpoint(env, GrvtWSEndpointType.TRADE_DATA_RPC_FULL, f"{ws_url(url)}/grvt/trades/ws/full")
+    adapter = GrvtAdapter({
+        "exchange_name": "grvt",
+        "env": env,
+        "api_key": "mock-api-key",
+        "trading_account_id": "1",
+        "private_key": TEST_EVM_KEY,
+        "order_entry": order_entry,
+        "metadata_cache": False,
+    })
+    adapter.connect()
+    if order_entry == "ws" and (adapter.ws_orders is None or not adapter.ws_orders.connected):
+        adapter.close()
+        raise RuntimeError("WS 下单通道未连接")
+    return GrvtClient(adapter, GRVT_SYMBOL, GRVT_PRICE)
+
+
+class NadoClient:
+    """Nado EngineClient：/query 获取合约地址，/execute 下单（返回 digest）和按 digest 撤单"""
+
+    def __init__(self, url: str):
+        from eth_account import Account
+        from nado_protocol.engine_client import EngineClient
+        from nado_protocol.engine_client.types import EngineClientOpts
+        from nado_protocol.utils.bytes32 import subaccount_to_hex
+
+        signer = Account.from_key(TEST_EVM_KEY)
+        self.client = EngineClient(EngineClientOpts(url=f"{url}/nado", signer=signer))
+        contracts = self.client.get_contracts()
+        self.client.chain_id = int(contracts.chain_id)
+        self.client.endpoint_addr = contracts.endpoint_addr
+        self.sender = subaccount_to_hex(signer.address, "default")
+        self.pushes = []
+
+    def place(self):
+        from nado_protocol.utils.expiration import OrderType, get_expiration_timestamp
+        from nado_protocol.utils.order import build_appendix
+
+        response = self.client.place_order({
+            "product_id": NADO_PRODUCT_ID,
+            "order": {
+                "sender": self.sender,
+                "priceX18": NADO_PRICE * 10**18,
+                "amount": int(QUANTITY * 10**18),
+                "expiration": get_expiration_timestamp(60),
+                "appendix": build_appendix(OrderType.POST_ONLY),
+            },
+        })
+        return response.data.digest
+
+    def cancel(self, digest):
+        self.client.cancel_orders({"productIds": [NADO_PRODUCT_ID], "digests": [digest], "sender": self.sender})
+
+    def close(self):
+        self.client.session.close()
+
+
+CONFIGS = {
+    "standx-rest": lambda url: make_standx(url, "rest"),
+    "standx-ws": lambda url: make_standx(url, "ws"),
+    "grvt-rest": lambda url: make_grvt(url, "rest"),
+    "grvt-ws": lambda url: make_grvt(url, "ws"),
+    "nado": NadoClient,
+}
+
+
+# ---------- 压测 ----------
+
+
+def run_load(client, orders: int, concurrency: int, warmup: int = 20) -> dict:
+    """concurrency 个线程共同完成 orders 轮 下单 -> 撤单，返回吞吐和延迟分布"""
+    for _ in range(warmup):
+        try:
+            client.cancel(client.place())
+        except Exception:
+            pass
+    client.pushes.clear()
+
+    place_ms, cancel_ms, round_ms, errors = [], [], [], []
+    lock = threading.Lock()
+    remaining = [orders]
+
+    def worker():
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            start = time.perf_counter()
+            try:
+                handle = client.place()
+                placed = time.perf_counter()
+                client.cancel(handle)
+                done = time.perf_counter()
+            except Exception as e:
+                with lock:
+                    errors.append(str(e))
+                continue
+            with lock:
+                place_ms.append((placed - start) * 1000)
+                cancel_ms.append((done - placed) * 1000)
+                round_ms.append((done - start) * 1000)
+
+    threads = [threading.Thread(target=worker, name=f"load-{i}", daemon=True) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return {
+        "orders": len(round_ms),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "elapsed": round(elapsed, 3),
+        "orders_per_sec": round(len(round_ms) / elapsed, 1) if elapsed > 0 else None,
+        "place_ms": summarize(place_ms),
+        "cancel_ms": summarize(cancel_ms),
+        "round_ms": summarize(round_ms),
+        "push_ms": summarize(client.pushes) if client.pushes else None,
+    }
+
+
+def _fmt(summary) -> str:
+    if not summary or summary["p50"] is None:
+        return f"{'-':>31}"
+    return f"{summary['p50']:>7.2f}{summary['p90']:>8.2f}{summary['p99']:>8.2f}{summary['max']:>8.2f}"
+
+
+def report(results: dict):
+    print(f"\n  {'配置':<13}{'orders/s':>10}{'错误':>6}   {'下单确认 ms p50/p90/p99/max':>31}   {'撤单确认 ms p50/p90/p99/max':>31}")
+    for name, result in results.items():
+        print(
+            f"  {name:<13}{result['orders_per_sec']:>10.1f}{result['errors']:>6}   "
+            f"{_fmt(result['place_ms'])}   {_fmt(result['cancel_ms'])}"
+        )
+    for name, result in results.items():
+        if result["push_ms"]:
+            print(f"  {name}: 下单到 order 频道推送 ms p50/p90/p99/max {_fmt(result['push_ms']).strip()}")
+        if result["first_error"]:
+            print(f"  {name}: 首个错误: {result['first_error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="端到端下单吞吐/延迟测试（本地模拟交易所）")
+    parser.add_argument('--only', nargs='+', choices=sorted(CONFIGS), help="只测试指定配置")
+    parser.add_argument('--orders', type=int, default=500, help="每个配置的下单+撤单轮数")
+    parser.add_argument('--concurrency', type=int, default=1, help="并发线程数")
+    parser.add_argument('--warmup', type=int, default=20, help="预热轮数（不计入统计）")
+    parser.add_argument('--url', default=None, help="已启动的模拟交易所地址（默认在本进程内启动一个）")
+    parser.add_argument('--latency', type=float, default=0.0, help="内置模拟交易所每个请求的固定延迟（毫秒）")
+    parser.add_argument('--jitter', type=float, default=0.0, help="叠加的均匀抖动上限（毫秒）")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="下单/撤单返回错误的概率")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="下单/撤单不响应（REST 返回 503）的概率")
+    parser.add_argument('--seed', type=int, default=7, help="随机数种子")
+    parser.add_argument('--json', default=None, help="把结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    exchange = None
+    url = args.url
+    if url is None:
+        exchange = MockExchange(
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            error_rate=args.error_rate,
+            drop_rate=args.drop_rate,
+            seed=args.seed,
+        )
+        url = exchange.start()
+    url = url.rstrip("/")
+    print(f"Python {sys.version.split()[0]}，模拟交易所 {url}，每个配置 {args.orders} 轮，并发 {args.concurrency}")
+    if exchange is not None:
+        print(f"注入: 延迟 {args.latency}ms + 抖动 0~{args.jitter}ms，错误率 {args.error_rate}，丢弃率 {args.drop_rate}")
+
+    results = {}
+    try:
+        for name in args.only or list(CONFIGS):
+            try:
+                client = CONFIGS[name](url)
+            except Exception as e:
+                print(f"  {name}: 跳过（{type(e).__name__}: {e}）")
+                continue
+            try:
+                results[name] = run_load(client, args.orders, args.concurrency, args.warmup)
+            finally:
+                client.close()
+    finally:
+        if exchange is not None:
+            stats = exchange.stats()
+            exchange.stop()
+
+    if results:
+        report(results)
+    if exchange is not None:
+        print(f"\n模拟交易所: 注入错误 {stats['errors']} 次，丢弃 {stats['dropped']} 次，剩余挂单 {stats['open_orders']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "args": vars(args), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
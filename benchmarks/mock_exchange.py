@@ -0,0 +1,739 @@
+"""
+本地模拟交易所（端到端吞吐/延迟测试用）
+
+一个 aiohttp 服务同时模拟 StandX、GRVT、Nado 三个交易所的下单相关协议，适配器/SDK 只需把地址指到本机，
+无需改动任何交易路径代码。每个请求可注入固定延迟 + 均匀抖动、错误响应和丢弃（不响应）：
+- 错误:  StandX 返回 code != 0（WS）/ HTTP 400（REST），GRVT 返回 JSON-RPC error / HTTP 400，
+         Nado 返回 status=failure
+- 丢弃:  WS 请求不回复（客户端超时），REST 请求返回 HTTP 503
+
+路径（同一端口）:
+- StandX:  REST /api/*（new_order、cancel_orders、query_open_orders、query_orders、query_symbol_info ...），
+           geo 服务 /v1/region，订单 WS /ws-api/v1，行情/账户推送 WS /ws-stream/v1
+           （price 频道按 --tick-interval 推送，order 频道在认证后推送订单变化）
+- GRVT:    REST {url}/grvt/edge、{url}/grvt/trades、{url}/grvt/market-data（cookie 登录、下单、撤单、挂单、合约列表），
+           交易 RPC WS {ws}/grvt/trades/ws/full（JSON-RPC v1/create_order、v1/cancel_order ...）
+- Nado:    引擎网关 {url}/nado/query、{url}/nado/execute（place_order、cancel_orders）
+
+不校验签名，只检查认证信息是否存在（Bearer token、gravity cookie）。
+
+使用示例:
+    exchange = MockExchange(latency=0.005, jitter=0.002, error_rate=0.01)
+    url = exchange.start()                 # 后台线程运行，返回 http://127.0.0.1:<port>
+    adapter = StandXAdapter({..., "base_url": url, "geo_url": url})
+    exchange.stop()
+
+运行（单独启动，供策略/其他工具连接）:
+    python benchmarks/mock_exchange.py --port 18080 --latency 5 --jitter 2 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from aiohttp import WSMsgType, web
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from adapters.loop_thread import LoopThread
+
+# 模拟的交易对: (StandX symbol, GRVT instrument, Nado product_id, 初始价格)
+MARKETS = [
+    ("BTC-USD", "BTC_USDT_Perp", 2, 95000.0),
+    ("ETH-USD", "ETH_USDT_Perp", 4, 3500.0),
+]
+GRVT_ACCOUNT_ID = "0x0000000000000000000000000000000000000000000000000000000000000001"
+NADO_CHAIN_ID = "763373"
+NADO_ENDPOINT_ADDR = "0x" + "00" * 19 + "42"
+
+
+def _iso_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def ws_url(url: str) -> str:
+    """http://host:port -> ws://host:port"""
+    return "ws" + url[len("http"):]
+
+
+def grvt_domains(url: str) -> Dict[str, str]:
+    """模拟交易所上 GRVT 各类 REST 接入点（键与 GrvtAdapter endpoints 配置相同）"""
+    return {
+        "edge": f"{url}/grvt/edge",
+        "trade_data": f"{url}/grvt/trades",
+        "market_data": f"{url}/grvt/market-data",
+    }
+
+
+def _json_response(data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> web.Response:
+    return web.Response(text=json.dumps(data), status=status, content_type="application/json", headers=headers)
+
+
+class MockExchange:
+    """
+    本地模拟交易所
+
+    Args:
+        latency: 每个请求的固定处理延迟（秒）
+        jitter: 在 latency 上叠加的均匀抖动上限（秒），实际延迟为 latency + U(0, jitter)
+        error_rate: 下单/撤单请求返回错误的概率
+        drop_rate: 下单/撤单请求被丢弃（WS 不回复、REST 返回 503）的概率
+        tick_interval: StandX price 频道推送间隔（秒），0 表示不推送
+        seed: 随机数种子（抖动和故障注入可复现）
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        tick_interval: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.tick_interval = tick_interval
+        self._rng = random.Random(seed)
+        self._ids = itertools.count(1)
+        self.prices = {standx: price for standx, _, _, price in MARKETS}
+        # 各交易所的挂单: StandX id -> 订单，GRVT client_order_id -> 订单，Nado digest -> 订单
+        self.standx_orders: Dict[int, Dict[str, Any]] = {}
+        self.grvt_orders: Dict[str, Dict[str, Any]] = {}
+        self.nado_orders: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter = Counter()
+        self.errors = 0
+        self.dropped = 0
+        self.url: Optional[str] = None
+        self._cookies: set = set()
+        self._streams: Dict[int, Dict[str, Any]] = {}  # StandX ws-stream 连接
+        self._sockets: set = set()  # 所有 WS 连接，stop() 时关闭
+        self._runner: Optional[web.AppRunner] = None
+        self._loop_thread = LoopThread("mock-exchange")
+
+    # ---------- 生命周期 ----------
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/health", self.standx_health)
+        app.router.add_get("/v1/region", self.standx_region)
+        app.router.add_post("/api/new_order", self.standx_new_order)
+        app.router.add_post("/api/cancel_orders", self.standx_cancel_orders)
+        app.router.add_get("/api/query_open_orders", self.standx_query_open_orders)
+        app.router.add_get("/api/query_orders", self.standx_query_orders)
+        app.router.add_get("/api/query_symbol_info", self.standx_query_symbol_info)
+        app.router.add_get("/api/query_symbol_price", self.standx_query_symbol_price)
+        app.router.add_get("/api/query_balance", self.standx_query_balance)
+        app.router.add_get("/api/query_positions", self.standx_query_positions)
+        app.router.add_get("/ws-api/v1", self.standx_ws_api)
+        app.router.add_get("/ws-stream/v1", self.standx_ws_stream)
+        app.router.add_post("/grvt/edge/auth/api_key/login", self.grvt_login)
+        app.router.add_post("/grvt/market-data/full/v1/{method}", self.grvt_market_data)
+        app.router.add_post("/grvt/trades/full/v1/{method}", self.grvt_trades)
+        app.router.add_get("/grvt/trades/ws/full", self.grvt_ws)
+        app.router.add_post("/nado/query", self.nado_query)
+        app.router.add_post("/nado/execute", self.nado_execute)
+        return app
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """在后台线程启动服务（port=0 时随机端口），返回 http://host:port"""
+        self._loop_thread.start()
+        self.url = self._loop_thread.run(self._start(host, port), 10)
+        return self.url
+
+    async def _start(self, host: str, port: int) -> str:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        port = self._runner.addresses[0][1]
+        return f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        """关闭所有 WS 连接和服务，停止后台线程"""
+        if self._runner is not None:
+            self._loop_thread.stop(self._stop())
+            self._runner = None
+
+    async def _stop(self) -> None:
+        for ws in list(self._sockets):
+            await ws.close()
+        await self._runner.cleanup()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": dict(self.requests),
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "open_orders": {
+                "standx": len(self.standx_orders),
+                "grvt": len(self.grvt_orders),
+                "nado": len(self.nado_orders),
+            },
+        }
+
+    # ---------- 延迟和故障注入 ----------
+
+    async def _delay(self) -> None:
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _fault(self) -> Optional[str]:
+        """按概率返回 'drop' / 'error' / None"""
+        if self.drop_rate <= 0 and self.error_rate <= 0:
+            return None
+        roll = self._rng.random()
+        if roll < self.drop_rate:
+            self.dropped += 1
+            return "drop"
+        if roll < self.drop_rate + self.error_rate:
+            self.errors += 1
+            return "error"
+        return None
+
+    async def _serve_ws(self, request: web.Request, handle) -> web.WebSocketResponse:
+        """WS 连接：每条请求在独立任务中处理，注入的延迟不会阻塞同一连接上的其他请求"""
+        ws = web.WebSocketResponse(heartbeat=None)
+        await ws.prepare(request)
+        self._sockets.add(ws)
+        tasks = set()
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    data = json.loads(msg.data)
+                except ValueError:
+                    continue
+                task = asyncio.create_task(handle(ws, data))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            self._sockets.discard(ws)
+            for task in tasks:
+                task.cancel()
+        return ws
+
+    @staticmethod
+    async def _send(ws: web.WebSocketResponse, data: Dict[str, Any]) -> None:
+        if not ws.closed:
+            try:
+                await ws.send_str(json.dumps(data))
+            except ConnectionError:
+                pass
+
+    # ---------- StandX ----------
+
+    async def standx_health(self, request: web.Request) -> web.Response:
+        self.requests["standx/health"] += 1
+        return web.Response(text="OK")
+
+    async def standx_region(self, request: web.Request) -> web.Response:
+        self.requests["standx/region"] += 1
+        await self._delay()
+        return _json_response({"systemTime": int(time.time()), "region": "mock"})
+
+    @staticmethod
+    def _standx_authorized(request: web.Request, signed: bool = False) -> bool:
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return False
+        return not signed or bool(request.headers.get("x-request-signature"))
+
+    def _standx_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        now = _iso_now()
+        order = {
+            "id": next(self._ids),
+            "cl_ord_id": params.get("cl_ord_id") or uuid.uuid4().hex,
+            "symbol": params.get("symbol"),
+            "side": params.get("side"),
+            "order_type": params.get("order_type"),
+            "price": params.get("price"),
+            "qty": params.get("qty"),
+            "fill_qty": "0",
+            "status": "new",
+            "time_in_force": params.get("time_in_force", "gtc"),
+            "reduce_only": bool(params.get("reduce_only", False)),
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.standx_orders[order["id"]] = order
+        self._push_standx_order(order)
+        return order
+
+    def _standx_cancel(self, params: Dict[str, Any]) -> int:
+        ids = set(params.get("order_id_list") or [])
+        cl_ids = set(params.get("cl_ord_id_list") or [])
+        cancelled = [
+            order for order in self.standx_orders.values()
+            if order["id"] in ids or order["cl_ord_id"] in cl_ids
+        ]
+        for order in cancelled:
+            del self.standx_orders[order["id"]]
+            order = dict(order, status="canceled", updated_at=_iso_now())
+            self._push_standx_order(order)
+        return len(cancelled)
+
+    def _push_standx_order(self, order: Dict[str, Any]) -> None:
+        """order 频道推送给已认证且订阅了 order 的 ws-stream 连接"""
+        message = {"seq": next(self._ids), "channel": "order", "data": order}
+        for stream in list(self._streams.values()):
+            if stream["authed"] and "order" in stream["channels"]:
+                asyncio.create_task(self._send(stream["ws"], message))
+
+    async def standx_new_order(self, request: web.Request) -> web.Response:
+        self.requests["standx/new_order"] += 1
+        if not self._standx_authorized(request, signed=True):
+            return _json_response({"code": 401, "message": "unauthorized"}, status=401)
+        params = await request.json()
+        await self._delay()
+        fault = self._fault()
+        if fault == "drop":
+            return web.Response(text="service unavailable", status=503)
+        request_id = request.headers.get("x-request-id") or uuid.uuid4().hex
+        if fault == "error":
+            return _json_response({"code": 400, "message": "mock rejected", "request_id": request_id}, status=400)
+        self._standx_create(params)
+        return _json_response({"code": 0, "message": "success", "request_id": request_id})
+
+    async def standx_cancel_orders(self, request: web.Request) -> web.Response:
+        self.requests["standx/cancel_orders"] += 1
+        if not self._standx_authorized(request, signed=True):
+            return _json_response({"code": 401, "message": "unauthorized"}, status=401)
+        params = await request.json()
+        await self._delay()
+        fault = self._fault()
+        if fault == "drop":
+            return web.Response(text="service unavailable", status=503)
+        if fault == "error":
+            return _json_response({"code": 400, "message": "mock rejected"}, status=400)
+        self._standx_cancel(params)
+        return _json_response([])
+
+    def _standx_order_list(self, request: web.Request, orders) -> web.Response:
+        symbol = request.query.get("symbol")
+        limit = int(request.query.get("limit") or 500)
+        result = [order for order in orders if not symbol or order["symbol"] == symbol][:limit]
+        return _json_response({"page_size": limit, "result": result, "total": len(result)})
+
+    async def standx_query_open_orders(self, request: web.Request) -> web.Response:
+        self.requests["standx/query_open_orders"] += 1
+        if not self._standx_authorized(request):
+            return _json_response({"code": 401, "message": "unauthorized"}, status=401)
+        await self._delay()
+        return self._standx_order_list(request, list(self.standx_orders.values()))
+
+    async def standx_query_orders(self, request: web.Request) -> web.Response:
+        self.requests["standx/query_orders"] += 1
+        if not self._standx_authorized(request):
+            return _json_response({"code": 401, "message": "unauthorized"}, status=401)
+        await self._delay()
+        return self._standx_order_list(request, sorted(self.standx_orders.values(), key=lambda o: -o["id"]))
+
+    async def standx_query_symbol_info(self, request: web.Request) -> web.Response:
+        self.requests["standx/query_symbol_info"] += 1
+        await self._delay()
+        infos = [
+            {
+                "symbol": symbol,
+                "base_asset": symbol.split("-")[0],
+                "quote_asset": "DUSD",
+                "price_tick_decimals": 1 if price > 10000 else 2,
+                "qty_tick_decimals": 3,
+                "min_order_qty": "0.001",
+                "status": "trading",
+            }
+            for symbol, _, _, price in MARKETS
+        ]
+        symbol = request.query.get("symbol")
+        if symbol:
+            infos = [info for info in infos if info["symbol"] == symbol]
+        return _json_response(infos)
+
+    def _standx_price(self, symbol: str) -> Dict[str, Any]:
+        mid = self.prices.get(symbol, 100.0)
+        return {
+            "symbol": symbol,
+            "mark_price": f"{mid:.2f}",
+            "index_price": f"{mid:.2f}",
+            "last_price": f"{mid:.2f}",
+            "mid_price": f"{mid:.2f}",
+            "spread_bid": f"{mid - 0.1:.2f}",
+            "spread_ask": f"{mid + 0.1:.2f}",
+            "time": _iso_now(),
+        }
+
+    async def standx_query_symbol_price(self, request: web.Request) -> web.Response:
+        self.requests["standx/query_symbol_price"] += 1
+        await self._delay()
+        return _json_response(self._standx_price(request.query.get("symbol", "BTC-USD")))
+
+    async def standx_query_balance(self, request: web.Request) -> web.Response:
+        self.requests["standx/query_balance"] += 1
+        if not self._standx_authorized(request):
+            return _json_response({"code": 401, "message": "unauthorized"}, status=401)
+        await self._delay()
+        return _json_response({"balance": "10000", "equity": "10000", "upnl": "0", "cross_available": "10000"})
+
+    async def standx_query_positions(self, request: web.Request) -> web.Response:
+        self.requests["standx/query_positions"] += 1
+        if not self._standx_authorized(request):
+            return _json_response({"code": 401, "message": "unauthorized"}, status=401)
+        await self._delay()
+        return _json_response([])
+
+    async def standx_ws_api(self, request: web.Request) -> web.WebSocketResponse:
+        """订单 WS: {session_id, request_id, method, params(JSON 字符串), header?} -> {code, message, request_id}"""
+        session = {"authed": False}
+
+        async def handle(ws, data):
+            method = data.get("method")
+            request_id = data.get("request_id")
+            self.requests[f"standx/ws {method}"] += 1
+            try:
+                params = json.loads(data.get("params") or "{}")
+            except ValueError:
+                params = {}
+            await self._delay()
+            if method == "auth:login":
+                session["authed"] = bool(params.get("token"))
+                code = 0 if session["authed"] else 401
+                await self._send(ws, {"code": code, "message": "success" if code == 0 else "unauthorized",
+                                      "request_id": request_id})
+                return
+            if method not in ("order:new", "order:cancel"):
+                await self._send(ws, {"code": 404, "message": f"unknown method {method}", "request_id": request_id})
+                return
+            if not session["authed"] or not (data.get("header") or {}).get("x-request-signature"):
+                await self._send(ws, {"code": 401, "message": "unauthorized", "request_id": request_id})
+                return
+            fault = self._fault()
+            if fault == "drop":
+                return
+            if fault == "error":
+                await self._send(ws, {"code": 400, "message": "mock rejected", "request_id": request_id})
+                return
+            if method == "order:new":
+                self._standx_create(params)
+            else:
+                self._standx_cancel(params)
+            await self._send(ws, {"code": 0, "message": "success", "request_id": request_id})
+
+        return await self._serve_ws(request, handle)
+
+    async def standx_ws_stream(self, request: web.Request) -> web.WebSocketResponse:
+        """行情/账户推送 WS: subscribe / unsubscribe / auth，price 频道定时推送，order 频道推送订单变化"""
+        stream = {"ws": None, "authed": False, "channels": set(), "symbols": set()}
+
+        async def handle(ws, data):
+            stream["ws"] = ws
+            if "auth" in data:
+                auth = data["auth"] or {}
+                stream["authed"] = bool(auth.get("token"))
+                for item in auth.get("streams") or []:
+                    stream["channels"].add(item.get("channel"))
+                await self._send(ws, {"seq": next(self._ids), "channel": "auth",
+                                      "data": {"code": 0 if stream["authed"] else 401, "msg": "success"}})
+            elif "subscribe" in data:
+                channel = data["subscribe"].get("channel")
+                stream["channels"].add(channel)
+                if channel in ("price", "depth_book") and data["subscribe"].get("symbol"):
+                    stream["symbols"].add(data["subscribe"]["symbol"])
+            elif "unsubscribe" in data:
+                symbol = data["unsubscribe"].get("symbol")
+                if symbol:
+                    stream["symbols"].discard(symbol)
+                else:
+                    stream["channels"].discard(data["unsubscribe"].get("channel"))
+
+        self._streams[id(stream)] = stream
+        ticker = asyncio.create_task(self._standx_ticks(stream)) if self.tick_interval > 0 else None
+        try:
+            return await self._serve_ws(request, handle)
+        finally:
+            self._streams.pop(id(stream), None)
+            if ticker is not None:
+                ticker.cancel()
+
+    async def _standx_ticks(self, stream: Dict[str, Any]) -> None:
+        """按 tick_interval 推送 price 频道（价格随机游走）"""
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            ws = stream["ws"]
+            if ws is None or "price" not in stream["channels"]:
+                continue
+            for symbol in list(stream["symbols"]):
+                self.prices[symbol] = self.prices.get(symbol, 100.0) * (1 + self._rng.gauss(0, 0.0002))
+                await self._send(ws, {"seq": next(self._ids), "channel": "price", "symbol": symbol,
+                                      "data": self._standx_price(symbol)})
+
+    # ---------- GRVT ----------
+
+    def _grvt_authorized(self, request: web.Request) -> bool:
+        return request.cookies.get("gravity") in self._cookies
+
+    async def grvt_login(self, request: web.Request) -> web.Response:
+        """api_key 登录，Set-Cookie 返回 gravity（1 小时后过期）和 X-Grvt-Account-Id"""
+        self.requests["grvt/login"] += 1
+        body = await request.json()
+        await self._delay()
+        if not body.get("api_key"):
+            return _json_response({"code": 1000, "message": "missing api_key", "status": 401}, status=401)
+        cookie = uuid.uuid4().hex
+        self._cookies.add(cookie)
+        expires = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 3600))
+        return _json_response(
+            {"status": "success"},
+            headers={
+                "Set-Cookie": f"gravity={cookie}; Path=/; Expires={expires}; HttpOnly",
+                "X-Grvt-Account-Id": GRVT_ACCOUNT_ID,
+            },
+        )
+
+    @staticmethod
+    def _grvt_instruments():
+        return [
+            {
+                "instrument": instrument,
+                "instrument_hash": f"0x{0x030501 + 0x100 * i:06x}",
+                "base": instrument.split("_")[0],
+                "quote": "USDT",
+                "kind": "PERPETUAL",
+                "venues": ["ORDERBOOK", "RFQ"],
+                "settlement_period": "PERPETUAL",
+                "base_decimals": 9,
+                "quote_decimals": 6,
+                "tick_size": "0.1" if price > 10000 else "0.01",
+                "min_size": "0.001",
+                "create_time": "1700000000000000000",
+            }
+            for i, (_, instrument, _, price) in enumerate(MARKETS)
+        ]
+
+    async def grvt_market_data(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.requests[f"grvt/{method}"] += 1
+        body = await request.json()
+        await self._delay()
+        instruments = self._grvt_instruments()
+        if method in ("instruments", "all_instruments"):
+            return _json_response({"result": instruments})
+        if method == "instrument":
+            found = [i for i in instruments if i["instrument"] == body.get("instrument")]
+            return _json_response({"result": found[0] if found else None})
+        return _json_response({"code": 1001, "message": f"mock does not implement {method}", "status": 404}, status=404)
+
+    def _grvt_create(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        order = json.loads(json.dumps(params.get("order") or {}))
+        now = str(time.time_ns())
+        order["order_id"] = f"0x{next(self._ids):064x}"
+        metadata = order.setdefault("metadata", {})
+        metadata["create_time"] = now
+        order["state"] = {
+            "status": "OPEN",
+            "reject_reason": "UNSPECIFIED",
+            "book_size": [leg.get("size") for leg in order.get("legs", [])],
+            "traded_size": ["0" for _ in order.get("legs", [])],
+            "update_time": now,
+        }
+        self.grvt_orders[str(metadata.get("client_order_id"))] = order
+        return order
+
+    def _grvt_call(self, method: str, params: Dict[str, Any]) -> Any:
+        """执行一个交易接口（REST 与 WS RPC 共用），返回 result；未知订单返回 None"""
+        if method == "create_order":
+            return self._grvt_create(params)
+        if method == "cancel_order":
+            if params.get("client_order_id") is not None:
+                order = self.grvt_orders.pop(str(params["client_order_id"]), None)
+            else:
+                order = next((o for o in self.grvt_orders.values() if o["order_id"] == params.get("order_id")), None)
+                if order is not None:
+                    del self.grvt_orders[str(order["metadata"]["client_order_id"])]
+            return {"ack": order is not None}
+        if method == "cancel_all_orders":
+            self.grvt_orders.clear()
+            return {"ack": True}
+        if method == "open_orders":
+            return list(self.grvt_orders.values())
+        if method == "order":
+            if params.get("client_order_id") is not None:
+                return self.grvt_orders.get(str(params["client_order_id"]))
+            return next((o for o in self.grvt_orders.values() if o["order_id"] == params.get("order_id")), None)
+        raise KeyError(method)
+
+    async def grvt_trades(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.requests[f"grvt/{method}"] += 1
+        if not self._grvt_authorized(request):
+            return _json_response({"code": 1000, "message": "unauthenticated", "status": 401}, status=401)
+        params = await request.json()
+        await self._delay()
+        if method in ("create_order", "cancel_order", "cancel_all_orders"):
+            fault = self._fault()
+            if fault == "drop":
+                return web.Response(text="service unavailable", status=503)
+            if fault == "error":
+                return _json_response({"code": 2000, "message": "mock rejected", "status": 400}, status=400)
+        try:
+            result = self._grvt_call(method, params)
+        except KeyError:
+            return _json_response({"code": 1001, "message": f"mock does not implement {method}", "status": 404},
+                                  status=404)
+        return _json_response({"result": result})
+
+    async def grvt_ws(self, request: web.Request) -> web.WebSocketResponse:
+        """交易 RPC WS: {jsonrpc, method: v1/<method>, params, id} -> {jsonrpc, result: {result: ...}, id}"""
+        if not self._grvt_authorized(request):
+            raise web.HTTPUnauthorized()
+
+        async def handle(ws, data):
+            method = str(data.get("method", ""))
+            rpc_id = data.get("id")
+            self.requests[f"grvt/ws {method}"] += 1
+            await self._delay()
+            if method in ("subscribe", "unsubscribe"):
+                params = data.get("params") or {}
+                await self._send(ws, {"jsonrpc": "2.0", "id": rpc_id, "result": {
+                    "stream": params.get("stream"), "subs": params.get("selectors") or [], "unsubs": []}})
+                return
+            name = method.split("/", 1)[-1]
+            if name in ("create_order", "cancel_order", "cancel_all_orders"):
+                fault = self._fault()
+                if fault == "drop":
+                    return
+                if fault == "error":
+                    await self._send(ws, {"jsonrpc": "2.0", "id": rpc_id,
+                                          "error": {"code": 2000, "message": "mock rejected"}})
+                    return
+            try:
+                result = self._grvt_call(name, data.get("params") or {})
+            except KeyError:
+                await self._send(ws, {"jsonrpc": "2.0", "id": rpc_id,
+                                      "error": {"code": 1001, "message": f"mock does not implement {method}"}})
+                return
+            await self._send(ws, {"jsonrpc": "2.0", "id": rpc_id, "result": {"result": result}})
+
+        return await self._serve_ws(request, handle)
+
+    # ---------- Nado ----------
+
+    async def nado_query(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        query_type = body.get("type")
+        self.requests[f"nado/query {query_type}"] += 1
+        await self._delay()
+        if query_type == "status":
+            data = "active"
+        elif query_type == "contracts":
+            data = {"chain_id": NADO_CHAIN_ID, "endpoint_addr": NADO_ENDPOINT_ADDR}
+        elif query_type == "nonces":
+            data = {"tx_nonce": "0", "order_nonce": str(time.time_ns())}
+        elif query_type == "subaccount_orders":
+            sender = body.get("sender")
+            product_id = body.get("product_id")
+            data = {
+                "sender": sender,
+                "product_id": product_id,
+                "orders": [
+                    order for order in self.nado_orders.values()
+                    if order["sender"] == sender and order["product_id"] == product_id
+                ],
+            }
+        else:
+            return _json_response({"status": "failure", "error": f"mock does not implement {query_type}",
+                                   "error_code": 1000, "request_type": f"query_{query_type}"})
+        return _json_response({"status": "success", "data": data, "request_type": f"query_{query_type}"})
+
+    async def nado_execute(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        execute_type = next(iter(body), "")
+        self.requests[f"nado/execute {execute_type}"] += 1
+        params = body.get(execute_type) or {}
+        await self._delay()
+        request_type = f"execute_{execute_type}"
+        fault = self._fault()
+        if fault == "drop":
+            return web.Response(text="service unavailable", status=503)
+        if fault == "error":
+            return _json_response({"status": "failure", "error": "mock rejected", "error_code": 2000,
+                                   "request_type": request_type})
+        signature = params.get("signature")
+        if execute_type == "place_order":
+            order = params.get("order") or {}
+            digest = "0x" + hashlib.sha256(json.dumps(order, sort_keys=True).encode()).hexdigest()
+            self.nado_orders[digest] = {
+                "product_id": params.get("product_id"),
+                "sender": order.get("sender"),
+                "price_x18": str(order.get("priceX18")),
+                "amount": str(order.get("amount")),
+                "expiration": str(order.get("expiration")),
+                "nonce": str(order.get("nonce")),
+                "unfilled_amount": str(order.get("amount")),
+                "digest": digest,
+                "placed_at": str(int(time.time())),
+            }
+            data = {"digest": digest}
+        elif execute_type == "cancel_orders":
+            tx = params.get("tx") or {}
+            cancelled = [self.nado_orders.pop(d) for d in tx.get("digests") or [] if d in self.nado_orders]
+            data = {"cancelled_orders": cancelled}
+        else:
+            return _json_response({"status": "failure", "error": f"mock does not implement {execute_type}",
+                                   "error_code": 1000, "request_type": request_type})
+        return _json_response({"status": "success", "signature": signature, "data": data,
+                               "request_type": request_type})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地模拟交易所（StandX / GRVT / Nado）")
+    parser.add_argument('--host', default="127.0.0.1", help="监听地址")
+    parser.add_argument('--port', type=int, default=18080, help="监听端口")
+    parser.add_argument('--latency', type=float, default=0.0, help="每个请求的固定延迟（毫秒）")
+    parser.add_argument('--jitter', type=float, default=0.0, help="叠加的均匀抖动上限（毫秒）")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="下单/撤单返回错误的概率")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="下单/撤单不响应（REST 返回 503）的概率")
+    parser.add_argument('--tick-interval', type=float, default=0.0, help="StandX price 频道推送间隔（毫秒），0 不推送")
+    parser.add_argument('--seed', type=int, default=None, help="随机数种子")
+    args = parser.parse_args()
+
+    exchange = MockExchange(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        drop_rate=args.drop_rate,
+        tick_interval=args.tick_interval / 1000,
+        seed=args.seed,
+    )
+    url = exchange.start(args.host, args.port)
+    print(f"模拟交易所已启动: {url}")
+    print(f"  StandX:  base_url={url} geo_url={url} ws-stream={ws_url(url)}/ws-stream/v1")
+    for key, domain in grvt_domains(url).items():
+        print(f"  GRVT {key:<12} {domain}")
+    print(f"  GRVT ws:  {ws_url(url)}/grvt/trades/ws/full")
+    print(f"  Nado:     {url}/nado")
+    try:
+        while True:
+            time.sleep(10)
+            print(f"[模拟交易所] {json.dumps(exchange.stats(), ensure_ascii=False)}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exchange.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -38,6 +38,11 @@ class GrvtCcxt(GrvtCcxtBase):
         env: GrvtEnv (DEV, TESTNET, PROD)
         logger: logging.Logger
         parameters: dict with trading_account_id, private_key, api_key etc
+        session: requests.Session to send requests with (e.g. one sharing a connection pool
+            with other clients). Must not be shared with another account, as it holds the
+            account cookie. A new session is created if not provided.
+        metadata_cache: on-disk metadata cache; when set, markets are loaded from it
+            without a network round trip and refreshed in the background once stale.
 
     Examples:
         >>> from grvt_api import GrvtCcxt
@@ -52,34 +57,54 @@ class GrvtCcxt(GrvtCcxtBase):
         logger: logging.Logger | None = None,
         parameters: dict = {},
         order_book_ccxt_format: bool = False,
+        session: requests.Session | None = None,
+        metadata_cache: Any = None,
     ):
         """Initialize the GrvtCcxt instance."""
-        super().__init__(env, logger, parameters, order_book_ccxt_format)
+        super().__init__(env, logger, parameters, order_book_ccxt_format, metadata_cache)
         self._clsname: str = type(self).__name__
-        self._session: requests.Session = requests.Session()
+        self._session: requests.Session = session or requests.Session()
         self._session.headers.update({"Content-Type": "application/json"})
+        # When True, an external manager owns the cookie lifecycle (see set_cookie)
+        # and requests never refresh the cookie inline.
+        self._external_cookie_refresh: bool = False
         self.refresh_cookie()
         # Assign markets here
-        self.markets: dict[str, dict] = self.load_markets()
+        self.markets: dict[str, dict] = self.load_markets_cached()
 
     def refresh_cookie(self) -> dict | None:
         """Refresh the session cookie."""
         if not self.should_refresh_cookie():
             return self._cookie
         path = get_grvt_endpoint(self.env, "AUTH")
-        self._cookie = get_cookie_with_expiration(path, self._api_key)
-        self._path_return_value_map[path] = self._cookie
-        if self._cookie:
-            self._session.cookies.update({"gravity": self._cookie["gravity"]})
-            if self._cookie["X-Grvt-Account-Id"]:
-                self._session.headers.update(
-                    {"X-Grvt-Account-Id": self._cookie["X-Grvt-Account-Id"]}
-                )
-            self.logger.info(
-                f"refresh_cookie {self._cookie=} {self._session.cookies=} {self._session.headers=}"
-            )
+        cookie = get_cookie_with_expiration(path, self._api_key)
+        self._path_return_value_map[path] = cookie
+        if cookie:
+            self.set_cookie(cookie)
+        else:
+            self._cookie = cookie
         return self._cookie
 
+    def set_cookie(self, cookie: dict) -> None:
+        """
+        Install a session cookie obtained elsewhere (e.g. by a background refresher).<br>
+        The cookie dict has the format returned by get_cookie_with_expiration().<br>
+        """
+        self._session.cookies.update({"gravity": cookie["gravity"]})
+        if cookie["X-Grvt-Account-Id"]:
+            self._session.headers.update({"X-Grvt-Account-Id": cookie["X-Grvt-Account-Id"]})
+        self._cookie = cookie
+        self.logger.info(
+            f"set_cookie {self._cookie=} {self._session.cookies=} {self._session.headers=}"
+        )
+
+    def set_external_cookie_refresh(self, enabled: bool) -> None:
+        """
+        Hand the cookie lifecycle over to an external refresher.<br>
+        When enabled, requests use the current cookie and never call refresh_cookie().<br>
+        """
+        self._external_cookie_refresh = enabled
+
     # PRIVATE API CALLS
     def _auth_and_post(self, path: str, payload: dict) -> dict:
         FN = f"_auth_and_post {path=}"
@@ -88,8 +113,10 @@ class GrvtCcxt(GrvtCcxtBase):
         if not path:
             self.logger.warning(f"{FN} Invalid path {path=} {payload=}")
             raise GrvtInvalidOrder(f"{FN} Invalid path {path=} {payload=}")
-        # Always see if need to referesh cookie before sending a request
-        self.refresh_cookie()
+        # Always see if need to referesh cookie before sending a request,
+        # unless a background refresher keeps it fresh for us
+        if not self._external_cookie_refresh:
+            self.refresh_cookie()
         payload_json = json.dumps(payload, cls=EnumEncoder)
         self.logger.info(f"{FN} {payload=}\n{payload_json=}")
         return_value = self._session.post(path, data=payload_json, timeout=5)
@@ -525,6 +552,20 @@ class GrvtCcxt(GrvtCcxtBase):
         return response
 
     # **************** PUBLIC API CALLS
+    def load_markets_cached(self) -> dict[str, dict]:
+        """
+        Load markets from the metadata cache if one is set, else from the API.
+        Stale cached markets are returned immediately and refreshed in the background
+        (the refresh updates self.markets when it completes).
+        """
+        if self._metadata_cache is None:
+            return self.load_markets()
+        markets = self._metadata_cache.get(self.markets_cache_key(), self.load_markets)
+        # a background refresh may already have assigned newer markets
+        if not self.markets:
+            self.markets = markets
+        return self.markets
+
     def load_markets(self) -> dict[str, dict]:
         self.logger.info("load_markets START")
         instruments = self.fetch_markets(
@@ -37,6 +37,9 @@ class GrvtCcxtBase:
         logger (logging.Logger, optional). Defaults to None.
         parameters: (dict, optional). Dict with trading_account_id, private_key, api_key etc
                 defaults to empty.
+        metadata_cache: (optional). On-disk metadata cache with `get(key, loader)`,
+                `peek(key)` and `put(key, value)`; when set, markets are served from it
+                and refreshed in the background once stale. Defaults to None.
     """
 
     def __init__(
@@ -45,6 +48,7 @@ class GrvtCcxtBase:
         logger: logging.Logger | None = None,
         parameters: dict = {},
         order_book_ccxt_format: bool = False,
+        metadata_cache: Any = None,
     ):
         """Initialize the GrvtCcxtBase part."""
         self.name: str = "GRVT"
@@ -54,6 +58,7 @@ class GrvtCcxtBase:
         self._private_key: str = str(parameters.get("private_key", ""))
         self._api_key: str = str(parameters.get("api_key", ""))
         self._order_book_ccxt_format: bool = order_book_ccxt_format
+        self._metadata_cache: Any = metadata_cache
 
         self._path_return_value_map: dict = {}
         self._cookie: dict | None = None
@@ -89,6 +94,10 @@ class GrvtCcxtBase:
             "fetch_ohlcv",
         ]
 
+    def markets_cache_key(self) -> str:
+        """Returns the metadata cache key of the markets of this environment."""
+        return f"grvt/{self.env.value}/markets"
+
     def get_trading_account_id(self) -> str:
         """Returns the trading account id."""
         return self._trading_account_id or ""
@@ -33,7 +33,33 @@ class GrvtWSEndpointType(str, Enum):
 END_POINT_VERSION = os.getenv("GRVT_END_POINT_VERSION", "v1")
 
 
+# Per-environment domain overrides, e.g. a lower-latency host picked by an endpoint prober
+_ENDPOINT_DOMAIN_OVERRIDES: dict[str, dict[GrvtEndpointType, str]] = {}
+
+
+def set_grvt_endpoint_domain(
+    env_name: str, endpoint_type: GrvtEndpointType, domain: str | None
+) -> None:
+    """
+    Override the REST domain used for one endpoint type of an environment.
+    Pass domain=None to restore the built-in default.
+    """
+    overrides = _ENDPOINT_DOMAIN_OVERRIDES.setdefault(env_name, {})
+    if domain:
+        overrides[GrvtEndpointType(endpoint_type)] = domain.rstrip("/")
+    else:
+        overrides.pop(GrvtEndpointType(endpoint_type), None)
+
+
 def get_grvt_endpoint_domains(env_name: str) -> dict[GrvtEndpointType, str]:
+    domains = _default_grvt_endpoint_domains(env_name)
+    overrides = _ENDPOINT_DOMAIN_OVERRIDES.get(env_name)
+    if overrides and domains:
+        domains.update(overrides)
+    return domains
+
+
+def _default_grvt_endpoint_domains(env_name: str) -> dict[GrvtEndpointType, str]:
     if env_name == GrvtEnv.PROD.value:
         return {
             GrvtEndpointType.EDGE: "https://edge.grvt.io",
@@ -61,11 +87,32 @@ def get_grvt_endpoint_domains(env_name: str) -> dict[GrvtEndpointType, str]:
     return {}
 
 
+# Per-environment WS URL overrides, e.g. a local mock exchange for load tests
+_WS_ENDPOINT_OVERRIDES: dict[str, dict[GrvtWSEndpointType, str]] = {}
+
+
+def set_grvt_ws_endpoint(
+    env_name: str, endpoint_type: GrvtWSEndpointType, url: str | None
+) -> None:
+    """
+    Override the WS URL used for one endpoint type of an environment.
+    Pass url=None to restore the built-in default.
+    """
+    overrides = _WS_ENDPOINT_OVERRIDES.setdefault(env_name, {})
+    if url:
+        overrides[GrvtWSEndpointType(endpoint_type)] = url
+    else:
+        overrides.pop(GrvtWSEndpointType(endpoint_type), None)
+
+
 def get_grvt_ws_endpoint(
     env: str,
     endpoint_type: GrvtWSEndpointType,
 ) -> str:
     """Returns string pointing to WS endpoint for given environment and endpoint type."""
+    override = _WS_ENDPOINT_OVERRIDES.get(env, {}).get(endpoint_type)
+    if override:
+        return override
     if env == GrvtEnv.PROD.value:
         return {
             GrvtWSEndpointType.TRADE_DATA: "wss://trades.grvt.io/ws",
@@ -9,7 +9,7 @@
 import asyncio
 import json
 import logging
-from typing import Literal
+from typing import Any, Literal
 
 import aiohttp
 
@@ -43,6 +43,11 @@ class GrvtCcxtPro(GrvtCcxtBase):
     Args:
         env: GrvtCcxtPro (DEV, TESTNET, PROD)
         parameters: dict with trading_account_id, private_key, api_key etc
+        session: aiohttp.ClientSession to send requests with (e.g. one sharing a connector
+            with other clients). Must not be shared with another account, as it holds the
+            account cookie. A new session is created if not provided.
+        metadata_cache: on-disk metadata cache; when set, load_markets() serves markets
+            from it and refreshes them in the background once stale.
 
     Examples:
         >>> from grvt_api_pro import GrvtCcxtPro
@@ -57,11 +62,18 @@ class GrvtCcxtPro(GrvtCcxtBase):
         logger: logging.Logger | None = None,
         parameters: dict = {},
         order_book_ccxt_format: bool = False,
+        session: aiohttp.ClientSession | None = None,
+        metadata_cache: Any = None,
     ):
         """Initialize the GrvtCcxt instance."""
-        super().__init__(env, logger, parameters, order_book_ccxt_format)
+        super().__init__(env, logger, parameters, order_book_ccxt_format, metadata_cache)
+        self._markets_refresh_task: asyncio.Task | None = None
         self._clsname: str = type(self).__name__
-        self._session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
+        if session is None:
+            session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
+        else:
+            session.headers.update({"Content-Type": "application/json"})
+        self._session = session
         # Force sync call to get cookie here
         self._cookie = get_cookie_with_expiration(
             get_grvt_endpoint(self.env, "AUTH"), self._api_key
@@ -562,6 +574,20 @@ class GrvtCcxtPro(GrvtCcxtBase):
 
     # **************** PUBLIC API CALLS
     async def load_markets(self) -> dict | None:
+        if self._metadata_cache is not None:
+            cached = self._metadata_cache.peek(self.markets_cache_key())
+            if cached is not None:
+                self.markets, fresh = cached
+                if not fresh and (
+                    self._markets_refresh_task is None or self._markets_refresh_task.done()
+                ):
+                    self._markets_refresh_task = asyncio.get_running_loop().create_task(
+                        self._fetch_markets_into_cache()
+                    )
+                return self.markets
+        return await self._fetch_markets_into_cache()
+
+    async def _fetch_markets_into_cache(self) -> dict | None:
         self.logger.info("load_markets START")
         instruments = await self.fetch_markets(
             params={
@@ -571,6 +597,8 @@ class GrvtCcxtPro(GrvtCcxtBase):
         if instruments:
             self.markets = {i.get("instrument"): i for i in instruments}
             self.logger.info(f"load_markets: loaded {len(self.markets)} markets.")
+            if self._metadata_cache is not None:
+                self._metadata_cache.put(self.markets_cache_key(), self.markets)
         else:
             self.logger.warning("load_markets: No markets found.")
         return self.markets
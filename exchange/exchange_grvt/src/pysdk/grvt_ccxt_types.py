@@ -24,6 +24,28 @@ class GrvtInvalidOrder(Exception):
     pass
 
 
+class GrvtRpcError(Exception):
+    """Error response to a JSON-RPC request sent over WebSocket."""
+
+    def __init__(self, error: dict | str, request_id: int | None = None):
+        if isinstance(error, dict):
+            self.code = error.get("code")
+            self.message = error.get("message", str(error))
+        else:
+            self.code = None
+            self.message = str(error)
+        self.request_id = request_id
+        super().__init__(f"code={self.code} message={self.message} id={request_id}")
+
+
+class GrvtRpcUnavailable(Exception):
+    """JSON-RPC request could not be delivered: connection not open or lost."""
+
+
+class GrvtRpcTimeout(GrvtRpcUnavailable):
+    """No JSON-RPC response within the timeout. The request may still have been executed."""
+
+
 class CandlestickInterval(Enum):
     CI_1_M = "CI_1_M"
     CI_3_M = "CI_3_M"
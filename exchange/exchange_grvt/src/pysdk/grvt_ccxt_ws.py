@@ -13,8 +13,11 @@ import traceback
 from asyncio.events import AbstractEventLoop
 from collections.abc import Callable
 from decimal import Decimal
+from typing import Any
 
+import aiohttp
 import websockets
+from websockets.exceptions import ConnectionClosed
 
 # import requests
 # from env import ENDPOINTS
@@ -30,11 +33,15 @@ from .grvt_ccxt_types import (
     GrvtInvalidOrder,
     GrvtOrderSide,
     GrvtOrderType,
+    GrvtRpcError,
+    GrvtRpcTimeout,
+    GrvtRpcUnavailable,
     Num,
 )
 from .grvt_ccxt_utils import get_order_rpc_payload
 
 WS_READ_TIMEOUT = 5
+RPC_TIMEOUT = 5
 
 
 class GrvtCcxtWS(GrvtCcxtPro):
@@ -43,7 +50,9 @@ class GrvtCcxtWS(GrvtCcxtPro):
 
     Args:
         env: GrvtCcxtPro (DEV, TESTNET, PROD)
-        parameters: dict with trading_account_id, private_key, api_key etc
+        parameters: dict with trading_account_id, private_key, api_key etc.
+            Optional `endpoint_types`: list of GrvtWSEndpointType to connect to
+            (default: all four), e.g. only TRADE_DATA_RPC_FULL for order entry.
 
     Examples:
         >>> from grvt_api_pro import GrvtCcxtPro
@@ -58,9 +67,11 @@ class GrvtCcxtWS(GrvtCcxtPro):
         loop: AbstractEventLoop,
         logger: logging.Logger | None = None,
         parameters: dict = {},
+        session: aiohttp.ClientSession | None = None,
+        metadata_cache: Any = None,
     ):
         """Initialize the GrvtCcxt instance."""
-        super().__init__(env, logger, parameters)
+        super().__init__(env, logger, parameters, session=session, metadata_cache=metadata_cache)
         self._loop = loop
         self._clsname: str = type(self).__name__
         self.api_ws_version = parameters.get("api_ws_version", "v1")
@@ -71,7 +82,11 @@ class GrvtCcxtWS(GrvtCcxtPro):
         self.api_url: dict[GrvtWSEndpointType, str] = {}
         self._last_message: dict[str, dict] = {}
         self._request_id = 0
-        self.endpoint_types = [
+        # request id -> (endpoint, future) of JSON-RPC calls awaiting a response
+        self._rpc_futures: dict[int, tuple[GrvtWSEndpointType, asyncio.Future]] = {}
+        # set while the endpoint connection is open; wakes up its reader right after connect
+        self._connected: dict[GrvtWSEndpointType, asyncio.Event] = {}
+        self.endpoint_types = parameters.get("endpoint_types") or [
             GrvtWSEndpointType.MARKET_DATA,
             GrvtWSEndpointType.TRADE_DATA,
             GrvtWSEndpointType.MARKET_DATA_RPC_FULL,
@@ -85,6 +100,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             self.callbacks[grvt_endpoint_type] = {}
             self.subscribed_streams[grvt_endpoint_type] = {}
             self.ws[grvt_endpoint_type] = None
+            self._connected[grvt_endpoint_type] = asyncio.Event()
             self._loop.create_task(self._read_messages(grvt_endpoint_type))
         self.logger.info(f"{self._clsname} initialized {self.api_url=}")
         self.logger.info(f"{self._clsname} initialized {self.ws=}")
@@ -108,9 +124,14 @@ class GrvtCcxtWS(GrvtCcxtPro):
         self._loop.create_task(self.connect_all_channels())
 
     def is_connection_open(self, grvt_endpoint_type: GrvtWSEndpointType) -> bool:
-        return (
-            self.ws[grvt_endpoint_type] is not None and self.ws[grvt_endpoint_type].open
-        )
+        ws = self.ws[grvt_endpoint_type]
+        if ws is None:
+            return False
+        # legacy connections expose `open`, websockets >= 14 connections only `state`
+        is_open = getattr(ws, "open", None)
+        if is_open is not None:
+            return bool(is_open)
+        return getattr(ws.state, "name", "") == "OPEN"
 
     def is_endpoint_connected(self, grvt_endpoint_type: GrvtWSEndpointType) -> bool:
         """
@@ -213,10 +234,16 @@ class GrvtCcxtWS(GrvtCcxtPro):
         except Exception as e:
             self.logger.warning(f"{FN} error:{e} traceback:{traceback.format_exc()}")
             self.ws[grvt_endpoint_type] = None
+        if self.is_connection_open(grvt_endpoint_type):
+            self._connected[grvt_endpoint_type].set()
         # return True  if connection successful
         return self.is_endpoint_connected(grvt_endpoint_type)
 
     async def _close_connection(self, grvt_endpoint_type: GrvtWSEndpointType):
+        self._connected[grvt_endpoint_type].clear()
+        self._fail_rpc_futures(
+            grvt_endpoint_type, GrvtRpcUnavailable(f"{grvt_endpoint_type} connection closed")
+        )
         try:
             if self.ws[grvt_endpoint_type]:
                 self.logger.info(f"{self._clsname} Closing connection...")
@@ -331,6 +358,9 @@ class GrvtCcxtWS(GrvtCcxtPro):
                         'id': 2}
                     """
                         self.logger.debug(f"{FN} jsonrpc result:{message.get('result')}")
+                        self._resolve_rpc(message)
+                    elif "error" in message and self._resolve_rpc(message):
+                        pass
                     else:
                         self.logger.info(f"{FN} Non-actionable message:{message}")
                 except (
@@ -351,11 +381,16 @@ class GrvtCcxtWS(GrvtCcxtPro):
                     await asyncio.sleep(1)
             else:
                 self.logger.info(f"{FN} connection not open")
-                await asyncio.sleep(2)
+                try:
+                    await asyncio.wait_for(
+                        self._connected[grvt_endpoint_type].wait(), timeout=2
+                    )
+                except asyncio.TimeoutError:  # noqa: UP041
+                    pass
 
     async def _send(self, end_point_type: GrvtWSEndpointType, message: str):
         try:
-            if self.ws[end_point_type] and self.ws[end_point_type].open:
+            if self.is_connection_open(end_point_type):
                 self.logger.info(
                     f"{self._clsname} _send() {end_point_type=}"
                     f" url:{self.api_url[end_point_type]} {message=}"
@@ -612,6 +647,77 @@ class GrvtCcxtWS(GrvtCcxtPro):
         await self._send(end_point_type, json.dumps(message))
         self.logger.info(f"{self._clsname} send_rpc_message {end_point_type=} {message=}")
 
+    async def rpc_call(
+        self,
+        end_point_type: GrvtWSEndpointType,
+        message: dict,
+        timeout: float = RPC_TIMEOUT,
+    ) -> dict:
+        """
+        Send a JSON-RPC request and wait for the response with the same `id`.<br>
+        Unlike send_rpc_message(), the request is not resent on reconnect: the caller
+        decides how to retry.<br>
+        Returns:
+            `result` of the response.<br>
+        Raises:
+            GrvtRpcError: the server answered with an error.<br>
+            GrvtRpcTimeout: no response within `timeout` secs (outcome unknown).<br>
+            GrvtRpcUnavailable: connection not open or lost before the response.<br>
+        """
+        FN = f"{self._clsname} rpc_call"
+        if not self.is_connection_open(end_point_type):
+            raise GrvtRpcUnavailable(f"{FN} {end_point_type} connection not open")
+        if "id" not in message:
+            self._request_id += 1
+            message["id"] = self._request_id
+        request_id = message["id"]
+        future = asyncio.get_running_loop().create_future()
+        self._rpc_futures[request_id] = (end_point_type, future)
+        try:
+            try:
+                await self.ws[end_point_type].send(json.dumps(message))
+            except ConnectionClosed as e:
+                raise GrvtRpcUnavailable(f"{FN} {end_point_type} send failed: {e}") from e
+            self.logger.info(f"{FN} {end_point_type=} {message=}")
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError as e:  # noqa: UP041
+                raise GrvtRpcTimeout(
+                    f"{FN} no response to id={request_id} in {timeout} secs"
+                ) from e
+        finally:
+            self._rpc_futures.pop(request_id, None)
+
+    def _resolve_rpc(self, message: dict) -> bool:
+        """Complete the rpc_call() future awaiting this response. Returns True if found."""
+        entry = self._rpc_futures.pop(message.get("id"), None)
+        if entry is None:
+            return False
+        future = entry[1]
+        if not future.done():
+            if "error" in message:
+                future.set_exception(GrvtRpcError(message["error"], message.get("id")))
+            else:
+                future.set_result(message.get("result"))
+        return True
+
+    def _fail_rpc_futures(
+        self, end_point_type: GrvtWSEndpointType, exc: Exception
+    ) -> None:
+        """Fail pending rpc_call() futures of the endpoint so callers do not wait for the timeout."""
+        for request_id, (ep, future) in list(self._rpc_futures.items()):
+            if ep == end_point_type:
+                del self._rpc_futures[request_id]
+                if not future.done():
+                    future.set_exception(exc)
+
+    async def _send_rpc(self, payload: dict, timeout: float | None) -> dict:
+        """send_rpc_message() if timeout is None, otherwise rpc_call() and return the response."""
+        if timeout is None:
+            await self.send_rpc_message(GrvtWSEndpointType.TRADE_DATA_RPC_FULL, payload)
+            return payload
+        return await self.rpc_call(GrvtWSEndpointType.TRADE_DATA_RPC_FULL, payload, timeout)
+
     async def rpc_create_order(
         self,
         symbol: str,
@@ -620,9 +726,12 @@ class GrvtCcxtWS(GrvtCcxtPro):
         amount: float | Decimal | str | int,
         price: Num = None,
         params={},
+        timeout: float | None = None,
     ) -> dict:
         """
-        Create an order.
+        Create an order.<br>
+        Returns the JSON-RPC payload sent, or, if `timeout` is given,
+        waits for the response and returns its `result` (see rpc_call()).
         """
         FN = f"{self._clsname} rpc_create_order"
         if not self.is_endpoint_connected(GrvtWSEndpointType.TRADE_DATA_RPC_FULL):
@@ -635,8 +744,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
         self._request_id += 1
         payload["id"] = self._request_id
         self.logger.info(f"{FN} {payload=}")
-        await self.send_rpc_message(GrvtWSEndpointType.TRADE_DATA_RPC_FULL, payload)
-        return payload
+        return await self._send_rpc(payload, timeout)
 
     async def rpc_create_limit_order(
         self,
@@ -645,12 +753,16 @@ class GrvtCcxtWS(GrvtCcxtPro):
         amount: float | Decimal | str | int,
         price: Num,
         params={},
+        timeout: float | None = None,
     ) -> dict:
-        return await self.rpc_create_order(symbol, "limit", side, amount, price, params)
+        return await self.rpc_create_order(
+            symbol, "limit", side, amount, price, params, timeout
+        )
 
     async def rpc_cancel_all_orders(
         self,
         params: dict = {},
+        timeout: float | None = None,
     ) -> dict:
         """
         Ccxt compliant signature BUT lacks symbol
@@ -660,21 +772,20 @@ class GrvtCcxtWS(GrvtCcxtPro):
                 `base` (str): base currency. If missing/empty then fetch
                                     orders for all base currencies.<br>
                 `quote` (str): quote currency. Defaults to all.<br>
+            timeout: if given, wait for the response and return its `result`.<br>
         """
         self._check_account_auth()
         # FN = f"{self._clsname} rpc_cancel_all_orders"
         payload: dict = self._get_payload_cancel_all_orders(params)
         jsonrpc_payload: dict = self.jsonrpc_wrap_payload(payload, method="cancel_all_orders")
-        await self.send_rpc_message(
-            GrvtWSEndpointType.TRADE_DATA_RPC_FULL, jsonrpc_payload
-        )
-        return jsonrpc_payload
+        return await self._send_rpc(jsonrpc_payload, timeout)
 
     async def rpc_cancel_order(
         self,
         id: str | None = None,
         symbol: str | None = None,
         params: dict = {},
+        timeout: float | None = None,
     ) -> dict:
         """
         Ccxt compliant signature
@@ -689,6 +800,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             params: 
                 * client_order_id (str): client assigned order ID<br>
                 * time_to_live_ms (str): lifetime of cancel requiest in millisecs<br>
+            timeout: if given, wait for the response and return its `result`.<br>
         Returns:
             payload used to cancel order.<br>
         """
@@ -710,14 +822,12 @@ class GrvtCcxtWS(GrvtCcxtPro):
             payload["time_to_live_ms"] = str(params["time_to_live_ms"])
         # Send cancel requiest
         jsonrpc_payload = self.jsonrpc_wrap_payload(payload, method="cancel_order")
-        await self.send_rpc_message(
-            GrvtWSEndpointType.TRADE_DATA_RPC_FULL, jsonrpc_payload
-        )
-        return jsonrpc_payload
+        return await self._send_rpc(jsonrpc_payload, timeout)
 
     async def rpc_fetch_open_orders(
         self,
         params: dict = {},
+        timeout: float | None = None,
     ) -> dict:
         """
         Fetch open orders for the account.<br>
@@ -732,6 +842,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
                 `base` (str): base currency. If missing/empty then fetch orders
                                     for all base currencies.<br>
                 `quote` (str): quote currency. Defaults to all.<br>
+            timeout: if given, wait for the response and return its `result`.<br>
         Returns:
             payload used to fetch open orders.<br><br>
         """
@@ -739,16 +850,14 @@ class GrvtCcxtWS(GrvtCcxtPro):
         # Prepare request payload
         payload: dict = self._get_payload_fetch_open_orders(symbol=None, params=params)
         jsonrpc_payload: dict = self.jsonrpc_wrap_payload(payload, method="open_orders")
-        await self.send_rpc_message(
-            GrvtWSEndpointType.TRADE_DATA_RPC_FULL, jsonrpc_payload
-        )
-        return jsonrpc_payload
+        return await self._send_rpc(jsonrpc_payload, timeout)
 
     async def rpc_fetch_order(
         self,
         id: str | None = None,
         symbol: str | None = None,
         params: dict = {},
+        timeout: float | None = None,
     ) -> dict:
         """
         Ccxt compliant signature.<br>
@@ -762,6 +871,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             symbol: (str) NOT SUPPRTED.<br>
             params: dictionary with parameters. Valid keys:<br>
                 `client_order_id` (int): client assigned order ID.<br>
+            timeout: if given, wait for the response and return its `result`.<br>
         Returns:
             payload used to fetch order.<br>
         """
@@ -779,7 +889,4 @@ class GrvtCcxtWS(GrvtCcxtPro):
                 f"{FN} requires either order_id or params['client_order_id']"
             )
         jsonrpc_payload = self.jsonrpc_wrap_payload(payload, method="order")
-        await self.send_rpc_message(
-            GrvtWSEndpointType.TRADE_DATA_RPC_FULL, jsonrpc_payload
-        )
-        return jsonrpc_payload
+        return await self._send_rpc(jsonrpc_payload, timeout)
@@ -1,16 +1,15 @@
-from enum import Enum
-
-from dacite import Config, from_dict
+import aiohttp
 
 from . import grvt_raw_types as types
 from .grvt_raw_base import GrvtApiConfig, GrvtError, GrvtRawAsyncBase
+from .grvt_raw_decode import from_dict
 
 # mypy: disable-error-code="no-any-return"
 
 
 class GrvtRawAsync(GrvtRawAsyncBase):
-    def __init__(self, config: GrvtApiConfig):
-        super().__init__(config)
+    def __init__(self, config: GrvtApiConfig, session: aiohttp.ClientSession | None = None):
+        super().__init__(config, session)
         self.md_rpc = self.env.market_data.rpc_endpoint
         self.td_rpc = self.env.trade_data.rpc_endpoint
 
@@ -20,7 +19,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/instrument", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetInstrumentResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetInstrumentResponse, resp)
 
     async def get_all_instruments_v1(
         self, req: types.ApiGetAllInstrumentsRequest
@@ -28,7 +27,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/all_instruments", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetAllInstrumentsResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetAllInstrumentsResponse, resp)
 
     async def get_filtered_instruments_v1(
         self, req: types.ApiGetFilteredInstrumentsRequest
@@ -36,9 +35,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/instruments", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiGetFilteredInstrumentsResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiGetFilteredInstrumentsResponse, resp)
 
     async def get_currency_v1(
         self, req: types.ApiGetCurrencyRequest
@@ -46,7 +43,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/currency", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetCurrencyResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetCurrencyResponse, resp)
 
     async def mini_ticker_v1(
         self, req: types.ApiMiniTickerRequest
@@ -54,7 +51,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/mini", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiMiniTickerResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiMiniTickerResponse, resp)
 
     async def ticker_v1(
         self, req: types.ApiTickerRequest
@@ -62,7 +59,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/ticker", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTickerResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTickerResponse, resp)
 
     async def orderbook_levels_v1(
         self, req: types.ApiOrderbookLevelsRequest
@@ -70,7 +67,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/book", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiOrderbookLevelsResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiOrderbookLevelsResponse, resp)
 
     async def trade_v1(
         self, req: types.ApiTradeRequest
@@ -78,7 +75,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/trade", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTradeResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTradeResponse, resp)
 
     async def trade_history_v1(
         self, req: types.ApiTradeHistoryRequest
@@ -86,7 +83,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/trade_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTradeHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTradeHistoryResponse, resp)
 
     async def candlestick_v1(
         self, req: types.ApiCandlestickRequest
@@ -94,7 +91,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/kline", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiCandlestickResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiCandlestickResponse, resp)
 
     async def funding_rate_v1(
         self, req: types.ApiFundingRateRequest
@@ -102,7 +99,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(False, self.md_rpc + "/full/v1/funding", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiFundingRateResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiFundingRateResponse, resp)
 
     async def create_order_v1(
         self, req: types.ApiCreateOrderRequest
@@ -110,7 +107,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/create_order", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiCreateOrderResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiCreateOrderResponse, resp)
 
     async def cancel_order_v1(
         self, req: types.ApiCancelOrderRequest
@@ -118,7 +115,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/cancel_order", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def cancel_all_orders_v1(
         self, req: types.ApiCancelAllOrdersRequest
@@ -126,7 +123,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/cancel_all_orders", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def get_order_v1(
         self, req: types.ApiGetOrderRequest
@@ -134,7 +131,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/order", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetOrderResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetOrderResponse, resp)
 
     async def open_orders_v1(
         self, req: types.ApiOpenOrdersRequest
@@ -142,7 +139,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/open_orders", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiOpenOrdersResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiOpenOrdersResponse, resp)
 
     async def order_history_v1(
         self, req: types.ApiOrderHistoryRequest
@@ -150,7 +147,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/order_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiOrderHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiOrderHistoryResponse, resp)
 
     async def cancel_on_disconnect_v1(
         self, req: types.ApiCancelOnDisconnectRequest
@@ -158,7 +155,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/cancel_on_disconnect", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def fill_history_v1(
         self, req: types.ApiFillHistoryRequest
@@ -166,7 +163,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/fill_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiFillHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiFillHistoryResponse, resp)
 
     async def positions_v1(
         self, req: types.ApiPositionsRequest
@@ -174,7 +171,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/positions", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiPositionsResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiPositionsResponse, resp)
 
     async def funding_payment_history_v1(
         self, req: types.ApiFundingPaymentHistoryRequest
@@ -184,9 +181,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiFundingPaymentHistoryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiFundingPaymentHistoryResponse, resp)
 
     async def deposit_history_v1(
         self, req: types.ApiDepositHistoryRequest
@@ -194,7 +189,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/deposit_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiDepositHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiDepositHistoryResponse, resp)
 
     async def transfer_v1(
         self, req: types.ApiTransferRequest
@@ -202,7 +197,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/transfer", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTransferResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTransferResponse, resp)
 
     async def transfer_history_v1(
         self, req: types.ApiTransferHistoryRequest
@@ -210,7 +205,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/transfer_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTransferHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTransferHistoryResponse, resp)
 
     async def withdrawal_v1(
         self, req: types.ApiWithdrawalRequest
@@ -218,7 +213,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/withdrawal", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def withdrawal_history_v1(
         self, req: types.ApiWithdrawalHistoryRequest
@@ -226,7 +221,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/withdrawal_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiWithdrawalHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiWithdrawalHistoryResponse, resp)
 
     async def sub_account_summary_v1(
         self, req: types.ApiSubAccountSummaryRequest
@@ -234,7 +229,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/account_summary", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiSubAccountSummaryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiSubAccountSummaryResponse, resp)
 
     async def sub_account_history_v1(
         self, req: types.ApiSubAccountHistoryRequest
@@ -242,7 +237,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/account_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiSubAccountHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiSubAccountHistoryResponse, resp)
 
     async def aggregated_account_summary_v1(
         self, req: types.EmptyRequest
@@ -252,9 +247,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiAggregatedAccountSummaryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiAggregatedAccountSummaryResponse, resp)
 
     async def funding_account_summary_v1(
         self, req: types.EmptyRequest
@@ -264,9 +257,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiFundingAccountSummaryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiFundingAccountSummaryResponse, resp)
 
     async def set_derisk_mm_ratio_v1(
         self, req: types.ApiSetDeriskToMaintenanceMarginRatioRequest
@@ -274,9 +265,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/set_derisk_mm_ratio", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiSetDeriskToMaintenanceMarginRatioResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiSetDeriskToMaintenanceMarginRatioResponse, resp)
 
     async def get_all_initial_leverage_v1(
         self, req: types.ApiGetAllInitialLeverageRequest
@@ -286,9 +275,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiGetAllInitialLeverageResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiGetAllInitialLeverageResponse, resp)
 
     async def set_initial_leverage_v1(
         self, req: types.ApiSetInitialLeverageRequest
@@ -296,7 +283,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/set_initial_leverage", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiSetInitialLeverageResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiSetInitialLeverageResponse, resp)
 
     async def vault_burn_tokens_v1(
         self, req: types.ApiVaultBurnTokensRequest
@@ -304,7 +291,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/vault_burn_tokens", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def vault_invest_v1(
         self, req: types.ApiVaultInvestRequest
@@ -312,7 +299,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/vault_invest", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def vault_investor_summary_v1(
         self, req: types.ApiVaultInvestorSummaryRequest
@@ -322,7 +309,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiVaultInvestorSummaryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiVaultInvestorSummaryResponse, resp)
 
     async def vault_redeem_v1(
         self, req: types.ApiVaultRedeemRequest
@@ -330,7 +317,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/vault_redeem", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def vault_redeem_cancel_v1(
         self, req: types.ApiVaultRedeemCancelRequest
@@ -338,7 +325,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         resp = await self._post(True, self.td_rpc + "/full/v1/vault_redeem_cancel", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     async def vault_redemption_queue_v1(
         self, req: types.ApiVaultViewRedemptionQueueRequest
@@ -348,9 +335,7 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiVaultViewRedemptionQueueResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiVaultViewRedemptionQueueResponse, resp)
 
     async def query_vault_manager_investor_history_v1(
         self, req: types.ApiQueryVaultManagerInvestorHistoryRequest
@@ -360,6 +345,4 @@ class GrvtRawAsync(GrvtRawAsyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiQueryVaultManagerInvestorHistoryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiQueryVaultManagerInvestorHistoryResponse, resp)
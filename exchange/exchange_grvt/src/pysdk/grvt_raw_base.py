@@ -73,10 +73,10 @@ class GrvtRawBase:
 
 
 class GrvtRawSyncBase(GrvtRawBase):
-    def __init__(self, config: GrvtApiConfig):
+    def __init__(self, config: GrvtApiConfig, session: requests.Session | None = None):
         super().__init__(config)
-        # Sync API session
-        self._session: requests.Session = requests.Session()
+        # Sync API session (may be injected to share a connection pool; holds this account's cookie)
+        self._session: requests.Session = session or requests.Session()
         self._session.headers.update({"Content-Type": "application/json"})
 
     """
@@ -164,12 +164,14 @@ class GrvtRawSyncBase(GrvtRawBase):
 
 
 class GrvtRawAsyncBase(GrvtRawBase):
-    def __init__(self, config: GrvtApiConfig):
+    def __init__(self, config: GrvtApiConfig, session: aiohttp.ClientSession | None = None):
         super().__init__(config)
-        # Async API session
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
-            headers={"Content-Type": "application/json"}
-        )
+        # Async API session (may be injected to share a connector; holds this account's cookie)
+        if session is None:
+            session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
+        else:
+            session.headers.update({"Content-Type": "application/json"})
+        self._session: aiohttp.ClientSession = session
 
     """
     Cookie handling
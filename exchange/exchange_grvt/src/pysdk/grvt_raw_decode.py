@@ -0,0 +1,139 @@
+"""
+Fast decoding of GRVT raw API responses into the dataclasses in `grvt_raw_types`.
+
+`dacite.from_dict` re-inspects the target type on every call. Here a decoder is
+generated once per dataclass from its type hints and cached, so decoding a
+response is a straight sequence of dict lookups, Enum casts and constructor calls.
+
+The behaviour matches `from_dict(cls, data, Config(cast=[Enum]))` for the field
+shapes used in `grvt_raw_types` (scalars, Enums, nested dataclasses, lists and
+`X | None`): unknown keys are ignored, missing optional fields become None and
+Enum fields are cast from their raw values. Scalar values are not type-checked.
+"""
+
+import dataclasses
+import types
+import typing
+from collections.abc import Callable
+from enum import Enum
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_NONE_TYPE = type(None)
+_MISSING = object()
+
+_decoders: dict[type, Callable[[dict[str, Any]], Any]] = {}
+_building: set[type] = set()
+
+
+class GrvtDecodeError(ValueError):
+    """Raised when a payload cannot be decoded into the requested dataclass."""
+
+
+def from_dict(data_class: type[T], data: dict[str, Any]) -> T:  # noqa: UP047
+    """Decode `data` into an instance of `data_class` using a cached decoder."""
+    decoder = _decoders.get(data_class)
+    if decoder is None:
+        decoder = get_decoder(data_class)
+    try:
+        return decoder(data)  # type: ignore[no-any-return]
+    except (KeyError, TypeError, ValueError) as err:
+        raise GrvtDecodeError(f"cannot decode {data_class.__name__}: {err!r}") from err
+
+
+def get_decoder(data_class: type[T]) -> Callable[[dict[str, Any]], T]:  # noqa: UP047
+    """Return the cached decoder for `data_class`, generating it on first use."""
+    decoder = _decoders.get(data_class)
+    if decoder is None:
+        decoder = _build_decoder(data_class)
+    return decoder
+
+
+def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
+    origin = typing.get_origin(tp)
+    if origin is typing.Union or origin is types.UnionType:
+        args = [a for a in typing.get_args(tp) if a is not _NONE_TYPE]
+        if len(args) == 1:
+            return args[0], True
+    return tp, False
+
+
+def _converter(tp: Any) -> Callable[[Any], Any] | None:
+    """Build a value converter for `tp`, or None when the raw value is used as-is."""
+    tp, _ = _unwrap_optional(tp)
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        return tp
+    if dataclasses.is_dataclass(tp):
+        nested = _decoders.get(tp)  # type: ignore[arg-type]
+        if nested is not None:
+            return nested
+        if tp in _building:
+            # self-referencing type: resolve lazily once the decoder is registered
+            return lambda value: _decoders[tp](value)  # type: ignore[index]
+        return _build_decoder(tp)  # type: ignore[arg-type]
+    if typing.get_origin(tp) is list:
+        (item_tp,) = typing.get_args(tp) or (Any,)
+        item = _converter(item_tp)
+        if item is None:
+            return None
+        return lambda value: [item(v) for v in value]
+    return None
+
+
+def _build_decoder(data_class: type[T]) -> Callable[[dict[str, Any]], T]:  # noqa: UP047
+    if not dataclasses.is_dataclass(data_class):
+        raise TypeError(f"{data_class!r} is not a dataclass")
+
+    _building.add(data_class)
+    try:
+        hints = typing.get_type_hints(data_class)
+        namespace: dict[str, Any] = {"_cls": data_class, "_MISSING": _MISSING}
+        body = []
+        args = []
+        for i, field in enumerate(dataclasses.fields(data_class)):
+            if not field.init:
+                continue
+            tp = hints[field.name]
+            _, optional = _unwrap_optional(tp)
+            conv = _converter(tp)
+            if conv is not None:
+                namespace[f"_c{i}"] = conv
+            key = repr(field.name)
+
+            if field.default is not dataclasses.MISSING:
+                namespace[f"_dv{i}"] = field.default
+                default = f"_dv{i}"
+            elif field.default_factory is not dataclasses.MISSING:
+                namespace[f"_df{i}"] = field.default_factory
+                default = f"_df{i}()"
+            elif optional:
+                default = "None"
+            else:
+                value = f"d[{key}]"
+                args.append(
+                    f"{field.name}=_c{i}({value})" if conv else f"{field.name}={value}"
+                )
+                continue
+
+            # missing -> default, explicit null -> None, otherwise convert
+            body.append(f"    v{i} = get({key}, _MISSING)")
+            body.append(f"    if v{i} is _MISSING:")
+            body.append(f"        v{i} = {default}")
+            if conv is not None:
+                body.append(f"    elif v{i} is not None:")
+                body.append(f"        v{i} = _c{i}(v{i})")
+            args.append(f"{field.name}=v{i}")
+
+        src = (
+            "def decode(d):\n"
+            "    get = d.get\n"
+            + "".join(line + "\n" for line in body)
+            + f"    return _cls({', '.join(args)})\n"
+        )
+        exec(compile(src, f"<grvt decoder {data_class.__name__}>", "exec"), namespace)  # noqa: S102
+        decoder = namespace["decode"]
+        _decoders[data_class] = decoder
+        return decoder  # type: ignore[no-any-return]
+    finally:
+        _building.discard(data_class)
@@ -1,16 +1,15 @@
-from enum import Enum
-
-from dacite import Config, from_dict
+import requests
 
 from . import grvt_raw_types as types
 from .grvt_raw_base import GrvtApiConfig, GrvtError, GrvtRawSyncBase
+from .grvt_raw_decode import from_dict
 
 # mypy: disable-error-code="no-any-return"
 
 
 class GrvtRawSync(GrvtRawSyncBase):
-    def __init__(self, config: GrvtApiConfig):
-        super().__init__(config)
+    def __init__(self, config: GrvtApiConfig, session: requests.Session | None = None):
+        super().__init__(config, session)
         self.md_rpc = self.env.market_data.rpc_endpoint
         self.td_rpc = self.env.trade_data.rpc_endpoint
 
@@ -20,7 +19,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/instrument", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetInstrumentResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetInstrumentResponse, resp)
 
     def get_all_instruments_v1(
         self, req: types.ApiGetAllInstrumentsRequest
@@ -28,7 +27,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/all_instruments", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetAllInstrumentsResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetAllInstrumentsResponse, resp)
 
     def get_filtered_instruments_v1(
         self, req: types.ApiGetFilteredInstrumentsRequest
@@ -36,9 +35,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/instruments", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiGetFilteredInstrumentsResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiGetFilteredInstrumentsResponse, resp)
 
     def get_currency_v1(
         self, req: types.ApiGetCurrencyRequest
@@ -46,7 +43,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/currency", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetCurrencyResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetCurrencyResponse, resp)
 
     def mini_ticker_v1(
         self, req: types.ApiMiniTickerRequest
@@ -54,7 +51,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/mini", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiMiniTickerResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiMiniTickerResponse, resp)
 
     def ticker_v1(
         self, req: types.ApiTickerRequest
@@ -62,7 +59,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/ticker", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTickerResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTickerResponse, resp)
 
     def orderbook_levels_v1(
         self, req: types.ApiOrderbookLevelsRequest
@@ -70,13 +67,13 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/book", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiOrderbookLevelsResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiOrderbookLevelsResponse, resp)
 
     def trade_v1(self, req: types.ApiTradeRequest) -> types.ApiTradeResponse | GrvtError:
         resp = self._post(False, self.md_rpc + "/full/v1/trade", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTradeResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTradeResponse, resp)
 
     def trade_history_v1(
         self, req: types.ApiTradeHistoryRequest
@@ -84,7 +81,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/trade_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTradeHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTradeHistoryResponse, resp)
 
     def candlestick_v1(
         self, req: types.ApiCandlestickRequest
@@ -92,7 +89,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/kline", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiCandlestickResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiCandlestickResponse, resp)
 
     def funding_rate_v1(
         self, req: types.ApiFundingRateRequest
@@ -100,7 +97,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(False, self.md_rpc + "/full/v1/funding", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiFundingRateResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiFundingRateResponse, resp)
 
     def create_order_v1(
         self, req: types.ApiCreateOrderRequest
@@ -108,7 +105,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/create_order", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiCreateOrderResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiCreateOrderResponse, resp)
 
     def cancel_order_v1(
         self, req: types.ApiCancelOrderRequest
@@ -116,7 +113,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/cancel_order", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def cancel_all_orders_v1(
         self, req: types.ApiCancelAllOrdersRequest
@@ -124,7 +121,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/cancel_all_orders", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def get_order_v1(
         self, req: types.ApiGetOrderRequest
@@ -132,7 +129,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/order", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiGetOrderResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiGetOrderResponse, resp)
 
     def open_orders_v1(
         self, req: types.ApiOpenOrdersRequest
@@ -140,7 +137,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/open_orders", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiOpenOrdersResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiOpenOrdersResponse, resp)
 
     def order_history_v1(
         self, req: types.ApiOrderHistoryRequest
@@ -148,7 +145,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/order_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiOrderHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiOrderHistoryResponse, resp)
 
     def cancel_on_disconnect_v1(
         self, req: types.ApiCancelOnDisconnectRequest
@@ -156,7 +153,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/cancel_on_disconnect", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def fill_history_v1(
         self, req: types.ApiFillHistoryRequest
@@ -164,7 +161,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/fill_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiFillHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiFillHistoryResponse, resp)
 
     def positions_v1(
         self, req: types.ApiPositionsRequest
@@ -172,7 +169,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/positions", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiPositionsResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiPositionsResponse, resp)
 
     def funding_payment_history_v1(
         self, req: types.ApiFundingPaymentHistoryRequest
@@ -180,9 +177,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/funding_payment_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiFundingPaymentHistoryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiFundingPaymentHistoryResponse, resp)
 
     def deposit_history_v1(
         self, req: types.ApiDepositHistoryRequest
@@ -190,7 +185,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/deposit_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiDepositHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiDepositHistoryResponse, resp)
 
     def transfer_v1(
         self, req: types.ApiTransferRequest
@@ -198,7 +193,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/transfer", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTransferResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTransferResponse, resp)
 
     def transfer_history_v1(
         self, req: types.ApiTransferHistoryRequest
@@ -206,7 +201,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/transfer_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiTransferHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiTransferHistoryResponse, resp)
 
     def withdrawal_v1(
         self, req: types.ApiWithdrawalRequest
@@ -214,7 +209,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/withdrawal", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def withdrawal_history_v1(
         self, req: types.ApiWithdrawalHistoryRequest
@@ -222,7 +217,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/withdrawal_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiWithdrawalHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiWithdrawalHistoryResponse, resp)
 
     def sub_account_summary_v1(
         self, req: types.ApiSubAccountSummaryRequest
@@ -230,7 +225,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/account_summary", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiSubAccountSummaryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiSubAccountSummaryResponse, resp)
 
     def sub_account_history_v1(
         self, req: types.ApiSubAccountHistoryRequest
@@ -238,7 +233,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/account_history", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiSubAccountHistoryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiSubAccountHistoryResponse, resp)
 
     def aggregated_account_summary_v1(
         self, req: types.EmptyRequest
@@ -246,9 +241,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/aggregated_account_summary", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiAggregatedAccountSummaryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiAggregatedAccountSummaryResponse, resp)
 
     def funding_account_summary_v1(
         self, req: types.EmptyRequest
@@ -256,9 +249,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/funding_account_summary", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiFundingAccountSummaryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiFundingAccountSummaryResponse, resp)
 
     def set_derisk_mm_ratio_v1(
         self, req: types.ApiSetDeriskToMaintenanceMarginRatioRequest
@@ -266,9 +257,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/set_derisk_mm_ratio", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiSetDeriskToMaintenanceMarginRatioResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiSetDeriskToMaintenanceMarginRatioResponse, resp)
 
     def get_all_initial_leverage_v1(
         self, req: types.ApiGetAllInitialLeverageRequest
@@ -276,9 +265,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/get_all_initial_leverage", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiGetAllInitialLeverageResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiGetAllInitialLeverageResponse, resp)
 
     def set_initial_leverage_v1(
         self, req: types.ApiSetInitialLeverageRequest
@@ -286,7 +273,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/set_initial_leverage", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiSetInitialLeverageResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiSetInitialLeverageResponse, resp)
 
     def vault_burn_tokens_v1(
         self, req: types.ApiVaultBurnTokensRequest
@@ -294,7 +281,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/vault_burn_tokens", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def vault_invest_v1(
         self, req: types.ApiVaultInvestRequest
@@ -302,7 +289,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/vault_invest", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def vault_investor_summary_v1(
         self, req: types.ApiVaultInvestorSummaryRequest
@@ -310,7 +297,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/vault_investor_summary", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.ApiVaultInvestorSummaryResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.ApiVaultInvestorSummaryResponse, resp)
 
     def vault_redeem_v1(
         self, req: types.ApiVaultRedeemRequest
@@ -318,7 +305,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/vault_redeem", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def vault_redeem_cancel_v1(
         self, req: types.ApiVaultRedeemCancelRequest
@@ -326,7 +313,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/vault_redeem_cancel", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return from_dict(types.AckResponse, resp)
 
     def vault_redemption_queue_v1(
         self, req: types.ApiVaultViewRedemptionQueueRequest
@@ -334,9 +321,7 @@ class GrvtRawSync(GrvtRawSyncBase):
         resp = self._post(True, self.td_rpc + "/full/v1/vault_view_redemption_queue", req)
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiVaultViewRedemptionQueueResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiVaultViewRedemptionQueueResponse, resp)
 
     def query_vault_manager_investor_history_v1(
         self, req: types.ApiQueryVaultManagerInvestorHistoryRequest
@@ -346,6 +331,4 @@ class GrvtRawSync(GrvtRawSyncBase):
         )
         if resp.get("code"):
             return GrvtError(**resp)
-        return from_dict(
-            types.ApiQueryVaultManagerInvestorHistoryResponse, resp, Config(cast=[Enum])
-        )
+        return from_dict(types.ApiQueryVaultManagerInvestorHistoryResponse, resp)
@@ -317,7 +317,7 @@ class ApiPositionsRequest:
     quote: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Positions:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -371,7 +371,7 @@ class Positions:
     leverage: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiPositionsResponse:
     # The positions matching the request filter
     result: list[Positions]
@@ -403,7 +403,7 @@ class ApiFillHistoryRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -463,7 +463,7 @@ class Fill:
     broker: BrokerTag | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiFillHistoryResponse:
     # The private trades matching the request asset
     result: list[Fill]
@@ -714,7 +714,7 @@ class ApiGetAllInitialLeverageResponse:
     results: list[InitialLeverageResult]
 
 
-@dataclass
+@dataclass(slots=True)
 class Signature:
     # The address (public key) of the wallet signing the payload
     signer: str
@@ -940,7 +940,7 @@ class WSOrderbookLevelsFeedSelectorV1:
     depth: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderbookLevel:
     # The price of the level, expressed in `9` decimals
     price: str
@@ -950,7 +950,7 @@ class OrderbookLevel:
     num_orders: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderbookLevels:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -1004,7 +1004,7 @@ class WSMiniTickerFeedSelectorV1:
     rate: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MiniTicker:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str | None = None
@@ -1072,7 +1072,7 @@ class WSTickerFeedSelectorV1:
     rate: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticker:
     """
     Derived data such as the below, will not be included by default:
@@ -1168,7 +1168,7 @@ class WSTradeFeedSelectorV1:
     limit: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -1236,7 +1236,7 @@ class WSCandlestickFeedSelectorV1:
     type: CandlestickType
 
 
-@dataclass
+@dataclass(slots=True)
 class Candlestick:
     # Open time of kline bar in unix nanoseconds
     open_time: str
@@ -1319,7 +1319,7 @@ class ApiOrderbookLevelsRequest:
     depth: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiOrderbookLevelsResponse:
     # The orderbook levels objects matching the request asset
     result: OrderbookLevels
@@ -1331,7 +1331,7 @@ class ApiMiniTickerRequest:
     instrument: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiMiniTickerResponse:
     # The mini ticker matching the request asset
     result: MiniTicker
@@ -1343,7 +1343,7 @@ class ApiTickerRequest:
     instrument: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiTickerResponse:
     # The mini ticker matching the request asset
     result: Ticker
@@ -1362,7 +1362,7 @@ class ApiTradeRequest:
     limit: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiTradeResponse:
     # The public trades matching the request asset
     result: list[Trade]
@@ -1390,7 +1390,7 @@ class ApiTradeHistoryRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiTradeHistoryResponse:
     # The public trades matching the request asset
     result: list[Trade]
@@ -1507,7 +1507,7 @@ class ApiCandlestickRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiCandlestickResponse:
     # The candlestick result set for given interval
     result: list[Candlestick]
@@ -1535,7 +1535,7 @@ class ApiFundingRateRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingRate:
     # The readable instrument name:<ul><li>Perpetual: `ETH_USDT_Perp`</li><li>Future: `BTC_USDT_Fut_20Oct23`</li><li>Call: `ETH_USDT_Call_20Oct23_2800`</li><li>Put: `ETH_USDT_Put_20Oct23_2800`</li></ul>
     instrument: str
@@ -1549,7 +1549,7 @@ class FundingRate:
     funding_rate_8_h_avg: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiFundingRateResponse:
     # The funding rate result set for given interval
     result: list[FundingRate]
@@ -1603,7 +1603,7 @@ class ApiQueryVaultManagerInvestorHistoryResponse:
     result: list[ApiVaultInvestorHistory]
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderLeg:
     # The instrument to trade in this leg
     instrument: str
@@ -1619,7 +1619,7 @@ class OrderLeg:
     limit_price: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TPSLOrderMetadata:
     """
     Contains metadata for Take Profit (TP) and Stop Loss (SL) trigger orders.
@@ -1639,7 +1639,7 @@ class TPSLOrderMetadata:
     close_position: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerOrderMetadata:
     """
     Contains metadata related to trigger orders, such as Take Profit (TP) or Stop Loss (SL).
@@ -1659,7 +1659,7 @@ class TriggerOrderMetadata:
     tpsl: TPSLOrderMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderMetadata:
     """
     Metadata fields are used to support Backend only operations. These operations are not trustless by nature.
@@ -1686,7 +1686,7 @@ class OrderMetadata:
     broker: BrokerTag | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderState:
     # The status of the order
     status: OrderStatus
@@ -1702,7 +1702,7 @@ class OrderState:
     avg_fill_price: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Order is a typed payload used throughout the GRVT platform to express all orderbook, RFQ, and liquidation orders.
@@ -1767,7 +1767,7 @@ class ApiCreateOrderRequest:
     order: Order
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiCreateOrderResponse:
     # The created order
     result: Order
@@ -1818,7 +1818,7 @@ class ApiOpenOrdersRequest:
     quote: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiOpenOrdersResponse:
     # The Open Orders matching the request filter
     result: list[Order]
@@ -1850,7 +1850,7 @@ class ApiOrderHistoryRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiOrderHistoryResponse:
     # The Open Orders matching the request filter
     result: list[Order]
@@ -1885,7 +1885,7 @@ class ApiGetOrderRequest:
     client_order_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiGetOrderResponse:
     # The order object for the requested filter
     result: Order
@@ -1973,7 +1973,7 @@ class WSOrderStateFeedSelectorV1:
     instrument: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderStateFeed:
     # A unique 128-bit identifier for the order, deterministically generated within the GRVT backend
     order_id: str
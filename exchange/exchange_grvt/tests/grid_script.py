@@ -2,8 +2,6 @@ import os
 import sys
 import time
 import yaml
-import csv
-from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import Any, Dict, Tuple, Optional
@@ -13,10 +11,14 @@ script_dir = Path(__file__).parent
 project_root = script_dir.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
+repo_root = project_root.parent.parent
+if str(repo_root) not in sys.path:
+    sys.path.append(str(repo_root))
 
 from src.pysdk.grvt_ccxt import GrvtCcxt
 from src.pysdk.grvt_ccxt_env import GrvtEnv
 from src.pysdk.grvt_ccxt_types import PRICE_MULTIPLIER
+from adapters.order_journal import OrderJournal
 from tests.risk_script import (
     check_time_permission,
     get_current_china_time,
@@ -27,49 +29,26 @@ from tests.risk_script import (
 # ADX风控状态：记录是否因为ADX过高而触发风控
 _adx_risk_triggered = False
 
-# CSV日志文件路径（按日期命名）
-_log_file_path: Optional[Path] = None
+# 订单日志：由 adapters.order_journal 的后台线程批量写入 logs/order_log-YYYYMMDD-NNN.csv，
+# 下单路径上只做一次入队，不再每次同步打开/追加/关闭 CSV 文件
+_order_journal: Optional[OrderJournal] = None
 
 
-def get_log_file_path() -> Path:
+def get_order_journal() -> OrderJournal:
     """
-    获取日志文件路径（按日期命名）
+    获取订单日志（首次调用时创建并启动后台写线程）
     
     Returns:
-        日志文件路径
+        订单日志实例
     """
-    global _log_file_path
-    if _log_file_path is None:
-        script_dir = Path(__file__).parent
-        today = datetime.now().strftime("%Y-%m-%d")
-        log_dir = script_dir / "logs"
-        log_dir.mkdir(exist_ok=True)
-        _log_file_path = log_dir / f"order_log_{today}.csv"
-    return _log_file_path
-
-
-def init_order_log() -> None:
-    """
-    初始化订单日志CSV文件（如果不存在则创建并写入表头）
-    """
-    log_file = get_log_file_path()
-    
-    # 如果文件不存在，创建并写入表头
-    if not log_file.exists():
-        with open(log_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "时间戳",
-                "操作类型",
-                "交易对",
-                "方向",
-                "价格",
-                "数量",
-                "订单ID",
-                "状态",
-                "错误信息",
-                "备注"
-            ])
+    global _order_journal
+    if _order_journal is None:
+        _order_journal = OrderJournal(
+            directory=str(script_dir / "logs"),
+            prefix="order_log",
+            fmt="csv",
+        ).start()
+    return _order_journal
 
 
 def log_order_operation(
@@ -84,7 +63,7 @@ def log_order_operation(
     notes: Optional[str] = None
 ) -> None:
     """
-    记录订单操作到CSV文件
+    记录订单操作到订单日志（只入队，不阻塞）
     
     Args:
         operation_type: 操作类型（下单/撤单/市价平仓/限价平仓/批量撤单）
@@ -97,37 +76,18 @@ def log_order_operation(
         error_message: 错误信息，可选
         notes: 备注，可选
     """
-    try:
-        # 确保日志文件已初始化
-        init_order_log()
-        
-        log_file = get_log_file_path()
-        
-        # 获取当前时间戳（精确到毫秒）
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        
-        # 准备数据行
-        row = [
-            timestamp,
-            operation_type,
-            symbol,
-            side or "",
-            f"{price:.2f}" if price is not None else "",
-            f"{amount:.6f}" if amount is not None else "",
-            order_id or "",
-            status,
-            error_message or "",
-            notes or ""
-        ]
-        
-        # 追加写入CSV文件
-        with open(log_file, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
-            
-    except Exception as e:
-        # 记录日志失败不应该影响主程序运行
-        print(f"⚠️  记录订单日志失败: {e}")
+    get_order_journal().record(
+        operation_type,
+        exchange="grvt",
+        symbol=symbol,
+        side=side,
+        quantity=amount,
+        price=price,
+        order_id=order_id,
+        status=status,
+        error=error_message,
+        extra=notes,
+    )
 
 
 def load_config(config_path: str | Path | None = None) -> Dict[str, Any]:
@@ -1075,9 +1035,8 @@ def main():
     config, grvt = load_and_parse_config()
     
     # 初始化订单日志
-    init_order_log()
-    log_file = get_log_file_path()
-    print(f"订单日志文件: {log_file}")
+    journal = get_order_journal()
+    print(f"订单日志目录: {journal.directory}")
     
     # 从配置读取循环间隔（秒），默认60秒
     loop_interval = config.get("loop_interval", 60)
@@ -1102,6 +1061,7 @@ def main():
             
         except KeyboardInterrupt:
             print("\n程序被用户中断，退出...")
+            journal.stop()
             break
         except Exception as e:
             print(f"\n执行出错: {e}")
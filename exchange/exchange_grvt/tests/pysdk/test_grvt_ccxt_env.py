@@ -0,0 +1,53 @@
+from pysdk.grvt_ccxt_env import (
+    GrvtEndpointType,
+    GrvtEnv,
+    GrvtWSEndpointType,
+    get_grvt_endpoint,
+    get_grvt_endpoint_domains,
+    get_grvt_ws_endpoint,
+    set_grvt_endpoint_domain,
+    set_grvt_ws_endpoint,
+)
+
+
+def test_endpoint_domain_override_applies_and_resets():
+    default = get_grvt_endpoint(GrvtEnv.PROD, "CREATE_ORDER")
+    assert default.startswith("https://trades.grvt.io/")
+
+    set_grvt_endpoint_domain(GrvtEnv.PROD.value, GrvtEndpointType.TRADE_DATA, "https://trades-ap.grvt.io/")
+    try:
+        assert get_grvt_endpoint(GrvtEnv.PROD, "CREATE_ORDER") == default.replace(
+            "https://trades.grvt.io", "https://trades-ap.grvt.io"
+        )
+        # other endpoint types and environments keep their defaults
+        domains = get_grvt_endpoint_domains(GrvtEnv.PROD.value)
+        assert domains[GrvtEndpointType.MARKET_DATA] == "https://market-data.grvt.io"
+        testnet = get_grvt_endpoint_domains(GrvtEnv.TESTNET.value)
+        assert testnet[GrvtEndpointType.TRADE_DATA] == "https://trades.testnet.grvt.io"
+    finally:
+        set_grvt_endpoint_domain(GrvtEnv.PROD.value, GrvtEndpointType.TRADE_DATA, None)
+
+    assert get_grvt_endpoint(GrvtEnv.PROD, "CREATE_ORDER") == default
+
+
+def test_ws_endpoint_override_applies_and_resets():
+    env = GrvtEnv.TESTNET.value
+    default = get_grvt_ws_endpoint(env, GrvtWSEndpointType.TRADE_DATA_RPC_FULL)
+    assert default == "wss://trades.testnet.grvt.io/ws/full"
+
+    set_grvt_ws_endpoint(env, GrvtWSEndpointType.TRADE_DATA_RPC_FULL, "ws://127.0.0.1:18080/grvt/ws/full")
+    try:
+        assert (
+            get_grvt_ws_endpoint(env, GrvtWSEndpointType.TRADE_DATA_RPC_FULL)
+            == "ws://127.0.0.1:18080/grvt/ws/full"
+        )
+        # other endpoint types and environments keep their defaults
+        assert get_grvt_ws_endpoint(env, GrvtWSEndpointType.MARKET_DATA) == "wss://market-data.testnet.grvt.io/ws"
+        assert (
+            get_grvt_ws_endpoint(GrvtEnv.PROD.value, GrvtWSEndpointType.TRADE_DATA_RPC_FULL)
+            == "wss://trades.grvt.io/ws/full"
+        )
+    finally:
+        set_grvt_ws_endpoint(env, GrvtWSEndpointType.TRADE_DATA_RPC_FULL, None)
+
+    assert get_grvt_ws_endpoint(env, GrvtWSEndpointType.TRADE_DATA_RPC_FULL) == default
@@ -0,0 +1,32 @@
+import requests
+
+from pysdk.grvt_ccxt import GrvtCcxt
+from pysdk.grvt_ccxt_env import GrvtEnv
+
+
+class _OfflineSession(requests.Session):
+    def request(self, *args, **kwargs):
+        raise AssertionError("unexpected network request")
+
+
+class _DictCache:
+    def __init__(self, values: dict):
+        self.values = values
+        self.keys: list[str] = []
+
+    def get(self, key, loader):
+        self.keys.append(key)
+        if key not in self.values:
+            self.values[key] = loader()
+        return self.values[key]
+
+
+def test_markets_are_served_from_metadata_cache() -> None:
+    markets = {"BTC_USDT_Perp": {"instrument": "BTC_USDT_Perp", "tick_size": "0.1"}}
+    cache = _DictCache({"grvt/prod/markets": markets})
+
+    api = GrvtCcxt(GrvtEnv.PROD, session=_OfflineSession(), metadata_cache=cache)
+
+    assert cache.keys == ["grvt/prod/markets"]
+    assert api.markets == markets
+    assert api.markets_cache_key() == "grvt/prod/markets"
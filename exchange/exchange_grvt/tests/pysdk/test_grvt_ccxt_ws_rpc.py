@@ -0,0 +1,172 @@
+import asyncio
+import json
+
+import pytest
+
+from pysdk.grvt_ccxt_env import GrvtEnv, GrvtWSEndpointType
+from pysdk.grvt_ccxt_types import GrvtRpcError, GrvtRpcTimeout, GrvtRpcUnavailable
+from pysdk.grvt_ccxt_ws import GrvtCcxtWS
+
+RPC = GrvtWSEndpointType.TRADE_DATA_RPC_FULL
+
+# GrvtCcxtPro.__del__ schedules session close on a loop that is gone by then
+pytestmark = pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
+
+
+class FakeWebSocket:
+    """In-memory stand-in for the websockets connection; replies via `responder`."""
+
+    def __init__(self, responder):
+        self.open = True
+        self.sent: list[dict] = []
+        self._responder = responder
+        self._inbox: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        self.sent.append(request)
+        for response in self._responder(request):
+            self._inbox.put_nowait(json.dumps(response))
+
+    async def recv(self) -> str:
+        return await self._inbox.get()
+
+    async def close(self) -> None:
+        self.open = False
+
+
+class FakeClientConnection(FakeWebSocket):
+    """websockets >= 14 connection: exposes `state` instead of `open`."""
+
+    class _State:
+        def __init__(self, name):
+            self.name = name
+
+    def __init__(self, responder):
+        super().__init__(responder)
+        del self.open
+        self.state = self._State("OPEN")
+
+    async def close(self) -> None:
+        self.state = self._State("CLOSED")
+
+
+async def make_client(responder) -> tuple[GrvtCcxtWS, FakeWebSocket]:
+    client = GrvtCcxtWS(
+        GrvtEnv.TESTNET,
+        asyncio.get_running_loop(),
+        parameters={"trading_account_id": "123", "endpoint_types": [RPC]},
+    )
+    ws = FakeWebSocket(responder)
+    client.ws[RPC] = ws
+    return client, ws
+
+
+def request(**params) -> dict:
+    return {"jsonrpc": "2.0", "method": "v1/x", "params": params}
+
+
+def run(scenario, responder):
+    async def main():
+        client, ws = await make_client(responder)
+        try:
+            return await scenario(client, ws)
+        finally:
+            await client._session.close()
+
+    return asyncio.run(main())
+
+
+def test_rpc_call_correlates_out_of_order_responses():
+    pending: list[dict] = []
+
+    def responder(request):
+        # hold the first request, answer both in reverse order on the second
+        pending.append(request)
+        if len(pending) < 2:
+            return []
+        return [
+            {"jsonrpc": "2.0", "result": {"echo": r["params"]["n"]}, "id": r["id"]}
+            for r in reversed(pending)
+        ]
+
+    async def scenario(client, ws):
+        results = await asyncio.gather(
+            client.rpc_call(RPC, request(n=1)), client.rpc_call(RPC, request(n=2))
+        )
+        assert client._rpc_futures == {}
+        assert [r["id"] for r in ws.sent] == [1, 2]
+        return results
+
+    assert run(scenario, responder) == [{"echo": 1}, {"echo": 2}]
+
+
+def test_rpc_call_error_response_raises():
+    def responder(request):
+        error = {"code": 1004, "message": "bad"}
+        return [{"jsonrpc": "2.0", "error": error, "id": request["id"]}]
+
+    async def scenario(client, ws):
+        with pytest.raises(GrvtRpcError) as info:
+            await client.rpc_cancel_order(params={"client_order_id": "7"}, timeout=1)
+        assert info.value.code == 1004
+
+    run(scenario, responder)
+
+
+def test_rpc_call_timeout_and_connection_errors():
+    async def scenario(client, ws):
+        with pytest.raises(GrvtRpcTimeout):
+            await client.rpc_call(RPC, request(), timeout=0.05)
+        assert client._rpc_futures == {}
+
+        waiting = asyncio.ensure_future(client.rpc_call(RPC, request()))
+        await asyncio.sleep(0)
+        await client._close_connection(RPC)
+        with pytest.raises(GrvtRpcUnavailable):
+            await waiting
+
+        assert not ws.open
+        with pytest.raises(GrvtRpcUnavailable):
+            await client.rpc_call(RPC, request())
+
+    run(scenario, lambda request: [])
+
+
+def test_rpc_without_timeout_returns_payload():
+    async def scenario(client, ws):
+        payload = await client.rpc_cancel_all_orders(params={"kind": "PERPETUAL"})
+        assert payload["method"] == "v1/cancel_all_orders"
+        assert ws.sent == [payload]
+        assert client._rpc_futures == {}
+
+    run(scenario, lambda request: [])
+
+
+def test_connection_state_of_new_websockets_connections():
+    async def scenario(client, ws):
+        client.ws[RPC] = FakeClientConnection(lambda request: [])
+        assert client.is_connection_open(RPC)
+        payload = await client.rpc_cancel_all_orders(params={"kind": "PERPETUAL"})
+        assert client.ws[RPC].sent == [payload]
+
+        await client.ws[RPC].close()
+        assert not client.is_connection_open(RPC)
+        with pytest.raises(GrvtRpcUnavailable):
+            await client.rpc_call(RPC, request())
+
+    run(scenario, lambda request: [])
+
+
+def test_awaited_rpc_over_new_websockets_connection():
+    def responder(request):
+        return [{"jsonrpc": "2.0", "result": {"ack": True}, "id": request["id"]}]
+
+    async def scenario(client, ws):
+        client.ws[RPC] = FakeClientConnection(responder)
+        result = await client.rpc_cancel_order(params={"client_order_id": "7"}, timeout=1)
+        assert result == {"ack": True}
+        assert client.ws[RPC].sent[0]["params"]["client_order_id"] == "7"
+        assert client._rpc_futures == {}
+
+    run(scenario, lambda request: [])
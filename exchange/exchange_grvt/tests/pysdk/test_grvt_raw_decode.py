@@ -0,0 +1,155 @@
+from enum import Enum
+
+import pytest
+from dacite import Config, from_dict
+
+from pysdk.grvt_raw_decode import GrvtDecodeError
+from pysdk.grvt_raw_decode import from_dict as fast_from_dict
+from pysdk.grvt_raw_types import (
+    ApiCandlestickResponse,
+    ApiFillHistoryResponse,
+    ApiOpenOrdersResponse,
+    ApiOrderbookLevelsResponse,
+    OrderStatus,
+    TriggerType,
+    Venue,
+)
+
+FILL = {
+    "event_time": "1730800479321350000",
+    "sub_account_id": "8289849667772468",
+    "instrument": "BTC_USDT_Perp",
+    "is_buyer": True,
+    "is_taker": True,
+    "size": "0.010",
+    "price": "68125.5",
+    "mark_price": "68120.12",
+    "index_price": "68118.04",
+    "interest_rate": "0.0",
+    "forward_price": "0.0",
+    "realized_pnl": "0.0",
+    "fee": "0.2725",
+    "fee_rate": "4.0",
+    "trade_id": "209358-2",
+    "order_id": "0x1028403",
+    "venue": "ORDERBOOK",
+    "client_order_id": "9223372036854775901",
+    "signer": "0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0",
+    "is_rpi": False,
+}
+
+ORDER = {
+    "order_id": "0x1028403",
+    "sub_account_id": "8289849667772468",
+    "is_market": False,
+    "time_in_force": "GOOD_TILL_TIME",
+    "post_only": True,
+    "reduce_only": False,
+    "legs": [
+        {
+            "instrument": "BTC_USDT_Perp",
+            "size": "0.010",
+            "limit_price": "68000.0",
+            "is_buying_asset": True,
+        }
+    ],
+    "signature": {
+        "signer": "0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0",
+        "r": "0x01",
+        "s": "0x02",
+        "v": 28,
+        "expiration": "1730800479321350000",
+        "nonce": 828700936,
+    },
+    "metadata": {
+        "client_order_id": "9223372036854775901",
+        "create_time": "1730800479321350000",
+        "trigger": {
+            "trigger_type": "TAKE_PROFIT",
+            "tpsl": {
+                "trigger_by": "INDEX",
+                "trigger_price": "70000.0",
+                "close_position": False,
+            },
+        },
+    },
+    "state": {
+        "status": "OPEN",
+        "reject_reason": "UNSPECIFIED",
+        "book_size": ["0.010"],
+        "traded_size": ["0.0"],
+        "update_time": "1730800479321350000",
+        "avg_fill_price": ["0.0"],
+    },
+}
+
+CASES = [
+    (ApiFillHistoryResponse, {"result": [FILL, {**FILL, "broker": None}], "next": ""}),
+    (ApiOpenOrdersResponse, {"result": [ORDER, {**ORDER, "state": None}]}),
+    (
+        ApiOrderbookLevelsResponse,
+        {
+            "result": {
+                "event_time": "1730800481902117000",
+                "instrument": "BTC_USDT_Perp",
+                "bids": [{"price": "68125.4", "size": "1.203", "num_orders": 7}],
+                "asks": [],
+            }
+        },
+    ),
+    (
+        ApiCandlestickResponse,
+        {
+            "result": [
+                {
+                    "open_time": "1730800440000000000",
+                    "close_time": "1730800500000000000",
+                    "open": "68101.2",
+                    "close": "68125.5",
+                    "high": "68140.0",
+                    "low": "68095.1",
+                    "volume_b": "12.402",
+                    "volume_q": "844902.11",
+                    "trades": 318,
+                    "instrument": "BTC_USDT_Perp",
+                }
+            ]
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(("data_class", "payload"), CASES)
+def test_decode_matches_dacite(data_class, payload):
+    expected = from_dict(data_class, payload, Config(cast=[Enum]))
+    assert fast_from_dict(data_class, payload) == expected
+
+
+def test_decode_nested_enums_and_optionals():
+    resp = fast_from_dict(ApiOpenOrdersResponse, {"result": [ORDER]})
+    order = resp.result[0]
+    assert order.state.status is OrderStatus.OPEN
+    assert order.metadata.trigger.trigger_type is TriggerType.TAKE_PROFIT
+    assert order.metadata.broker is None
+    assert order.legs[0].limit_price == "68000.0"
+
+    fills = fast_from_dict(ApiFillHistoryResponse, {"result": [FILL], "next": ""})
+    assert fills.result[0].venue is Venue.ORDERBOOK
+    assert fills.result[0].broker is None
+
+
+def test_decode_ignores_unknown_keys():
+    resp = fast_from_dict(
+        ApiFillHistoryResponse, {"result": [{**FILL, "extra": 1}], "next": "", "x": 2}
+    )
+    assert resp.result[0].trade_id == "209358-2"
+
+
+def test_decode_errors():
+    missing = {k: v for k, v in FILL.items() if k != "price"}
+    with pytest.raises(GrvtDecodeError):
+        fast_from_dict(ApiFillHistoryResponse, {"result": [missing], "next": ""})
+    with pytest.raises(GrvtDecodeError):
+        fast_from_dict(
+            ApiFillHistoryResponse, {"result": [{**FILL, "venue": "NOPE"}], "next": ""}
+        )
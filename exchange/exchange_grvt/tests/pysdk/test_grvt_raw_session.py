@@ -0,0 +1,37 @@
+import asyncio
+
+import aiohttp
+import requests
+
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_sync import GrvtRawSync
+
+
+def _config() -> GrvtApiConfig:
+    return GrvtApiConfig(
+        env=GrvtEnv.TESTNET, trading_account_id=None, private_key=None, api_key=None, logger=None
+    )
+
+
+def test_sync_client_uses_injected_session() -> None:
+    session = requests.Session()
+    api = GrvtRawSync(_config(), session=session)
+    assert api._session is session
+    assert session.headers["Content-Type"] == "application/json"
+    # each client gets its own session by default, as cookies are per account
+    assert GrvtRawSync(_config())._session is not GrvtRawSync(_config())._session
+
+
+def test_async_client_uses_injected_session() -> None:
+    async def run() -> None:
+        session = aiohttp.ClientSession()
+        try:
+            api = GrvtRawAsync(_config(), session=session)
+            assert api._session is session
+            assert session.headers["Content-Type"] == "application/json"
+        finally:
+            await session.close()
+
+    asyncio.run(run())
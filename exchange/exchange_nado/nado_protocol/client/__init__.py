@@ -1,4 +1,6 @@
 import logging
+import requests
+from typing import Any, Optional
 from nado_protocol.client.apis.market import MarketAPI
 from nado_protocol.client.apis.perp import PerpAPI
 from nado_protocol.client.apis.spot import SpotAPI
@@ -93,6 +95,8 @@ def create_nado_client(
     mode: NadoClientMode,
     signer: Optional[Signer] = None,
     context_opts: Optional[NadoClientContextOpts] = None,
+    session: Optional[requests.Session] = None,
+    metadata_cache: Any = None,
 ) -> NadoClient:
     """
     Create a new NadoClient based on the given mode and signer.
@@ -112,6 +116,12 @@ def create_nado_client(
         context_opts (NadoClientContextOpts, optional): Options for creating the client context.
             If not provided, default options for the given mode will be used.
 
+        session (requests.Session, optional): HTTP session shared by the engine, indexer and trigger clients,
+            e.g. one with a tuned connection pool and timeouts. If not provided, a new one is created.
+
+        metadata_cache (optional): On-disk metadata cache with a `get(key, loader)` method, used to avoid
+            querying the verifying contracts on every start.
+
     Returns:
         NadoClient: The created NadoClient instance.
     """
@@ -172,6 +182,8 @@ def create_nado_client(
             contracts_context=contracts_context,
         ),
         signer,
+        session,
+        metadata_cache,
     )
     return NadoClient(context)
 
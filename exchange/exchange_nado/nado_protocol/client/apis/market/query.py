@@ -4,6 +4,7 @@ from nado_protocol.engine_client.types.query import (
     AllProductsData,
     MarketLiquidityData,
     MarketPriceData,
+    MarketPricesData,
     MaxLpMintableData,
     MaxOrderSizeData,
     ProductSymbolsData,
@@ -91,6 +92,18 @@ class MarketQueryAPI(NadoBaseAPI):
         """
         return self.context.engine_client.get_market_price(product_id)
 
+    def get_latest_market_prices(self, product_ids: list[int]) -> MarketPricesData:
+        """
+        Retrieves the latest off-chain orderbook prices from the engine for multiple products in one request.
+
+        Args:
+            product_ids (list[int]): The identifiers for the products to retrieve the latest market prices.
+
+        Returns:
+            MarketPricesData: A data class object containing the latest market prices for the given products.
+        """
+        return self.context.engine_client.get_market_prices(product_ids)
+
     def get_subaccount_open_orders(
         self, product_id: int, sender: str
     ) -> SubaccountOpenOrdersData:
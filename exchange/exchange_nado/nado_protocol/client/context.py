@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
+import requests
 from eth_account import Account
 
 from pydantic import AnyUrl, BaseModel
@@ -8,6 +9,7 @@ from nado_protocol.contracts import NadoContracts, NadoContractsContext
 from eth_account.signers.local import LocalAccount
 from nado_protocol.engine_client import EngineClient
 from nado_protocol.engine_client.types import EngineClientOpts
+from nado_protocol.engine_client.types.query import ContractsData
 from nado_protocol.utils.backend import Signer
 from nado_protocol.indexer_client import IndexerClient
 from nado_protocol.trigger_client import TriggerClient
@@ -37,7 +39,10 @@ class NadoClientContextOpts(BaseModel):
 
 
 def create_nado_client_context(
-    opts: NadoClientContextOpts, signer: Optional[Signer] = None
+    opts: NadoClientContextOpts,
+    signer: Optional[Signer] = None,
+    session: Optional[requests.Session] = None,
+    metadata_cache: Any = None,
 ) -> NadoClientContext:
     """
     Initializes a NadoClientContext instance with the provided signer and options.
@@ -47,6 +52,12 @@ def create_nado_client_context(
 
         signer (Signer, optional): An instance of LocalAccount or a private key string for signing transactions.
 
+        session (requests.Session, optional): HTTP session shared by the engine, indexer and trigger clients.
+            If not provided, a new one is created and shared between them.
+
+        metadata_cache (optional): On-disk metadata cache with a `get(key, loader)` method. When provided, the
+            verifying contracts are read from it instead of being queried on every start, and refreshed by the cache.
+
     Returns:
         NadoClientContext: The initialized Nado client context.
 
@@ -60,18 +71,20 @@ def create_nado_client_context(
     assert opts.indexer_endpoint_url is not None, "Missing indexer endpoint URL"
 
     signer = Account.from_key(signer) if isinstance(signer, str) else signer
+    session = session or requests.Session()
     engine_client = EngineClient(
-        EngineClientOpts(url=opts.engine_endpoint_url, signer=signer)
+        EngineClientOpts(url=opts.engine_endpoint_url, signer=signer), session=session
     )
     trigger_client = None
     try:
-        contracts = engine_client.get_contracts()
+        contracts = _load_contracts(engine_client, metadata_cache)
         engine_client.endpoint_addr = contracts.endpoint_addr
         engine_client.chain_id = int(contracts.chain_id)
 
         if opts.trigger_endpoint_url is not None:
             trigger_client = TriggerClient(
-                TriggerClientOpts(url=opts.trigger_endpoint_url, signer=signer)
+                TriggerClientOpts(url=opts.trigger_endpoint_url, signer=signer),
+                session=session,
             )
             trigger_client.endpoint_addr = contracts.endpoint_addr
             trigger_client.chain_id = int(contracts.chain_id)
@@ -83,6 +96,19 @@ def create_nado_client_context(
         signer=signer,
         engine_client=engine_client,
         trigger_client=trigger_client,
-        indexer_client=IndexerClient(IndexerClientOpts(url=opts.indexer_endpoint_url)),
+        indexer_client=IndexerClient(
+            IndexerClientOpts(url=opts.indexer_endpoint_url), session=session
+        ),
         contracts=NadoContracts(opts.rpc_node_url, opts.contracts_context),
     )
+
+
+def _load_contracts(engine_client: EngineClient, metadata_cache: Any) -> ContractsData:
+    """Query the verifying contracts, through the metadata cache when one is provided."""
+    if metadata_cache is None:
+        return engine_client.get_contracts()
+    data = metadata_cache.get(
+        f"nado/{engine_client.url}/contracts",
+        lambda: engine_client.get_contracts().dict(),
+    )
+    return ContractsData.parse_obj(data)
@@ -17,6 +17,7 @@ from nado_protocol.engine_client.types.query import (
     LinkedSignerData,
     MarketLiquidityData,
     MarketPriceData,
+    MarketPricesData,
     MaxLpMintableData,
     MaxOrderSizeData,
     MaxWithdrawableData,
@@ -32,6 +33,7 @@ from nado_protocol.engine_client.types.query import (
     QueryLinkedSignerParams,
     QueryMarketLiquidityParams,
     QueryMarketPriceParams,
+    QueryMarketPricesParams,
     QueryMaxLpMintableParams,
     QueryMaxOrderSizeParams,
     QueryMaxWithdrawableParams,
@@ -66,17 +68,22 @@ class EngineQueryClient:
     Client class for querying the off-chain engine.
     """
 
-    def __init__(self, opts: EngineClientOpts):
+    def __init__(
+        self, opts: EngineClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initialize EngineQueryClient with provided options.
 
         Args:
             opts (EngineClientOpts): Options for the client.
+
+            session (requests.Session, optional): HTTP session to send requests with, e.g. one shared
+                with other clients so they reuse the same connection pool. If not provided, a new one is created.
         """
         self._opts: EngineClientOpts = EngineClientOpts.parse_obj(opts)
         self.url: str = self._opts.url
         self.url_v2: str = self.url.replace("/v1", "") + "/v2"
-        self.session = requests.Session()  # type: ignore
+        self.session = session or requests.Session()  # type: ignore
 
     def query(self, req: QueryRequest) -> QueryResponse:
         """
@@ -334,6 +341,22 @@ class EngineQueryClient:
             MarketPriceData,
         )
 
+    def get_market_prices(self, product_ids: list[int]) -> MarketPricesData:
+        """
+        Retrieves the highest bid and lowest ask price levels
+        from the orderbook for multiple products in a single request.
+
+        Args:
+            product_ids (list[int]): The ids of the products.
+
+        Returns:
+            MarketPricesData: Market price data for the specified products.
+        """
+        return ensure_data_type(
+            self.query(QueryMarketPricesParams(product_ids=product_ids)).data,
+            MarketPricesData,
+        )
+
     def get_max_order_size(self, params: QueryMaxOrderSizeParams) -> MaxOrderSizeData:
         """
         Retrieves the maximum order size of a given product for a specified subaccount.
@@ -49,6 +49,7 @@ __all__ = [
     "QueryMarketLiquidityParams",
     "QueryAllProductsParams",
     "QueryMarketPriceParams",
+    "QueryMarketPricesParams",
     "QueryMaxOrderSizeParams",
     "QueryMaxWithdrawableParams",
     "QueryMaxLpMintableParams",
@@ -66,6 +67,7 @@ __all__ = [
     "MarketLiquidityData",
     "AllProductsData",
     "MarketPriceData",
+    "MarketPricesData",
     "MaxOrderSizeData",
     "MaxWithdrawableData",
     "MaxLpMintableData",
@@ -38,6 +38,7 @@ class EngineQueryType(StrEnum):
     LINKED_SIGNER = "linked_signer"
     MARKET_LIQUIDITY = "market_liquidity"
     MARKET_PRICE = "market_price"
+    MARKET_PRICES = "market_prices"
     MAX_ORDER_SIZE = "max_order_size"
     MAX_WITHDRAWABLE = "max_withdrawable"
     MAX_NLP_MINTABLE = "max_nlp_mintable"
@@ -162,6 +163,15 @@ class QueryMarketPriceParams(NadoBaseModel):
     product_id: int
 
 
+class QueryMarketPricesParams(NadoBaseModel):
+    """
+    Parameters for querying the market prices of multiple products in a single request.
+    """
+
+    type = EngineQueryType.MARKET_PRICES.value
+    product_ids: list[int]
+
+
 class SpotLeverageSerializerMixin(NadoBaseModel):
     spot_leverage: Optional[bool]
 
@@ -254,6 +264,7 @@ QueryRequest = Union[
     QuerySymbolsParams,
     QueryAllProductsParams,
     QueryMarketPriceParams,
+    QueryMarketPricesParams,
     QueryMaxOrderSizeParams,
     QueryMaxWithdrawableParams,
     QueryMaxLpMintableParams,
@@ -419,6 +430,14 @@ class MarketPriceData(NadoBaseModel):
     ask_x18: str
 
 
+class MarketPricesData(NadoBaseModel):
+    """
+    Data model for the bid and ask prices of multiple products.
+    """
+
+    market_prices: list[MarketPriceData]
+
+
 class MaxOrderSizeData(NadoBaseModel):
     """
     Data model for the maximum order size.
@@ -495,6 +514,7 @@ QueryResponseData = Union[
     SymbolsData,
     AllProductsData,
     MarketPriceData,
+    MarketPricesData,
     MaxOrderSizeData,
     MaxWithdrawableData,
     MaxLpMintableData,
@@ -1,3 +1,12 @@
+from typing import Optional
+
+import requests
+
+from nado_protocol.indexer_client.paginator import (
+    IndexerPage,
+    IndexerPaginator,
+    fan_out,
+)
 from nado_protocol.indexer_client.query import IndexerQueryClient
 from nado_protocol.indexer_client.types import IndexerClientOpts
 
@@ -15,14 +24,25 @@ class IndexerClient(IndexerQueryClient):
         __init__: Initializes the `IndexerClient` with the provided options.
     """
 
-    def __init__(self, opts: IndexerClientOpts):
+    def __init__(
+        self, opts: IndexerClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initializes the IndexerClient with the provided options.
 
         Args:
             opts (IndexerClientOpts): Client configuration options for connecting and interacting with the indexer service.
+
+            session (requests.Session, optional): HTTP session to send requests with. If not provided, a new one is created.
         """
-        super().__init__(opts)
+        super().__init__(opts, session=session)
 
 
-__all__ = ["IndexerClient", "IndexerClientOpts", "IndexerQueryClient"]
+__all__ = [
+    "IndexerClient",
+    "IndexerClientOpts",
+    "IndexerQueryClient",
+    "IndexerPage",
+    "IndexerPaginator",
+    "fan_out",
+]
@@ -0,0 +1,292 @@
+"""
+Streaming paginators for the indexer history endpoints.
+
+The indexer returns history newest first, one page at a time, and callers move
+backwards with a cursor (``submission_idx`` for orders / matches / events,
+``max_idx`` for interest and funding payments). ``IndexerPaginator`` wraps that
+loop in a generator and fetches the next page on a background thread while the
+caller processes the current one.
+
+- Bounded memory: at most ``prefetch`` pages are buffered ahead of the consumer.
+- Resumable: ``paginator.cursor`` is the cursor that continues right after the
+  last page the consumer finished; pass it back as ``start_cursor`` to resume.
+- Records sharing a ``submission_idx`` (one transaction) never straddle two
+  pages, see ``submission_idx_page``.
+- Fan-out: ``fan_out`` drains many paginators (e.g. one per subaccount or
+  product) on a thread pool and yields their pages as they arrive.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# fetch(cursor) -> (data, items, next_cursor); next_cursor None means last page
+PageFetcher = Callable[[Optional[int]], Tuple[Any, list, Optional[int]]]
+
+_DONE = object()
+
+
+class IndexerPage(Generic[T]):
+    """
+    A single page of indexer results.
+
+    Attributes:
+        data: Raw response model (e.g. ``IndexerMatchesData`` including ``txs``).
+        items: Records of this page, newest first.
+        cursor: Cursor used to fetch this page (None for the newest page).
+        next_cursor: Cursor of the following (older) page, None if this is the last page.
+    """
+
+    __slots__ = ("data", "items", "cursor", "next_cursor")
+
+    def __init__(
+        self,
+        data: Any,
+        items: list[T],
+        cursor: Optional[int],
+        next_cursor: Optional[int],
+    ):
+        self.data = data
+        self.items = items
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexerPage(items={len(self.items)}, cursor={self.cursor}, "
+            f"next_cursor={self.next_cursor})"
+        )
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class IndexerPaginator(Generic[T]):
+    """
+    Generator based paginator over a cursor paginated indexer endpoint.
+
+    Iterating yields records; ``pages()`` yields whole ``IndexerPage`` objects.
+    A paginator can be iterated once.
+
+    Args:
+        fetch: Function fetching the page at a cursor, see ``PageFetcher``.
+        start_cursor: Cursor to start from (None starts at the newest record).
+            Once the paginator is exhausted ``cursor`` is None and ``exhausted`` True.
+        prefetch: Number of pages fetched ahead of the consumer on a background
+            thread. 0 fetches synchronously on the consumer's thread.
+        max_pages: Stop after this many pages.
+    """
+
+    def __init__(
+        self,
+        fetch: PageFetcher,
+        start_cursor: Optional[int] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ):
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        self._fetch = fetch
+        self.prefetch = prefetch
+        self.max_pages = max_pages
+        self.cursor: Optional[int] = start_cursor
+        self.exhausted = False
+        self._started = False
+
+    def _fetch_pages(self, stop: threading.Event) -> Iterator[IndexerPage[T]]:
+        cursor = self.cursor
+        fetched = 0
+        while not stop.is_set():
+            if self.max_pages is not None and fetched >= self.max_pages:
+                return
+            data, items, next_cursor = self._fetch(cursor)
+            fetched += 1
+            yield IndexerPage(data, items, cursor, next_cursor)
+            if next_cursor is None:
+                return
+            cursor = next_cursor
+
+    def _produce(self, buffer: "queue.Queue", stop: threading.Event) -> None:
+        try:
+            for page in self._fetch_pages(stop):
+                if not _put(buffer, page, stop):
+                    return
+            _put(buffer, _DONE, stop)
+        except BaseException as e:  # surfaced on the consumer's thread
+            _put(buffer, _Failure(e), stop)
+
+    def pages(self) -> Iterator[IndexerPage[T]]:
+        """
+        Yield pages from newest to oldest.
+
+        ``cursor`` is advanced once the consumer asks for the page after the
+        current one, so breaking out of the loop keeps the current page replayable.
+        """
+        if self._started:
+            raise RuntimeError("IndexerPaginator can only be iterated once")
+        self._started = True
+
+        stop = threading.Event()
+        if self.prefetch == 0:
+            source: Iterator[Any] = self._fetch_pages(stop)
+        else:
+            buffer: "queue.Queue" = queue.Queue(maxsize=self.prefetch)
+            threading.Thread(
+                target=self._produce,
+                args=(buffer, stop),
+                name="nado-indexer-prefetch",
+                daemon=True,
+            ).start()
+            source = iter(buffer.get, _DONE)
+
+        try:
+            for page in source:
+                if isinstance(page, _Failure):
+                    raise page.error
+                yield page
+                self.cursor = page.next_cursor
+            self.exhausted = self.max_pages is None or self.cursor is None
+        finally:
+            # The producer exits after its in-flight request; no need to wait for it.
+            stop.set()
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page.items
+
+
+def _put(buffer: "queue.Queue", item: Any, stop: threading.Event) -> bool:
+    """Blocking put that gives up once the consumer has gone away."""
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def fan_out(
+    paginators: Sequence[IndexerPaginator[T]],
+    max_workers: int = 4,
+    buffer_pages: int = 8,
+) -> Iterator[Tuple[int, IndexerPage[T]]]:
+    """
+    Drain several paginators concurrently, e.g. one per subaccount or product.
+
+    Each worker drains one paginator at a time synchronously, so at most
+    ``max_workers`` requests are in flight and ``buffer_pages`` pages are held.
+    Pages of one paginator arrive in order; pages of different paginators interleave.
+    A paginator's ``cursor`` advances as soon as a page is buffered, so to checkpoint
+    a backfill save ``page.next_cursor`` per index after processing each page.
+
+    Args:
+        paginators: Paginators to drain. Their ``prefetch`` setting is ignored.
+        max_workers: Number of paginators drained in parallel.
+        buffer_pages: Max pages buffered ahead of the consumer.
+
+    Yields:
+        (index of the paginator in ``paginators``, page).
+    """
+    buffer: "queue.Queue" = queue.Queue(maxsize=buffer_pages)
+    stop = threading.Event()
+
+    def drain(index: int) -> None:
+        if stop.is_set():
+            return
+        paginator = paginators[index]
+        paginator.prefetch = 0
+        try:
+            for page in paginator.pages():
+                if not _put(buffer, (index, page), stop):
+                    return
+        except BaseException as e:
+            _put(buffer, _Failure(e), stop)
+
+    def run() -> None:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="nado-indexer-fanout"
+        ) as pool:
+            list(pool.map(drain, range(len(paginators))))
+        _put(buffer, _DONE, stop)
+
+    coordinator = threading.Thread(target=run, name="nado-indexer-fanout", daemon=True)
+    coordinator.start()
+    try:
+        for entry in iter(buffer.get, _DONE):
+            if isinstance(entry, _Failure):
+                raise entry.error
+            yield entry
+    finally:
+        stop.set()
+
+
+def submission_idx_page(
+    items: list, page_size: Optional[int]
+) -> Tuple[list, Optional[int]]:
+    """
+    Split a page sorted newest first into the records to yield and the next cursor.
+
+    The ``submission_idx`` cursor is inclusive and one transaction can produce several
+    records with the same ``submission_idx`` (e.g. the matches of one order), so a page
+    that may continue leaves its oldest idx group to the next page, which starts at that idx.
+
+    Returns:
+        (records, next cursor). The cursor is None on the last page (empty, or shorter than
+        ``page_size``). No records with a cursor means a single idx group filled the page.
+    """
+    if not items or (page_size is not None and len(items) < page_size):
+        return items, None
+    boundary = int(items[-1].submission_idx)
+    head = [item for item in items if int(item.submission_idx) > boundary]
+    if head or page_size is not None:
+        return head, boundary
+    # Unknown page size and a single group: take it as complete and move past it
+    return items, boundary - 1
+
+
+def fetch_submission_idx_page(
+    get: Callable[[Optional[int]], Any],
+    records: Callable[[Any], list],
+    page_size: Optional[int],
+) -> Tuple[Any, list, Optional[int]]:
+    """
+    Fetch one page of an endpoint following the inclusive ``submission_idx`` cursor.
+
+    When a single idx group fills the page, the page is fetched again with a doubled limit.
+    ``data`` is the raw response and may still hold the group left to the next page.
+
+    Args:
+        get: Fetches the page at the current cursor with the given limit.
+        records: Extracts the records (newest first) from a response.
+        page_size: Requested page size, None for the indexer default.
+
+    Returns:
+        (data, records, next cursor), see ``PageFetcher``.
+    """
+    limit = page_size
+    while True:
+        data = get(limit)
+        items, next_cursor = submission_idx_page(records(data), limit)
+        if items or next_cursor is None:
+            return data, items, next_cursor
+        limit *= 2
@@ -1,13 +1,25 @@
 from typing import Optional, Union
 import requests
 from functools import singledispatchmethod
+from nado_protocol.indexer_client.paginator import (
+    IndexerPaginator,
+    fetch_submission_idx_page,
+)
 from nado_protocol.indexer_client.types import IndexerClientOpts
-from nado_protocol.indexer_client.types.models import MarketType
+from nado_protocol.indexer_client.types.models import (
+    IndexerEvent,
+    IndexerHistoricalOrder,
+    IndexerMatch,
+    IndexerPayment,
+    MarketType,
+)
 from nado_protocol.indexer_client.types.query import (
     IndexerCandlesticksParams,
     IndexerCandlesticksData,
     IndexerEventsParams,
     IndexerEventsData,
+    IndexerEventsRawLimit,
+    IndexerEventsTxsLimit,
     IndexerFundingRateParams,
     IndexerFundingRateData,
     IndexerFundingRatesParams,
@@ -61,17 +73,21 @@ class IndexerQueryClient:
         url (str): URL of the indexer service.
     """
 
-    def __init__(self, opts: IndexerClientOpts):
+    def __init__(
+        self, opts: IndexerClientOpts, session: Optional[requests.Session] = None
+    ):
         """
         Initializes the IndexerQueryClient with the provided options.
 
         Args:
             opts (IndexerClientOpts): Client configuration options for connecting and interacting with the indexer service.
+
+            session (requests.Session, optional): HTTP session to send requests with. If not provided, a new one is created.
         """
         self._opts = IndexerClientOpts.parse_obj(opts)
         self.url = self._opts.url
         self.url_v2: str = self.url.replace("/v1", "") + "/v2"
-        self.session = requests.Session()
+        self.session = session or requests.Session()
 
     @singledispatchmethod
     def query(self, params: Union[IndexerParams, IndexerRequest]) -> IndexerResponse:
@@ -175,6 +191,142 @@ class IndexerQueryClient:
             self.query(IndexerEventsParams.parse_obj(params)).data, IndexerEventsData
         )
 
+    def paginate_subaccount_historical_orders(
+        self,
+        params: IndexerSubaccountHistoricalOrdersParams,
+        *,
+        start_cursor: Optional[int] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ) -> IndexerPaginator[IndexerHistoricalOrder]:
+        """
+        Streams historical orders page by page, newest first, following the
+        `submission_idx` cursor.
+
+        Args:
+            params (IndexerSubaccountHistoricalOrdersParams): Query filters; `limit` is the page size.
+            start_cursor (Optional[int]): Cursor to resume from. Defaults to `params.idx`.
+            prefetch (int): Pages fetched ahead of the consumer on a background thread.
+            max_pages (Optional[int]): Stop after this many pages.
+
+        Returns:
+            IndexerPaginator[IndexerHistoricalOrder]: Iterate for orders or call `pages()`.
+        """
+        params = IndexerSubaccountHistoricalOrdersParams.parse_obj(params)
+
+        def fetch(cursor: Optional[int]):
+            return fetch_submission_idx_page(
+                lambda limit: self.get_subaccount_historical_orders(
+                    params.copy(update={"idx": cursor, "limit": limit})
+                ),
+                lambda data: data.orders,
+                params.limit,
+            )
+
+        return IndexerPaginator(
+            fetch,
+            start_cursor if start_cursor is not None else params.idx,
+            prefetch=prefetch,
+            max_pages=max_pages,
+        )
+
+    def paginate_matches(
+        self,
+        params: IndexerMatchesParams,
+        *,
+        start_cursor: Optional[int] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ) -> IndexerPaginator[IndexerMatch]:
+        """
+        Streams matches page by page, newest first, following the `submission_idx` cursor.
+
+        Args:
+            params (IndexerMatchesParams): Query filters; `limit` is the page size.
+            start_cursor (Optional[int]): Cursor to resume from. Defaults to `params.idx`.
+            prefetch (int): Pages fetched ahead of the consumer on a background thread.
+            max_pages (Optional[int]): Stop after this many pages.
+
+        Returns:
+            IndexerPaginator[IndexerMatch]: Iterate for matches, or call `pages()` to
+            also get each page's `txs`.
+        """
+        params = IndexerMatchesParams.parse_obj(params)
+
+        def fetch(cursor: Optional[int]):
+            return fetch_submission_idx_page(
+                lambda limit: self.get_matches(
+                    params.copy(update={"idx": cursor, "limit": limit})
+                ),
+                lambda data: data.matches,
+                params.limit,
+            )
+
+        return IndexerPaginator(
+            fetch,
+            start_cursor if start_cursor is not None else params.idx,
+            prefetch=prefetch,
+            max_pages=max_pages,
+        )
+
+    def paginate_events(
+        self,
+        params: IndexerEventsParams,
+        *,
+        start_cursor: Optional[int] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ) -> IndexerPaginator[IndexerEvent]:
+        """
+        Streams events page by page, newest first, following the `submission_idx` cursor.
+
+        Args:
+            params (IndexerEventsParams): Query filters; `limit` (raw or txs) is the page size.
+            start_cursor (Optional[int]): Cursor to resume from. Defaults to `params.idx`.
+            prefetch (int): Pages fetched ahead of the consumer on a background thread.
+            max_pages (Optional[int]): Stop after this many pages.
+
+        Returns:
+            IndexerPaginator[IndexerEvent]: Iterate for events, or call `pages()` to
+            also get each page's `txs`.
+        """
+        params = IndexerEventsParams.parse_obj(params)
+        limit = params.limit
+
+        def fetch(cursor: Optional[int]):
+            if isinstance(limit, IndexerEventsTxsLimit):
+                # Limited by transactions: pages hold whole transactions, so the next
+                # page starts below the oldest one; a short page has fewer txs than requested
+                data = self.get_events(params.copy(update={"idx": cursor}))
+                if not data.events or len(data.txs) < limit.txs:
+                    return data, data.events, None
+                return (
+                    data,
+                    data.events,
+                    min(int(event.submission_idx) for event in data.events) - 1,
+                )
+            return fetch_submission_idx_page(
+                lambda raw: self.get_events(
+                    params.copy(
+                        update={
+                            "idx": cursor,
+                            "limit": IndexerEventsRawLimit(raw=raw)
+                            if raw is not None
+                            else None,
+                        }
+                    )
+                ),
+                lambda data: data.events,
+                limit.raw if limit is not None else None,
+            )
+
+        return IndexerPaginator(
+            fetch,
+            start_cursor if start_cursor is not None else params.idx,
+            prefetch=prefetch,
+            max_pages=max_pages,
+        )
+
     def get_product_snapshots(
         self, params: IndexerProductSnapshotsParams
     ) -> IndexerProductSnapshotsData:
@@ -344,6 +496,48 @@ class IndexerQueryClient:
             IndexerInterestAndFundingData,
         )
 
+    def paginate_interest_and_funding_payments(
+        self,
+        params: IndexerInterestAndFundingParams,
+        *,
+        start_cursor: Optional[int] = None,
+        prefetch: int = 1,
+        max_pages: Optional[int] = None,
+    ) -> IndexerPaginator[IndexerPayment]:
+        """
+        Streams interest and funding payments page by page, newest first,
+        following the `max_idx` / `next_idx` cursor.
+
+        Args:
+            params (IndexerInterestAndFundingParams): Query filters; `limit` is the page size.
+            start_cursor (Optional[int]): Cursor to resume from. Defaults to `params.max_idx`.
+            prefetch (int): Pages fetched ahead of the consumer on a background thread.
+            max_pages (Optional[int]): Stop after this many pages.
+
+        Returns:
+            IndexerPaginator[IndexerPayment]: Iterate for payments (interest then funding
+            within each page), or call `pages()` to keep them apart.
+        """
+        params = IndexerInterestAndFundingParams.parse_obj(params)
+
+        def fetch(cursor: Optional[int]):
+            data = self.get_interest_and_funding_payments(
+                params.copy(update={"max_idx": cursor})
+            )
+            items = data.interest_payments + data.funding_payments
+            next_cursor = int(data.next_idx) if items and data.next_idx else None
+            if next_cursor is not None and cursor is not None and next_cursor >= cursor:
+                next_cursor = None
+            return data, items, next_cursor
+
+        start = start_cursor if start_cursor is not None else params.max_idx
+        return IndexerPaginator(
+            fetch,
+            int(start) if start is not None else None,
+            prefetch=prefetch,
+            max_pages=max_pages,
+        )
+
     def get_tickers(
         self, market_type: Optional[MarketType] = None
     ) -> IndexerTickersData:
@@ -1,12 +1,19 @@
+from typing import Optional
+
+import requests
+
 from nado_protocol.trigger_client.types import TriggerClientOpts
 from nado_protocol.trigger_client.execute import TriggerExecuteClient
 from nado_protocol.trigger_client.query import TriggerQueryClient
 
 
 class TriggerClient(TriggerQueryClient, TriggerExecuteClient):  # type: ignore
-    def __init__(self, opts: TriggerClientOpts):
-        TriggerQueryClient.__init__(self, opts)
-        TriggerExecuteClient.__init__(self, opts)
+    def __init__(
+        self, opts: TriggerClientOpts, session: Optional[requests.Session] = None
+    ):
+        session = session or requests.Session()
+        TriggerQueryClient.__init__(self, opts, session=session)
+        TriggerExecuteClient.__init__(self, opts, session=session)
 
 
 __all__ = [
@@ -39,11 +39,13 @@ from nado_protocol.trigger_client.types.models import (
 
 
 class TriggerExecuteClient(NadoBaseExecute):
-    def __init__(self, opts: TriggerClientOpts):
+    def __init__(
+        self, opts: TriggerClientOpts, session: Optional[requests.Session] = None
+    ):
         super().__init__(opts)
         self._opts: TriggerClientOpts = TriggerClientOpts.parse_obj(opts)
         self.url: str = self._opts.url
-        self.session = requests.Session()
+        self.session = session or requests.Session()
 
     def tx_nonce(self, _: str) -> int:
         raise NotImplementedError
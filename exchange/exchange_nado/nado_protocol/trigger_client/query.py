@@ -1,3 +1,5 @@
+from typing import Optional
+
 import requests
 from nado_protocol.contracts.types import NadoTxType
 from nado_protocol.trigger_client.types import TriggerClientOpts
@@ -22,10 +24,12 @@ class TriggerQueryClient(NadoBaseExecute):
     Client class for querying the trigger service.
     """
 
-    def __init__(self, opts: TriggerClientOpts):
+    def __init__(
+        self, opts: TriggerClientOpts, session: Optional[requests.Session] = None
+    ):
         self._opts: TriggerClientOpts = TriggerClientOpts.parse_obj(opts)
         self.url: str = self._opts.url
-        self.session = requests.Session()  # type: ignore
+        self.session = session or requests.Session()  # type: ignore
 
     def tx_nonce(self, _: str) -> int:
         raise NotImplementedError
@@ -25,7 +25,10 @@ from nado_protocol.engine_client.types.models import (
 )
 from nado_protocol.engine_client.types.query import SubaccountInfoData
 from nado_protocol.indexer_client.types.models import IndexerEvent
-from nado_protocol.indexer_client.types.query import IndexerAccountSnapshotsParams
+from nado_protocol.indexer_client.types.query import (
+    IndexerAccountSnapshotsData,
+    IndexerAccountSnapshotsParams,
+)
 from nado_protocol.utils.bytes32 import subaccount_to_hex
 
 if TYPE_CHECKING:
@@ -271,6 +274,42 @@ class MarginManager:
         events = snapshots_for_subaccount.get(latest_key, [])
         return list(events) if events else []
 
+    @staticmethod
+    def batch_from_client(
+        client: "NadoClient",
+        subaccounts: list[str],
+        *,
+        snapshot_timestamp: Optional[int] = None,
+        snapshot_isolated: Optional[bool] = None,
+        snapshot_active_only: bool = True,
+    ) -> dict[str, "SubaccountMarginMetrics"]:
+        """
+        Evaluate account level metrics for many subaccounts from one indexer request.
+
+        Args:
+            client: Configured Nado client with indexer connectivity.
+            subaccounts: Subaccount hexes (bytes32) to evaluate.
+            snapshot_timestamp: Epoch seconds to request. Defaults to ``int(time.time())``.
+            snapshot_isolated: Limit snapshots to isolated (True), cross (False), or all
+                (None, default) balances. Isolated balances only add to portfolio value.
+            snapshot_active_only: When True (default), only live balances are returned.
+
+        Returns:
+            Dict mapping subaccount hex -> SubaccountMarginMetrics.
+            See ``calculate_batch_margin_metrics``.
+        """
+        snapshot_response = (
+            client.context.indexer_client.get_multi_subaccount_snapshots(
+                IndexerAccountSnapshotsParams(
+                    subaccounts=subaccounts,
+                    timestamps=[snapshot_timestamp or int(time())],
+                    isolated=snapshot_isolated,
+                    active=snapshot_active_only,
+                )
+            )
+        )
+        return calculate_batch_margin_metrics(snapshot_response)
+
     def calculate_account_summary(self) -> AccountSummary:
         """
         Calculate complete account margin summary.
@@ -709,6 +748,556 @@ class MarginManager:
         return self._create_balance_with_product(spot_balance, spot_product, "spot")
 
 
+# Incremental and batch evaluation
+#
+# Both modes keep balances as parsed x18 integers and only convert to Decimal when
+# a metric is read. Health contributions follow the engine formula:
+#   spot: amount * price * weight
+#   perp: amount * price * weight + v_quote_balance
+# with long weights for amount >= 0 and short weights otherwise (weight 1 for
+# unweighted health). Products are computed at x36 and divided once, so the
+# arithmetic is exact up to the final truncation.
+
+_X18 = 10**18
+_X36 = 10**36
+_HEALTH_TYPES = 3  # initial, maintenance, unweighted
+
+
+def _to_decimal_x18(value: int) -> Decimal:
+    return Decimal(value) / TEN_TO_18
+
+
+class _BalanceState:
+    """Parsed balance and risk parameters of one product, as x18 integers."""
+
+    __slots__ = (
+        "product_id",
+        "is_perp",
+        "amount",
+        "v_quote",
+        "price",
+        "long_initial",
+        "long_maint",
+        "short_initial",
+        "short_maint",
+    )
+
+    def __init__(
+        self,
+        product_id: int,
+        is_perp: bool,
+        amount: int,
+        v_quote: int,
+        product: Union[SpotProduct, PerpProduct],
+    ):
+        self.product_id = product_id
+        self.is_perp = is_perp
+        self.amount = amount
+        self.v_quote = v_quote
+        self.price = int(product.oracle_price_x18)
+        risk = product.risk
+        self.long_initial = int(risk.long_weight_initial_x18)
+        self.long_maint = int(risk.long_weight_maintenance_x18)
+        self.short_initial = int(risk.short_weight_initial_x18)
+        self.short_maint = int(risk.short_weight_maintenance_x18)
+
+    @classmethod
+    def from_balance(
+        cls,
+        balance: Union[SpotProductBalance, PerpProductBalance],
+        product: Union[SpotProduct, PerpProduct],
+    ) -> "_BalanceState":
+        is_perp = isinstance(balance, PerpProductBalance)
+        v_quote = int(balance.balance.v_quote_balance) if is_perp else 0  # type: ignore[union-attr]
+        return cls(
+            balance.product_id, is_perp, int(balance.balance.amount), v_quote, product
+        )
+
+    def health(self) -> tuple[int, int, int]:
+        """Contribution to (initial, maintenance, unweighted) health, x18."""
+        value_x36 = self.amount * self.price
+        if self.amount >= 0:
+            w_initial, w_maint = self.long_initial, self.long_maint
+        else:
+            w_initial, w_maint = self.short_initial, self.short_maint
+        return (
+            value_x36 * w_initial // _X36 + self.v_quote,
+            value_x36 * w_maint // _X36 + self.v_quote,
+            value_x36 // _X18 + self.v_quote,
+        )
+
+    def leverage_notional(self) -> int:
+        """abs(amount * price) for leverage, 0 for the quote and zero-health products."""
+        if self.product_id == MarginManager.QUOTE_PRODUCT_ID:
+            return 0
+        if self.long_initial == 0 and self.short_initial == 2 * _X18:
+            return 0
+        return abs(self.amount * self.price) // _X18
+
+    def is_borrow_or_perp(self) -> bool:
+        return self.amount != 0 if self.is_perp else self.amount < 0
+
+    def to_balance_with_product(self) -> BalanceWithProduct:
+        return BalanceWithProduct(
+            product_id=self.product_id,
+            amount=_to_decimal_x18(self.amount),
+            oracle_price=_to_decimal_x18(self.price),
+            long_weight_initial=_to_decimal_x18(self.long_initial),
+            long_weight_maintenance=_to_decimal_x18(self.long_maint),
+            short_weight_initial=_to_decimal_x18(self.short_initial),
+            short_weight_maintenance=_to_decimal_x18(self.short_maint),
+            balance_type="perp" if self.is_perp else "spot",
+            v_quote_balance=_to_decimal_x18(self.v_quote) if self.is_perp else None,
+        )
+
+
+class _IsolatedState:
+    """Base/quote balances and engine healths of one isolated position."""
+
+    __slots__ = ("base", "quote_amount", "healths")
+
+    def __init__(self, iso_pos: IsolatedPosition):
+        self.base = _BalanceState.from_balance(
+            iso_pos.base_balance, iso_pos.base_product
+        )
+        self.quote_amount = int(iso_pos.quote_balance.balance.amount)
+        self.healths = [int(h.health) for h in iso_pos.healths[:2]]
+
+    def net_margin(self) -> int:
+        base = self.base
+        return self.quote_amount + base.amount * base.price // _X18 + base.v_quote
+
+
+class IncrementalMarginManager:
+    """
+    Margin calculator that keeps parsed state and applies deltas.
+
+    Starts from the engine's health values and, on every balance or price update,
+    adds only the change in the affected product's health contribution. Health,
+    leverage, margin usage and portfolio value are therefore O(1) to read, and
+    position level metrics are only built when asked for.
+
+    Example:
+        >>> manager = IncrementalMarginManager.from_client(client)
+        >>> manager.update_price(2, "65000000000000000000000")
+        >>> manager.margin_usage_fractions().initial
+    """
+
+    def __init__(self, manager: MarginManager):
+        """
+        Args:
+            manager: MarginManager holding the engine snapshot to start from.
+        """
+        self.manager = manager
+        info = manager.subaccount_info
+
+        self._balances: dict[int, _BalanceState] = {}
+        for balance, product in zip(info.spot_balances, info.spot_products):
+            self._balances[balance.product_id] = _BalanceState.from_balance(
+                balance, product
+            )
+        for balance, product in zip(info.perp_balances, info.perp_products):
+            self._balances[balance.product_id] = _BalanceState.from_balance(
+                balance, product
+            )
+
+        self._isolated: dict[int, _IsolatedState] = {}
+        for iso_pos in manager.isolated_positions:
+            state = _IsolatedState(iso_pos)
+            self._isolated[state.base.product_id] = state
+
+        self._health = [int(h.health) for h in info.healths[:_HEALTH_TYPES]]
+        self._leverage_notional = sum(
+            b.leverage_notional() for b in self._balances.values()
+        )
+        self._borrows_or_perps = sum(
+            1 for b in self._balances.values() if b.is_borrow_or_perp()
+        )
+        self._iso_net_margin = sum(s.net_margin() for s in self._isolated.values())
+
+    @classmethod
+    def from_client(cls, client: "NadoClient", **kwargs) -> "IncrementalMarginManager":
+        """
+        Fetch a fresh snapshot via ``MarginManager.from_client`` and wrap it.
+
+        Accepts the same keyword arguments as ``MarginManager.from_client``.
+        """
+        return cls(MarginManager.from_client(client, **kwargs))
+
+    # Updates
+
+    def _apply(self, state: _BalanceState, mutate) -> None:
+        old_health = state.health()
+        old_notional = state.leverage_notional()
+        old_flag = state.is_borrow_or_perp()
+
+        mutate(state)
+
+        for i, (old, new) in enumerate(zip(old_health, state.health())):
+            self._health[i] += new - old
+        self._leverage_notional += state.leverage_notional() - old_notional
+        self._borrows_or_perps += int(state.is_borrow_or_perp()) - int(old_flag)
+
+    def _state(self, product_id: int) -> _BalanceState:
+        state = self._balances.get(product_id)
+        if state is None:
+            raise ValueError(f"Unknown product_id: {product_id}")
+        return state
+
+    def update_balance(
+        self,
+        product_id: int,
+        amount_x18: Union[int, str],
+        v_quote_balance_x18: Optional[Union[int, str]] = None,
+    ) -> None:
+        """
+        Set the cross balance of a product to a new absolute value.
+
+        Args:
+            product_id: Product whose balance changed.
+            amount_x18: New balance amount (x18).
+            v_quote_balance_x18: New v_quote balance (x18), perps only. Unchanged if omitted.
+        """
+
+        def mutate(state: _BalanceState) -> None:
+            state.amount = int(amount_x18)
+            if v_quote_balance_x18 is not None and state.is_perp:
+                state.v_quote = int(v_quote_balance_x18)
+
+        self._apply(self._state(product_id), mutate)
+
+    def apply_balance_delta(
+        self,
+        product_id: int,
+        amount_delta_x18: Union[int, str],
+        v_quote_delta_x18: Union[int, str] = 0,
+    ) -> None:
+        """
+        Add a change (e.g. a fill) to the cross balance of a product.
+
+        Args:
+            product_id: Product whose balance changed.
+            amount_delta_x18: Change in balance amount (x18).
+            v_quote_delta_x18: Change in v_quote balance (x18), perps only.
+        """
+
+        def mutate(state: _BalanceState) -> None:
+            state.amount += int(amount_delta_x18)
+            if state.is_perp:
+                state.v_quote += int(v_quote_delta_x18)
+
+        self._apply(self._state(product_id), mutate)
+
+    def update_price(self, product_id: int, oracle_price_x18: Union[int, str]) -> None:
+        """
+        Update the oracle price of a product.
+
+        Affects the cross balance and, if present, the isolated position in that product.
+        """
+        price = int(oracle_price_x18)
+        state = self._balances.get(product_id)
+        if state is not None:
+
+            def mutate(s: _BalanceState) -> None:
+                s.price = price
+
+            self._apply(state, mutate)
+
+        iso = self._isolated.get(product_id)
+        if iso is not None:
+            old_margin = iso.net_margin()
+            old_health = iso.base.health()
+            iso.base.price = price
+            new_health = iso.base.health()
+            for i in range(len(iso.healths)):
+                iso.healths[i] += new_health[i] - old_health[i]
+            self._iso_net_margin += iso.net_margin() - old_margin
+
+    def update_prices(self, prices_x18: dict[int, Union[int, str]]) -> None:
+        """Update the oracle prices of several products."""
+        for product_id, price in prices_x18.items():
+            self.update_price(product_id, price)
+
+    def update_isolated_position(
+        self,
+        product_id: int,
+        amount_x18: Union[int, str],
+        v_quote_balance_x18: Union[int, str],
+        quote_amount_x18: Optional[Union[int, str]] = None,
+    ) -> None:
+        """
+        Set the balances of an existing isolated position.
+
+        Args:
+            product_id: Perp product of the isolated position.
+            amount_x18: New base amount (x18).
+            v_quote_balance_x18: New base v_quote balance (x18).
+            quote_amount_x18: New quote (margin) amount (x18). Unchanged if omitted.
+        """
+        iso = self._isolated.get(product_id)
+        if iso is None:
+            raise ValueError(f"No isolated position for product_id: {product_id}")
+        old_margin = iso.net_margin()
+        old_health = iso.base.health()
+        old_quote = iso.quote_amount
+        iso.base.amount = int(amount_x18)
+        iso.base.v_quote = int(v_quote_balance_x18)
+        if quote_amount_x18 is not None:
+            iso.quote_amount = int(quote_amount_x18)
+        new_health = iso.base.health()
+        quote_delta = iso.quote_amount - old_quote
+        for i in range(len(iso.healths)):
+            iso.healths[i] += new_health[i] - old_health[i] + quote_delta
+        self._iso_net_margin += iso.net_margin() - old_margin
+
+    # Metrics
+
+    @property
+    def initial_health(self) -> Decimal:
+        return _to_decimal_x18(self._health[0])
+
+    @property
+    def maintenance_health(self) -> Decimal:
+        return _to_decimal_x18(self._health[1])
+
+    @property
+    def unweighted_health(self) -> Decimal:
+        return _to_decimal_x18(self._health[2])
+
+    @property
+    def funds_available(self) -> Decimal:
+        return max(Decimal(0), self.initial_health)
+
+    @property
+    def funds_until_liquidation(self) -> Decimal:
+        return max(Decimal(0), self.maintenance_health)
+
+    @property
+    def portfolio_value(self) -> Decimal:
+        return _to_decimal_x18(self._health[2] + self._iso_net_margin)
+
+    def margin_usage_fractions(self) -> MarginUsageFractions:
+        """Margin usage bounded to [0, 1], see ``MarginManager.calculate_margin_usage_fractions``."""
+        return _margin_usage_fractions(self._health, self._borrows_or_perps > 0)
+
+    @property
+    def account_leverage(self) -> Decimal:
+        if self._health[2] == 0 or not self._borrows_or_perps:
+            return Decimal(0)
+        return Decimal(self._leverage_notional) / Decimal(self._health[2])
+
+    def cross_position_metrics(self, product_id: int) -> CrossPositionMetrics:
+        """Metrics for the cross position in one perp product."""
+        state = self._state(product_id)
+        if not state.is_perp:
+            raise ValueError(f"product_id {product_id} is not a perp product")
+        return self.manager.calculate_cross_position_metrics(
+            state.to_balance_with_product()
+        )
+
+    def isolated_position_metrics(self, product_id: int) -> IsolatedPositionMetrics:
+        """Metrics for the isolated position in one perp product."""
+        iso = self._isolated.get(product_id)
+        if iso is None:
+            raise ValueError(f"No isolated position for product_id: {product_id}")
+        base = iso.base.to_balance_with_product()
+        net_margin = _to_decimal_x18(iso.net_margin())
+        return IsolatedPositionMetrics(
+            product_id=product_id,
+            symbol=f"Product_{product_id}",
+            position_size=base.amount,
+            notional_value=self.manager.calculate_perp_balance_notional_value(base),
+            net_margin=net_margin,
+            leverage=self.manager.calculate_isolated_position_leverage(
+                base, net_margin
+            ),
+            initial_health=(
+                _to_decimal_x18(iso.healths[0]) if iso.healths else Decimal(0)
+            ),
+            maintenance_health=(
+                _to_decimal_x18(iso.healths[1]) if len(iso.healths) > 1 else Decimal(0)
+            ),
+        )
+
+    def calculate_account_summary(self) -> AccountSummary:
+        """Full AccountSummary built from the current state."""
+        spot_balances: list[BalanceWithProduct] = []
+        cross_positions: list[CrossPositionMetrics] = []
+        total_deposits = Decimal(0)
+        total_borrows = Decimal(0)
+        for state in self._balances.values():
+            balance = state.to_balance_with_product()
+            if not state.is_perp:
+                spot_balances.append(balance)
+                value = self.manager.calculate_spot_balance_value(balance)
+                if value > 0:
+                    total_deposits += value
+                else:
+                    total_borrows += abs(value)
+            elif state.amount != 0:
+                cross_positions.append(
+                    self.manager.calculate_cross_position_metrics(balance)
+                )
+
+        usage = self.margin_usage_fractions()
+        return AccountSummary(
+            initial_health=self.initial_health,
+            maintenance_health=self.maintenance_health,
+            unweighted_health=self.unweighted_health,
+            margin_usage_fraction=usage.initial,
+            maint_margin_usage_fraction=usage.maintenance,
+            funds_available=self.funds_available,
+            funds_until_liquidation=self.funds_until_liquidation,
+            portfolio_value=self.portfolio_value,
+            account_leverage=self.account_leverage,
+            cross_positions=cross_positions,
+            isolated_positions=[
+                self.isolated_position_metrics(pid) for pid in self._isolated
+            ],
+            spot_positions=spot_balances,
+            total_spot_deposits=total_deposits,
+            total_spot_borrows=total_borrows,
+        )
+
+
+def _margin_usage_fractions(
+    health_x18: list[int], has_borrows_or_perps: bool
+) -> MarginUsageFractions:
+    initial, maint, unweighted = health_x18
+    if unweighted == 0 or not has_borrows_or_perps:
+        return MarginUsageFractions(initial=Decimal(0), maintenance=Decimal(0))
+    unweighted_dec = Decimal(unweighted)
+    return MarginUsageFractions(
+        initial=(
+            Decimal(1)
+            if initial < 0
+            else min((unweighted_dec - initial) / unweighted_dec, Decimal(1))
+        ),
+        maintenance=(
+            Decimal(1)
+            if maint < 0
+            else min((unweighted_dec - maint) / unweighted_dec, Decimal(1))
+        ),
+    )
+
+
+class SubaccountMarginMetrics(BaseModel):
+    """Account level margin metrics of one subaccount, from an indexer snapshot."""
+
+    subaccount: str
+    timestamp: int
+    initial_health: Decimal
+    maintenance_health: Decimal
+    unweighted_health: Decimal
+    margin_usage_fraction: Decimal
+    maint_margin_usage_fraction: Decimal
+    funds_available: Decimal
+    funds_until_liquidation: Decimal
+    portfolio_value: Decimal
+    account_leverage: Decimal
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+def calculate_batch_margin_metrics(
+    snapshots: Union[
+        IndexerAccountSnapshotsData, dict[str, dict[str, list[IndexerEvent]]]
+    ],
+) -> dict[str, SubaccountMarginMetrics]:
+    """
+    Evaluate account level margin metrics for many subaccounts at once.
+
+    Every balance of every subaccount (latest snapshot timestamp per subaccount) is
+    flattened into parallel x18 integer columns, the health contributions are
+    computed column-wise, and per-subaccount totals are reduced in a single pass.
+    Cross health uses non-isolated balances; isolated balances add their net
+    margin to the portfolio value.
+
+    Args:
+        snapshots: Result of ``get_multi_subaccount_snapshots`` (or its ``snapshots`` map).
+
+    Returns:
+        Dict mapping subaccount hex -> SubaccountMarginMetrics.
+    """
+    snapshot_map = (
+        snapshots.snapshots
+        if isinstance(snapshots, IndexerAccountSnapshotsData)
+        else snapshots
+    ) or {}
+
+    subaccounts: list[str] = []
+    timestamps: list[int] = []
+    col_sub: list[int] = []
+    col_states: list[_BalanceState] = []
+    col_isolated: list[bool] = []
+    for subaccount, by_timestamp in snapshot_map.items():
+        if not by_timestamp:
+            continue
+        latest = max(by_timestamp, key=int)
+        index = len(subaccounts)
+        subaccounts.append(subaccount)
+        timestamps.append(int(latest))
+        for event in by_timestamp[latest] or []:
+            balance = getattr(event.post_balance, "perp", None) or event.post_balance.spot  # type: ignore[union-attr]
+            product = getattr(event.product, "perp", None) or event.product.spot  # type: ignore[union-attr]
+            col_sub.append(index)
+            col_states.append(_BalanceState.from_balance(balance, product))
+            col_isolated.append(bool(event.isolated))
+
+    # Column-wise contributions
+    healths = [s.health() for s in col_states]
+    notionals = [s.leverage_notional() for s in col_states]
+    flags = [s.is_borrow_or_perp() for s in col_states]
+    iso_values = [
+        s.amount * s.price // _X18 + s.v_quote if s.is_perp else s.amount
+        for s in col_states
+    ]
+
+    # Per-subaccount reduction
+    n = len(subaccounts)
+    health_totals = [[0, 0, 0] for _ in range(n)]
+    notional_totals = [0] * n
+    flag_counts = [0] * n
+    iso_totals = [0] * n
+    for sub, isolated, health, notional, flag, iso_value in zip(
+        col_sub, col_isolated, healths, notionals, flags, iso_values
+    ):
+        if isolated:
+            iso_totals[sub] += iso_value
+            continue
+        totals = health_totals[sub]
+        totals[0] += health[0]
+        totals[1] += health[1]
+        totals[2] += health[2]
+        notional_totals[sub] += notional
+        flag_counts[sub] += flag
+
+    result: dict[str, SubaccountMarginMetrics] = {}
+    for i, subaccount in enumerate(subaccounts):
+        initial, maint, unweighted = health_totals[i]
+        usage = _margin_usage_fractions(health_totals[i], flag_counts[i] > 0)
+        leverage = (
+            Decimal(notional_totals[i]) / Decimal(unweighted)
+            if unweighted != 0 and flag_counts[i]
+            else Decimal(0)
+        )
+        result[subaccount] = SubaccountMarginMetrics(
+            subaccount=subaccount,
+            timestamp=timestamps[i],
+            initial_health=_to_decimal_x18(initial),
+            maintenance_health=_to_decimal_x18(maint),
+            unweighted_health=_to_decimal_x18(unweighted),
+            margin_usage_fraction=usage.initial,
+            maint_margin_usage_fraction=usage.maintenance,
+            funds_available=max(Decimal(0), _to_decimal_x18(initial)),
+            funds_until_liquidation=max(Decimal(0), _to_decimal_x18(maint)),
+            portfolio_value=_to_decimal_x18(unweighted + iso_totals[i]),
+            account_leverage=leverage,
+        )
+    return result
+
+
 def print_account_summary(summary: AccountSummary) -> None:
     """Print formatted account summary matching UI layout."""
     print("\n" + "=" * 80)
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from nado_protocol.engine_client import EngineClient
+from nado_protocol.engine_client.types.query import (
+    MarketPricesData,
+    QueryMarketPricesParams,
+)
+
+
+def test_market_prices_params():
+    params = QueryMarketPricesParams(product_ids=[2, 4])
+
+    assert params.dict() == {"type": "market_prices", "product_ids": [2, 4]}
+
+
+def test_get_market_prices(
+    engine_client: EngineClient,
+    mock_post: MagicMock,
+):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "data": {
+            "market_prices": [
+                {
+                    "product_id": 2,
+                    "bid_x18": "64000000000000000000000",
+                    "ask_x18": "64001000000000000000000",
+                },
+                {
+                    "product_id": 4,
+                    "bid_x18": "3400000000000000000000",
+                    "ask_x18": "3400500000000000000000",
+                },
+            ]
+        },
+    }
+    mock_post.return_value = mock_response
+
+    res = engine_client.get_market_prices([2, 4])
+
+    mock_post.assert_called_once_with(
+        f"{engine_client.url}/query",
+        json={"type": "market_prices", "product_ids": [2, 4]},
+    )
+    assert isinstance(res, MarketPricesData)
+    assert [p.product_id for p in res.market_prices] == [2, 4]
+    assert res.market_prices[1].ask_x18 == "3400500000000000000000"
@@ -0,0 +1,283 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from nado_protocol.indexer_client import IndexerClient, IndexerPaginator, fan_out
+from nado_protocol.indexer_client.types.query import (
+    IndexerEventsParams,
+    IndexerEventsRawLimit,
+    IndexerEventsTxsLimit,
+    IndexerInterestAndFundingParams,
+    IndexerMatchesParams,
+    IndexerSubaccountHistoricalOrdersParams,
+)
+
+
+def fake_history(total: int, field: str):
+    """Fake endpoint over `total` records with submission_idx 1..total, newest first."""
+    requests = []
+
+    def endpoint(params):
+        requests.append(params)
+        top = total if params.idx is None else params.idx
+        idxs = list(range(top, 0, -1))[: params.limit or 100]
+        records = [SimpleNamespace(submission_idx=str(i)) for i in idxs]
+        return SimpleNamespace(**{field: records, "txs": []})
+
+    return endpoint, requests
+
+
+def idxs(items) -> list[int]:
+    return [int(item.submission_idx) for item in items]
+
+
+def test_paginate_matches_follows_submission_idx(url: str):
+    client = IndexerClient({"url": url})
+    client.get_matches, requests = fake_history(25, "matches")
+
+    paginator = client.paginate_matches(
+        IndexerMatchesParams(subaccounts=["xxx"], limit=10)
+    )
+    pages = list(paginator.pages())
+
+    # A full page leaves its oldest idx to the next page, which starts at that idx
+    assert [len(p) for p in pages] == [9, 9, 7]
+    assert [p.cursor for p in pages] == [None, 16, 7]
+    assert pages[-1].next_cursor is None
+    assert [r.idx for r in requests] == [None, 16, 7]
+    assert all(r.subaccounts == ["xxx"] for r in requests)
+    assert paginator.exhausted and paginator.cursor is None
+
+
+def test_paginator_items_and_full_last_page(url: str):
+    client = IndexerClient({"url": url})
+    client.get_subaccount_historical_orders, requests = fake_history(20, "orders")
+
+    items = list(
+        client.paginate_subaccount_historical_orders(
+            IndexerSubaccountHistoricalOrdersParams(subaccounts=["xxx"], limit=10),
+            prefetch=0,
+        )
+    )
+
+    assert idxs(items) == list(range(20, 0, -1))
+    # The second page is full, so one more (short) page confirms the end
+    assert [r.idx for r in requests] == [None, 11, 2]
+
+
+def test_paginator_resume_from_cursor(url: str):
+    client = IndexerClient({"url": url})
+    client.get_matches, _ = fake_history(30, "matches")
+    params = IndexerMatchesParams(limit=10)
+
+    paginator = client.paginate_matches(params)
+    seen = []
+    for item in paginator:
+        seen.append(int(item.submission_idx))
+        if len(seen) == 15:
+            break
+    # Stopped half way through the second page: it is replayed on resume
+    assert paginator.cursor == 21 and not paginator.exhausted
+
+    resumed = client.paginate_matches(params, start_cursor=paginator.cursor)
+    assert idxs(resumed) == list(range(21, 0, -1))
+
+
+def grouped_history(groups: list[int], field: str):
+    """Fake endpoint where submission_idx i has groups[i - 1] records, newest first."""
+    records = [
+        SimpleNamespace(submission_idx=str(i), n=n)
+        for i in range(len(groups), 0, -1)
+        for n in range(groups[i - 1])
+    ]
+    requests = []
+
+    def endpoint(params):
+        limit = params.limit.raw if field == "events" else params.limit
+        requests.append((params.idx, limit))
+        top = len(groups) if params.idx is None else params.idx
+        page = [r for r in records if int(r.submission_idx) <= top][:limit]
+        return SimpleNamespace(**{field: page, "txs": []})
+
+    return endpoint, requests, records
+
+
+def test_paginate_matches_keeps_idx_groups_on_one_page(url: str):
+    client = IndexerClient({"url": url})
+    # idx 5 has 3 matches and straddles the first page boundary (limit 4)
+    client.get_matches, requests, records = grouped_history([1, 1, 2, 1, 3, 1], "matches")
+
+    pages = list(client.paginate_matches(IndexerMatchesParams(limit=4)).pages())
+
+    assert [idxs(p.items) for p in pages] == [[6], [5, 5, 5], [4, 3, 3], [2, 1]]
+    assert [(r.submission_idx, r.n) for p in pages for r in p.items] == [
+        (r.submission_idx, r.n) for r in records
+    ]
+    assert [idx for idx, _ in requests] == [None, 5, 4, 2]
+
+
+def test_paginate_events_widens_page_for_large_group(url: str):
+    client = IndexerClient({"url": url})
+    # idx 2 has more events than a page holds
+    client.get_events, requests, records = grouped_history([1, 5, 1], "events")
+
+    items = list(
+        client.paginate_events(
+            IndexerEventsParams(limit=IndexerEventsRawLimit(raw=2))
+        )
+    )
+
+    assert len(items) == len(records)
+    assert idxs(items) == [3, 2, 2, 2, 2, 2, 1]
+    assert requests == [(None, 2), (2, 2), (2, 4), (2, 8)]
+
+
+def test_paginator_max_pages(url: str):
+    client = IndexerClient({"url": url})
+    client.get_matches, _ = fake_history(100, "matches")
+
+    paginator = client.paginate_matches(IndexerMatchesParams(limit=10), max_pages=2)
+
+    assert len(list(paginator)) == 18
+    assert paginator.cursor == 82 and not paginator.exhausted
+
+
+def test_paginator_prefetch_is_bounded():
+    fetched = []
+
+    def fetch(cursor):
+        fetched.append(cursor)
+        next_cursor = (cursor or 1000) - 1
+        return None, [next_cursor], next_cursor
+
+    paginator = IndexerPaginator(fetch, prefetch=2)
+    pages = paginator.pages()
+    first = next(pages)
+    time.sleep(0.3)
+
+    # One page handed out, `prefetch` pages buffered, one blocked on the full buffer
+    assert first.cursor is None
+    assert len(fetched) <= 1 + 2 + 1
+    pages.close()
+
+
+def test_paginator_prefetches_while_consumer_works():
+    fetched = threading.Event()
+
+    def fetch(cursor):
+        if cursor is not None:
+            fetched.set()
+        return None, [cursor], None if cursor == 1 else 1
+
+    pages = IndexerPaginator(fetch, prefetch=1).pages()
+    next(pages)
+    # Second page is requested before the consumer asks for it
+    assert fetched.wait(1.0)
+    assert [p.cursor for p in pages] == [1]
+
+
+def test_paginator_propagates_errors():
+    def fetch(cursor):
+        if cursor is not None:
+            raise RuntimeError("boom")
+        return None, [1], 5
+
+    paginator = IndexerPaginator(fetch)
+    with pytest.raises(RuntimeError, match="boom"):
+        list(paginator)
+    assert paginator.cursor == 5
+
+
+def test_paginator_single_use():
+    paginator = IndexerPaginator(lambda cursor: (None, [], None))
+    list(paginator)
+    with pytest.raises(RuntimeError):
+        list(paginator)
+
+
+def test_paginate_events_txs_limit(url: str):
+    client = IndexerClient({"url": url})
+    requests = []
+
+    def get_events(params):
+        requests.append(params.idx)
+        top = 50 if params.idx is None else params.idx
+        events = [SimpleNamespace(submission_idx=str(i)) for i in (top, top - 1)]
+        txs = [object()] * (3 if top > 20 else 1)
+        return SimpleNamespace(events=events, txs=txs)
+
+    client.get_events = get_events
+    pages = list(
+        client.paginate_events(
+            IndexerEventsParams(limit=IndexerEventsTxsLimit(txs=3))
+        ).pages()
+    )
+
+    assert requests == [None] + list(range(48, 19, -2))
+    assert pages[-1].next_cursor is None
+
+
+def test_paginate_interest_and_funding(url: str):
+    client = IndexerClient({"url": url})
+    requests = []
+
+    def get_payments(params):
+        requests.append(params.max_idx)
+        top = 9 if params.max_idx is None else params.max_idx
+        interest = [
+            SimpleNamespace(idx=str(i)) for i in range(top, max(top - 3, 0), -1)
+        ]
+        funding = [SimpleNamespace(idx="f")] if interest else []
+        return SimpleNamespace(
+            interest_payments=interest,
+            funding_payments=funding,
+            next_idx=str(top - 3),
+        )
+
+    client.get_interest_and_funding_payments = get_payments
+    paginator = client.paginate_interest_and_funding_payments(
+        IndexerInterestAndFundingParams(subaccount="xxx", product_ids=[2], limit=3)
+    )
+    items = list(paginator)
+
+    assert requests == [None, 6, 3, 0]
+    assert [i.idx for i in items if i.idx != "f"] == [str(i) for i in range(9, 0, -1)]
+    assert paginator.exhausted
+
+
+def test_fan_out_across_subaccounts(url: str):
+    client = IndexerClient({"url": url})
+    sizes = {"a": 25, "b": 0, "c": 7}
+
+    def get_matches(params):
+        total = sizes[params.subaccounts[0]]
+        top = total if params.idx is None else params.idx
+        records = [
+            SimpleNamespace(submission_idx=str(i))
+            for i in list(range(top, 0, -1))[: params.limit]
+        ]
+        return SimpleNamespace(matches=records, txs=[])
+
+    client.get_matches = get_matches
+    subaccounts = list(sizes)
+    paginators = [
+        client.paginate_matches(IndexerMatchesParams(subaccounts=[s], limit=10))
+        for s in subaccounts
+    ]
+
+    collected: dict[str, list[int]] = {s: [] for s in subaccounts}
+    for index, page in fan_out(paginators, max_workers=2, buffer_pages=2):
+        collected[subaccounts[index]].extend(idxs(page.items))
+
+    assert collected == {s: list(range(n, 0, -1)) for s, n in sizes.items()}
+
+
+def test_fan_out_propagates_errors():
+    def failing(cursor):
+        raise ValueError("bad page")
+
+    ok = IndexerPaginator(lambda cursor: (None, [1], None))
+    with pytest.raises(ValueError, match="bad page"):
+        list(fan_out([ok, IndexerPaginator(failing)], max_workers=1))
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import requests
+
 from eth_account import Account
 from nado_protocol.client import NadoClientMode, create_nado_client
 
@@ -8,6 +10,7 @@ from nado_protocol.client.context import (
     create_nado_client_context,
 )
 import pytest
+from pydantic import AnyUrl, parse_obj_as
 from nado_protocol.contracts import NadoContractsContext
 
 from nado_protocol.utils.backend import NadoBackendURL
@@ -145,3 +148,99 @@ def test_create_nado_client(
 
     assert custom_nado_client.context.engine_client.url == url
     assert custom_nado_client.context.indexer_client.url == url
+
+
+def test_create_nado_client_shares_session(
+    mock_post: MagicMock,
+    mock_web3: MagicMock,
+    mock_load_abi: MagicMock,
+    private_keys: list[str],
+    endpoint_addr: str,
+    chain_id: int,
+):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "data": {
+            "endpoint_addr": endpoint_addr,
+            "chain_id": chain_id,
+        },
+    }
+    mock_post.return_value = mock_response
+
+    context_opts = NadoClientContextOpts(
+        trigger_endpoint_url=parse_obj_as(AnyUrl, "http://trigger.example.com")
+    )
+    default_client = create_nado_client(
+        NadoClientMode.TESTING, private_keys[0], context_opts
+    )
+    context = default_client.context
+    assert (
+        context.engine_client.session
+        is context.engine_client._querier.session
+        is context.indexer_client.session
+        is context.trigger_client.session
+    )
+
+    session = requests.Session()
+    nado_client = create_nado_client(
+        NadoClientMode.TESTING, private_keys[0], context_opts, session=session
+    )
+    context = nado_client.context
+    assert context.engine_client.session is session
+    assert context.engine_client._querier.session is session
+    assert context.indexer_client.session is session
+    assert context.trigger_client.session is session
+    assert context.engine_client.chain_id == chain_id
+
+
+class _DictCache:
+    def __init__(self):
+        self.values: dict = {}
+
+    def get(self, key, loader):
+        if key not in self.values:
+            self.values[key] = loader()
+        return self.values[key]
+
+
+def test_create_nado_client_context_uses_metadata_cache(
+    mock_post: MagicMock,
+    mock_web3: MagicMock,
+    mock_load_abi: MagicMock,
+    private_keys: list[str],
+    url: str,
+    endpoint_addr: str,
+    querier_addr: str,
+    chain_id: int,
+):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "status": "success",
+        "data": {
+            "endpoint_addr": endpoint_addr,
+            "chain_id": chain_id,
+        },
+    }
+    mock_post.return_value = mock_response
+    opts = NadoClientContextOpts(
+        engine_endpoint_url=url,
+        indexer_endpoint_url=url,
+        rpc_node_url=url,
+        contracts_context=NadoContractsContext(
+            endpoint_addr=endpoint_addr, querier_addr=querier_addr
+        ),
+    )
+    cache = _DictCache()
+
+    cold = create_nado_client_context(opts, private_keys[0], metadata_cache=cache)
+    assert mock_post.call_count == 1
+    assert list(cache.values) == [f"nado/{url}/contracts"]
+
+    warm = create_nado_client_context(opts, private_keys[0], metadata_cache=cache)
+    assert mock_post.call_count == 1
+    for context in (cold, warm):
+        assert context.engine_client.endpoint_addr == endpoint_addr
+        assert context.engine_client.chain_id == chain_id
@@ -0,0 +1,358 @@
+from decimal import Decimal
+
+import pytest
+
+from nado_protocol.engine_client.types.models import IsolatedPosition
+from nado_protocol.engine_client.types.query import SubaccountInfoData
+from nado_protocol.indexer_client.types.query import IndexerAccountSnapshotsData
+from nado_protocol.utils.margin_manager import (
+    IncrementalMarginManager,
+    MarginManager,
+    calculate_batch_margin_metrics,
+)
+
+X18 = 10**18
+SUBACCOUNT = "0x" + "ab" * 32
+
+# product_id -> (oracle price, long_init, long_maint, short_init, short_maint)
+SPOT_PRODUCTS = {
+    0: ("1", "1", "1", "1", "1"),
+    1: ("3000", "0.9", "0.95", "1.1", "1.05"),
+}
+PERP_PRODUCTS = {
+    2: ("60000", "0.95", "0.975", "1.05", "1.025"),
+    4: ("150", "0.9", "0.95", "1.1", "1.05"),
+}
+
+
+def x18(value) -> str:
+    return str(int(Decimal(str(value)) * X18))
+
+
+def product(product_id: int, params: tuple, is_perp: bool) -> dict:
+    price, long_i, long_m, short_i, short_m = params
+    data = {
+        "product_id": product_id,
+        "oracle_price_x18": x18(price),
+        "risk": {
+            "long_weight_initial_x18": x18(long_i),
+            "short_weight_initial_x18": x18(short_i),
+            "long_weight_maintenance_x18": x18(long_m),
+            "short_weight_maintenance_x18": x18(short_m),
+            "price_x18": x18(price),
+        },
+        "book_info": {
+            "size_increment": "1",
+            "price_increment_x18": "1",
+            "min_size": "1",
+            "collected_fees": "0",
+        },
+    }
+    if is_perp:
+        data["state"] = {
+            "cumulative_funding_long_x18": "0",
+            "cumulative_funding_short_x18": "0",
+            "available_settle": "0",
+            "open_interest": "0",
+        }
+    else:
+        data["config"] = {
+            "token": "0x0",
+            "interest_inflection_util_x18": "0",
+            "interest_floor_x18": "0",
+            "interest_small_cap_x18": "0",
+            "interest_large_cap_x18": "0",
+            "withdraw_fee_x18": "0",
+            "min_deposit_rate_x18": "0",
+        }
+        data["state"] = {
+            "cumulative_deposits_multiplier_x18": x18(1),
+            "cumulative_borrows_multiplier_x18": x18(1),
+            "total_deposits_normalized": "0",
+            "total_borrows_normalized": "0",
+        }
+    return data
+
+
+def reference_healths(spot: dict, perp: dict, prices: dict) -> list[Decimal]:
+    """Engine health formula in plain Decimal: [initial, maintenance, unweighted]."""
+    totals = [Decimal(0)] * 3
+    for product_id, amount in spot.items():
+        _, long_i, long_m, short_i, short_m = SPOT_PRODUCTS[product_id]
+        value = Decimal(str(amount)) * Decimal(
+            prices.get(product_id, SPOT_PRODUCTS[product_id][0])
+        )
+        w = (long_i, long_m) if amount >= 0 else (short_i, short_m)
+        totals = [
+            totals[0] + value * Decimal(w[0]),
+            totals[1] + value * Decimal(w[1]),
+            totals[2] + value,
+        ]
+    for product_id, (amount, v_quote) in perp.items():
+        _, long_i, long_m, short_i, short_m = PERP_PRODUCTS[product_id]
+        value = Decimal(str(amount)) * Decimal(
+            prices.get(product_id, PERP_PRODUCTS[product_id][0])
+        )
+        w = (long_i, long_m) if amount >= 0 else (short_i, short_m)
+        v_quote = Decimal(str(v_quote))
+        totals = [
+            totals[0] + value * Decimal(w[0]) + v_quote,
+            totals[1] + value * Decimal(w[1]) + v_quote,
+            totals[2] + value + v_quote,
+        ]
+    return totals
+
+
+def subaccount_info(spot: dict, perp: dict, prices: dict = {}) -> SubaccountInfoData:
+    healths = reference_healths(spot, perp, prices)
+
+    def priced(products: dict) -> dict:
+        return {pid: (prices.get(pid, p[0]),) + p[1:] for pid, p in products.items()}
+
+    spot_products = priced(SPOT_PRODUCTS)
+    perp_products = priced(PERP_PRODUCTS)
+    return SubaccountInfoData.parse_obj(
+        {
+            "subaccount": SUBACCOUNT,
+            "exists": True,
+            "healths": [
+                {"assets": "0", "liabilities": "0", "health": x18(h)} for h in healths
+            ],
+            "health_contributions": [],
+            "spot_count": len(spot_products),
+            "perp_count": len(perp_products),
+            "spot_balances": [
+                {"product_id": pid, "balance": {"amount": x18(spot.get(pid, 0))}}
+                for pid in spot_products
+            ],
+            "perp_balances": [
+                {
+                    "product_id": pid,
+                    "balance": {
+                        "amount": x18(perp.get(pid, (0, 0))[0]),
+                        "v_quote_balance": x18(perp.get(pid, (0, 0))[1]),
+                        "last_cumulative_funding_x18": "0",
+                    },
+                }
+                for pid in perp_products
+            ],
+            "spot_products": [
+                product(pid, p, False) for pid, p in spot_products.items()
+            ],
+            "perp_products": [
+                product(pid, p, True) for pid, p in perp_products.items()
+            ],
+            "pre_state": None,
+        }
+    )
+
+
+def assert_close(a: Decimal, b: Decimal, tol: Decimal = Decimal("1e-12")):
+    assert abs(a - b) <= tol, (a, b)
+
+
+def assert_same_account(inc: IncrementalMarginManager, expected: MarginManager):
+    summary = expected.calculate_account_summary()
+    assert_close(inc.initial_health, summary.initial_health)
+    assert_close(inc.maintenance_health, summary.maintenance_health)
+    assert_close(inc.unweighted_health, summary.unweighted_health)
+    usage = inc.margin_usage_fractions()
+    assert_close(usage.initial, summary.margin_usage_fraction)
+    assert_close(usage.maintenance, summary.maint_margin_usage_fraction)
+    assert_close(inc.account_leverage, summary.account_leverage)
+    assert_close(inc.portfolio_value, summary.portfolio_value)
+
+
+SPOT = {0: 50000, 1: -2}
+PERP = {2: (0.5, -29000), 4: (-10, 1600)}
+
+
+def test_incremental_matches_engine_snapshot():
+    inc = IncrementalMarginManager(MarginManager(subaccount_info(SPOT, PERP)))
+    assert_same_account(inc, MarginManager(subaccount_info(SPOT, PERP)))
+
+    summary = inc.calculate_account_summary()
+    expected = MarginManager(subaccount_info(SPOT, PERP)).calculate_account_summary()
+    assert [p.product_id for p in summary.cross_positions] == [2, 4]
+    for got, want in zip(summary.cross_positions, expected.cross_positions):
+        assert got.notional_value == want.notional_value
+        assert got.unsettled == want.unsettled
+        assert got.margin_used == want.margin_used
+    assert summary.total_spot_borrows == expected.total_spot_borrows
+
+
+def test_incremental_price_update():
+    inc = IncrementalMarginManager(MarginManager(subaccount_info(SPOT, PERP)))
+    inc.update_prices({2: x18(52000), 1: x18(3300)})
+
+    expected = MarginManager(subaccount_info(SPOT, PERP, {2: "52000", 1: "3300"}))
+    assert_same_account(inc, expected)
+    assert inc.cross_position_metrics(2).notional_value == Decimal(26000)
+
+
+def test_incremental_balance_updates():
+    inc = IncrementalMarginManager(MarginManager(subaccount_info(SPOT, PERP)))
+
+    # Fill: buy 0.25 more of product 2 at 60000 and flip product 4 to long
+    inc.apply_balance_delta(2, x18(0.25), x18(-15000))
+    inc.update_balance(4, x18(5), x18(-750))
+    inc.update_balance(1, x18(1))
+
+    spot = {0: 50000, 1: 1}
+    perp = {2: (0.75, -44000), 4: (5, -750)}
+    assert_same_account(inc, MarginManager(subaccount_info(spot, perp)))
+
+
+def test_incremental_no_borrows_or_perps():
+    inc = IncrementalMarginManager(
+        MarginManager(subaccount_info({0: 1000}, {2: (0.1, -6000)}))
+    )
+    assert inc.account_leverage > 0
+
+    inc.update_balance(2, 0, 0)
+    usage = inc.margin_usage_fractions()
+    assert usage.initial == 0 and usage.maintenance == 0
+    assert inc.account_leverage == 0
+    assert inc.portfolio_value == Decimal(1000)
+
+
+def test_incremental_unknown_product():
+    inc = IncrementalMarginManager(MarginManager(subaccount_info(SPOT, PERP)))
+    with pytest.raises(ValueError):
+        inc.update_balance(99, x18(1))
+    with pytest.raises(ValueError):
+        inc.isolated_position_metrics(2)
+
+
+def test_incremental_isolated_position():
+    info = subaccount_info({0: 1000}, {})
+    iso = IsolatedPosition.parse_obj(
+        {
+            "subaccount": SUBACCOUNT,
+            "quote_balance": {"product_id": 0, "balance": {"amount": x18(500)}},
+            "base_balance": {
+                "product_id": 2,
+                "balance": {
+                    "amount": x18(0.1),
+                    "v_quote_balance": x18(-6000),
+                    "last_cumulative_funding_x18": "0",
+                },
+            },
+            "quote_product": product(0, SPOT_PRODUCTS[0], False),
+            "base_product": product(2, PERP_PRODUCTS[2], True),
+            "healths": [
+                {
+                    "assets": "0",
+                    "liabilities": "0",
+                    "health": x18(500 + 6000 * 0.95 - 6000),
+                },
+                {
+                    "assets": "0",
+                    "liabilities": "0",
+                    "health": x18(500 + 6000 * 0.975 - 6000),
+                },
+            ],
+            "quote_healths": [],
+            "base_healths": [],
+        }
+    )
+    inc = IncrementalMarginManager(MarginManager(info, [iso]))
+    assert inc.portfolio_value == Decimal(1500)
+
+    inc.update_price(2, x18(61000))
+    metrics = inc.isolated_position_metrics(2)
+    assert metrics.net_margin == Decimal(600)
+    assert metrics.notional_value == Decimal(6100)
+    assert metrics.leverage == Decimal(6100) / Decimal(600)
+    assert_close(metrics.initial_health, Decimal(500 + 6100 * 0.95 - 6000))
+    assert inc.portfolio_value == Decimal(1600)
+
+
+def snapshot_event(
+    product_id: int, amount, v_quote=None, isolated: bool = False
+) -> dict:
+    is_perp = product_id in PERP_PRODUCTS
+    params = PERP_PRODUCTS[product_id] if is_perp else SPOT_PRODUCTS[product_id]
+    kind = "perp" if is_perp else "spot"
+    balance = {"amount": x18(amount)}
+    if is_perp:
+        balance["v_quote_balance"] = x18(v_quote)
+        balance["last_cumulative_funding_x18"] = "0"
+    post_balance = {kind: {"product_id": product_id, "balance": balance}}
+    return {
+        "submission_idx": "1",
+        "timestamp": "1700000000",
+        "subaccount": SUBACCOUNT,
+        "product_id": product_id,
+        "event_type": "match_orders",
+        "product": {kind: product(product_id, params, is_perp)},
+        "pre_balance": post_balance,
+        "post_balance": post_balance,
+        "isolated": isolated,
+        "isolated_product_id": 2 if isolated else None,
+        "net_interest_unrealized": "0",
+        "net_interest_cumulative": "0",
+        "net_funding_unrealized": "0",
+        "net_funding_cumulative": "0",
+        "net_entry_unrealized": "0",
+        "net_entry_cumulative": "0",
+        "quote_volume_cumulative": "0",
+    }
+
+
+def test_batch_matches_per_subaccount():
+    accounts = {
+        f"0x{i:064x}": (
+            {0: 1000 * (i + 1), 1: -0.5 * i},
+            {2: (0.01 * i, -600 * i), 4: (-i, 150 * i)},
+        )
+        for i in range(1, 40)
+    }
+    data = IndexerAccountSnapshotsData.parse_obj(
+        {
+            "snapshots": {
+                sub: {
+                    "1699990000": [snapshot_event(0, 1)],
+                    "1700000000": [
+                        snapshot_event(pid, amt) for pid, amt in spot.items()
+                    ]
+                    + [snapshot_event(pid, *bal) for pid, bal in perp.items()],
+                }
+                for sub, (spot, perp) in accounts.items()
+            }
+        }
+    )
+
+    metrics = calculate_batch_margin_metrics(data)
+
+    assert set(metrics) == set(accounts)
+    for sub, (spot, perp) in accounts.items():
+        got = metrics[sub]
+        assert got.timestamp == 1700000000
+        want = MarginManager(subaccount_info(spot, perp)).calculate_account_summary()
+        assert_close(got.initial_health, want.initial_health)
+        assert_close(got.maintenance_health, want.maintenance_health)
+        assert_close(got.unweighted_health, want.unweighted_health)
+        assert_close(got.margin_usage_fraction, want.margin_usage_fraction)
+        assert_close(got.maint_margin_usage_fraction, want.maint_margin_usage_fraction)
+        assert_close(got.account_leverage, want.account_leverage)
+        assert_close(got.portfolio_value, want.portfolio_value)
+
+
+def test_batch_isolated_balances_add_to_portfolio_value():
+    data = {
+        SUBACCOUNT: {
+            "1700000000": [
+                snapshot_event(0, 1000),
+                snapshot_event(0, 500, isolated=True),
+                snapshot_event(2, 0.1, -6000, isolated=True),
+            ]
+        }
+    }
+    parsed = IndexerAccountSnapshotsData.parse_obj({"snapshots": data})
+
+    metrics = calculate_batch_margin_metrics(parsed)[SUBACCOUNT]
+
+    assert metrics.unweighted_health == Decimal(1000)
+    assert metrics.portfolio_value == Decimal(1500)
+    assert metrics.account_leverage == 0
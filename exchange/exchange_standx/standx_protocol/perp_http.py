@@ -18,16 +18,28 @@ class RegionResponse:
 class StandXPerpHTTP:
     """StandX Perps HTTP API Client"""
     
-    def __init__(self, base_url: str = "https://perps.standx.com", geo_url: str = "https://geo.standx.com"):
+    def __init__(
+        self,
+        base_url: str = "https://perps.standx.com",
+        geo_url: str = "https://geo.standx.com",
+        session: Optional[requests.Session] = None,
+        metadata_cache: Any = None,
+    ):
         """
         Initialize StandX Perps HTTP client.
         
         Args:
             base_url: Base URL for perps API (default: https://perps.standx.com)
             geo_url: Base URL for geo API (default: https://geo.standx.com)
+            session: Optional requests.Session to send requests with (default: a new Session)
+            metadata_cache: Optional on-disk metadata cache with a get(key, loader) method,
+                used by load_symbol_info()
         """
         self.base_url = base_url.rstrip('/')
         self.geo_url = geo_url.rstrip('/')
+        # 复用连接（keep-alive），避免每个请求重新 DNS + TCP + TLS 握手；可传入共享连接池的 Session
+        self.session = session or requests.Session()
+        self.metadata_cache = metadata_cache
     
     def health_check(self) -> str:
         """
@@ -40,7 +52,7 @@ class StandXPerpHTTP:
             ValueError: If request fails
         """
         url = f"{self.base_url}/api/health"
-        response = requests.get(url)
+        response = self.session.get(url)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -59,7 +71,7 @@ class StandXPerpHTTP:
         """
         url = f"{self.geo_url}/v1/region"
         # 增加超时时间，防止网络问题导致长时间阻塞
-        response = requests.get(url, timeout=1.0)
+        response = self.session.get(url, timeout=1.0)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -116,7 +128,7 @@ class StandXPerpHTTP:
             "Authorization": f"Bearer {token}"
         }
         
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -202,7 +214,7 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -246,7 +258,7 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -282,13 +294,57 @@ class StandXPerpHTTP:
         url = f"{self.base_url}/api/query_symbol_price"
         params = {"symbol": symbol}
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
         
         return response.json()
     
+    def query_symbol_info(
+        self,
+        symbol: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query listed symbols and their trading parameters.
+        
+        Args:
+            symbol: Optional trading pair filter (e.g., "BTC-USD"); all symbols if omitted
+        
+        Returns:
+            List of symbol info dictionaries (fields include symbol, base_asset,
+            quote_asset, price_tick_decimals, qty_tick_decimals, status)
+        
+        Raises:
+            ValueError: If request fails
+        """
+        url = f"{self.base_url}/api/query_symbol_info"
+        params = {"symbol": symbol} if symbol else None
+        
+        response = self.session.get(url, params=params)
+        
+        if not response.ok:
+            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+        
+        data = response.json()
+        if isinstance(data, dict):
+            return [data]
+        return data
+    
+    def load_symbol_info(self) -> List[Dict[str, Any]]:
+        """
+        Trading parameters of all symbols, served from the metadata cache when one is set
+        (stale entries are refreshed in the background), otherwise queried directly.
+
+        Use query_symbol_info() when the live status of a symbol matters.
+
+        Returns:
+            List of symbol info dictionaries, as query_symbol_info()
+        """
+        if self.metadata_cache is None:
+            return self.query_symbol_info()
+        return self.metadata_cache.get(f"standx/{self.base_url}/symbol_info", self.query_symbol_info)
+
     def query_open_orders(
         self,
         token: str,
@@ -323,7 +379,111 @@ class StandXPerpHTTP:
         if limit:
             params["limit"] = limit
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
+        
+        if not response.ok:
+            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+        
+        return response.json()
+    
+    def query_orders(
+        self,
+        token: str,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        last_id: Optional[int] = None,
+        limit: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Query user order history, newest first.
+        
+        Args:
+            token: Authentication token
+            symbol: Trading pair (optional, e.g., "BTC-USD")
+            status: Order status filter (optional, e.g., "filled", "canceled")
+            start: Start time, ISO 8601 (optional)
+            end: End time, ISO 8601 (optional)
+            last_id: Only return orders older than this order ID (pagination)
+            limit: Results limit (default: 500)
+            
+        Returns:
+            Response dictionary with fields:
+            - page_size: Page size
+            - result: List of order dictionaries
+            - total: Total number of orders
+            
+        Raises:
+            ValueError: If request fails
+        """
+        url = f"{self.base_url}/api/query_orders"
+        headers = {
+            "Authorization": f"Bearer {token}"
+        }
+        
+        params = {
+            "symbol": symbol,
+            "status": status,
+            "start": start,
+            "end": end,
+            "last_id": last_id,
+            "limit": limit,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = self.session.get(url, headers=headers, params=params)
+        
+        if not response.ok:
+            raise ValueError(f"HTTP {response.status_code}: {response.text}")
+        
+        return response.json()
+    
+    def query_trades(
+        self,
+        token: str,
+        symbol: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        last_id: Optional[int] = None,
+        limit: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Query user trade (fill) history, newest first.
+        
+        Args:
+            token: Authentication token
+            symbol: Trading pair (optional, e.g., "BTC-USD")
+            start: Start time, ISO 8601 (optional)
+            end: End time, ISO 8601 (optional)
+            last_id: Only return trades older than this trade ID (pagination)
+            limit: Results limit (default: 500)
+            
+        Returns:
+            Response dictionary with fields:
+            - page_size: Page size
+            - result: List of trade dictionaries (id, order_id, symbol, side,
+              price, qty, value, fee_qty, fee_asset, pnl, created_at)
+            - total: Total number of trades
+            
+        Raises:
+            ValueError: If request fails
+        """
+        url = f"{self.base_url}/api/query_trades"
+        headers = {
+            "Authorization": f"Bearer {token}"
+        }
+        
+        params = {
+            "symbol": symbol,
+            "start": start,
+            "end": end,
+            "last_id": last_id,
+            "limit": limit,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -379,7 +539,7 @@ class StandXPerpHTTP:
         sign_headers = auth.sign_request(payload_str, request_id, timestamp)
         headers.update(sign_headers)
         
-        response = requests.post(url, headers=headers, data=payload_str)
+        response = self.session.post(url, headers=headers, data=payload_str)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
@@ -423,7 +583,7 @@ class StandXPerpHTTP:
         if symbol:
             params["symbol"] = symbol
         
-        response = requests.get(url, headers=headers, params=params)
+        response = self.session.get(url, headers=headers, params=params)
         
         if not response.ok:
             raise ValueError(f"HTTP {response.status_code}: {response.text}")
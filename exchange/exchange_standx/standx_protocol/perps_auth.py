@@ -44,13 +44,15 @@ class LoginResponse:
 class StandXAuth:
     """StandX Authentication Client"""
     
-    def __init__(self, private_key: Optional[bytes] = None):
+    def __init__(self, private_key: Optional[bytes] = None, session: Optional[requests.Session] = None):
         """
         Initialize StandXAuth instance.
         
         Args:
             private_key: Optional 32-byte private key. If None, generates a new key pair.
+            session: Optional requests.Session to send requests with (default: a new Session)
         """
+        self.session = session or requests.Session()
         if private_key:
             if len(private_key) != 32:
                 raise ValueError("Private key must be 32 bytes")
@@ -111,7 +113,7 @@ class StandXAuth:
             "requestId": self.request_id
         }
         
-        response = requests.post(
+        response = self.session.post(
             url,
             json=data,
             headers={"Content-Type": "application/json"}
@@ -156,7 +158,7 @@ class StandXAuth:
             "expiresSeconds": expires_seconds
         }
         
-        response = requests.post(
+        response = self.session.post(
             url,
             json=data,
             headers={"Content-Type": "application/json"}
@@ -6,72 +6,228 @@ from typing import Dict, Any, Optional, Callable, List
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+# 账户私有频道（认证后推送）：订单状态、成交、持仓、余额每条都不能丢，队列不设上限
+PRIVATE_CHANNELS = frozenset(("order", "trade", "position", "balance"))
+
+
+class _Subscription:
+    """单个 (channel, symbol) 订阅：队列（queue_size 为 0 时无上限）+ 独立的分发任务（按到达顺序依次调用回调）"""
+    
+    __slots__ = ("channel", "symbol", "callback", "queue", "task", "delivered", "dropped", "lagging", "errors")
+    
+    def __init__(self, channel: str, symbol: Optional[str], callback: Optional[Callable], queue_size: int):
+        self.channel = channel
+        self.symbol = symbol
+        self.callback = callback
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.dropped = 0
+        self.lagging = 0
+        self.errors = 0
+    
+    def message(self) -> Dict[str, Any]:
+        subscribe = {"channel": self.channel}
+        if self.symbol:
+            subscribe["symbol"] = self.symbol
+        return {"subscribe": subscribe}
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.queue.qsize(),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "lagging": self.lagging,
+            "errors": self.errors,
+        }
+
 
 class StandXMarketStream:
-    """Market Stream - 市场数据流"""
+    """
+    Market Stream - 市场数据流（ws-stream/v1）
+    
+    消息按 (channel, symbol) 路由到对应订阅（没有精确匹配时路由到同频道 symbol=None 的订阅）。
+    每个订阅一个队列和一个分发任务，回调按消息到达顺序依次执行。
+    行情频道的队列有界，回调跟不上时队列满，丢弃最旧的消息（行情只关心最新状态），计入 dropped；
+    账户私有频道（PRIVATE_CHANNELS：order / trade / position / balance）的队列不设上限，从不丢弃，
+    回调跟不上时只会积压（queued）并计入 lagging；
+    消息从收到到开始分发超过 lag_threshold 秒计入 lagging。
+    连接断开后按指数退避自动重连，重新认证并重新订阅；连接满 rotate_after 秒主动重连（服务端 24 小时断开连接）。
     
-    def __init__(self, base_url: str = "wss://perps.standx.com/ws-stream/v1"):
+    Args:
+        base_url: WebSocket 地址
+        queue_size: 每个行情订阅的队列长度（私有频道不受限制）
+        lag_threshold: 分发延迟告警阈值（秒）
+        token_getter: 重新认证时获取最新 JWT 的函数（默认使用上次 authenticate 的 token）
+        reconnect: 断线后是否自动重连
+        reconnect_delay / max_reconnect_delay: 重连退避的初始/最大间隔（秒）
+        rotate_after: 主动轮换连接的时间（秒）
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "wss://perps.standx.com/ws-stream/v1",
+        queue_size: int = 1024,
+        lag_threshold: float = 0.5,
+        token_getter: Optional[Callable[[], Optional[str]]] = None,
+        reconnect: bool = True,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        rotate_after: float = 23.5 * 3600,
+    ):
         self.base_url = base_url
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
-        self.callbacks: Dict[str, Callable] = {}
+        self.subscriptions: Dict[tuple, _Subscription] = {}
         self.connected = False
         self._connect_time: Optional[float] = None  # 记录连接时间，用于 24 小时重连
+        self.queue_size = queue_size
+        self.lag_threshold = lag_threshold
+        self.token_getter = token_getter
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.rotate_after = rotate_after
+        self.received = 0
+        self.unrouted = 0
+        self.reconnects = 0
+        self._token: Optional[str] = None
+        self._auth_streams: Optional[List[Dict[str, str]]] = None
+        self._receiver: Optional[asyncio.Task] = None
+        self._supervisor: Optional[asyncio.Task] = None
+        self._closing = False
     
     async def connect(self):
-        """建立 WebSocket 连接"""
+        """建立 WebSocket 连接（已认证/订阅过时自动重新认证和订阅），并启动断线重连"""
+        self._closing = False
+        await self._open()
+        if self.reconnect and self._supervisor is None:
+            self._supervisor = asyncio.create_task(self._supervise())
+    
+    async def _open(self):
         try:
             # 禁用代理，避免需要 python-socks
             # 启用 websockets 库的自动 ping/pong 处理
             # 服务器每 10 秒发送 ping，客户端自动响应 pong
             # ping_interval=None 表示不主动发送 ping，只响应服务器的 ping
             # ping_timeout 设置为 5 分钟（服务器要求 5 分钟内响应）
-            self.ws = await websockets.connect(
+            ws = await websockets.connect(
                 self.base_url, 
                 proxy=None,
                 ping_interval=None,      # 不主动发送 ping（服务器会发送）
                 ping_timeout=300.0       # 5 分钟超时（服务器要求）
             )
-            self.connected = True
-            self._connect_time = time.time()  # 记录连接时间
-            # 启动消息接收任务
-            asyncio.create_task(self._receive_messages())
         except Exception as e:
             self.connected = False
             raise Exception(f"WebSocket 连接失败: {e}")
+        self.ws = ws
+        self.connected = True
+        self._connect_time = time.time()  # 记录连接时间
+        # 启动消息接收任务
+        self._receiver = asyncio.create_task(self._receive_messages(ws))
+        try:
+            token = self._current_token()
+            if token:
+                await self._send_auth(token, self._auth_streams)
+            for subscription in self.subscriptions.values():
+                await self._send_message(subscription.message())
+        except Exception:
+            await self._drop()
+            raise
+    
+    def _current_token(self) -> Optional[str]:
+        if self._token is None:
+            return None  # 未调用过 authenticate：公共行情不需要认证
+        if self.token_getter is not None:
+            token = self.token_getter()
+            if token:
+                return token
+        return self._token
     
-    async def _receive_messages(self):
-        """接收消息"""
+    async def _receive_messages(self, ws):
+        """接收消息，只解析和入队，不执行回调（回调在各订阅的分发任务中按顺序执行）"""
         try:
-            async for message in self.ws:
+            async for message in ws:
                 try:
-                    data = json.loads(message)
-                    # 异步处理消息，避免阻塞接收循环
-                    asyncio.create_task(self._handle_message(data))
+                    self._route(json.loads(message))
                 except Exception as e:
                     print(f"处理消息错误: {e}")
         except ConnectionClosed:
-            self.connected = False
+            pass
         except Exception as e:
             print(f"接收消息错误: {e}")
-            self.connected = False
+        finally:
+            if ws is self.ws:
+                self.connected = False
     
-    async def _handle_message(self, data: Dict[str, Any]):
-        """处理接收到的消息"""
+    def _route(self, data: Dict[str, Any]):
+        """按 (channel, symbol) 把消息放入对应订阅的队列，行情队列满时丢弃最旧的消息（私有频道队列无上限）"""
+        self.received += 1
         channel = data.get("channel")
-        if channel and channel in self.callbacks:
-            callback = self.callbacks[channel]
-            # 如果回调是协程函数，使用 await；否则直接调用
-            if asyncio.iscoroutinefunction(callback):
-                await callback(data)
-            else:
-                # 在事件循环中执行同步回调，避免阻塞
-                callback(data)
+        symbol = data.get("symbol")
+        if symbol is None and isinstance(data.get("data"), dict):
+            symbol = data["data"].get("symbol")
+        subscription = self.subscriptions.get((channel, symbol)) or self.subscriptions.get((channel, None))
+        if subscription is None or subscription.callback is None:
+            self.unrouted += 1
+            return
+        queue = subscription.queue
+        if queue.full():
+            queue.get_nowait()
+            subscription.dropped += 1
+        queue.put_nowait((asyncio.get_running_loop().time(), data))
     
-    async def authenticate(self, token: str, streams: Optional[List[Dict[str, str]]] = None):
-        """使用 JWT token 认证"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
-        
+    async def _dispatch(self, subscription: _Subscription):
+        """按顺序执行单个订阅的回调"""
+        loop = asyncio.get_running_loop()
+        while True:
+            received_at, data = await subscription.queue.get()
+            if loop.time() - received_at > self.lag_threshold:
+                subscription.lagging += 1
+            try:
+                # 如果回调是协程函数，使用 await；否则直接调用
+                if asyncio.iscoroutinefunction(subscription.callback):
+                    await subscription.callback(data)
+                else:
+                    subscription.callback(data)
+                subscription.delivered += 1
+            except Exception as e:
+                subscription.errors += 1
+                print(f"[StandX] 行情回调错误 {subscription.channel}/{subscription.symbol}: {e}")
+    
+    async def _supervise(self):
+        """断线重连（指数退避）与定时轮换"""
+        delay = self.reconnect_delay
+        while not self._closing:
+            await asyncio.sleep(min(1.0, delay))
+            if self.connected:
+                delay = self.reconnect_delay
+                age = time.time() - (self._connect_time or time.time())
+                if age < self.rotate_after:
+                    continue
+                print(f"[StandX] 行情流已连接 {age / 3600:.1f} 小时，主动轮换连接")
+                await self._drop()
+            try:
+                await self._open()
+                self.reconnects += 1
+                print(f"[StandX] 行情流已重连（第 {self.reconnects} 次），已恢复 {len(self.subscriptions)} 个订阅")
+                delay = self.reconnect_delay
+            except Exception as e:
+                print(f"[StandX] 行情流重连失败，{delay:.0f} 秒后重试: {e}")
+                await self._drop()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+    
+    async def _drop(self):
+        """关闭当前连接（不停止重连）"""
+        ws, self.ws = self.ws, None
+        self.connected = False
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+    
+    async def _send_auth(self, token: str, streams: Optional[List[Dict[str, str]]]):
         auth_msg = {
             "auth": {
                 "token": token
@@ -81,21 +237,58 @@ class StandXMarketStream:
         if streams:
             auth_msg["auth"]["streams"] = streams
         
-        await self.ws.send(json.dumps(auth_msg))
+        await self._send_message(auth_msg)
+    
+    async def authenticate(self, token: str, streams: Optional[List[Dict[str, str]]] = None):
+        """使用 JWT token 认证（断线重连后会自动用最新 token 重新认证）"""
+        if not self.connected or not self.ws:
+            raise Exception("WebSocket 未连接")
+        self._token = token
+        self._auth_streams = streams
+        await self._send_auth(token, streams)
     
     async def subscribe(self, channel: str, symbol: Optional[str] = None, callback: Optional[Callable] = None):
-        """订阅频道"""
+        """订阅频道（断线重连后自动重新订阅）；同一 (channel, symbol) 重复订阅时替换回调"""
         if not self.connected or not self.ws:
             raise Exception("WebSocket 未连接")
         
-        subscribe_msg = {"subscribe": {"channel": channel}}
-        if symbol:
-            subscribe_msg["subscribe"]["symbol"] = symbol
+        key = (channel, symbol or None)
+        subscription = self.subscriptions.get(key)
+        if subscription is None:
+            queue_size = 0 if channel in PRIVATE_CHANNELS else self.queue_size
+            subscription = _Subscription(channel, symbol or None, callback, queue_size)
+            subscription.task = asyncio.create_task(self._dispatch(subscription))
+            self.subscriptions[key] = subscription
+        elif callback is not None:
+            subscription.callback = callback
         
-        await self._send_message(subscribe_msg)
-        
-        if callback:
-            self.callbacks[channel] = callback
+        await self._send_message(subscription.message())
+    
+    async def unsubscribe(self, channel: str, symbol: Optional[str] = None):
+        """取消订阅并停止对应的分发任务"""
+        subscription = self.subscriptions.pop((channel, symbol or None), None)
+        if subscription is None:
+            return
+        subscription.task.cancel()
+        if self.connected and self.ws:
+            unsubscribe = subscription.message()["subscribe"]
+            await self._send_message({"unsubscribe": unsubscribe})
+    
+    def stats(self) -> Dict[str, Any]:
+        """计数器：收到 / 未路由 / 重连次数，以及各订阅的排队、分发、丢弃、延迟和回调错误数"""
+        subscriptions = {
+            f"{channel}:{symbol}" if symbol else channel: subscription.stats()
+            for (channel, symbol), subscription in self.subscriptions.items()
+        }
+        return {
+            "connected": self.connected,
+            "received": self.received,
+            "unrouted": self.unrouted,
+            "reconnects": self.reconnects,
+            "dropped": sum(s["dropped"] for s in subscriptions.values()),
+            "lagging": sum(s["lagging"] for s in subscriptions.values()),
+            "subscriptions": subscriptions,
+        }
     
     async def _send_message(self, message: Dict[str, Any]):
         """发送消息"""
@@ -103,17 +296,69 @@ class StandXMarketStream:
             await self.ws.send(json.dumps(message))
     
     async def close(self):
-        """关闭连接"""
-        if self.ws:
-            await self.ws.close()
-            self.connected = False
-            self._connect_time = None
+        """关闭连接，停止重连和所有分发任务"""
+        self._closing = True
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            self._supervisor = None
+        for subscription in self.subscriptions.values():
+            subscription.task.cancel()
+        self.subscriptions.clear()
+        await self._drop()
+        self._connect_time = None
+
+
+class StandXRpcError(Exception):
+    """订单流请求被服务端拒绝（响应 code != 0）"""
+    
+    def __init__(self, response: Dict[str, Any]):
+        self.code = response.get("code")
+        self.message = response.get("message", "")
+        self.request_id = response.get("request_id")
+        self.response = response
+        super().__init__(f"code={self.code} message={self.message} request_id={self.request_id}")
+
+
+class StandXRpcUnavailable(Exception):
+    """订单流不可用：未连接、连接断开或在途请求数已满，请求未送达或结果未知"""
+
+
+class StandXRpcTimeout(StandXRpcUnavailable):
+    """截止时间内未收到响应，请求可能已被执行"""
 
 
 class StandXOrderStream:
-    """Order Response Stream - 订单响应流"""
+    """
+    Order Response Stream - 订单响应流（ws-api/v1 上的请求/响应 RPC）
+    
+    每个请求以 request_id 对应一个 Future，在截止时间内等待响应；
+    在途请求数由信号量限制，满时等待空位（同样受截止时间约束）。
+    连接断开时所有在途请求立即失败（StandXRpcUnavailable），后台按指数退避重连并重新登录；
+    连接满 rotate_after 秒且没有在途请求时主动重连（服务端 24 小时断开连接）。
+    
+    Args:
+        base_url: WebSocket 地址
+        timeout: 请求默认超时（秒）
+        max_in_flight: 最大在途请求数
+        token_getter: 重新登录时获取最新 JWT 的函数（默认使用上次 login 的 token）
+        reconnect: 断线后是否自动重连
+        reconnect_delay / max_reconnect_delay: 重连退避的初始/最大间隔（秒）
+        rotate_after: 主动轮换连接的时间（秒）
+        on_message: 非请求响应消息（服务端推送）的回调
+    """
     
-    def __init__(self, base_url: str = "wss://perps.standx.com/ws-api/v1"):
+    def __init__(
+        self,
+        base_url: str = "wss://perps.standx.com/ws-api/v1",
+        timeout: float = 5.0,
+        max_in_flight: int = 64,
+        token_getter: Optional[Callable[[], Optional[str]]] = None,
+        reconnect: bool = True,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        rotate_after: float = 23.5 * 3600,
+        on_message: Optional[Callable] = None,
+    ):
         self.base_url = base_url
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.session_id = str(uuid.uuid4())
@@ -121,9 +366,38 @@ class StandXOrderStream:
         self.connected = False
         self.auth: Optional[Any] = None  # StandXAuth 实例，用于签名
         self._connect_time: Optional[float] = None  # 记录连接时间，用于 24 小时重连
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.token_getter = token_getter
+        self.reconnect = reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.rotate_after = rotate_after
+        self.on_message = on_message
+        self.reconnects = 0
+        self._token: Optional[str] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._ready: Optional[asyncio.Event] = None  # 已连接（且已登录）
+        self._receiver: Optional[asyncio.Task] = None
+        self._supervisor: Optional[asyncio.Task] = None
+        self._closing = False
+    
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
     
     async def connect(self):
-        """建立 WebSocket 连接"""
+        """建立 WebSocket 连接（已 login 过时自动重新登录），并启动断线重连"""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._closing = False
+        await self._open()
+        if self.reconnect and self._supervisor is None:
+            self._supervisor = asyncio.create_task(self._supervise())
+    
+    async def _open(self):
         try:
             # 禁用代理，避免需要 python-socks
             # 启用 websockets 库的自动 ping/pong 处理
@@ -136,60 +410,214 @@ class StandXOrderStream:
                 ping_interval=None,      # 不主动发送 ping（服务器会发送）
                 ping_timeout=300.0       # 5 分钟超时（服务器要求）
             )
-            self.connected = True
-            self._connect_time = time.time()  # 记录连接时间
-            # 启动消息接收任务
-            asyncio.create_task(self._receive_messages())
         except Exception as e:
             self.connected = False
             raise Exception(f"WebSocket 连接失败: {e}")
+        self.connected = True
+        self._connect_time = time.time()  # 记录连接时间
+        # 启动消息接收任务
+        self._receiver = asyncio.create_task(self._receive_messages(self.ws))
+        token = self._current_token()
+        if token:
+            try:
+                await self._login(token, self.timeout)
+            except Exception:
+                await self._drop()
+                raise
+        self._ready.set()
     
-    async def _receive_messages(self):
-        """接收消息"""
+    def _current_token(self) -> Optional[str]:
+        if self.token_getter is not None:
+            token = self.token_getter()
+            if token:
+                return token
+        return self._token
+    
+    async def _receive_messages(self, ws):
+        """接收消息，按 request_id 完成对应的 Future（在接收循环内同步完成，保持响应顺序）"""
         try:
-            async for message in self.ws:
+            async for message in ws:
                 try:
                     data = json.loads(message)
-                    # 异步处理消息，避免阻塞接收循环
-                    asyncio.create_task(self._handle_message(data))
+                    await self._handle_message(data)
                 except Exception as e:
                     print(f"处理消息错误: {e}")
         except ConnectionClosed:
-            self.connected = False
+            pass
         except Exception as e:
             print(f"接收消息错误: {e}")
-            self.connected = False
+        finally:
+            if ws is self.ws:
+                self._on_disconnect(StandXRpcUnavailable("订单流连接已断开"))
     
     async def _handle_message(self, data: Dict[str, Any]):
         """处理接收到的消息"""
         request_id = data.get("request_id")
-        if request_id and request_id in self.callbacks:
-            callback = self.callbacks[request_id]
+        future = self._pending.pop(request_id, None) if request_id else None
+        if future is not None and not future.done():
+            if data.get("code", 0) == 0:
+                future.set_result(data)
+            else:
+                future.set_exception(StandXRpcError(data))
+        callback = self.callbacks.pop(request_id, None) if request_id else None
+        if callback is not None:
             # 如果回调是协程函数，使用 await；否则直接调用
             if asyncio.iscoroutinefunction(callback):
                 await callback(data)
             else:
                 callback(data)
-            # 一次性回调，处理完后删除
-            del self.callbacks[request_id]
+        elif future is None and self.on_message is not None:
+            if asyncio.iscoroutinefunction(self.on_message):
+                await self.on_message(data)
+            else:
+                self.on_message(data)
     
-    async def login(self, token: str, callback: Optional[Callable] = None):
-        """使用 JWT token 登录"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
+    def _on_disconnect(self, exc: Exception):
+        """标记断开，让所有在途请求立即失败"""
+        self.connected = False
+        if self._ready is not None:
+            self._ready.clear()
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+    
+    async def _supervise(self):
+        """断线重连（指数退避）与定时轮换"""
+        delay = self.reconnect_delay
+        while not self._closing:
+            await asyncio.sleep(min(1.0, delay))
+            if self.connected:
+                delay = self.reconnect_delay
+                age = time.time() - (self._connect_time or time.time())
+                if age < self.rotate_after or self._pending:
+                    continue
+                print(f"[StandX] 订单流已连接 {age / 3600:.1f} 小时，主动轮换连接")
+                await self._drop()
+            try:
+                await self._open()
+                self.reconnects += 1
+                print(f"[StandX] 订单流已重连（第 {self.reconnects} 次）")
+                delay = self.reconnect_delay
+            except Exception as e:
+                print(f"[StandX] 订单流重连失败，{delay:.0f} 秒后重试: {e}")
+                await self._drop()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+    
+    async def _drop(self):
+        """关闭当前连接（不停止重连）"""
+        ws, self.ws = self.ws, None
+        self._on_disconnect(StandXRpcUnavailable("订单流连接已关闭"))
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+    
+    async def request(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        signed: bool = True,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable] = None,
+    ) -> Dict[str, Any]:
+        """
+        发送请求并等待响应
         
+        Args:
+            method: 如 "order:new"、"order:cancel"、"auth:login"
+            params: 请求参数
+            signed: 是否用 StandXAuth 签名
+            timeout: 截止时间（秒，含等待在途空位和重连），默认使用 self.timeout
+            callback: 收到响应时额外调用的回调（兼容旧接口）
+            
+        Returns:
+            响应（code == 0）
+            
+        Raises:
+            StandXRpcError: 服务端拒绝
+            StandXRpcTimeout: 截止时间内未收到响应（请求可能已被执行）
+            StandXRpcUnavailable: 未连接 / 连接断开 / 在途请求已满
+        """
+        if self._ready is None:
+            raise StandXRpcUnavailable("WebSocket 未连接")
+        if signed and not self.auth:
+            raise Exception("需要 StandXAuth 实例进行请求签名")
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise StandXRpcUnavailable(f"在途请求已满（{self.max_in_flight}）")
+        try:
+            if not self._ready.is_set():
+                # 重连中：在截止时间内等待连接恢复
+                try:
+                    await asyncio.wait_for(self._ready.wait(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    raise StandXRpcUnavailable("WebSocket 未连接")
+            return await self._send_request(method, params, signed, deadline, callback)
+        finally:
+            self._slots.release()
+    
+    async def _send_request(self, method, params, signed, deadline, callback=None) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        params_str = json.dumps(params)
         request_id = str(uuid.uuid4())
         message = {
             "session_id": self.session_id,
             "request_id": request_id,
-            "method": "auth:login",
-            "params": json.dumps({"token": token})
+            "method": method,
+            "params": params_str,
         }
+        if signed:
+            # 生成签名头
+            sign_headers = self.auth.sign_request(params_str, request_id, int(time.time()))
+            message["header"] = {
+                "x-request-id": sign_headers["x-request-id"],
+                "x-request-timestamp": sign_headers["x-request-timestamp"],
+                "x-request-signature": sign_headers["x-request-signature"]
+            }
         
+        future = loop.create_future()
+        self._pending[request_id] = future
         if callback:
             self.callbacks[request_id] = callback
-        
-        await self.ws.send(json.dumps(message))
+        try:
+            try:
+                await self.ws.send(json.dumps(message))
+            except Exception as e:
+                raise StandXRpcUnavailable(f"发送失败: {e}")
+            try:
+                return await asyncio.wait_for(future, max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                raise StandXRpcTimeout(f"{method} 请求 {request_id} 超时未响应")
+        finally:
+            self._pending.pop(request_id, None)
+            self.callbacks.pop(request_id, None)
+    
+    async def _login(self, token: str, timeout: Optional[float]) -> Dict[str, Any]:
+        return await self._send_request(
+            "auth:login", {"token": token}, False,
+            asyncio.get_running_loop().time() + (self.timeout if timeout is None else timeout),
+        )
+    
+    async def login(self, token: str, callback: Optional[Callable] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """使用 JWT token 登录（断线重连后会自动用最新 token 重新登录）"""
+        if not self.connected or not self.ws:
+            raise Exception("WebSocket 未连接")
+        self._token = token
+        response = await self._login(token, timeout)
+        if callback:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(response)
+            else:
+                callback(response)
+        return response
     
     async def new_order(
         self,
@@ -201,15 +629,10 @@ class StandXOrderStream:
         reduce_only: bool,
         price: Optional[str] = None,
         cl_ord_id: Optional[str] = None,
-        callback: Optional[Callable] = None
-    ):
-        """创建新订单"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
-        
-        if not self.auth:
-            raise Exception("需要 StandXAuth 实例进行请求签名")
-        
+        callback: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """创建新订单，返回服务端响应（见 request）"""
         # 构建订单参数
         params = {
             "symbol": symbol,
@@ -225,43 +648,16 @@ class StandXOrderStream:
         if cl_ord_id:
             params["cl_ord_id"] = cl_ord_id
         
-        params_str = json.dumps(params)
-        request_id = str(uuid.uuid4())
-        timestamp = int(time.time())
-        
-        # 生成签名头
-        sign_headers = self.auth.sign_request(params_str, request_id, timestamp)
-        
-        message = {
-            "session_id": self.session_id,
-            "request_id": request_id,
-            "method": "order:new",
-            "header": {
-                "x-request-id": sign_headers["x-request-id"],
-                "x-request-timestamp": sign_headers["x-request-timestamp"],
-                "x-request-signature": sign_headers["x-request-signature"]
-            },
-            "params": params_str
-        }
-        
-        if callback:
-            self.callbacks[request_id] = callback
-        
-        await self.ws.send(json.dumps(message))
+        return await self.request("order:new", params, timeout=timeout, callback=callback)
     
     async def cancel_order(
         self,
         order_id_list: Optional[List[int]] = None,
         cl_ord_id_list: Optional[List[str]] = None,
-        callback: Optional[Callable] = None
-    ):
-        """取消订单"""
-        if not self.connected or not self.ws:
-            raise Exception("WebSocket 未连接")
-        
-        if not self.auth:
-            raise Exception("需要 StandXAuth 实例进行请求签名")
-        
+        callback: Optional[Callable] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """取消订单，返回服务端响应（见 request）"""
         if not order_id_list and not cl_ord_id_list:
             raise ValueError("必须提供 order_id_list 或 cl_ord_id_list")
         
@@ -271,33 +667,13 @@ class StandXOrderStream:
         if cl_ord_id_list:
             params["cl_ord_id_list"] = cl_ord_id_list
         
-        params_str = json.dumps(params)
-        request_id = str(uuid.uuid4())
-        timestamp = int(time.time())
-        
-        # 生成签名头
-        sign_headers = self.auth.sign_request(params_str, request_id, timestamp)
-        
-        message = {
-            "session_id": self.session_id,
-            "request_id": request_id,
-            "method": "order:cancel",
-            "header": {
-                "x-request-id": sign_headers["x-request-id"],
-                "x-request-timestamp": sign_headers["x-request-timestamp"],
-                "x-request-signature": sign_headers["x-request-signature"]
-            },
-            "params": params_str
-        }
-        
-        if callback:
-            self.callbacks[request_id] = callback
-        
-        await self.ws.send(json.dumps(message))
+        return await self.request("order:cancel", params, timeout=timeout, callback=callback)
     
     async def close(self):
-        """关闭连接"""
-        if self.ws:
-            await self.ws.close()
-            self.connected = False
-            self._connect_time = None
\ No newline at end of file
+        """关闭连接并停止重连"""
+        self._closing = True
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            self._supervisor = None
+        await self._drop()
+        self._connect_time = None
@@ -7,9 +7,9 @@ import sys
 import time
 import random
 import re
+import asyncio
 from pathlib import Path
 from typing import Optional, Tuple, Dict, List
-from playwright.sync_api import sync_playwright
 import requests
 import yaml
 
@@ -20,7 +20,10 @@ script_dir = Path(__file__).parent
 project_root = script_dir.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
+if str(script_dir.parent) not in sys.path:
+    sys.path.insert(0, str(script_dir.parent))
 from adapters import create_adapter
+from profile_orchestrator import HedgeLeg, ProfileOrchestrator
 
 def build_target_url(config: dict) -> str | None:
     """构建目标URL"""
@@ -99,7 +102,7 @@ def get_base_currency_from_pair(trading_pair: str) -> str:
         return trading_pair.split("-")[0].strip()
     return trading_pair.strip()
 
-def check_account_position(page, env_id: str, trading_pair: str, max_retries: int = 3, retry_delay: float = 1.0) -> Optional[float]:
+async def check_account_position(page, env_id: str, trading_pair: str, max_retries: int = 3, retry_delay: float = 1.0) -> Optional[float]:
     """
     通过UI检查账户持仓（带重试机制）
     
@@ -122,39 +125,39 @@ def check_account_position(page, env_id: str, trading_pair: str, max_retries: in
             try:
                 # 尝试精确匹配
                 position_button = page.locator('div[data-text^="仓位"]').first
-                if position_button.count() == 0:
+                if await position_button.count() == 0:
                     # 如果精确匹配失败，尝试包含文本的匹配
                     position_button = page.locator('div:has-text("仓位")').first
-                position_button.click(timeout=5000)
-                time.sleep(1)  # 等待仓位列表加载
+                await position_button.click(timeout=5000)
+                await asyncio.sleep(1)  # 等待仓位列表加载
             except Exception as e:
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
                     continue
                 else:
                     print(f"  [{env_id}] 检查持仓失败: {e}")
                     return None
             
             # 查找仓位列表中的所有行
-            rows = page.locator('div.style_tableRow__gbjWO').all()
+            rows = await page.locator('div.style_tableRow__gbjWO').all()
             
             # 遍历行，找到对应的交易对
             for row in rows:
                 try:
                     # 查找交易对名称（在第一列的 div.fx-as-flex-start 中）
                     instrument_cell = row.locator('div.fx-as-flex-start.txt-hover-brand').first
-                    if instrument_cell.count() == 0:
+                    if await instrument_cell.count() == 0:
                         continue
                     
-                    instrument_text = instrument_cell.inner_text(timeout=2000).strip()
+                    instrument_text = (await instrument_cell.inner_text(timeout=2000)).strip()
                     
                     # 检查是否匹配基础货币
                     if instrument_text == base_currency:
                         # 找到对应的交易对，提取持仓数量
                         # 持仓数量在第二列，格式如 "30 XPL"
-                        position_cells = row.locator('div.fx-column.fx-jc-center').all()
+                        position_cells = await row.locator('div.fx-column.fx-jc-center').all()
                         if len(position_cells) >= 2:
-                            position_text = position_cells[1].inner_text(timeout=2000).strip()
+                            position_text = (await position_cells[1].inner_text(timeout=2000)).strip()
                             # 提取数字部分（如 "30 XPL" -> 30）
                             match = re.search(r'([-]?\d+\.?\d*)', position_text)
                             if match:
@@ -168,7 +171,7 @@ def check_account_position(page, env_id: str, trading_pair: str, max_retries: in
             
         except Exception as e:
             if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay)
             else:
                 print(f"  [{env_id}] 检查持仓失败: {e}")
                 return None
@@ -242,112 +245,77 @@ TRADING_AMOUNT = cfg.get("amount", 0.001)
 POSITION_CHECK_INTERVAL = cfg.get("position_check_interval", 3)
 
 
-def start_profile(env_id: str) -> Optional[str]:
-    """启动浏览器配置文件，返回 CDP URL"""
-    try:
-        data = requests.post(f"{API_BASE_URL}/api/env/start", json={"envId": env_id}, timeout=API_TIMEOUT).json()
-        if data.get("code") == 0:
-            return f"http://127.0.0.1:{data['data']['debugPort']}"
-    except Exception:
-        pass
-    return None
-
-
-def open_page(cdp_url: str, target_url: str, playwright):
-    """
-    在浏览器中打开页面，返回 page 对象
-    优先复用已存在的页面，减少重复打开。
-    """
-    browser = playwright.chromium.connect_over_cdp(cdp_url)
-    
-    # 复用已存在的页面（任意 context）
-    for ctx in browser.contexts:
-        for pg in ctx.pages:
-            current_url = pg.url or ""
-            if current_url.startswith(target_url) or target_url in current_url:
-                try:
-                    pg.bring_to_front()
-                except Exception:
-                    pass
-                return pg
-    
-    # 没有可复用页面则创建
-    context = browser.contexts[0] if browser.contexts else browser.new_context()
-    page = context.new_page()
-    page.goto(target_url, wait_until=WAIT_UNTIL, timeout=PAGE_LOAD_TIMEOUT)
-    return page
-
-def click_element(page, text: str):
+async def click_element(page, text: str):
     """点击包含指定文本的元素"""
     try:
-        page.click(f'div[data-text="{text}"]', timeout=5000)
+        await page.click(f'div[data-text="{text}"]', timeout=5000)
         return True
     except Exception:
         return False
 
-def fill_price_input(page, price: float):
+async def fill_price_input(page, price: float):
     """在价格输入框中输入价格，返回实际输入的值"""
     try:
         input_selector = 'input[placeholder="价格"].text-field_input__csqr7'
-        page.fill(input_selector, "", timeout=5000)
+        await page.fill(input_selector, "", timeout=5000)
         price_str = f"{price:.4f}"
-        page.fill(input_selector, price_str, timeout=5000)
-        page.evaluate(f'document.querySelector(\'{input_selector}\')?.blur()')
-        time.sleep(0.5)
-        actual_value = page.input_value(input_selector, timeout=2000)
+        await page.fill(input_selector, price_str, timeout=5000)
+        await page.evaluate(f'document.querySelector(\'{input_selector}\')?.blur()')
+        await asyncio.sleep(0.5)
+        actual_value = await page.input_value(input_selector, timeout=2000)
         return actual_value
     except Exception:
         return None
 
-def fill_amount_input(page, amount: float):
+async def fill_amount_input(page, amount: float):
     """在数量输入框中输入数量，返回实际输入的值"""
     try:
         input_selector = 'input[placeholder="数量"].text-field_input__csqr7'
-        page.fill(input_selector, "", timeout=5000)
+        await page.fill(input_selector, "", timeout=5000)
         amount_str = f"{amount:.6f}".rstrip('0').rstrip('.')
-        page.fill(input_selector, amount_str, timeout=5000)
-        page.evaluate(f'document.querySelector(\'{input_selector}\')?.blur()')
-        time.sleep(0.5)
-        actual_value = page.input_value(input_selector, timeout=2000)
+        await page.fill(input_selector, amount_str, timeout=5000)
+        await page.evaluate(f'document.querySelector(\'{input_selector}\')?.blur()')
+        await asyncio.sleep(0.5)
+        actual_value = await page.input_value(input_selector, timeout=2000)
         return actual_value
     except Exception:
         return None
 
-def click_buy_button(page):
+async def click_buy_button(page):
     """点击做多按钮（买入 / 做多）"""
     try:
         button_selector = 'button:has-text("买入 / 做多")'
-        page.click(button_selector, timeout=5000)
-        time.sleep(0.5)
+        await page.click(button_selector, timeout=5000)
+        await asyncio.sleep(0.5)
         return True
     except Exception:
         return False
 
-def click_sell_button(page):
+async def click_sell_button(page):
     """点击做空按钮（卖出 / 做空）"""
     try:
         button_selector = 'button:has-text("卖出 / 做空")'
-        page.click(button_selector, timeout=5000)
-        time.sleep(0.5)
+        await page.click(button_selector, timeout=5000)
+        await asyncio.sleep(0.5)
         return True
     except Exception:
         return False
 
-def click_open_orders_button(page):
+async def click_open_orders_button(page):
     """点击未成交订单按钮"""
     try:
         # 匹配 data-text 属性，可能包含数字如 "未成交订单（ 1 ）"
         open_orders_button = page.locator('div[data-text^="未成交订单"]').first
-        if open_orders_button.count() == 0:
+        if await open_orders_button.count() == 0:
             # 如果精确匹配失败，尝试包含文本的匹配
             open_orders_button = page.locator('div:has-text("未成交订单")').first
-        open_orders_button.click(timeout=5000)
-        time.sleep(1)  # 等待订单列表加载
+        await open_orders_button.click(timeout=5000)
+        await asyncio.sleep(1)  # 等待订单列表加载
         return True
     except Exception:
         return False
 
-def cancel_all_open_orders(page, env_id: str) -> bool:
+async def cancel_all_open_orders(page, env_id: str) -> bool:
     """
     取消所有未成交订单
     
@@ -360,24 +328,24 @@ def cancel_all_open_orders(page, env_id: str) -> bool:
     """
     try:
         # 点击未成交订单按钮
-        if not click_open_orders_button(page):
+        if not await click_open_orders_button(page):
             return False
         
         # 等待订单列表加载
-        time.sleep(1)
+        await asyncio.sleep(1)
         
         # 更精确地查找未成交订单表格中的取消按钮
         # 使用 data-sentry-source-file="row.tsx" 来确保只找到订单行中的取消按钮
-        cancel_buttons = page.locator('button[data-sentry-source-file="row.tsx"]:has-text("取消")').all()
+        cancel_buttons = await page.locator('button[data-sentry-source-file="row.tsx"]:has-text("取消")').all()
         canceled_count = 0
         
         for cancel_button in cancel_buttons:
             try:
                 # 检查按钮是否可见和可点击
-                if cancel_button.is_visible(timeout=1000):
-                    cancel_button.click(timeout=3000)
+                if await cancel_button.is_visible(timeout=1000):
+                    await cancel_button.click(timeout=3000)
                     canceled_count += 1
-                    time.sleep(0.3)  # 每次点击后稍作等待
+                    await asyncio.sleep(0.3)  # 每次点击后稍作等待
             except Exception:
                 continue
         
@@ -389,9 +357,9 @@ def cancel_all_open_orders(page, env_id: str) -> bool:
         print(f"  [{env_id}] 取消未成交订单失败: {e}")
         return False
 
-def place_limit_order(page, env_id: str, side: str, trading_pair: str, price_offset: float, amount: float) -> bool:
+async def prepare_limit_order(page, env_id: str, side: str, trading_pair: str, price_offset: float, amount: float) -> bool:
     """
-    下限价单
+    填写限价单表单（不提交）
     
     Args:
         page: Playwright页面对象
@@ -406,11 +374,11 @@ def place_limit_order(page, env_id: str, side: str, trading_pair: str, price_off
     """
     try:
         # 点击限价按钮
-        if not click_element(page, "限价"):
+        if not await click_element(page, "限价"):
             return False
         
-        # 获取价格并输入
-        best_bid, best_ask = get_best_prices(trading_pair)
+        # 获取价格并输入（adapter 是同步接口，放到线程里避免阻塞其他环境）
+        best_bid, best_ask = await asyncio.to_thread(get_best_prices, trading_pair)
         if not best_bid or not best_ask:
             return False
         
@@ -420,36 +388,24 @@ def place_limit_order(page, env_id: str, side: str, trading_pair: str, price_off
         else:  # sell
             price = best_ask - price_offset
         
-        actual_price = fill_price_input(page, price)
+        actual_price = await fill_price_input(page, price)
         if not actual_price:
             return False
         
         # 输入数量
-        actual_amount = fill_amount_input(page, amount)
-        if not actual_amount:
-            return False
-        
-        # 点击做多或做空按钮
-        if side == "buy":
-            if click_buy_button(page):
-                return True
-        else:  # sell
-            if click_sell_button(page):
-                return True
-        
-        return False
+        actual_amount = await fill_amount_input(page, amount)
+        return bool(actual_amount)
     except Exception as e:
         print(f"  [{env_id}] 下限价单失败: {e}")
         return False
 
-def place_market_order(page, env_id: str, side: str, amount: float) -> bool:
+async def prepare_market_order(page, env_id: str, amount: float) -> bool:
     """
-    下市价单
+    填写市价单表单（不提交）
     
     Args:
         page: Playwright页面对象
         env_id: 环境ID
-        side: "buy" 或 "sell"（做多或做空）
         amount: 交易数量
     
     Returns:
@@ -457,27 +413,83 @@ def place_market_order(page, env_id: str, side: str, amount: float) -> bool:
     """
     try:
         # 点击市价按钮
-        if not click_element(page, "市价"):
+        if not await click_element(page, "市价"):
             return False
         
         # 输入数量
-        actual_amount = fill_amount_input(page, amount)
-        if not actual_amount:
-            return False
-        
-        # 点击做多或做空按钮
-        if side == "buy":
-            if click_buy_button(page):
-                return True
-        else:  # sell
-            if click_sell_button(page):
-                return True
-        
-        return False
+        actual_amount = await fill_amount_input(page, amount)
+        return bool(actual_amount)
     except Exception as e:
         print(f"  [{env_id}] 下市价单失败: {e}")
         return False
 
+async def submit_order(page, side: str) -> bool:
+    """点击做多或做空按钮提交订单"""
+    if side == "buy":
+        return await click_buy_button(page)
+    return await click_sell_button(page)
+
+async def place_limit_order(page, env_id: str, side: str, trading_pair: str, price_offset: float, amount: float) -> bool:
+    """
+    下限价单
+    
+    Args:
+        page: Playwright页面对象
+        env_id: 环境ID
+        side: "buy" 或 "sell"（做多或做空）
+        trading_pair: 交易对
+        price_offset: 价格偏移量
+        amount: 交易数量
+    
+    Returns:
+        是否成功
+    """
+    if not await prepare_limit_order(page, env_id, side, trading_pair, price_offset, amount):
+        return False
+    return await submit_order(page, side)
+
+async def place_market_order(page, env_id: str, side: str, amount: float) -> bool:
+    """
+    下市价单
+    
+    Args:
+        page: Playwright页面对象
+        env_id: 环境ID
+        side: "buy" 或 "sell"（做多或做空）
+        amount: 交易数量
+    
+    Returns:
+        是否成功
+    """
+    if not await prepare_market_order(page, env_id, amount):
+        return False
+    return await submit_order(page, side)
+
+async def place_hedge_pair(orchestrator: ProfileOrchestrator, limit_env_id: str, limit_side: str, market_env_id: str, amount: float):
+    """
+    同时提交一组对冲单：limit_env_id 下限价单，market_env_id 下反方向市价单
+    
+    两个环境先并发填好表单，再同时点击提交。
+    
+    Returns:
+        list[bool] | None: [限价单结果, 市价单结果]；任一表单填写失败时两单都不提交，返回 None
+    """
+    market_side = "sell" if limit_side == "buy" else "buy"
+    limit_page = orchestrator.page(limit_env_id)
+    market_page = orchestrator.page(market_env_id)
+    return await orchestrator.submit_legs([
+        HedgeLeg(
+            limit_env_id,
+            lambda: prepare_limit_order(limit_page, limit_env_id, limit_side, TRADING_PAIR, PRICE_OFFSET, amount),
+            lambda: submit_order(limit_page, limit_side),
+        ),
+        HedgeLeg(
+            market_env_id,
+            lambda: prepare_market_order(market_page, market_env_id, amount),
+            lambda: submit_order(market_page, market_side),
+        ),
+    ])
+
 
 def stop_profile(env_id: str, timeout: int = None):
     """关闭浏览器配置文件"""
@@ -525,111 +537,96 @@ def main():
     
     print(f"打开 {len(ENV_IDS)} 个环境...")
     
-    with sync_playwright() as playwright:
-        opened_profiles = []
-        profile_pages = {}  # 存储环境ID和对应的page对象
-        
-        for env_id in ENV_IDS:
-            cdp_url = start_profile(env_id)
-            if not cdp_url:
-                continue
-            
-            time.sleep(DELAY_AFTER_BROWSER_START)
-            
-            try:
-                page = open_page(cdp_url, TARGET_URL, playwright)
-                opened_profiles.append(env_id)
-                profile_pages[env_id] = page
-                print(f"✓ {env_id}")
-            except Exception:
-                stop_profile(env_id)
-            
-            time.sleep(DELAY_BETWEEN_PROFILES)
+    # 所有环境并发启动和打开页面，共用一个事件循环
+    orchestrator = ProfileOrchestrator(
+        api_base_url=API_BASE_URL,
+        api_timeout=API_TIMEOUT,
+        page_load_timeout=PAGE_LOAD_TIMEOUT,
+        wait_until=WAIT_UNTIL,
+        start_delay=DELAY_AFTER_BROWSER_START,
+        navigate_existing=False,
+    )
+    specs = {env_id: (env_id, TARGET_URL) for env_id in ENV_IDS}
+    profiles = orchestrator.run(orchestrator.open_profiles(specs, stagger=DELAY_BETWEEN_PROFILES))
+    
+    opened_profiles = []
+    for env_id in ENV_IDS:
+        if env_id in profiles:
+            opened_profiles.append(env_id)
+            print(f"✓ {env_id}")
+        else:
+            stop_profile(env_id)
+    
+    if opened_profiles:
+        print(f"\n成功: {len(opened_profiles)}/{len(ENV_IDS)}")
+        print("按 Ctrl+C 退出")
         
-        if opened_profiles:
-            print(f"\n成功: {len(opened_profiles)}/{len(ENV_IDS)}")
-            print("按 Ctrl+C 退出")
+        try:
+            orchestrator.run(trade_loop(orchestrator, opened_profiles))
+        except KeyboardInterrupt:
+            print("\n关闭环境...")
+            # for env_id in opened_profiles:
+            #     stop_profile(env_id, timeout=API_CLOSE_TIMEOUT)
+    else:
+        print("没有成功打开任何环境")
+    
+    orchestrator.close()
+
+
+async def trade_loop(orchestrator: ProfileOrchestrator, opened_profiles: List[str]):
+    """交易主循环：随机两个环境同时下对冲单，每N次循环检查一次持仓"""
+    loop_count = 0  # 循环计数器
+    while True:
+        if len(opened_profiles) >= 2:
+            available = opened_profiles.copy()
+            first_id = random.choice(available)
+            print(f"1环境ID: [{first_id}]")
+            available.remove(first_id)
+            second_id = random.choice(available)
+            print(f"2环境ID: [{second_id}]")
             
-            try:
-                loop_count = 0  # 循环计数器
-                while True:
-                    if len(opened_profiles) >= 2:
-                        available = opened_profiles.copy()
-                        first_id = random.choice(available)
-                        print(f"1环境ID: [{first_id}]")
-                        available.remove(first_id)
-                        second_id = random.choice(available)
-                        print(f"2环境ID: [{second_id}]")
+            if TRADING_PAIR:
+                # 第一个环境限价做多，第二个环境市价做空，两单同时提交
+                await place_hedge_pair(orchestrator, first_id, "buy", second_id, TRADING_AMOUNT)
+            else:
+                # 下市价单做空
+                await orchestrator.run_on(second_id, place_market_order, second_id, "sell", TRADING_AMOUNT)
+        if len(opened_profiles) >= 2 and TRADING_PAIR:
+            # 每N次循环检查一次持仓并处理
+            loop_count += 1
+            if loop_count % POSITION_CHECK_INTERVAL == 0:
+                print(f"\n=== 第 {loop_count // POSITION_CHECK_INTERVAL} 次持仓检查 ===")
+                
+                # 遍历 opened_profiles，实时获取持仓并处理
+                for i, env_id in enumerate(opened_profiles):
+                    # 获取持仓
+                    position = await orchestrator.run_on(env_id, check_account_position, env_id, TRADING_PAIR)
+                    if position is None or abs(position) < 0.0001:
+                        continue
+                    
+                    print(f"  [{env_id}] 当前持仓: {position:.4f}")
+                    
+                    abs_position = abs(position)
+                    is_last = (i == len(opened_profiles) - 1)
+                    # 持仓为正：当前限价空单；持仓为负：当前限价多单
+                    side = "sell" if position > 0 else "buy"
+                    
+                    if is_last:
+                        # 最后一个环境：取消未成交订单后限价平仓
+                        await orchestrator.run_on(env_id, cancel_all_open_orders, env_id)
+                        await asyncio.sleep(1)
                         
-                        # 点击元素并操作
-                        if first_id in profile_pages and TRADING_PAIR:
-                            page1 = profile_pages[first_id]
-                            # 下限价单做多
-                            place_limit_order(page1, first_id, "buy", TRADING_PAIR, PRICE_OFFSET, TRADING_AMOUNT)
+                        print(f"  [{env_id}] 最后环境，限价平仓: {'卖出' if position > 0 else '买入'} {abs_position:.4f}")
+                        await orchestrator.run_on(env_id, place_limit_order, env_id, side, TRADING_PAIR, PRICE_OFFSET, abs_position)
+                    else:
+                        # 非最后环境：当前环境限价单，下一个环境反方向市价单，两单同时提交
+                        next_env_id = opened_profiles[i + 1]
+                        print(f"  [{env_id}] 限价{'空' if position > 0 else '多'}单 / [{next_env_id}] 市价{'多' if position > 0 else '空'}单: {abs_position:.4f}")
+                        await place_hedge_pair(orchestrator, env_id, side, next_env_id, abs_position)
                         
-                        if second_id in profile_pages:
-                            page2 = profile_pages[second_id]
-                            # 下市价单做空
-                            place_market_order(page2, second_id, "sell", TRADING_AMOUNT)
-                    if len(opened_profiles) >= 2 and TRADING_PAIR:
-                        # 每N次循环检查一次持仓并处理
-                        loop_count += 1
-                        if loop_count % POSITION_CHECK_INTERVAL == 0:
-                            print(f"\n=== 第 {loop_count // POSITION_CHECK_INTERVAL} 次持仓检查 ===")
-                            
-                            # 遍历 opened_profiles，实时获取持仓并处理
-                            for i, env_id in enumerate(opened_profiles):
-                                page = profile_pages.get(env_id)
-                                if not page:
-                                    continue
-                                
-                                # 获取持仓
-                                position = check_account_position(page, env_id, TRADING_PAIR)
-                                if position is None or abs(position) < 0.0001:
-                                    continue
-                                
-                                print(f"  [{env_id}] 当前持仓: {position:.4f}")
-                                
-                                abs_position = abs(position)
-                                is_last = (i == len(opened_profiles) - 1)
-                                
-                                if is_last:
-                                    # 最后一个环境：取消未成交订单后限价平仓
-                                    cancel_all_open_orders(page, env_id)
-                                    time.sleep(1)
-                                    
-                                    side = "sell" if position > 0 else "buy"
-                                    print(f"  [{env_id}] 最后环境，限价平仓: {'卖出' if position > 0 else '买入'} {abs_position:.4f}")
-                                    place_limit_order(page, env_id, side, TRADING_PAIR, PRICE_OFFSET, abs_position)
-                                else:
-                                    # 非最后环境：当前环境限价单，下一个环境市价单
-                                    next_env_id = opened_profiles[i + 1]
-                                    next_page = profile_pages.get(next_env_id)
-                                    if not next_page:
-                                        continue
-                                    
-                                    if position > 0:
-                                        # 持仓为正：当前限价空单，下一个市价多单
-                                        print(f"  [{env_id}] 限价空单: {abs_position:.4f}")
-                                        place_limit_order(page, env_id, "sell", TRADING_PAIR, PRICE_OFFSET, abs_position)
-                                        print(f"  [{next_env_id}] 市价多单: {abs_position:.4f}")
-                                        place_market_order(next_page, next_env_id, "buy", abs_position)
-                                    else:
-                                        # 持仓为负：当前限价多单，下一个市价空单
-                                        print(f"  [{env_id}] 限价多单: {abs_position:.4f}")
-                                        place_limit_order(page, env_id, "buy", TRADING_PAIR, PRICE_OFFSET, abs_position)
-                                        print(f"  [{next_env_id}] 市价空单: {abs_position:.4f}")
-                                        place_market_order(next_page, next_env_id, "sell", abs_position)
-                                    
-                                    time.sleep(1)
-                    
-                    time.sleep(10)
-            except KeyboardInterrupt:
-                print("\n关闭环境...")
-                # for env_id in opened_profiles:
-                #     stop_profile(env_id, timeout=API_CLOSE_TIMEOUT)
-        else:
-            print("没有成功打开任何环境")
+                        await asyncio.sleep(1)
+        
+        await asyncio.sleep(10)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,141 @@
+"""
+Nado 成交检测（基于 nado_protocol API）
+
+通过 indexer 的 matches 和 engine 的 subaccount_info 判断订单成交与持仓，
+替代从页面抓取持仓文本再用正则解析的方式。
+"""
+
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+nado_sdk_path = os.path.join(project_root, 'exchange', 'exchange_nado')
+if nado_sdk_path not in sys.path:
+    sys.path.insert(0, nado_sdk_path)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from nado_protocol.engine_client import EngineClientOpts, EngineQueryClient
+from nado_protocol.indexer_client import IndexerClientOpts, IndexerQueryClient
+from nado_protocol.indexer_client.types.query import IndexerMatchesParams
+from nado_protocol.utils.backend import NadoBackendURL
+from nado_protocol.utils.bytes32 import subaccount_to_hex
+from nado_protocol.utils.math import from_x18
+
+from adapters.transport import get_default_transport
+
+
+class NadoFill:
+    """单笔成交"""
+
+    def __init__(self, submission_idx, product_id, digest, base_filled, quote_filled, fee, timestamp=None):
+        self.submission_idx = submission_idx
+        self.product_id = product_id
+        self.digest = digest
+        self.base_filled = base_filled  # 带符号，正数为买入
+        self.quote_filled = quote_filled
+        self.fee = fee
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"NadoFill(idx={self.submission_idx}, product={self.product_id}, base={self.base_filled})"
+
+
+class NadoFillWatcher:
+    """
+    Nado 账户成交监听器
+
+    Args:
+        address: 钱包地址
+        subaccount_name: 子账户名，默认 "default"
+        gateway_url: engine 网关地址
+        indexer_url: indexer 地址
+    """
+
+    def __init__(
+        self,
+        address,
+        subaccount_name="default",
+        gateway_url=NadoBackendURL.MAINNET_GATEWAY.value,
+        indexer_url=NadoBackendURL.MAINNET_INDEXER.value,
+    ):
+        self.subaccount = subaccount_to_hex(address, subaccount_name)
+        # 只读查询：使用共享传输层的查询 Session（429/5xx 自动重试）
+        session = get_default_transport().session(query=True)
+        self.engine = EngineQueryClient(EngineClientOpts(url=gateway_url), session=session)
+        self.indexer = IndexerQueryClient(IndexerClientOpts(url=indexer_url), session=session)
+
+    def get_position(self, product_id):
+        """
+        获取永续持仓数量（带符号，正数做多，负数做空）
+
+        Returns:
+            float: 持仓数量，无持仓返回 0.0
+        """
+        info = self.engine.get_subaccount_info(self.subaccount)
+        for perp_balance in info.perp_balances:
+            if perp_balance.product_id == product_id:
+                return from_x18(int(perp_balance.balance.amount))
+        return 0.0
+
+    def get_recent_fills(self, product_id, limit=20):
+        """获取最近的成交（按 submission_idx 从新到旧）"""
+        data = self.indexer.get_matches(
+            IndexerMatchesParams(
+                subaccounts=[self.subaccount],
+                product_ids=[product_id],
+                limit=limit,
+            )
+        )
+        fills = []
+        for match in data.matches:
+            fills.append(
+                NadoFill(
+                    submission_idx=int(match.submission_idx),
+                    product_id=product_id,
+                    digest=match.digest,
+                    base_filled=from_x18(int(match.base_filled)),
+                    quote_filled=from_x18(int(match.quote_filled)),
+                    fee=from_x18(int(match.fee)),
+                    timestamp=match.timestamp,
+                )
+            )
+        return fills
+
+    def last_fill_idx(self, product_id):
+        """最近一笔成交的 submission_idx，作为等待新成交的基准；没有成交返回 0"""
+        fills = self.get_recent_fills(product_id, limit=1)
+        return fills[0].submission_idx if fills else 0
+
+    def wait_for_fill(self, product_id, since_idx, timeout=30, poll_interval=0.25):
+        """
+        等待 since_idx 之后的新成交
+
+        Args:
+            product_id: 产品ID
+            since_idx: 基准 submission_idx（通常下单前调用 last_fill_idx 获取）
+            timeout: 最长等待时间（秒）
+            poll_interval: 轮询间隔（秒）
+
+        Returns:
+            list[NadoFill]: 新成交列表（从旧到新），超时返回空列表
+
+        Raises:
+            KeyboardInterrupt: 如果被 Ctrl+C 中断，会抛出异常
+        """
+        deadline = time.time() + timeout
+        while True:
+            try:
+                new_fills = [f for f in self.get_recent_fills(product_id) if f.submission_idx > since_idx]
+                if new_fills:
+                    return sorted(new_fills, key=lambda f: f.submission_idx)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                print(f"查询Nado成交失败: {e}")
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return []
+            time.sleep(min(poll_interval, remaining))
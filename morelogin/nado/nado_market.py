@@ -0,0 +1,235 @@
+"""
+Nado 行情服务（基于 nado_protocol EngineQueryClient）
+
+常驻进程内的行情数据服务，替代每次调用都读写 product_id_cache.json、
+每次取价都新建 HTTP 连接的做法：
+- 使用共享传输层（adapters/transport.py）的查询 Session（共享连接池 + 429/5xx 自动退避重试）
+- 交易对 -> product_id 索引常驻内存，按 TTL 整体刷新；冷启动读磁盘元数据缓存（adapters/metadata_cache.py），不发请求
+- 多个产品的价格通过一次 market_prices 请求批量获取
+- x18 价格用整数运算换算成美分，不经过 float
+"""
+
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+nado_sdk_path = os.path.join(project_root, 'exchange', 'exchange_nado')
+if nado_sdk_path not in sys.path:
+    sys.path.insert(0, nado_sdk_path)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from nado_protocol.engine_client import EngineClientOpts, EngineQueryClient
+from nado_protocol.engine_client.types.query import SymbolsData
+from nado_protocol.utils.backend import NadoBackendURL
+
+from adapters.transport import get_default_transport
+
+# 1 美分 = 10^16 (x18)
+_CENT_X18 = 10 ** 16
+
+
+def x18_to_cents(value_x18):
+    """x18 整数价格转为美分（四舍五入），例如 '64000125000000000000000' -> 6400013"""
+    value = int(value_x18)
+    if value >= 0:
+        return (value + _CENT_X18 // 2) // _CENT_X18
+    return -((-value + _CENT_X18 // 2) // _CENT_X18)
+
+
+def _symbol_key(symbol, product_type):
+    """交易对索引键，与 symbols 接口返回的 'BTC-PERP' 格式一致"""
+    return f"{symbol.upper()}-{product_type.upper()}"
+
+
+class NadoMarketData:
+    """
+    Nado 行情数据服务
+
+    Args:
+        gateway_url: engine 网关地址
+        symbols_ttl: 交易对索引 / 产品信息缓存时间（秒）
+        price_ttl: 价格缓存时间（秒），0 表示每次都请求最新价格
+        session: engine 查询使用的 requests.Session，默认取共享传输层的查询 Session（429/5xx 自动重试）
+        metadata_cache: 元数据磁盘缓存（可选），交易对索引优先从缓存读取，过期时后台刷新
+    """
+
+    def __init__(
+        self,
+        gateway_url=NadoBackendURL.MAINNET_GATEWAY.value,
+        symbols_ttl=3600,
+        price_ttl=0.5,
+        session=None,
+        metadata_cache=None,
+    ):
+        self.engine = EngineQueryClient(
+            EngineClientOpts(url=gateway_url),
+            session=session or get_default_transport().session(query=True),
+        )
+
+        self.symbols_ttl = symbols_ttl
+        self.metadata_cache = metadata_cache
+        self._symbols_key = f"nado/{gateway_url}/symbols"
+        self.price_ttl = price_ttl
+
+        self._lock = threading.Lock()
+        self._symbols = {}  # 'BTC-PERP' -> SymbolData
+        self._symbols_at = 0.0
+        self._products = {}  # product_id -> PerpProduct / SpotProduct
+        self._products_at = 0.0
+        self._prices = {}  # product_id -> (MarketPriceData, 获取时间)
+
+    # ---------- 交易对索引 ----------
+
+    def _fetch_symbols(self):
+        return self.engine.get_symbols().dict()
+
+    def refresh_symbols(self, force=False):
+        """重建交易对索引；有元数据缓存时先读缓存，force 为 True 时直接请求 symbols 接口并更新缓存"""
+        if self.metadata_cache is None:
+            data = self.engine.get_symbols()
+        elif force:
+            data = SymbolsData.parse_obj(self.metadata_cache.refresh(self._symbols_key, self._fetch_symbols))
+        else:
+            data = SymbolsData.parse_obj(self.metadata_cache.get(self._symbols_key, self._fetch_symbols))
+        symbols = {key.upper(): info for key, info in data.symbols.items()}
+        with self._lock:
+            self._symbols = symbols
+            self._symbols_at = time.time()
+
+    def _ensure_symbols(self, force=False):
+        if force or not self._symbols or time.time() - self._symbols_at > self.symbols_ttl:
+            self.refresh_symbols(force=force)
+
+    def get_symbol_info(self, symbol, product_type="perp"):
+        """
+        获取交易对信息（product_id、价格/数量精度等）
+
+        Returns:
+            SymbolData: 交易对信息，不存在返回 None
+        """
+        key = _symbol_key(symbol, product_type)
+        self._ensure_symbols()
+        info = self._symbols.get(key)
+        if info is None and time.time() - self._symbols_at > 60:
+            # 可能是新上线的交易对，强制刷新一次（最多每分钟一次）
+            self._ensure_symbols(force=True)
+            info = self._symbols.get(key)
+        return info
+
+    def get_product_id(self, symbol, product_type="perp"):
+        """
+        获取 product_id
+
+        Returns:
+            int: product_id，不存在返回 None
+        """
+        info = self.get_symbol_info(symbol, product_type)
+        return int(info.product_id) if info is not None else None
+
+    # ---------- 产品信息 ----------
+
+    def get_product(self, product_id):
+        """
+        获取产品信息（oracle 价格、风险参数、盘口精度等），按 symbols_ttl 缓存
+
+        Returns:
+            PerpProduct | SpotProduct: 产品信息，不存在返回 None
+        """
+        if not self._products or time.time() - self._products_at > self.symbols_ttl:
+            data = self.engine.get_all_products()
+            products = {p.product_id: p for p in data.spot_products}
+            products.update({p.product_id: p for p in data.perp_products})
+            with self._lock:
+                self._products = products
+                self._products_at = time.time()
+        return self._products.get(product_id)
+
+    # ---------- 价格 ----------
+
+    def get_market_prices(self, product_ids):
+        """
+        批量获取盘口最优买卖价（一次请求）
+
+        Args:
+            product_ids: 产品ID列表
+
+        Returns:
+            dict: {product_id: MarketPriceData}
+        """
+        now = time.time()
+        result = {}
+        missing = []
+        for product_id in dict.fromkeys(product_ids):
+            cached = self._prices.get(product_id)
+            if cached is not None and now - cached[1] <= self.price_ttl:
+                result[product_id] = cached[0]
+            else:
+                missing.append(product_id)
+
+        if missing:
+            data = self.engine.get_market_prices(missing)
+            fetched_at = time.time()
+            for price in data.market_prices:
+                self._prices[price.product_id] = (price, fetched_at)
+                result[price.product_id] = price
+        return result
+
+    def get_prices(self, symbols, product_type="perp"):
+        """
+        批量获取多个交易对的价格（美分整数）
+
+        Args:
+            symbols: 交易对符号列表（如 ['BTC', 'ETH']）
+            product_type: 产品类型，"spot" 或 "perp"
+
+        Returns:
+            dict: {symbol: {'bid': int, 'ask': int, 'mid': int}}，未找到的交易对不包含在结果中
+        """
+        product_ids = {}
+        for symbol in symbols:
+            product_id = self.get_product_id(symbol, product_type)
+            if product_id is not None:
+                product_ids[symbol] = product_id
+        if not product_ids:
+            return {}
+
+        market_prices = self.get_market_prices(list(product_ids.values()))
+        result = {}
+        for symbol, product_id in product_ids.items():
+            price = market_prices.get(product_id)
+            if price is not None:
+                result[symbol] = self._to_cents(price)
+        return result
+
+    def get_price(self, symbol, product_type="perp"):
+        """获取单个交易对价格（美分整数），失败返回 None"""
+        return self.get_prices([symbol], product_type).get(symbol)
+
+    @staticmethod
+    def _to_cents(price):
+        bid_x18 = int(price.bid_x18)
+        ask_x18 = int(price.ask_x18)
+        return {
+            'bid': x18_to_cents(bid_x18),
+            'ask': x18_to_cents(ask_x18),
+            'mid': x18_to_cents((bid_x18 + ask_x18) // 2),
+        }
+
+
+_MARKET_DATA = None
+_MARKET_DATA_LOCK = threading.Lock()
+
+
+def get_market_data():
+    """获取进程内共享的行情服务实例"""
+    global _MARKET_DATA
+    if _MARKET_DATA is None:
+        with _MARKET_DATA_LOCK:
+            if _MARKET_DATA is None:
+                from adapters.metadata_cache import get_default_metadata_cache
+
+                _MARKET_DATA = NadoMarketData(metadata_cache=get_default_metadata_cache())
+    return _MARKET_DATA
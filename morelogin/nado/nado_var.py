@@ -6,31 +6,15 @@ import sys
 import csv
 import os
 import time
-import json
 import random
+import asyncio
 import argparse
-import requests
-from playwright.sync_api import sync_playwright
 
+morelogin_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if morelogin_dir not in sys.path:
+    sys.path.insert(0, morelogin_dir)
 
-def start(envId, uniqueId):
-    """启动浏览器配置文件，返回 CDP URL"""
-    if envId and envId.strip():
-        data = {"envId": envId}
-    elif uniqueId:
-        data = {"uniqueId": uniqueId}
-    else:
-        print("错误: 必须设置 env_id 或 unique_id 之一")
-        return None
-    
-    response = requests.post("http://localhost:40000/api/env/start", json=data).json()
-    
-    if response["code"] != 0:
-        print(f"启动失败: {response.get('msg', '')}")
-        return None
-
-    port = response["data"]["debugPort"]
-    return "http://127.0.0.1:" + port
+from profile_orchestrator import HedgeLeg, ProfileOrchestrator, submit_legs
 
 
 def get_url(symbol, platform="nado"):
@@ -44,63 +28,6 @@ def get_url(symbol, platform="nado"):
         raise ValueError(f"不支持的平台: {platform}")
 
 
-def open_page(playwright, env_id, url):
-    """
-    打开指定环境并访问页面，返回页面对象
-    如果页面已经打开，会复用已打开的页面
-    
-    Args:
-        playwright: Playwright对象
-        env_id: 环境ID
-        url: 目标URL
-    
-    Returns:
-        Page对象，如果失败返回None
-    """
-    cdp_url = start(env_id, None)
-    if cdp_url is None:
-        return None
-    
-    try:
-        browser = playwright.chromium.connect_over_cdp(cdp_url)
-        ctx = browser.contexts[0]
-        
-        # 检查是否已经有打开的页面匹配目标URL
-        existing_pages = ctx.pages
-        for existing_page in existing_pages:
-            try:
-                current_url = existing_page.url
-                # 比较URL（忽略协议、查询参数等）
-                # 提取主要部分进行比较
-                url_main = url.split('?')[0].split('#')[0]
-                current_url_main = current_url.split('?')[0].split('#')[0]
-                
-                if url_main in current_url_main or current_url_main in url_main:
-                    print(f"  检测到已打开的页面: {current_url}")
-                    print(f"  复用现有页面，无需重新打开")
-                    # 如果当前URL不完全匹配，导航到目标URL
-                    if current_url != url:
-                        try:
-                            existing_page.goto(url, timeout=120000, wait_until="domcontentloaded")
-                        except Exception as nav_e:
-                            print(f"  导航到目标URL时出错: {nav_e}，继续使用当前页面")
-                    return existing_page
-            except Exception as check_e:
-                # 如果检查页面URL时出错，跳过这个页面
-                continue
-        
-        # 如果没有找到匹配的页面，创建新页面
-        print(f"  未找到匹配的已打开页面，创建新页面")
-        page = ctx.new_page()
-        # 增加超时时间到120秒，使用domcontentloaded等待策略（更快）
-        page.goto(url, timeout=120000, wait_until="domcontentloaded")
-        return page
-    except Exception as e:
-        print(f"打开页面失败: {url}")
-        print(f"错误信息: {e}")
-        return None
-
-
 def load_config(csv_file="config.csv"):
     """从CSV文件加载配置"""
     configs = []
@@ -127,88 +54,67 @@ def load_config(csv_file="config.csv"):
                 'size': row.get('size', '').strip(),
                 'price_offset': row.get('price_offset', '-5').strip(),  # 默认-5
                 'repeat_count': row.get('repeat_count', '1').strip(),  # 默认1次
-                'sleep_range': row.get('sleep_range', '10-50').strip()  # 默认10-50秒
+                'sleep_range': row.get('sleep_range', '10-50').strip(),  # 默认10-50秒
+                # 可选：填写Nado钱包地址后通过API检测成交和持仓，不再抓取页面
+                'nado_address': (row.get('nado_address') or '').strip(),
+                'nado_subaccount': (row.get('nado_subaccount') or '').strip() or 'default'
             })
     
     return configs
 
 
-def get_product_id_cache_file():
-    """获取product_id缓存文件路径"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(script_dir, 'product_id_cache.json')
+_FILL_WATCHERS = {}
 
 
-def load_product_id_cache():
-    """加载product_id缓存"""
-    cache_file = get_product_id_cache_file()
-    if os.path.exists(cache_file):
+def get_fill_watcher(config):
+    """
+    获取Nado成交监听器（按钱包地址和子账户缓存）
+    
+    Args:
+        config: 配置字典，需要包含 nado_address
+    
+    Returns:
+        NadoFillWatcher: 监听器，如果未配置地址或初始化失败返回None（回退到页面检测）
+    """
+    address = config.get('nado_address')
+    if not address:
+        return None
+    
+    key = (address.lower(), config.get('nado_subaccount', 'default'))
+    if key not in _FILL_WATCHERS:
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+            from nado_fills import NadoFillWatcher
+            _FILL_WATCHERS[key] = NadoFillWatcher(address, key[1])
+        except Exception as e:
+            print(f"  警告: 初始化Nado成交监听失败，回退到页面检测: {e}")
+            return None
+    return _FILL_WATCHERS[key]
 
 
-def save_product_id_cache(cache):
-    """保存product_id缓存"""
-    cache_file = get_product_id_cache_file()
-    try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
-    except IOError as e:
-        print(f"  警告: 无法保存缓存文件: {e}")
+_MARKET_DATA_ERROR = None
 
 
-def get_product_id_from_api(symbol, product_type="perp"):
+def get_market_data():
     """
-    从API获取product_id
-    
-    Args:
-        symbol: 交易对符号（如BTC）
-        product_type: 产品类型，"spot" 或 "perp"，默认"perp"
+    获取共享的Nado行情服务（连接池 + 内存中的交易对索引和价格缓存）
     
     Returns:
-        int: product_id，如果获取失败返回None
+        NadoMarketData: 行情服务，初始化失败返回None
     """
+    global _MARKET_DATA_ERROR
     try:
-        base_url = "https://gateway.prod.nado.xyz/v1/query"
-        params_symbols = {
-            "type": "symbols",
-            "product_type": product_type
-        }
-        
-        response = requests.get(base_url, params=params_symbols, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # API响应结构: {'status': 'success', 'data': {'symbols': {'BTC-PERP': {...}}}}
-        symbols_dict = data.get('data', {}).get('symbols', {})
-        
-        if not symbols_dict:
-            return None
-        
-        # 查找对应的交易对，格式是 'BTC-PERP'
-        symbol_upper = symbol.upper()
-        search_key = f"{symbol_upper}-PERP" if product_type == "perp" else f"{symbol_upper}-SPOT"
-        
-        symbol_info = symbols_dict.get(search_key)
-        if not symbol_info:
-            return None
-        
-        product_id = symbol_info.get('product_id')
-        return product_id
-        
-    except requests.exceptions.RequestException:
-        return None
-    except (ValueError, KeyError, TypeError):
+        from nado_market import get_market_data as _get_market_data
+        return _get_market_data()
+    except Exception as e:
+        if _MARKET_DATA_ERROR is None:
+            _MARKET_DATA_ERROR = e
+            print(f"  警告: 初始化Nado行情服务失败: {e}")
         return None
 
 
 def get_product_id(symbol, product_type="perp"):
     """
-    获取product_id（带缓存）
+    获取product_id（内存索引，按TTL刷新）
     
     Args:
         symbol: 交易对符号（如BTC）
@@ -217,25 +123,41 @@ def get_product_id(symbol, product_type="perp"):
     Returns:
         int: product_id，如果获取失败返回None
     """
-    symbol_upper = symbol.upper()
+    market_data = get_market_data()
+    if market_data is None:
+        return None
     
-    # 先检查缓存
-    cache = load_product_id_cache()
-    cache_key = f"{symbol_upper}_{product_type}"
+    try:
+        product_id = market_data.get_product_id(symbol, product_type)
+    except Exception as e:
+        print(f"获取交易对 {symbol} 失败: {e}")
+        return None
     
-    if cache_key in cache:
-        return cache[cache_key]
+    if product_id is None:
+        print(f"交易对 {symbol} ({product_type}) 不存在")
+    return product_id
+
+
+def get_prices_from_api(symbols, product_type="perp"):
+    """
+    通过API批量获取多个交易对价格（一次请求）
     
-    # 缓存中没有，调用API
-    product_id = get_product_id_from_api(symbol, product_type)
+    Args:
+        symbols: 交易对符号列表（如['BTC', 'ETH']）
+        product_type: 产品类型，"spot" 或 "perp"，默认"perp"
     
-    if product_id:
-        cache[cache_key] = product_id
-        save_product_id_cache(cache)
-        return product_id
-    else:
-        print(f"交易对 {symbol} ({product_type}) 不存在")
-        return None
+    Returns:
+        dict: {symbol: {'bid': int, 'ask': int, 'mid': int}}，价格为乘以100后的整数；失败返回空字典
+    """
+    market_data = get_market_data()
+    if market_data is None:
+        return {}
+    
+    try:
+        return market_data.get_prices(symbols, product_type)
+    except Exception as e:
+        print(f"API请求失败: {e}")
+        return {}
 
 
 def get_price_from_api(symbol, product_type="perp"):
@@ -250,88 +172,8 @@ def get_price_from_api(symbol, product_type="perp"):
         dict: 包含bid、ask、mid价格的字典，格式: {'bid': int, 'ask': int, 'mid': int}
               价格是整数（乘以100后的值，去掉小数点），如果获取失败返回None
     """
-    try:
-        base_url = "https://gateway.prod.nado.xyz/v1/query"
-        
-        # 步骤1: 获取product_id（带缓存）
-        product_id = get_product_id(symbol, product_type)
-        
-        if not product_id:
-            return None
-        
-        # 步骤2: 使用product_id获取market_price（带重试）
-        params_price = {
-            "type": "market_price",
-            "product_id": product_id
-        }
-        
-        max_retries = 10
-        price_data = None
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(base_url, params=params_price, timeout=10)
-                
-                # 如果是429错误，等待后重试
-                if response.status_code == 429:
-                    wait_time = (2 ** attempt) * 1
-                    if attempt < max_retries - 1:
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        print(f"API请求失败: 429 Too Many Requests (已重试{max_retries}次)")
-                        return None
-                
-                response.raise_for_status()
-                price_data = response.json()
-                break
-            except requests.exceptions.RequestException as e:
-                if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) * 1
-                    time.sleep(wait_time)
-                else:
-                    print(f"API请求失败: {e}")
-                    return None
-        
-        if not price_data:
-            return None
-        
-        # 提取价格，API返回格式: {'data': {'bid_x18': '...', 'ask_x18': '...'}}
-        # x18表示18位精度，需要除以10^18
-        if isinstance(price_data, dict):
-            data_section = price_data.get('data', price_data)
-            
-            bid_x18 = data_section.get('bid_x18')
-            ask_x18 = data_section.get('ask_x18')
-            
-            result = {}
-            bid = None
-            ask = None
-            
-            if bid_x18:
-                bid = float(bid_x18) / (10 ** 18)
-                bid_int = int(round(bid * 100))
-                result['bid'] = bid_int
-            
-            if ask_x18:
-                ask = float(ask_x18) / (10 ** 18)
-                ask_int = int(round(ask * 100))
-                result['ask'] = ask_int
-            
-            if bid is not None and ask is not None:
-                mid = (bid + ask) / 2
-                mid_int = int(round(mid * 100))
-                result['mid'] = mid_int
-            
-            if result:
-                return result
-        
-        print(f"API响应中未找到价格信息")
-        return None
-        
-    except (ValueError, KeyError, TypeError) as e:
-        print(f"  解析API响应失败: {e}")
-        return None
+    return get_prices_from_api([symbol], product_type).get(symbol)
+
 
 
 def show_menu():
@@ -349,7 +191,7 @@ def show_menu():
     print("=" * 50)
 
 
-def click_limit_button(page):
+async def click_limit_button(page):
     """
     点击页面上的Limit按钮
     
@@ -361,9 +203,9 @@ def click_limit_button(page):
     """
     try:
         # 精准查找Limit按钮
-        button = page.query_selector('button:has-text("Limit")')
+        button = await page.query_selector('button:has-text("Limit")')
         if button:
-            button.click()
+            await button.click()
             return True
         return False
     except Exception as e:
@@ -371,7 +213,7 @@ def click_limit_button(page):
         return False
 
 
-def click_long_tab_button(page):
+async def click_long_tab_button(page):
     """
     点击做多标签按钮（Buy/Long tab）
     
@@ -383,9 +225,9 @@ def click_long_tab_button(page):
     """
     try:
         # 精准查找做多标签按钮
-        button = page.query_selector('button:has-text("Buy/Long")[role="tab"]')
+        button = await page.query_selector('button:has-text("Buy/Long")[role="tab"]')
         if button:
-            button.click()
+            await button.click()
             return True
         return False
     except Exception as e:
@@ -393,7 +235,7 @@ def click_long_tab_button(page):
         return False
 
 
-def click_short_tab_button(page):
+async def click_short_tab_button(page):
     """
     点击做空标签按钮（Sell/Short tab）
     
@@ -405,9 +247,9 @@ def click_short_tab_button(page):
     """
     try:
         # 精准查找做空标签按钮
-        button = page.query_selector('button:has-text("Sell/Short")[role="tab"]')
+        button = await page.query_selector('button:has-text("Sell/Short")[role="tab"]')
         if button:
-            button.click()
+            await button.click()
             return True
         return False
     except Exception as e:
@@ -415,7 +257,7 @@ def click_short_tab_button(page):
         return False
 
 
-def click_submit_long_button(page, symbol):
+async def click_submit_long_button(page, symbol):
     """
     点击提交做多按钮（Buy/Long BTC）
     
@@ -428,9 +270,9 @@ def click_submit_long_button(page, symbol):
     """
     try:
         # 精准查找提交做多按钮
-        button = page.query_selector(f'button[type="submit"]:has-text("Buy/Long {symbol}")')
+        button = await page.query_selector(f'button[type="submit"]:has-text("Buy/Long {symbol}")')
         if button:
-            button.click()
+            await button.click()
             return True
         return False
     except Exception as e:
@@ -438,7 +280,7 @@ def click_submit_long_button(page, symbol):
         return False
 
 
-def click_submit_short_button(page, symbol):
+async def click_submit_short_button(page, symbol):
     """
     点击提交做空按钮（Sell/Short BTC）
     
@@ -451,9 +293,9 @@ def click_submit_short_button(page, symbol):
     """
     try:
         # 精准查找提交做空按钮
-        button = page.query_selector(f'button[type="submit"]:has-text("Sell/Short {symbol}")')
+        button = await page.query_selector(f'button[type="submit"]:has-text("Sell/Short {symbol}")')
         if button:
-            button.click()
+            await button.click()
             return True
         return False
     except Exception as e:
@@ -461,7 +303,7 @@ def click_submit_short_button(page, symbol):
         return False
 
 
-def click_open_orders_button(page, symbol):
+async def click_open_orders_button(page, symbol):
     """
     点击未成交订单按钮（Open Orders）
     
@@ -481,11 +323,11 @@ def click_open_orders_button(page, symbol):
         ]
         
         for selector in selectors:
-            button = page.query_selector(selector)
+            button = await page.query_selector(selector)
             if button:
-                button_text = button.inner_text()
+                button_text = await button.inner_text()
                 if "Open Orders" in button_text:
-                    button.click()
+                    await button.click()
                     return True
         return False
     except Exception as e:
@@ -493,7 +335,7 @@ def click_open_orders_button(page, symbol):
         return False
 
 
-def cancel_all_orders(page, symbol):
+async def cancel_all_orders(page, symbol):
     """
     取消所有未成交订单
     
@@ -506,25 +348,25 @@ def cancel_all_orders(page, symbol):
     """
     try:
         # 先点击未成交订单按钮
-        if not click_open_orders_button(page, symbol):
+        if not await click_open_orders_button(page, symbol):
             print("无法打开订单列表，取消订单失败")
             return False
         
-        page.wait_for_timeout(100)
+        await page.wait_for_timeout(100)
         
         # 查找取消按钮
-        cancel_button = page.query_selector('button:has-text("Cancel all")')
+        cancel_button = await page.query_selector('button:has-text("Cancel all")')
         if cancel_button:
             # 检查按钮是否可用
-            is_disabled = cancel_button.get_attribute('disabled') is not None
+            is_disabled = await cancel_button.get_attribute('disabled') is not None
             if is_disabled:
                 # 按钮不可用，说明没有订单
                 return True
             
             # 尝试点击，如果按钮不可用则忽略
             try:
-                cancel_button.click(timeout=2000)
-                page.wait_for_timeout(100)
+                await cancel_button.click(timeout=2000)
+                await page.wait_for_timeout(100)
                 return True
             except Exception:
                 # 点击失败（可能是按钮不可用），视为没有订单
@@ -535,7 +377,7 @@ def cancel_all_orders(page, symbol):
         return True
 
 
-def check_order_status(page, order_price, symbol):
+async def check_order_status(page, order_price, symbol):
     """
     检查订单是否成交
     
@@ -551,7 +393,7 @@ def check_order_status(page, order_price, symbol):
         import re
         
         # 查找所有订单行
-        rows = page.query_selector_all('div.flex.items-center.border-overlay-divider')
+        rows = await page.query_selector_all('div.flex.items-center.border-overlay-divider')
         
         # 将订单价格转换为数字，移除小数点，用于匹配
         order_price_num = float(order_price)
@@ -566,7 +408,7 @@ def check_order_status(page, order_price, symbol):
         ]
         
         for row in rows:
-            row_text = row.inner_text()
+            row_text = await row.inner_text()
             
             # 检查这一行是否包含我们的订单价格（移除逗号后比较）
             row_text_no_comma = row_text.replace(',', '')
@@ -581,17 +423,17 @@ def check_order_status(page, order_price, symbol):
             if price_matched:
                 # 查找Filled/Total列（min-w-28 max-w-40 flex-1）
                 # Filled和Total分别在两个div中
-                filled_total_div = row.query_selector('div.min-w-28.max-w-40.flex-1')
+                filled_total_div = await row.query_selector('div.min-w-28.max-w-40.flex-1')
                 if filled_total_div:
                     # 获取所有子div
-                    child_divs = filled_total_div.query_selector_all('div')
+                    child_divs = await filled_total_div.query_selector_all('div')
                     
                     filled = 0.0
                     total = 0.0
                     
                     # 第一个div包含filled（格式：0.00000 /）
                     if len(child_divs) >= 1:
-                        filled_text = child_divs[0].inner_text().strip()
+                        filled_text = (await child_divs[0].inner_text()).strip()
                         # 提取数字部分（移除 "/" 等）
                         filled_match = re.search(r'(\d+\.?\d*)', filled_text)
                         if filled_match:
@@ -599,7 +441,7 @@ def check_order_status(page, order_price, symbol):
                     
                     # 第二个div包含total（格式：0.00150 BTC）
                     if len(child_divs) >= 2:
-                        total_text = child_divs[1].inner_text().strip()
+                        total_text = (await child_divs[1].inner_text()).strip()
                         # 提取数字部分（移除 "BTC" 等）
                         total_match = re.search(r'(\d+\.?\d*)', total_text)
                         if total_match:
@@ -618,8 +460,8 @@ def check_order_status(page, order_price, symbol):
                         is_filled = fill_ratio >= 1.0
                         
                         # 提取实际显示的价格用于调试
-                        price_elem = row.query_selector('div.min-w-30.max-w-40.flex-1')
-                        actual_price = price_elem.inner_text().strip() if price_elem else str(order_price)
+                        price_elem = await row.query_selector('div.min-w-30.max-w-40.flex-1')
+                        actual_price = (await price_elem.inner_text()).strip() if price_elem else str(order_price)
                         
                         return {
                             'found': True,
@@ -638,23 +480,20 @@ def check_order_status(page, order_price, symbol):
         return None
 
 
-def safe_sleep(seconds):
+async def safe_sleep(seconds):
     """
-    安全休眠函数，将长时间休眠拆分成多个短时间等待，以便能够响应 Ctrl+C
+    安全休眠函数，asyncio.sleep 可以被取消，Ctrl+C 时立即返回菜单
     
     Args:
         seconds: 休眠总秒数
     
     Raises:
-        KeyboardInterrupt: 如果被中断，会抛出异常
+        asyncio.CancelledError: 如果被中断，会抛出异常
     """
-    chunk_seconds = 0.1  # 每次等待0.1秒，更频繁地检查中断
-    chunks = int(seconds / chunk_seconds)
-    for _ in range(chunks):
-        time.sleep(chunk_seconds)
+    await asyncio.sleep(seconds)
 
 
-def monitor_order_fill(page, symbol, initial_position, check_interval=0.5, max_wait_time=30, retry_timeout=30):
+async def monitor_order_fill(page, symbol, initial_position, check_interval=0.5, max_wait_time=30, retry_timeout=30):
     """
     监控订单是否成交（通过比较持仓变化）
     
@@ -671,7 +510,7 @@ def monitor_order_fill(page, symbol, initial_position, check_interval=0.5, max_w
         None: 如果retry_timeout内未成交，需要重新下单
     
     Raises:
-        KeyboardInterrupt: 如果被 Ctrl+C 中断，会抛出异常
+        asyncio.CancelledError: 如果被 Ctrl+C 中断，会抛出异常
     """
     start_time = time.time()
     print(f"监控订单是否成交")
@@ -686,29 +525,60 @@ def monitor_order_fill(page, symbol, initial_position, check_interval=0.5, max_w
                 return False
             
             try:
-                current_position = get_nado_position(page, symbol)
+                current_position = await get_nado_position(page, symbol)
                 if current_position != initial_position:
                     print(f"订单已成交: {initial_position} -> {current_position}")
                     return True
-            except KeyboardInterrupt:
+            except asyncio.CancelledError:
                 # 如果获取持仓时被中断，直接抛出
                 raise
             except Exception:
                 pass
             
             if elapsed_time < max_wait_time:
-                # 使用 time.sleep 替代 page.wait_for_timeout，以便能够响应 Ctrl+C
-                safe_sleep(check_interval)
+                # 使用 asyncio.sleep 替代 page.wait_for_timeout，以便能够响应 Ctrl+C
+                await safe_sleep(check_interval)
             else:
                 break
-    except KeyboardInterrupt:
-        # 捕获 KeyboardInterrupt 并重新抛出，让上层处理
+    except asyncio.CancelledError:
+        # 捕获 asyncio.CancelledError 并重新抛出，让上层处理
         raise
     
     return False
 
 
-def fill_order_form(page, price, size):
+async def monitor_order_fill_api(watcher, product_id, since_idx, retry_timeout=30):
+    """
+    通过API等待订单成交（等待 since_idx 之后的新成交事件）
+    
+    Args:
+        watcher: NadoFillWatcher 实例
+        product_id: 产品ID
+        since_idx: 下单前最新成交的 submission_idx
+        retry_timeout: 重试超时时间（秒），超时未成交返回None表示需要重新下单
+    
+    Returns:
+        bool: True 表示已成交
+        None: 如果retry_timeout内未成交，需要重新下单
+    
+    Raises:
+        asyncio.CancelledError: 如果被 Ctrl+C 中断，会抛出异常
+    """
+    print(f"监控订单是否成交（API）")
+    deadline = time.time() + retry_timeout
+    while True:
+        # 每次最多在线程中等待1秒，保证事件循环上的其他任务和 Ctrl+C 能及时响应
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return None
+        fills = await asyncio.to_thread(watcher.wait_for_fill, product_id, since_idx, timeout=min(1.0, remaining))
+        if fills:
+            filled = sum(f.base_filled for f in fills)
+            print(f"订单已成交: {len(fills)} 笔, 数量 {filled:+.6f}")
+            return True
+
+
+async def fill_order_form(page, price, size):
     """
     填写订单表单：价格和大小
     
@@ -721,17 +591,17 @@ def fill_order_form(page, price, size):
         bool: 是否成功填写
     """
     try:
-        price_input = page.query_selector('#limitPrice')
+        price_input = await page.query_selector('#limitPrice')
         if not price_input:
             print("未找到价格输入框")
             return False
-        price_input.fill(str(price))
+        await price_input.fill(str(price))
         
-        size_input = page.query_selector('#size')
+        size_input = await page.query_selector('#size')
         if not size_input:
             print("未找到大小输入框")
             return False
-        size_input.fill(str(size))
+        await size_input.fill(str(size))
         
         return True
     except Exception as e:
@@ -739,7 +609,7 @@ def fill_order_form(page, price, size):
         return False
 
 
-def click_short_button_variational(page):
+async def click_short_button_variational(page):
     """
     在variational页面点击做空按钮
     
@@ -751,9 +621,9 @@ def click_short_button_variational(page):
     """
     try:
         # 通过data-testid="bid-price-display"定位做空按钮（更精准，支持中英文）
-        span = page.query_selector('span[data-testid="bid-price-display"]')
+        span = await page.query_selector('span[data-testid="bid-price-display"]')
         if span:
-            clicked = span.evaluate('el => { const btn = el.closest("button"); if (btn) { btn.click(); return true; } return false; }')
+            clicked = await span.evaluate('el => { const btn = el.closest("button"); if (btn) { btn.click(); return true; } return false; }')
             if clicked:
                 return True
         return False
@@ -762,7 +632,7 @@ def click_short_button_variational(page):
         return False
 
 
-def click_long_button_variational(page):
+async def click_long_button_variational(page):
     """
     在variational页面点击做多按钮
     
@@ -774,9 +644,9 @@ def click_long_button_variational(page):
     """
     try:
         # 通过data-testid="ask-price-display"定位做多按钮（更精准，支持中英文）
-        span = page.query_selector('span[data-testid="ask-price-display"]')
+        span = await page.query_selector('span[data-testid="ask-price-display"]')
         if span:
-            clicked = span.evaluate('el => { const btn = el.closest("button"); if (btn) { btn.click(); return true; } return false; }')
+            clicked = await span.evaluate('el => { const btn = el.closest("button"); if (btn) { btn.click(); return true; } return false; }')
             if clicked:
                 return True
         return False
@@ -785,7 +655,7 @@ def click_long_button_variational(page):
         return False
 
 
-def fill_quantity_variational(page, size):
+async def fill_quantity_variational(page, size):
     """
     在variational页面输入仓位大小
     
@@ -810,9 +680,9 @@ def fill_quantity_variational(page, size):
                 size_str = str(size)
         
         # 精准查找数量输入框
-        input_elem = page.query_selector('input[data-testid="quantity-input"]')
+        input_elem = await page.query_selector('input[data-testid="quantity-input"]')
         if input_elem:
-            input_elem.fill(size_str)
+            await input_elem.fill(size_str)
             return True
         return False
     except Exception as e:
@@ -820,7 +690,7 @@ def fill_quantity_variational(page, size):
         return False
 
 
-def click_submit_variational(page, symbol, direction="long", max_retries=5):
+async def click_submit_variational(page, symbol, direction="long", max_retries=5):
     """
     在variational页面点击确认按钮（带重试机制）
     
@@ -846,12 +716,12 @@ def click_submit_variational(page, symbol, direction="long", max_retries=5):
     for attempt in range(1, max_retries + 1):
         try:
             # 查找所有提交按钮
-            buttons = page.query_selector_all('button[data-testid="submit-button"]')
+            buttons = await page.query_selector_all('button[data-testid="submit-button"]')
             
             if not buttons:
                 if attempt < max_retries:
                     print(f"  第 {attempt} 次尝试: 未找到提交按钮，等待后重试...")
-                    safe_sleep(0.5)
+                    await safe_sleep(0.5)
                     continue
                 else:
                     print(f"  错误: 未找到任何提交按钮 (data-testid='submit-button')")
@@ -859,23 +729,23 @@ def click_submit_variational(page, symbol, direction="long", max_retries=5):
             
             for button in buttons:
                 # 获取按钮文本
-                button_text = button.inner_text().strip()
+                button_text = (await button.inner_text()).strip()
                 
                 # 必须包含symbol和对应的方向文本（"买"或"卖"）
                 if symbol not in button_text or expected_text not in button_text:
                     continue
                 
                 # 检查按钮的class是否包含对应的背景色
-                button_class = button.get_attribute('class') or ''
+                button_class = await button.get_attribute('class') or ''
                 if expected_class not in button_class:
                     continue
                 
                 # 检查按钮是否disabled
-                is_disabled = button.get_attribute('disabled') is not None
+                is_disabled = await button.get_attribute('disabled') is not None
                 if is_disabled:
                     if attempt < max_retries:
                         print(f"  第 {attempt} 次尝试: 按钮被禁用，等待后重试...")
-                        safe_sleep(0.5)
+                        await safe_sleep(0.5)
                         break  # 跳出按钮循环，进行下一次重试
                     else:
                         print(f"  错误: 按钮被禁用，无法点击")
@@ -884,13 +754,13 @@ def click_submit_variational(page, symbol, direction="long", max_retries=5):
                 # 找到匹配的按钮，点击
                 if attempt > 1:
                     print(f"  第 {attempt} 次尝试: 找到可用按钮，点击...")
-                button.click()
+                await button.click()
                 return True
             
             # 如果所有按钮都不匹配或都被禁用，进行重试
             if attempt < max_retries:
                 print(f"  第 {attempt} 次尝试: 未找到匹配的可用按钮，等待后重试...")
-                safe_sleep(0.5)
+                await safe_sleep(0.5)
             else:
                 print(f"  错误: 经过 {max_retries} 次尝试，仍未找到匹配的可用按钮")
                 print(f"  需要: 包含'{symbol}'和'{expected_text}'，class包含'{expected_class}'，且未禁用")
@@ -899,7 +769,7 @@ def click_submit_variational(page, symbol, direction="long", max_retries=5):
         except Exception as e:
             if attempt < max_retries:
                 print(f"  第 {attempt} 次尝试出错: {e}，等待后重试...")
-                safe_sleep(0.5)
+                await safe_sleep(0.5)
             else:
                 print(f"Variational确认按钮错误: {e}")
                 return False
@@ -907,7 +777,7 @@ def click_submit_variational(page, symbol, direction="long", max_retries=5):
     return False
 
 
-def execute_variational_short(pages, configs, size=None):
+async def execute_variational_short(pages, configs, size=None):
     """
     在variational页面执行做空操作
     
@@ -931,22 +801,22 @@ def execute_variational_short(pages, configs, size=None):
     
     # 点击做空按钮
     print("步骤1: 点击做空按钮...")
-    if not click_short_button_variational(variational_page):
+    if not await click_short_button_variational(variational_page):
         print("无法继续，做空按钮点击失败")
         return False
     
     # 输入仓位大小
     print("\n步骤2: 输入仓位大小...")
-    if not fill_quantity_variational(variational_page, size):
+    if not await fill_quantity_variational(variational_page, size):
         print("无法继续，输入仓位大小失败")
         return False
     
     # 等待页面处理输入
-    safe_sleep(0.5)
+    await safe_sleep(0.5)
     
     # 点击确认按钮
     print("\n步骤3: 点击确认按钮...")
-    if click_submit_variational(variational_page, symbol, direction="short"):
+    if await click_submit_variational(variational_page, symbol, direction="short"):
         print(f"\nVariational做空订单已提交: {symbol}, 大小: {size}")
         return True
     else:
@@ -954,7 +824,7 @@ def execute_variational_short(pages, configs, size=None):
         return False
 
 
-def execute_variational_long(pages, configs, size=None):
+async def execute_variational_long(pages, configs, size=None):
     """
     在variational页面执行做多操作
     
@@ -973,18 +843,18 @@ def execute_variational_long(pages, configs, size=None):
     if size is None:
         size = config.get('size', '0.0001')
     
-    if not click_long_button_variational(variational_page):
+    if not await click_long_button_variational(variational_page):
         print("Variational做多按钮点击失败")
         return False
     
-    if not fill_quantity_variational(variational_page, size):
+    if not await fill_quantity_variational(variational_page, size):
         print("输入仓位大小失败")
         return False
     
     # 等待页面处理输入
-    safe_sleep(0.5)
+    await safe_sleep(0.5)
     
-    if click_submit_variational(variational_page, symbol, direction="long"):
+    if await click_submit_variational(variational_page, symbol, direction="long"):
         print(f"Variational做多已提交: {size}")
         return True
     else:
@@ -992,7 +862,48 @@ def execute_variational_long(pages, configs, size=None):
         return False
 
 
-def get_and_calculate_order_price(page, symbol, price_offset, direction, show_log=True):
+def make_variational_leg(pages, configs, direction, size=None):
+    """
+    构造Variational对冲腿：准备阶段选择方向并输入仓位大小，提交阶段点击确认按钮
+    
+    Args:
+        pages: 页面字典
+        configs: 配置列表
+        direction: 方向，"long"或"short"
+        size: 仓位大小，如果为None则从config读取
+    
+    Returns:
+        HedgeLeg: 对冲腿，未找到variational页面返回None
+    """
+    if not pages or 'variational' not in pages:
+        print("错误: 未找到variational页面")
+        return None
+    
+    variational_page = pages['variational']
+    config = configs[0]
+    symbol = config['symbol']
+    if size is None:
+        size = config.get('size', '0.0001')
+    
+    async def prepare():
+        click_direction = click_long_button_variational if direction == "long" else click_short_button_variational
+        if not await click_direction(variational_page):
+            print("Variational方向按钮点击失败")
+            return False
+        if not await fill_quantity_variational(variational_page, size):
+            print("输入仓位大小失败")
+            return False
+        # 等待页面处理输入
+        await safe_sleep(0.5)
+        return True
+    
+    async def submit():
+        return await click_submit_variational(variational_page, symbol, direction=direction)
+    
+    return HedgeLeg('variational', prepare, submit)
+
+
+async def get_and_calculate_order_price(page, symbol, price_offset, direction, show_log=True):
     """
     获取交易对价格并计算订单价格
     
@@ -1006,7 +917,7 @@ def get_and_calculate_order_price(page, symbol, price_offset, direction, show_lo
     Returns:
         tuple: (当前价格, 订单价格) 或 (None, None) 如果失败
     """
-    prices = get_price_from_api(symbol, product_type="perp")
+    prices = await asyncio.to_thread(get_price_from_api, symbol, "perp")
     
     if prices is None:
         print(f"未能通过API获取{symbol}价格")
@@ -1030,7 +941,7 @@ def get_and_calculate_order_price(page, symbol, price_offset, direction, show_lo
         return None, None
 
 
-def fill_nado_order_form(page, order_price, size):
+async def fill_nado_order_form(page, order_price, size):
     """
     填写Nado订单表单（价格和大小）
     
@@ -1042,27 +953,27 @@ def fill_nado_order_form(page, order_price, size):
     Returns:
         bool: 是否成功填写
     """
-    price_input = page.query_selector('#limitPrice')
+    price_input = await page.query_selector('#limitPrice')
     if price_input:
         price_actual = order_price / 100.0
-        price_input.fill(f"{price_actual:.2f}")
+        await price_input.fill(f"{price_actual:.2f}")
     else:
         print("未找到价格输入框")
         return False
-    safe_sleep(0.3)  # 等待0.3秒，可中断
+    await safe_sleep(0.3)  # 等待0.3秒，可中断
     
-    size_input = page.query_selector('#size')
+    size_input = await page.query_selector('#size')
     if size_input:
-        size_input.fill(str(size))
+        await size_input.fill(str(size))
     else:
         print("未找到大小输入框")
         return False
-    safe_sleep(0.3)  # 等待0.3秒，可中断
+    await safe_sleep(0.3)  # 等待0.3秒，可中断
     
     return True
 
 
-def execute_nado_order_with_retry(page, symbol, size, price_offset, direction, max_retries=999):
+async def execute_nado_order_with_retry(page, symbol, size, price_offset, direction, max_retries=999, watcher=None, hedge_leg=None):
     """
     执行Nado下单流程（带重试逻辑）
     
@@ -1073,45 +984,69 @@ def execute_nado_order_with_retry(page, symbol, size, price_offset, direction, m
         price_offset: 价格偏移量
         direction: 方向，"long"或"short"
         max_retries: 最大重试次数
+        watcher: NadoFillWatcher 实例，提供时通过API检测成交，否则抓取页面持仓
+        hedge_leg: 对冲腿（HedgeLeg），提供时首次下单与Nado同时提交，重新下单时不再重复提交
     
     Returns:
-        bool: 是否完全成交
+        tuple: (is_filled, hedge_ok)，is_filled 为Nado是否完全成交，hedge_ok 为对冲腿是否提交成功
+               （未提供 hedge_leg 时为 True）；对冲腿失败时调用方需按实际持仓补齐对冲
     
     Raises:
-        KeyboardInterrupt: 如果被 Ctrl+C 中断，会抛出异常
+        asyncio.CancelledError: 如果被 Ctrl+C 中断，会抛出异常
     """
     retry_count = 0
+    hedge_ok = True
     
     try:
         while retry_count < max_retries:
             if retry_count > 0:
                 print(f"\n第 {retry_count} 次重新下单...")
-                cancel_all_orders(page, symbol)
-                safe_sleep(1)  # 等待1秒，避免API限流
+                await cancel_all_orders(page, symbol)
+                await safe_sleep(1)  # 等待1秒，避免API限流
             else:
                 print("\n开始下单流程...")
             
             # 每次重新获取交易对价格，计算订单价格
             print("  获取最新价格...")
-            price_num, order_price = get_and_calculate_order_price(page, symbol, price_offset, direction)
+            price_num, order_price = await get_and_calculate_order_price(page, symbol, price_offset, direction)
             if price_num is None:
                 print("获取价格失败，停止下单")
-                return False
+                return False, hedge_ok
             
-            # 获取当前持仓作为基准
-            initial_position = get_nado_position(page, symbol)
+            # 获取成交基准：API 模式记录最新成交序号，否则记录页面持仓
+            product_id = await asyncio.to_thread(get_product_id, symbol) if watcher else None
+            if product_id:
+                since_idx = await asyncio.to_thread(watcher.last_fill_idx, product_id)
+            else:
+                initial_position = await get_nado_position(page, symbol)
             
-            # 执行下单
-            if not execute_nado_order(page, symbol, order_price, size, direction):
+            # 执行下单：首次下单时Nado和对冲腿先各自填好表单，再同时点击提交
+            if hedge_leg is not None and retry_count == 0:
+                nado_leg = HedgeLeg(
+                    'nado',
+                    lambda: prepare_nado_order(page, order_price, size, direction),
+                    lambda: submit_nado_order(page, symbol, order_price, size, direction),
+                )
+                results = await submit_legs([nado_leg, hedge_leg])
+                hedge_ok = bool(results and results[1])
+                if not results or not results[0]:
+                    print("下单失败")
+                    return False, hedge_ok
+                if not hedge_ok:
+                    print("  ⚠️ 对冲腿提交失败，将由持仓检查补齐")
+            elif not await execute_nado_order(page, symbol, order_price, size, direction):
                 print("下单失败")
-                return False
+                return False, hedge_ok
             
             # 监控订单是否成交
-            result = monitor_order_fill(page, symbol, initial_position, check_interval=0.5, max_wait_time=300, retry_timeout=30)
+            if product_id:
+                result = await monitor_order_fill_api(watcher, product_id, since_idx, retry_timeout=30)
+            else:
+                result = await monitor_order_fill(page, symbol, initial_position, check_interval=0.5, max_wait_time=300, retry_timeout=30)
             
             if result is True:
                 print("订单已成交")
-                return True
+                return True, hedge_ok
             elif result is None:
                 # 超时未成交，需要重新下单
                 retry_count += 1
@@ -1119,16 +1054,16 @@ def execute_nado_order_with_retry(page, symbol, size, price_offset, direction, m
             else:
                 # 其他情况，停止重试
                 print("订单监控超时，停止重试")
-                return False
-    except KeyboardInterrupt:
-        # 捕获 KeyboardInterrupt 并重新抛出，让上层处理
+                return False, hedge_ok
+    except asyncio.CancelledError:
+        # 捕获 asyncio.CancelledError 并重新抛出，让上层处理
         raise
     
     print(f"\n❌ 已达到最大重试次数 ({max_retries})，停止重试")
-    return False
+    return False, hedge_ok
 
 
-def execute_nado_order(page, symbol, order_price, size, direction):
+async def execute_nado_order(page, symbol, order_price, size, direction):
     """
     执行Nado下单流程（通用函数）
     
@@ -1142,29 +1077,48 @@ def execute_nado_order(page, symbol, order_price, size, direction):
     Returns:
         bool: 是否成功提交订单
     """
-    if not click_limit_button(page):
+    if not await prepare_nado_order(page, order_price, size, direction):
+        return False
+    return await submit_nado_order(page, symbol, order_price, size, direction)
+
+
+async def prepare_nado_order(page, order_price, size, direction):
+    """
+    填写Nado限价单表单（Limit、方向标签、价格和大小），不提交
+    
+    Returns:
+        bool: 是否成功填写
+    """
+    if not await click_limit_button(page):
         print("Limit按钮点击失败")
         return False
-    safe_sleep(0.5)  # 等待0.5秒，可中断
+    await safe_sleep(0.5)  # 等待0.5秒，可中断
     
     if direction == "long":
-        if not click_long_tab_button(page):
+        if not await click_long_tab_button(page):
             print("做多标签按钮点击失败")
             return False
     else:
-        if not click_short_tab_button(page):
+        if not await click_short_tab_button(page):
             print("做空标签按钮点击失败")
             return False
-    safe_sleep(0.5)  # 等待0.5秒，可中断
+    await safe_sleep(0.5)  # 等待0.5秒，可中断
     
-    if not fill_nado_order_form(page, order_price, size):
-        return False
+    return await fill_nado_order_form(page, order_price, size)
+
+
+async def submit_nado_order(page, symbol, order_price, size, direction):
+    """
+    点击Nado提交按钮（表单需已由 prepare_nado_order 填好）
     
+    Returns:
+        bool: 是否成功提交订单
+    """
     order_type = "做多" if direction == "long" else "做空"
     if direction == "long":
-        success = click_submit_long_button(page, symbol)
+        success = await click_submit_long_button(page, symbol)
     else:
-        success = click_submit_short_button(page, symbol)
+        success = await click_submit_short_button(page, symbol)
     
     if success:
         price_actual = order_price / 100.0
@@ -1175,7 +1129,7 @@ def execute_nado_order(page, symbol, order_price, size, direction):
         return False
 
 
-def method1(pages, configs):
+async def method1(pages, configs):
     """做多Nado做空Variational"""
     if not configs:
         print("错误: 未找到配置")
@@ -1193,20 +1147,20 @@ def method1(pages, configs):
     
     print(f"\n开始执行做多Nado操作 - {symbol}")
     
-    # 执行Nado下单流程（带重试逻辑）
-    is_filled = execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "long", max_retries=999)
+    # 执行Nado下单流程（带重试逻辑），Variational做空与Nado首单同时提交
+    hedge_leg = make_variational_leg(pages, configs, "short")
+    is_filled, hedge_ok = await execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "long", max_retries=999, watcher=get_fill_watcher(config), hedge_leg=hedge_leg)
     
-    # 如果订单成交，执行Variational做空操作
-    if is_filled:
-        print("\n步骤8: 执行Variational做空操作...")
-        execute_variational_short(pages, configs)
-    else:
-        print("\n订单未成交，跳过Variational操作")
+    # 如果订单最终未成交或对冲腿提交失败，按实际持仓调整Variational
+    if (not is_filled or not hedge_ok) and hedge_leg is not None:
+        print("\n订单未成交或对冲腿失败，按实际持仓调整Variational...")
+        await cancel_all_orders(nado_page, symbol)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
     
     print("=" * 50)
 
 
-def method2(pages, configs):
+async def method2(pages, configs):
     """做空Nado做多Variational"""
     if not configs:
         print("错误: 未找到配置")
@@ -1225,17 +1179,18 @@ def method2(pages, configs):
     print(f"\n做空Nado做多Variational - {symbol}")
     print("=" * 50)
     
-    is_filled = execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "short", max_retries=999)
+    hedge_leg = make_variational_leg(pages, configs, "long")
+    is_filled, hedge_ok = await execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "short", max_retries=999, watcher=get_fill_watcher(config), hedge_leg=hedge_leg)
     
-    if is_filled:
-        execute_variational_long(pages, configs)
-    else:
-        print("  ⚠️ 订单未成交，跳过Variational操作")
+    if (not is_filled or not hedge_ok) and hedge_leg is not None:
+        print("  ⚠️ 订单未成交或对冲腿失败，按实际持仓调整Variational")
+        await cancel_all_orders(nado_page, symbol)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
     
     print("=" * 50)
 
 
-def method3(pages, configs):
+async def method3(pages, configs):
     """多次做多Nado做空Variational"""
     if not configs:
         print("错误: 未找到配置")
@@ -1283,34 +1238,34 @@ def method3(pages, configs):
         
         # 执行做多Nado操作
         print(f"\n开始执行做多Nado操作 - {symbol}")
-        is_filled = execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "long", max_retries=999)
+        is_filled, _ = await execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "long", max_retries=999, watcher=get_fill_watcher(config))
         
         # 如果订单成交，执行Variational做空操作
         # if is_filled:
         #     print("\n执行Variational做空操作...")
-        #     execute_variational_short(pages, configs)
+        #     await execute_variational_short(pages, configs)
         
         # 检查并调整持仓对冲情况
         print("\n检查持仓对冲情况...")
-        cancel_all_orders(nado_page, symbol)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
+        await cancel_all_orders(nado_page, symbol)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
         
         # 如果不是最后一次执行，随机休眠
         if i < repeat_count:
             sleep_time = random.randint(sleep_min, sleep_max)
             print(f"\n等待 {sleep_time} 秒后继续下一次执行...")
-            safe_sleep(sleep_time)
+            await safe_sleep(sleep_time)
     
     print(f"已完成 {repeat_count} 次执行")
 
 
-def method4(pages, configs):
+async def method4(pages, configs):
     """多次做空Nado做多Variational"""
     if not configs:
         print("错误: 未找到配置")
@@ -1356,36 +1311,36 @@ def method4(pages, configs):
         
         # 执行做空Nado操作
         print(f"\n开始执行做空Nado操作 - {symbol}")
-        is_filled = execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "short", max_retries=999)
+        is_filled, _ = await execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "short", max_retries=999, watcher=get_fill_watcher(config))
         
         # 如果订单成交，执行Variational做多操作
         # if is_filled:
         #     print("\n执行Variational做多操作...")
-        #     execute_variational_long(pages, configs)
+        #     await execute_variational_long(pages, configs)
         
         # 检查并调整持仓对冲情况
         print("\n检查持仓对冲情况...")
-        cancel_all_orders(nado_page, symbol)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
+        await cancel_all_orders(nado_page, symbol)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
         
         # 如果不是最后一次执行，随机休眠
         if i < repeat_count:
             sleep_time = random.randint(sleep_min, sleep_max)
             print(f"\n等待 {sleep_time} 秒后继续下一次执行...")
-            safe_sleep(sleep_time)
+            await safe_sleep(sleep_time)
     
     print(f"已完成 {repeat_count} 次执行")
 
 
-def method5(pages, configs):
+async def method5(pages, configs):
     """无限循环执行：做多Nado做空Variational -> 休眠 -> 做空Nado做多Variational"""
     if not configs:
         print("错误: 未找到配置")
@@ -1423,53 +1378,53 @@ def method5(pages, configs):
         
         # 步骤1: 单次做多Nado做空Variational
         print(f"\n[步骤1] 执行做多Nado做空Variational操作")
-        is_filled_long = execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "long", max_retries=999)
+        is_filled_long, _ = await execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "long", max_retries=999, watcher=get_fill_watcher(config))
         # if is_filled_long:
         #     print("\n执行Variational做空操作...")
-        #     execute_variational_short(pages, configs)
+        #     await execute_variational_short(pages, configs)
         
         # 步骤2: 休眠随机秒数
         sleep_time = random.randint(sleep_min, sleep_max)
         print(f"\n[步骤2] 等待 {sleep_time} 秒...")
-        cancel_all_orders(nado_page, symbol)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(sleep_time)
+        await cancel_all_orders(nado_page, symbol)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(sleep_time)
         
         # 步骤3: 单次做空Nado做多Variational
         print(f"\n[步骤3] 执行做空Nado做多Variational操作")
-        is_filled_short = execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "short", max_retries=999)
+        is_filled_short, _ = await execute_nado_order_with_retry(nado_page, symbol, size, price_offset, "short", max_retries=999, watcher=get_fill_watcher(config))
         # if is_filled_short:
         #     print("\n执行Variational做多操作...")
-        #     execute_variational_long(pages, configs)
+        #     await execute_variational_long(pages, configs)
         
         # 检查持仓对冲情况
         print("\n[检查2] 检查持仓对冲情况...")
-        cancel_all_orders(nado_page, symbol)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
-        safe_sleep(10)
-        check_and_adjust_hedge(pages, configs, show_details=True)
+        await cancel_all_orders(nado_page, symbol)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
+        await safe_sleep(10)
+        await check_and_adjust_hedge(pages, configs, show_details=True)
         
         # 休眠后继续下一轮循环
         sleep_time = random.randint(sleep_min, sleep_max)
         print(f"\n等待 {sleep_time} 秒后继续下一轮循环...")
-        safe_sleep(sleep_time)
+        await safe_sleep(sleep_time)
 
 
-def get_nado_position(page, symbol):
+async def get_nado_position(page, symbol):
     """
     获取Nado持仓信息
     
@@ -1488,9 +1443,9 @@ def get_nado_position(page, symbol):
         ]
         
         for selector in selectors:
-            position_button = page.query_selector(selector)
+            position_button = await page.query_selector(selector)
             if position_button:
-                position_text = position_button.inner_text().strip()
+                position_text = (await position_button.inner_text()).strip()
                 if position_text and (symbol.upper() in position_text.upper() or 'BTC' in position_text or 'ETH' in position_text):
                     return position_text
         
@@ -1500,7 +1455,7 @@ def get_nado_position(page, symbol):
         return None
 
 
-def get_variational_position(page, symbol):
+async def get_variational_position(page, symbol):
     """
     获取Variational持仓信息
     
@@ -1519,17 +1474,17 @@ def get_variational_position(page, symbol):
         ]
         
         for selector in selectors:
-            position_span = page.query_selector(selector)
+            position_span = await page.query_selector(selector)
             if position_span:
-                position_text = position_span.inner_text().strip()
+                position_text = (await position_span.inner_text()).strip()
                 # 检查是否包含交易对符号或BTC/ETH
                 if position_text and (symbol.upper() in position_text.upper() or 'BTC' in position_text or 'ETH' in position_text):
                     return position_text
         
         # 如果上面的选择器都没找到，尝试查找所有包含持仓信息的span
-        all_spans = page.query_selector_all('span.text-blackwhite')
+        all_spans = await page.query_selector_all('span.text-blackwhite')
         for span in all_spans:
-            text = span.inner_text().strip()
+            text = (await span.inner_text()).strip()
             if text and (symbol.upper() in text.upper() or 'BTC' in text or 'ETH' in text):
                 return text
         
@@ -1591,7 +1546,7 @@ def parse_position(position_str, symbol):
         return None, 0
 
 
-def check_and_adjust_hedge(pages, configs, show_details=True):
+async def check_and_adjust_hedge(pages, configs, show_details=True):
     """
     检查并调整持仓对冲情况
     
@@ -1618,9 +1573,19 @@ def check_and_adjust_hedge(pages, configs, show_details=True):
     TOLERANCE = 0.00001  # 对冲容差
     MIN_SIZE = 0.00001   # 最小交易单位
     
-    # 获取并解析持仓
-    nado_position_str = get_nado_position(nado_page, symbol)
-    var_position_str = get_variational_position(variational_page, symbol)
+    # 获取并解析持仓：配置了 nado_address 时Nado持仓直接从API读取
+    nado_position_str = None
+    watcher = get_fill_watcher(config)
+    product_id = await asyncio.to_thread(get_product_id, symbol) if watcher else None
+    if product_id:
+        try:
+            amount = await asyncio.to_thread(watcher.get_position, product_id)
+            nado_position_str = f"{amount:.8f} {symbol}"
+        except Exception as e:
+            print(f"  API获取Nado持仓失败，回退到页面: {e}")
+    if nado_position_str is None:
+        nado_position_str = await get_nado_position(nado_page, symbol)
+    var_position_str = await get_variational_position(variational_page, symbol)
     nado_value, nado_direction = parse_position(nado_position_str, symbol)
     var_value, var_direction = parse_position(var_position_str, symbol)
     
@@ -1686,13 +1651,13 @@ def check_and_adjust_hedge(pages, configs, show_details=True):
     # 执行调整
     if show_details:
         print(f"  调整Variational仓位：{adjustment_direction} {adjustment_size}")
-    success = execute_variational_long(pages, configs, size=adjustment_size) if adjustment_direction == "long" else execute_variational_short(pages, configs, size=adjustment_size)
+    success = await execute_variational_long(pages, configs, size=adjustment_size) if adjustment_direction == "long" else await execute_variational_short(pages, configs, size=adjustment_size)
     if show_details:
         print(f"  Variational调整{'成功' if success else '失败'}")
     return success
 
 
-def method6(pages, configs):
+async def method6(pages, configs):
     """比对Nado和Variational持仓，如果不是对冲则调整Variational仓位"""
     if not configs:
         print("错误: 未找到配置")
@@ -1718,12 +1683,13 @@ def method6(pages, configs):
             current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
             print(f"\n[{current_time}] 检查 #{check_count}")
             
-            check_and_adjust_hedge(pages, configs, show_details=True)
+            await check_and_adjust_hedge(pages, configs, show_details=True)
             
-            safe_sleep(5)
+            await safe_sleep(5)
             
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
         print(f"\n\n监控已停止，共检查 {check_count} 次")
+        raise
 
 
 def main():
@@ -1743,75 +1709,68 @@ def main():
         print(f"错误: 未找到配置，请检查 {args.config} 文件")
         sys.exit(1)
     
-    # 先打开所有窗口
-    with sync_playwright() as playwright:
-        pages = {}
-        for config in configs:
-            url_1 = get_url(config['symbol'], "variational")
-            url_2 = get_url(config['symbol'], "nado")
-            
-            print(f"\n正在打开Variational页面: {url_1}")
-            variational_page = open_page(playwright, config['variational_env_id'], url_1)
-            if variational_page:
-                pages['variational'] = variational_page
-                print("Variational页面打开成功")
-            else:
-                print("Variational页面打开失败")
-            
-            print(f"\n正在打开Nado页面: {url_2}")
-            nado_page = open_page(playwright, config['nado_env_id'], url_2)
-            if nado_page:
-                pages['nado'] = nado_page
-                print("Nado页面打开成功")
-            else:
-                print("Nado页面打开失败")
+    # 先并发打开所有窗口
+    orchestrator = ProfileOrchestrator()
+    specs = {}
+    for config in configs:
+        specs['variational'] = (config['variational_env_id'], get_url(config['symbol'], "variational"))
+        specs['nado'] = (config['nado_env_id'], get_url(config['symbol'], "nado"))
+    
+    print("\n正在同时打开Variational和Nado页面...")
+    profiles = orchestrator.run(orchestrator.open_profiles(specs))
+    pages = {name: profile.page for name, profile in profiles.items()}
+    for name in specs:
+        print(f"{'Variational' if name == 'variational' else 'Nado'}页面打开{'成功' if name in pages else '失败'}")
+    
+    # 检查是否至少有一个页面成功打开
+    if not pages:
+        print("\n错误: 所有页面打开失败，程序退出")
+        orchestrator.close()
+        sys.exit(1)
+    
+    if 'nado' not in pages:
+        print("\n警告: Nado页面未打开，部分功能可能无法使用")
+    if 'variational' not in pages:
+        print("\n警告: Variational页面未打开，部分功能可能无法使用")
+    
+    methods = {
+        "1": method1,
+        "2": method2,
+        "3": method3,
+        "4": method4,
+        "5": method5,
+        "6": method6,
+    }
+    
+    # 窗口打开后，显示菜单
+    while True:
+        try:
+            show_menu()
+            choice = input("请选择 (1-6): ").strip()
+        except KeyboardInterrupt:
+            # 在菜单界面按 Ctrl+C 退出程序
+            print("\n\n退出脚本")
+            orchestrator.close()
+            sys.exit(0)
         
-        # 检查是否至少有一个页面成功打开
-        if not pages:
-            print("\n错误: 所有页面打开失败，程序退出")
-            sys.exit(1)
+        # 每次执行方法前重新加载配置，这样修改配置文件后无需重启脚本
+        configs = load_config(args.config)
+        if not configs:
+            print(f"错误: 未找到配置，请检查 {args.config} 文件")
+            continue
         
-        if 'nado' not in pages:
-            print("\n警告: Nado页面未打开，部分功能可能无法使用")
-        if 'variational' not in pages:
-            print("\n警告: Variational页面未打开，部分功能可能无法使用")
+        method = methods.get(choice)
+        if method is None:
+            print("无效选择，请重新输入")
+            continue
         
-        # 窗口打开后，显示菜单
-        while True:
-            try:
-                show_menu()
-                choice = input("请选择 (1-6): ").strip()
-            except KeyboardInterrupt:
-                # 在菜单界面按 Ctrl+C 退出程序
-                print("\n\n退出脚本")
-                sys.exit(0)
-            
-            # 每次执行方法前重新加载配置，这样修改配置文件后无需重启脚本
-            configs = load_config(args.config)
-            if not configs:
-                print(f"错误: 未找到配置，请检查 {args.config} 文件")
-                continue
-            
-            # 执行方法时捕获 Ctrl+C，返回菜单而不是退出程序
-            try:
-                if choice == "1":
-                    method1(pages, configs)
-                elif choice == "2":
-                    method2(pages, configs)
-                elif choice == "3":
-                    method3(pages, configs)
-                elif choice == "4":
-                    method4(pages, configs)
-                elif choice == "5":
-                    method5(pages, configs)
-                elif choice == "6":
-                    method6(pages, configs)
-                else:
-                    print("无效选择，请重新输入")
-            except KeyboardInterrupt:
-                # 在执行方法时按 Ctrl+C，返回菜单
-                print("\n\n已取消当前操作，返回菜单...")
-                continue
+        # 执行方法时捕获 Ctrl+C，返回菜单而不是退出程序
+        try:
+            orchestrator.run(method(pages, configs))
+        except KeyboardInterrupt:
+            # 在执行方法时按 Ctrl+C，返回菜单
+            print("\n\n已取消当前操作，返回菜单...")
+            continue
 
 
 if __name__ == "__main__":
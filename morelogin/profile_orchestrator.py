@@ -0,0 +1,326 @@
+"""
+MoreLogin 多环境并发编排（基于 Playwright async API）
+
+在同一个事件循环里并发启动/连接多个浏览器环境，每个环境一把锁，
+同一页面上的操作串行，不同环境之间互不阻塞、互不影响（单个环境出错不会中断其他环境）。
+
+对冲下单分两阶段：先并发填好所有腿的表单，再同时点击提交，
+两腿之间的时间差只剩点击本身的延迟。
+
+使用示例:
+    orchestrator = ProfileOrchestrator()
+    profiles = orchestrator.run(orchestrator.open_profiles({
+        "nado": (nado_env_id, nado_url),
+        "variational": (var_env_id, var_url),
+    }))
+    orchestrator.run(orchestrator.submit_legs([
+        HedgeLeg("nado", prepare_nado, submit_nado),
+        HedgeLeg("variational", prepare_var, submit_var),
+    ]))
+    orchestrator.close()
+"""
+
+import asyncio
+import time
+
+import requests
+from playwright.async_api import async_playwright
+
+
+class HedgeLeg:
+    """
+    对冲的一条腿
+
+    Args:
+        name: 环境名称（open_profiles 时使用的键）
+        prepare: 无参协程函数，填写表单，返回是否成功
+        submit: 无参协程函数，点击提交，返回是否成功
+    """
+
+    def __init__(self, name, prepare, submit):
+        self.name = name
+        self.prepare = prepare
+        self.submit = submit
+
+
+class Profile:
+    """单个浏览器环境"""
+
+    def __init__(self, name, env_id):
+        self.name = name
+        self.env_id = env_id
+        self.cdp_url = None
+        self.browser = None
+        self.page = None
+        self.lock = asyncio.Lock()
+
+    def __repr__(self):
+        return f"Profile(name={self.name}, env_id={self.env_id})"
+
+
+class ProfileOrchestrator:
+    """
+    多环境并发编排器（持有唯一的事件循环和 Playwright 实例）
+
+    Args:
+        api_base_url: MoreLogin 本地 API 地址
+        api_timeout: MoreLogin API 超时（秒）
+        page_load_timeout: 页面加载超时（毫秒）
+        wait_until: 页面加载等待策略
+        start_delay: 环境启动后、连接 CDP 前的等待时间（秒）
+        navigate_existing: 复用已打开的页面时，URL 不一致是否导航到目标 URL；
+            False 时只把已打开的页面切到前台，不重新加载（用户可能正在该页面上操作）
+    """
+
+    def __init__(
+        self,
+        api_base_url="http://localhost:40000",
+        api_timeout=10,
+        page_load_timeout=120000,
+        wait_until="domcontentloaded",
+        start_delay=0,
+        navigate_existing=True,
+    ):
+        self.api_base_url = api_base_url
+        self.api_timeout = api_timeout
+        self.page_load_timeout = page_load_timeout
+        self.wait_until = wait_until
+        self.start_delay = start_delay
+        self.navigate_existing = navigate_existing
+        self.loop = asyncio.new_event_loop()
+        self.profiles = {}
+        self._playwright = None
+
+    # ---------- 事件循环 ----------
+
+    def run(self, coro):
+        """
+        在编排器的事件循环上执行协程（同步入口）
+
+        Ctrl+C 时取消正在执行的任务并等待其退出，然后重新抛出 KeyboardInterrupt，
+        事件循环和已打开的页面保持可用，调用方可以继续执行下一个操作。
+        """
+        task = self.loop.create_task(coro)
+        try:
+            return self.loop.run_until_complete(task)
+        except KeyboardInterrupt:
+            task.cancel()
+            self.loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+            raise
+
+    def close(self):
+        """停止 Playwright 并关闭事件循环（不关闭浏览器环境）"""
+        if self.loop.is_closed():
+            return
+        if self._playwright is not None:
+            self.loop.run_until_complete(self._playwright.stop())
+            self._playwright = None
+        self.loop.close()
+
+    async def _ensure_playwright(self):
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return self._playwright
+
+    # ---------- 环境启动与页面 ----------
+
+    async def start_profile(self, env_id):
+        """启动浏览器环境，返回 CDP URL，失败返回 None"""
+        def _start():
+            response = requests.post(
+                f"{self.api_base_url}/api/env/start",
+                json={"envId": env_id},
+                timeout=self.api_timeout,
+            ).json()
+            if response.get("code") != 0:
+                print(f"[{env_id}] 启动失败: {response.get('msg', '')}")
+                return None
+            return f"http://127.0.0.1:{response['data']['debugPort']}"
+
+        try:
+            return await asyncio.to_thread(_start)
+        except Exception as e:
+            print(f"[{env_id}] 启动失败: {e}")
+            return None
+
+    async def open_profile(self, name, env_id, url, delay=0):
+        """
+        启动环境并打开页面，优先复用已打开的匹配页面
+
+        Args:
+            delay: 发起启动请求前的等待时间（秒），用于错开对 MoreLogin API 的请求
+
+        Returns:
+            Profile: 成功返回环境对象，失败返回 None
+        """
+        if delay:
+            await asyncio.sleep(delay)
+        profile = Profile(name, env_id)
+        profile.cdp_url = await self.start_profile(env_id)
+        if profile.cdp_url is None:
+            return None
+        if self.start_delay:
+            await asyncio.sleep(self.start_delay)
+
+        playwright = await self._ensure_playwright()
+        try:
+            profile.browser = await playwright.chromium.connect_over_cdp(profile.cdp_url)
+            profile.page = await self._find_or_open_page(profile.browser, url)
+        except Exception as e:
+            print(f"[{env_id}] 打开页面失败: {url}")
+            print(f"错误信息: {e}")
+            return None
+
+        self.profiles[name] = profile
+        return profile
+
+    async def _find_or_open_page(self, browser, url):
+        if self.navigate_existing:
+            page = await self._find_and_navigate_page(browser, url)
+        else:
+            page = await self._find_open_page(browser, url)
+        if page is not None:
+            return page
+
+        ctx = browser.contexts[0] if browser.contexts else await browser.new_context()
+        page = await ctx.new_page()
+        await page.goto(url, timeout=self.page_load_timeout, wait_until=self.wait_until)
+        return page
+
+    async def _find_and_navigate_page(self, browser, url):
+        """查找已打开的同站页面（忽略 query/hash），URL 不一致时导航到目标 URL"""
+        url_main = url.split('?')[0].split('#')[0]
+        for ctx in browser.contexts:
+            for existing_page in ctx.pages:
+                current_url_main = (existing_page.url or "").split('?')[0].split('#')[0]
+                if not current_url_main or not (url_main in current_url_main or current_url_main in url_main):
+                    continue
+                print(f"  检测到已打开的页面: {existing_page.url}")
+                if existing_page.url != url:
+                    try:
+                        await existing_page.goto(url, timeout=self.page_load_timeout, wait_until=self.wait_until)
+                    except Exception as nav_e:
+                        print(f"  导航到目标URL时出错: {nav_e}，继续使用当前页面")
+                return existing_page
+        return None
+
+    async def _find_open_page(self, browser, url):
+        """查找已打开的目标页面（URL 以目标 URL 开头或包含目标 URL），切到前台后原样复用"""
+        for ctx in browser.contexts:
+            for existing_page in ctx.pages:
+                current_url = existing_page.url or ""
+                if current_url.startswith(url) or url in current_url:
+                    try:
+                        await existing_page.bring_to_front()
+                    except Exception:
+                        pass
+                    return existing_page
+        return None
+
+    async def open_profiles(self, specs, stagger=0):
+        """
+        并发启动并打开多个环境
+
+        Args:
+            specs: {名称: (env_id, url)}
+            stagger: 相邻环境启动请求之间的间隔（秒），页面加载仍然并发
+
+        Returns:
+            dict: {名称: Profile}，只包含成功打开的环境
+        """
+        names = list(specs)
+        results = await asyncio.gather(
+            *(self.open_profile(name, *specs[name], delay=i * stagger) for i, name in enumerate(names)),
+            return_exceptions=True,
+        )
+        opened = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                print(f"[{name}] 打开失败: {result}")
+            elif result is not None:
+                opened[name] = result
+        return opened
+
+    def page(self, name):
+        """获取环境的页面，未打开返回 None"""
+        profile = self.profiles.get(name)
+        return profile.page if profile is not None else None
+
+    # ---------- 并发执行 ----------
+
+    async def run_on(self, name, fn, *args, **kwargs):
+        """
+        在指定环境上执行 fn(page, *args, **kwargs)，同一环境的操作串行执行
+
+        异常只影响当前环境，打印后返回 None。
+        """
+        profile = self.profiles[name]
+        async with profile.lock:
+            try:
+                return await fn(profile.page, *args, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[{profile.env_id}] 执行 {getattr(fn, '__name__', fn)} 失败: {e}")
+                return None
+
+    async def run_on_all(self, names, fn, *args, **kwargs):
+        """在多个环境上并发执行同一个操作，返回 {名称: 结果}"""
+        results = await asyncio.gather(*(self.run_on(name, fn, *args, **kwargs) for name in names))
+        return dict(zip(names, results))
+
+    async def submit_legs(self, legs):
+        """
+        同时提交对冲的多条腿（持有相关环境的锁）
+
+        Returns:
+            list[bool] | None: 各腿提交结果；任一腿准备失败时不提交任何一腿，返回 None
+        """
+        profiles = sorted({leg.name for leg in legs})
+        locks = [self.profiles[name].lock for name in profiles]
+        for lock in locks:
+            await lock.acquire()
+        try:
+            return await submit_legs(legs)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+async def _guarded(label, fn):
+    try:
+        return bool(await fn())
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[{label}] 失败: {e}")
+        return False
+
+
+async def submit_legs(legs):
+    """
+    两阶段并发提交：先并发准备所有腿，全部成功后同时点击提交
+
+    Args:
+        legs: HedgeLeg 列表
+
+    Returns:
+        list[bool] | None: 各腿提交结果（与 legs 顺序一致）；任一腿准备失败时返回 None
+    """
+    prepared = await asyncio.gather(*(_guarded(f"{leg.name} 准备", leg.prepare) for leg in legs))
+    if not all(prepared):
+        failed = [leg.name for leg, ok in zip(legs, prepared) if not ok]
+        print(f"  准备失败: {', '.join(failed)}，本次不提交任何一腿")
+        return None
+
+    fired_at = {}
+
+    async def _fire(leg):
+        fired_at[leg.name] = time.perf_counter()
+        return await _guarded(f"{leg.name} 提交", leg.submit)
+
+    results = await asyncio.gather(*(_fire(leg) for leg in legs))
+    if len(fired_at) > 1:
+        skew_ms = (max(fired_at.values()) - min(fired_at.values())) * 1000
+        print(f"  对冲腿同时提交: {', '.join(f'{leg.name}={ok}' for leg, ok in zip(legs, results))} (时间差 {skew_ms:.1f}ms)")
+    return results
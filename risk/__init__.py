@@ -1,7 +1,30 @@
 """
 Risk Management Module
 风险控制模块
+
+导出项在首次访问时才导入（numpy / requests 较慢，只用网格不开风控时不加载）
 """
-from risk.indicators import IndicatorTool
+import importlib
+
+_EXPORTS = {
+    "IndicatorTool": "risk.indicators",
+    "RegimeScanner": "risk.regime_scanner",
+    "RegimeTable": "risk.regime_scanner",
+    "RegimeRow": "risk.regime_scanner",
+    "read_regime_table": "risk.regime_scanner",
+}
+
+__all__ = ["IndicatorTool", "RegimeScanner", "RegimeTable", "RegimeRow", "read_regime_table"]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'risk' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["IndicatorTool"]
+def __dir__():
+    return sorted(list(globals()) + __all__)
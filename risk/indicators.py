@@ -2,11 +2,67 @@
 Technical Indicators Tool
 技术指标工具类
 """
+import numpy as np
 import requests
-import pandas as pd
-import talib
 from typing import Optional
 
+from risk.indicators_np import adx as _adx
+
+BINANCE_KLINES_URL = "https://api.binance.com/api/v3/klines"
+
+
+def to_binance_symbol(symbol: str) -> str:
+    """转换交易对格式为币安格式: BTC-USD/BTC-USDT/BTC_USDT_Perp -> BTCUSDT"""
+    binance_symbol = symbol.upper().replace("_PERP", "").replace("-", "").replace("_", "")
+    if binance_symbol.endswith("USD") and not binance_symbol.endswith("USDT"):
+        binance_symbol = binance_symbol[:-3] + "USDT"
+    return binance_symbol
+
+
+def fetch_binance_klines(
+    symbol: str,
+    interval: str,
+    limit: int = 100,
+    session: Optional[requests.Session] = None,
+    timeout: float = 5
+) -> Optional[np.ndarray]:
+    """
+    从币安获取K线
+    
+    Args:
+        symbol: 交易对符号，任意格式（会转换为币安格式）
+        interval: 时间周期 (e.g., "1m", "5m", "1h")
+        limit: K线数量
+        session: 可选的 requests.Session（批量获取时复用连接）
+        timeout: 请求超时（秒）
+        
+    Returns:
+        Optional[np.ndarray]: 形状 [N, 3] 的 high/low/close（按时间从旧到新），失败返回 None
+    """
+    params = {
+        "symbol": to_binance_symbol(symbol),
+        "interval": interval,
+        "limit": limit
+    }
+    
+    try:
+        response = (session or requests).get(BINANCE_KLINES_URL, params=params, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        print(f"币安K线: 无法连接币安API - {type(e).__name__}")
+        return None
+    
+    if not response.ok:
+        print(f"币安K线: 币安API返回错误 - HTTP {response.status_code} ({params['symbol']})")
+        return None
+    
+    data = response.json()
+    if not data:
+        print(f"币安K线: 币安API返回空数据 ({params['symbol']})")
+        return None
+    
+    # K线格式: [open_time, open, high, low, close, volume, ...]
+    return np.array([row[2:5] for row in data], dtype=np.float64)
+
 
 class IndicatorTool:
     """技术指标工具类"""
@@ -29,51 +85,16 @@ class IndicatorTool:
             Optional[float]: ADX 值，如果计算失败返回 None
         """
         try:
-            # 转换交易对格式为币安格式: BTC-USD/BTC-USDT/BTC_USDT_Perp -> BTCUSDT
-            binance_symbol = symbol.upper().replace("_PERP", "").replace("-", "").replace("_", "")
-            if binance_symbol.endswith("USD") and not binance_symbol.endswith("USDT"):
-                binance_symbol = binance_symbol[:-3] + "USDT"
-            
-            # 从币安获取K线数据
-            url = f"https://api.binance.com/api/v3/klines"
-            params = {
-                "symbol": binance_symbol,
-                "interval": resolution,
-                "limit": 100
-            }
-            
-            try:
-                response = requests.get(url, params=params, timeout=5)
-            except requests.exceptions.RequestException as e:
-                print(f"ADX指标: 无法连接币安API - {type(e).__name__}")
-                return None
-            
-            if not response.ok:
-                print(f"ADX指标: 币安API返回错误 - HTTP {response.status_code}")
-                return None
-            
-            data = response.json()
-            if not data:
-                print(f"ADX指标: 币安API返回空数据")
+            klines = fetch_binance_klines(symbol, resolution, limit=100)
+            if klines is None:
                 return None
+            high, low, close = klines[:, 0], klines[:, 1], klines[:, 2]
             
-            # 转换为 DataFrame
-            df = pd.DataFrame(data, columns=[
-                'open_time', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
-            
-            # 转换为数值类型
-            df['high'] = pd.to_numeric(df['high'])
-            df['low'] = pd.to_numeric(df['low'])
-            df['close'] = pd.to_numeric(df['close'])
-            
-            # 计算 ADX
-            adx = talib.ADX(df['high'], df['low'], df['close'], timeperiod=period)
+            # 计算 ADX（与 talib.ADX 口径一致）
+            adx = _adx(high, low, close, period=period)
             
             # 返回最新的 ADX 值
-            return float(adx.iloc[-1]) if not pd.isna(adx.iloc[-1]) else None
+            return float(adx[-1]) if not np.isnan(adx[-1]) else None
             
         except Exception:
             return None
@@ -0,0 +1,329 @@
+"""
+Vectorized Indicators
+NumPy 向量化技术指标
+
+所有函数接受形状为 [品种数 × K线数] 的二维数组（也接受一维数组，视为单个品种），
+一次调用算完整个品种池，返回同形状的 float64 数组，前面不足周期的位置为 NaN。
+计算口径与 TA-Lib 默认设置一致（Wilder 平滑的初始化方式、零值处理），
+可以直接替换 talib.RSI / ATR / PLUS_DI / MINUS_DI / DX / ADX / BBANDS。
+
+Wilder 平滑是沿时间方向的递推，这里按块展开成矩阵乘法：
+每 _BLOCK 根K线一次 (品种 × 块) @ (块 × 块) 的乘法，不对每根K线做 Python 循环。
+
+使用示例:
+    high, low, close = np.asarray(highs), np.asarray(lows), np.asarray(closes)  # [symbols, bars]
+    adx_values = adx(high, low, close, period=14)[:, -1]   # 每个品种最新的 ADX
+    rsi_values = rsi(close, period=14)[:, -1]
+"""
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# TA-Lib 的 TA_IS_ZERO 判定阈值
+_ZERO = 1e-8
+# Wilder 递推按块展开的块长度
+_BLOCK = 64
+
+_weights_cache: Dict[Tuple[float, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _as_2d(x) -> Tuple[np.ndarray, bool]:
+    arr = np.asarray(x, dtype=np.float64)
+    if arr.ndim == 1:
+        return arr[np.newaxis, :], True
+    if arr.ndim != 2:
+        raise ValueError(f"输入必须是一维或二维数组，实际维度: {arr.ndim}")
+    return arr, False
+
+
+def _restore(out: np.ndarray, squeeze: bool) -> np.ndarray:
+    return out[0] if squeeze else out
+
+
+def _nan_like(x: np.ndarray) -> np.ndarray:
+    return np.full(x.shape, np.nan, dtype=np.float64)
+
+
+def _block_weights(alpha: float, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    块内递推的展开系数:
+        y[k] = decay[k] * y_prev + sum_j x[j] * w[j, k]
+    其中 decay[k] = (1-alpha)^(k+1)，w[j, k] = alpha * (1-alpha)^(k-j)（j <= k）
+    """
+    key = (alpha, size)
+    cached = _weights_cache.get(key)
+    if cached is not None:
+        return cached
+    beta = 1.0 - alpha
+    k = np.arange(size)
+    decay = beta ** (k + 1)
+    lag = k[np.newaxis, :] - k[:, np.newaxis]
+    w = np.where(lag >= 0, alpha * beta ** np.maximum(lag, 0), 0.0)
+    _weights_cache[key] = (decay, w)
+    return decay, w
+
+
+def _ema_from(seed: np.ndarray, x: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    从初始值 seed（每个品种一个）开始做递推 y[t] = (1-alpha) * y[t-1] + alpha * x[t]
+
+    Args:
+        seed: 形状 [S]
+        x: 形状 [S, K]
+
+    Returns:
+        np.ndarray: 形状 [S, K]，第 k 列为消费完 x[:, k] 之后的值
+    """
+    n_rows, n_cols = x.shape
+    out = np.empty((n_rows, n_cols), dtype=np.float64)
+    prev = seed.astype(np.float64, copy=True)
+    for start in range(0, n_cols, _BLOCK):
+        block = x[:, start:start + _BLOCK]
+        size = block.shape[1]
+        decay, w = _block_weights(alpha, size)
+        ys = prev[:, np.newaxis] * decay[np.newaxis, :] + block @ w
+        out[:, start:start + size] = ys
+        prev = ys[:, -1]
+    return out
+
+
+def wilder_smooth(x, period: int) -> np.ndarray:
+    """
+    Wilder 平滑（TA-Lib 口径）：前 period 个值的简单平均作为初始值，之后 y = (y*(n-1) + x) / n
+
+    Returns:
+        np.ndarray: 与输入同形状，前 period-1 个位置为 NaN
+    """
+    arr, squeeze = _as_2d(x)
+    if period < 1:
+        raise ValueError("period 必须 >= 1")
+    out = _nan_like(arr)
+    if arr.shape[1] >= period:
+        seed = arr[:, :period].mean(axis=1)
+        out[:, period - 1] = seed
+        out[:, period:] = _ema_from(seed, arr[:, period:], 1.0 / period)
+    return _restore(out, squeeze)
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """真实波幅 TR，第 0 根K线为 NaN（与 talib.TRANGE 一致）"""
+    h, squeeze = _as_2d(high)
+    l, _ = _as_2d(low)
+    c, _ = _as_2d(close)
+    out = _nan_like(h)
+    prev_close = c[:, :-1]
+    out[:, 1:] = np.maximum.reduce([
+        h[:, 1:] - l[:, 1:],
+        np.abs(h[:, 1:] - prev_close),
+        np.abs(l[:, 1:] - prev_close),
+    ])
+    return _restore(out, squeeze)
+
+
+def directional_movement(high, low) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    +DM / -DM，第 0 根K线为 NaN
+
+    Returns:
+        (plus_dm, minus_dm)
+    """
+    h, squeeze = _as_2d(high)
+    l, _ = _as_2d(low)
+    up = h[:, 1:] - h[:, :-1]
+    down = l[:, :-1] - l[:, 1:]
+    plus_dm = _nan_like(h)
+    minus_dm = _nan_like(h)
+    plus_dm[:, 1:] = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm[:, 1:] = np.where((down > up) & (down > 0), down, 0.0)
+    return _restore(plus_dm, squeeze), _restore(minus_dm, squeeze)
+
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    """平均真实波幅 ATR（与 talib.ATR 一致，前 period 个位置为 NaN）"""
+    tr, squeeze = _as_2d(true_range(high, low, close))
+    out = _nan_like(tr)
+    out[:, 1:] = wilder_smooth(tr[:, 1:], period) if tr.shape[1] > 1 else out[:, 1:]
+    return _restore(out, squeeze)
+
+
+def _smoothed_dm(high, low, close, period: int):
+    """
+    TA-Lib DI/DX/ADX 使用的平滑 +DM、-DM、TR（只保留比值，省去求和口径里的常数因子 n）
+
+    初始值为第 1..period-1 根K线的累加，之后每根K线做一次 Wilder 递推，
+    返回从第 period 根K线开始的 (plus, minus, tr)，形状 [S, bars - period]。
+    """
+    plus_dm, minus_dm = directional_movement(high, low)
+    plus_dm, _ = _as_2d(plus_dm)
+    minus_dm, _ = _as_2d(minus_dm)
+    tr, _ = _as_2d(true_range(high, low, close))
+    # 三个序列叠成一个 [3S, K] 数组，一次递推
+    stacked = np.concatenate((plus_dm, minus_dm, tr), axis=0)
+    seed = stacked[:, 1:period].sum(axis=1) / period
+    smoothed = _ema_from(seed, stacked[:, period:], 1.0 / period)
+    return np.split(smoothed, 3, axis=0)
+
+
+def _di_pair(plus_s: np.ndarray, minus_s: np.ndarray, tr_s: np.ndarray, period: int):
+    # TA-Lib 对求和口径的 TR 做零值判定，这里的平滑值是其 1/period
+    valid_tr = np.abs(tr_s * period) >= _ZERO
+    safe_tr = np.where(valid_tr, tr_s, 1.0)
+    plus_di = np.where(valid_tr, 100.0 * plus_s / safe_tr, 0.0)
+    minus_di = np.where(valid_tr, 100.0 * minus_s / safe_tr, 0.0)
+    return plus_di, minus_di, valid_tr
+
+
+def plus_di(high, low, close, period: int = 14) -> np.ndarray:
+    """+DI（与 talib.PLUS_DI 一致，前 period 个位置为 NaN）"""
+    h, squeeze = _as_2d(high)
+    out = _nan_like(h)
+    if h.shape[1] > period:
+        p, m, tr = _smoothed_dm(high, low, close, period)
+        out[:, period:] = _di_pair(p, m, tr, period)[0]
+    return _restore(out, squeeze)
+
+
+def minus_di(high, low, close, period: int = 14) -> np.ndarray:
+    """-DI（与 talib.MINUS_DI 一致，前 period 个位置为 NaN）"""
+    h, squeeze = _as_2d(high)
+    out = _nan_like(h)
+    if h.shape[1] > period:
+        p, m, tr = _smoothed_dm(high, low, close, period)
+        out[:, period:] = _di_pair(p, m, tr, period)[1]
+    return _restore(out, squeeze)
+
+
+def _raw_dx(high, low, close, period: int):
+    """DX 原始值及有效标记（TR 或 DI 之和为零的位置无效），形状 [S, bars - period]"""
+    p, m, tr = _smoothed_dm(high, low, close, period)
+    pdi, mdi, valid = _di_pair(p, m, tr, period)
+    di_sum = pdi + mdi
+    valid &= np.abs(di_sum) >= _ZERO
+    dx = np.where(valid, 100.0 * np.abs(pdi - mdi) / np.where(valid, di_sum, 1.0), 0.0)
+    return dx, valid
+
+
+def _hold_invalid(values: np.ndarray, valid: np.ndarray, first: float = 0.0) -> np.ndarray:
+    """无效位置沿用前一个有效值（第一个之前用 first）"""
+    if valid.all():
+        return values
+    idx = np.where(valid, np.arange(values.shape[1])[np.newaxis, :], -1)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = np.take_along_axis(values, np.maximum(idx, 0), axis=1)
+    return np.where(idx >= 0, filled, first)
+
+
+def dx(high, low, close, period: int = 14) -> np.ndarray:
+    """DX（与 talib.DX 一致，前 period 个位置为 NaN）"""
+    h, squeeze = _as_2d(high)
+    out = _nan_like(h)
+    if h.shape[1] > period:
+        raw, valid = _raw_dx(high, low, close, period)
+        out[:, period:] = _hold_invalid(raw, valid)
+    return _restore(out, squeeze)
+
+
+def adx(high, low, close, period: int = 14) -> np.ndarray:
+    """
+    平均趋向指数 ADX（与 talib.ADX 一致，前 2*period-1 个位置为 NaN）
+
+    初始 ADX 为第 period..2*period-1 根K线 DX 的平均（无效 DX 计 0），
+    之后 Wilder 平滑；DX 无效的K线 ADX 保持不变。
+    """
+    h, squeeze = _as_2d(high)
+    out = _nan_like(h)
+    lookback = 2 * period - 1
+    if h.shape[1] <= lookback:
+        return _restore(out, squeeze)
+
+    raw, valid = _raw_dx(high, low, close, period)
+    seed = raw[:, :period].mean(axis=1)
+    out[:, lookback] = seed
+    rest, rest_valid = raw[:, period:], valid[:, period:]
+    if rest.shape[1]:
+        alpha = 1.0 / period
+        smoothed = _ema_from(seed, rest, alpha)
+        bad_rows = ~rest_valid.all(axis=1)
+        for row in np.flatnonzero(bad_rows):
+            # 少数出现无效 DX 的品种逐根递推，保持 TA-Lib 的"无效不更新"口径
+            value = seed[row]
+            for k in range(rest.shape[1]):
+                if rest_valid[row, k]:
+                    value = value + alpha * (rest[row, k] - value)
+                smoothed[row, k] = value
+        out[:, lookback + 1:] = smoothed
+    return _restore(out, squeeze)
+
+
+def rsi(close, period: int = 14) -> np.ndarray:
+    """相对强弱指标 RSI（与 talib.RSI 一致，前 period 个位置为 NaN）"""
+    c, squeeze = _as_2d(close)
+    out = _nan_like(c)
+    if c.shape[1] > period:
+        delta = np.diff(c, axis=1)
+        gain = wilder_smooth(np.maximum(delta, 0.0), period)
+        loss = wilder_smooth(np.maximum(-delta, 0.0), period)
+        gain, _ = _as_2d(gain)
+        loss, _ = _as_2d(loss)
+        total = gain + loss
+        valid = np.abs(total) >= _ZERO
+        values = np.where(valid, 100.0 * gain / np.where(valid, total, 1.0), 0.0)
+        out[:, period:] = values[:, period - 1:]
+    return _restore(out, squeeze)
+
+
+def _rolling_windows(x: np.ndarray, period: int) -> np.ndarray:
+    return np.lib.stride_tricks.sliding_window_view(x, period, axis=1)
+
+
+def bbands(close, period: int = 20, nbdev_up: float = 2.0, nbdev_dn: float = 2.0):
+    """
+    布林带（与 talib.BBANDS(matype=0) 一致：简单均线 + 总体标准差）
+
+    Returns:
+        (upper, middle, lower)，前 period-1 个位置为 NaN
+    """
+    c, squeeze = _as_2d(close)
+    upper, middle, lower = _nan_like(c), _nan_like(c), _nan_like(c)
+    if c.shape[1] >= period:
+        windows = _rolling_windows(c, period)
+        mean = windows.mean(axis=2)
+        std = windows.std(axis=2)
+        middle[:, period - 1:] = mean
+        upper[:, period - 1:] = mean + nbdev_up * std
+        lower[:, period - 1:] = mean - nbdev_dn * std
+    return _restore(upper, squeeze), _restore(middle, squeeze), _restore(lower, squeeze)
+
+
+def realized_vol(close, period: int = 20, periods_per_year: float = None) -> np.ndarray:
+    """
+    已实现波动率：最近 period 根K线对数收益率的平方均值开方 sqrt(mean(r^2))
+
+    Args:
+        close: 收盘价
+        period: 窗口长度（收益率个数）
+        periods_per_year: 年化系数（如 5m K线为 365*24*12），None 表示不年化
+
+    Returns:
+        np.ndarray: 前 period 个位置为 NaN
+    """
+    c, squeeze = _as_2d(close)
+    out = _nan_like(c)
+    if c.shape[1] > period:
+        log_ret = np.diff(np.log(c), axis=1)
+        windows = _rolling_windows(log_ret * log_ret, period)
+        vol = np.sqrt(windows.mean(axis=2))
+        if periods_per_year:
+            vol = vol * np.sqrt(periods_per_year)
+        out[:, period:] = vol
+    return _restore(out, squeeze)
+
+
+def latest(values: np.ndarray) -> np.ndarray:
+    """每个品种最后一个非 NaN 值（全部为 NaN 的品种返回 NaN）"""
+    arr, squeeze = _as_2d(values)
+    valid = ~np.isnan(arr)
+    idx = np.where(valid, np.arange(arr.shape[1])[np.newaxis, :], -1).max(axis=1)
+    out = np.where(idx >= 0, arr[np.arange(arr.shape[0]), np.maximum(idx, 0)], np.nan)
+    return out[0] if squeeze else out
@@ -0,0 +1,589 @@
+"""
+Regime Scanner
+全市场行情状态扫描
+
+按固定间隔并发拉取各交易所全部永续合约的K线与盘口，一次性用
+risk.indicators_np 批量计算 ADX / ATR% / 已实现波动率 / 布林带宽度 / 点差，
+划分行情状态并按网格适配度排序，发布为 RegimeTable。
+
+策略循环里只读取已发布的表（内存引用或本地 JSON 文件），不做任何网络请求：
+
+    scanner = RegimeScanner([GrvtKlineSource(grvt), NadoKlineSource()], publish_path="logs/regime.json")
+    scanner.start()
+    ...
+    row = scanner.table.get("grvt", "BTC_USDT_Perp")
+
+    # 或在另一个进程中
+    table = read_regime_table("logs/regime.json")
+
+所有指标都与价格单位无关（比值 / 收益率），因此各交易所K线的价格单位不需要统一。
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import requests
+
+from risk import indicators_np as ind
+from risk.indicators import fetch_binance_klines
+
+# 行情状态
+REGIME_TREND = "trend"
+REGIME_VOLATILE = "volatile"
+REGIME_RANGE = "range"
+
+# K线周期 -> 秒
+INTERVAL_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+
+def _best_bid_ask_spread_bps(bid, ask) -> Optional[float]:
+    """最优买卖价点差（基点），任一侧缺失或盘口交叉返回 None"""
+    try:
+        bid, ask = float(bid), float(ask)
+    except (TypeError, ValueError):
+        return None
+    if bid <= 0 or ask <= 0 or ask < bid:
+        return None
+    return (ask - bid) / ((ask + bid) / 2) * 10000
+
+
+# ---------- 数据源 ----------
+
+class KlineSource:
+    """
+    单个交易所的数据源
+
+    子类实现 list_symbols / fetch_klines / fetch_spread；
+    如果交易所支持一次请求获取多个品种的盘口，设置 batch_spreads = True 并实现 fetch_spreads。
+    方法会被扫描器的线程池并发调用，需要保证线程安全。
+    """
+
+    exchange = ""
+    batch_spreads = False
+
+    def list_symbols(self) -> List[str]:
+        """返回全部上市的永续合约"""
+        raise NotImplementedError
+
+    def fetch_klines(self, symbol: str, interval: str, limit: int) -> Optional[np.ndarray]:
+        """
+        获取K线
+
+        Returns:
+            Optional[np.ndarray]: 形状 [N, 3] 的 high/low/close，按时间从旧到新；失败返回 None
+        """
+        raise NotImplementedError
+
+    def fetch_spread(self, symbol: str) -> Optional[float]:
+        """获取当前点差（基点），失败返回 None"""
+        return None
+
+    def fetch_spreads(self, symbols: List[str]) -> Dict[str, float]:
+        """批量获取点差（基点），仅在 batch_spreads = True 时被调用"""
+        return {symbol: self.fetch_spread(symbol) for symbol in symbols}
+
+
+class GrvtKlineSource(KlineSource):
+    """
+    GRVT 数据源（pysdk.grvt_ccxt.GrvtCcxt）
+
+    Args:
+        grvt: GrvtCcxt 实例（行情接口不需要 API Key）
+    """
+
+    exchange = "grvt"
+
+    # GRVT K线周期命名
+    _TIMEFRAMES = {"1m": "1m", "5m": "5m", "15m": "15m", "1h": "1h", "4h": "4h", "1d": "1d"}
+
+    def __init__(self, grvt):
+        self.grvt = grvt
+
+    def list_symbols(self) -> List[str]:
+        markets = self.grvt.fetch_all_markets(is_active=True)
+        return [m["instrument"] for m in markets if m.get("kind") == "PERPETUAL"]
+
+    def fetch_klines(self, symbol, interval, limit):
+        response = self.grvt.fetch_ohlcv(
+            symbol,
+            timeframe=self._TIMEFRAMES.get(interval, interval),
+            limit=limit,
+            params={"candle_type": "TRADE"},
+        )
+        candles = response.get("result", []) if isinstance(response, dict) else []
+        if not candles:
+            return None
+        # GRVT 返回的K线从新到旧
+        return np.array(
+            [(c["high"], c["low"], c["close"]) for c in reversed(candles)],
+            dtype=np.float64,
+        )
+
+    def fetch_spread(self, symbol):
+        ticker = self.grvt.fetch_ticker(symbol)
+        if not ticker:
+            return None
+        return _best_bid_ask_spread_bps(ticker.get("best_bid_price"), ticker.get("best_ask_price"))
+
+
+class NadoKlineSource(KlineSource):
+    """
+    Nado 数据源（nado_protocol engine + indexer）
+
+    K线来自 indexer 的 candlesticks，盘口通过一次 market_prices 请求批量获取。
+
+    Args:
+        engine: EngineQueryClient，默认连接主网（共享传输层的查询 Session）
+        indexer: IndexerQueryClient，默认连接主网（共享传输层的查询 Session）
+    """
+
+    exchange = "nado"
+    batch_spreads = True
+
+    def __init__(self, engine=None, indexer=None):
+        from nado_protocol.engine_client import EngineClientOpts, EngineQueryClient
+        from nado_protocol.indexer_client import IndexerClientOpts, IndexerQueryClient
+        from nado_protocol.utils.backend import NadoBackendURL
+
+        from adapters.transport import get_default_transport
+
+        session = get_default_transport().session(query=True)
+        self.engine = engine or EngineQueryClient(
+            EngineClientOpts(url=NadoBackendURL.MAINNET_GATEWAY.value), session=session
+        )
+        self.indexer = indexer or IndexerQueryClient(
+            IndexerClientOpts(url=NadoBackendURL.MAINNET_INDEXER.value), session=session
+        )
+        self._product_ids: Dict[str, int] = {}
+
+    def list_symbols(self) -> List[str]:
+        perp_ids = {p.product_id for p in self.engine.get_all_products().perp_products}
+        symbols = self.engine.get_symbols().symbols
+        product_ids = {
+            info.symbol: int(info.product_id)
+            for info in symbols.values()
+            if int(info.product_id) in perp_ids
+        }
+        self._product_ids = product_ids
+        return list(product_ids)
+
+    def fetch_klines(self, symbol, interval, limit):
+        from nado_protocol.indexer_client.types import IndexerCandlesticksGranularity, IndexerCandlesticksParams
+
+        params = IndexerCandlesticksParams(
+            product_id=self._product_ids[symbol],
+            granularity=IndexerCandlesticksGranularity(INTERVAL_SECONDS[interval]),
+            limit=limit,
+        )
+        candles = self.indexer.get_candlesticks(params).candlesticks
+        if not candles:
+            return None
+        candles = sorted(candles, key=lambda c: int(c.timestamp or 0))
+        # x18 定点数，指标只用比值，直接按 float 处理即可
+        return np.array(
+            [(int(c.high_x18), int(c.low_x18), int(c.close_x18)) for c in candles],
+            dtype=np.float64,
+        )
+
+    def fetch_spreads(self, symbols):
+        ids = {self._product_ids[s]: s for s in symbols if s in self._product_ids}
+        if not ids:
+            return {}
+        prices = self.engine.get_market_prices(list(ids)).market_prices
+        return {
+            ids[p.product_id]: _best_bid_ask_spread_bps(int(p.bid_x18), int(p.ask_x18))
+            for p in prices
+            if p.product_id in ids
+        }
+
+
+class StandXKlineSource(KlineSource):
+    """
+    StandX 数据源
+
+    StandX 没有K线接口，与 IndicatorTool 一样使用币安同名交易对的K线；
+    交易对列表和盘口来自 StandX 自身。
+
+    Args:
+        http: StandXPerpHTTP 实例
+    """
+
+    exchange = "standx"
+
+    def __init__(self, http):
+        self.http = http
+        self._session = requests.Session()
+
+    def list_symbols(self) -> List[str]:
+        return [
+            info["symbol"]
+            for info in self.http.query_symbol_info()
+            if info.get("status", "trading") == "trading"
+        ]
+
+    def fetch_klines(self, symbol, interval, limit):
+        return fetch_binance_klines(symbol, interval, limit=limit, session=self._session)
+
+    def fetch_spread(self, symbol):
+        price = self.http.query_symbol_price(symbol)
+        return _best_bid_ask_spread_bps(price.get("spread_bid"), price.get("spread_ask"))
+
+
+# ---------- 结果表 ----------
+
+class RegimeRow:
+    """单个品种的行情状态"""
+
+    __slots__ = (
+        "exchange", "symbol", "price", "adx", "plus_di", "minus_di",
+        "atr_pct", "realized_vol", "bb_width_pct", "spread_bps", "regime", "score",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (
+            f"RegimeRow({self.exchange}:{self.symbol} {self.regime} score={self.score:.3f} "
+            f"adx={self.adx:.1f} atr%={self.atr_pct:.3f} spread={self.spread_bps})"
+        )
+
+
+class RegimeTable:
+    """
+    按得分降序排列的行情状态表（只读）
+
+    Args:
+        rows: RegimeRow 列表
+        generated_at: 生成时间（秒）
+        interval: K线周期
+        period: 指标周期
+    """
+
+    def __init__(self, rows: Iterable[RegimeRow] = (), generated_at: float = 0.0, interval: str = "", period: int = 0):
+        self.rows: List[RegimeRow] = sorted(rows, key=lambda r: r.score, reverse=True)
+        self.generated_at = generated_at
+        self.interval = interval
+        self.period = period
+        self._index = {(r.exchange, r.symbol): r for r in self.rows}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    @property
+    def age(self) -> float:
+        """距离生成时间的秒数"""
+        return time.time() - self.generated_at
+
+    def get(self, exchange: str, symbol: str) -> Optional[RegimeRow]:
+        return self._index.get((exchange, symbol))
+
+    def top(self, n: int = 10, exchange: Optional[str] = None, regime: Optional[str] = None) -> List[RegimeRow]:
+        """得分最高的 n 个品种，可按交易所 / 行情状态过滤"""
+        rows = (
+            r for r in self.rows
+            if (exchange is None or r.exchange == exchange) and (regime is None or r.regime == regime)
+        )
+        return [r for _, r in zip(range(n), rows)]
+
+    def to_dict(self) -> dict:
+        return {
+            "generated_at": self.generated_at,
+            "interval": self.interval,
+            "period": self.period,
+            "rows": [r.to_dict() for r in self.rows],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RegimeTable":
+        return cls(
+            rows=[RegimeRow(**row) for row in data.get("rows", [])],
+            generated_at=data.get("generated_at", 0.0),
+            interval=data.get("interval", ""),
+            period=data.get("period", 0),
+        )
+
+    def save(self, path: str):
+        """原子写入 JSON（先写临时文件再 os.replace，读方不会读到半个文件）"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RegimeTable":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+# path -> (mtime_ns, RegimeTable)
+_table_cache: Dict[str, Tuple[int, RegimeTable]] = {}
+
+
+def read_regime_table(path: str) -> Optional[RegimeTable]:
+    """
+    读取已发布的行情状态表，文件未变化时直接返回缓存（每次调用只有一次 stat）
+
+    Returns:
+        Optional[RegimeTable]: 文件不存在或解析失败返回 None
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _table_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        table = RegimeTable.load(path)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 读取行情状态表失败: {e}")
+        return cached[1] if cached is not None else None
+    _table_cache[path] = (mtime, table)
+    return table
+
+
+# ---------- 扫描器 ----------
+
+class RegimeScanner:
+    """
+    全市场行情状态扫描器
+
+    Args:
+        sources: KlineSource 列表
+        interval: K线周期
+        bars: 每个品种获取的K线数量
+        period: ADX / ATR / 布林带周期
+        max_workers: 并发请求线程数
+        refresh_interval: 后台扫描间隔（秒）
+        publish_path: 每次扫描后写入的 JSON 路径（可选）
+        trend_adx: ADX 不低于此值视为趋势
+        volatile_atr_pct: ATR 占价格百分比不低于此值视为高波动
+    """
+
+    def __init__(
+        self,
+        sources: List[KlineSource],
+        interval: str = "5m",
+        bars: int = 100,
+        period: int = 14,
+        max_workers: int = 16,
+        refresh_interval: float = 300,
+        publish_path: Optional[str] = None,
+        trend_adx: float = 25,
+        volatile_atr_pct: float = 0.5,
+    ):
+        if interval not in INTERVAL_SECONDS:
+            raise ValueError(f"不支持的K线周期: {interval}")
+        self.sources = list(sources)
+        self.interval = interval
+        self.bars = bars
+        self.period = period
+        self.max_workers = max_workers
+        self.refresh_interval = refresh_interval
+        self.publish_path = publish_path
+        self.trend_adx = trend_adx
+        self.volatile_atr_pct = volatile_atr_pct
+
+        self._table = RegimeTable(interval=interval, period=period)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def table(self) -> RegimeTable:
+        """最新一次扫描结果（引用整体替换，读取无需加锁）"""
+        return self._table
+
+    # ---------- 拉取 ----------
+
+    def _collect(self, pool: ThreadPoolExecutor):
+        """并发拉取全部交易所的品种列表、K线和点差"""
+        listed = {}
+        for source, future in [(s, pool.submit(s.list_symbols)) for s in self.sources]:
+            try:
+                listed[source] = future.result()
+            except Exception as e:
+                print(f"⚠️ {source.exchange} 获取交易对列表失败: {e}")
+
+        kline_futures = {}
+        spread_futures = {}
+        for source, symbols in listed.items():
+            for symbol in symbols:
+                kline_futures[(source.exchange, symbol)] = pool.submit(
+                    source.fetch_klines, symbol, self.interval, self.bars
+                )
+            if source.batch_spreads:
+                spread_futures[source.exchange] = pool.submit(source.fetch_spreads, symbols)
+            else:
+                for symbol in symbols:
+                    spread_futures[(source.exchange, symbol)] = pool.submit(source.fetch_spread, symbol)
+
+        klines = {}
+        failed = 0
+        for key, future in kline_futures.items():
+            try:
+                data = future.result()
+            except Exception:
+                data = None
+            if data is None:
+                failed += 1
+            else:
+                klines[key] = data
+
+        spreads = {}
+        for key, future in spread_futures.items():
+            try:
+                value = future.result()
+            except Exception:
+                continue
+            if isinstance(key, tuple):
+                spreads[key] = value
+            else:
+                spreads.update({(key, symbol): bps for symbol, bps in (value or {}).items()})
+
+        if failed:
+            print(f"⚠️ {failed} 个品种K线获取失败，已跳过")
+        return klines, spreads
+
+    # ---------- 计算 ----------
+
+    def compute(self, klines: Dict[Tuple[str, str], np.ndarray], spreads: Dict[Tuple[str, str], float]) -> RegimeTable:
+        """
+        一次批量计算全部品种的指标
+
+        K线根数相同的品种堆叠为 [品种, N] 矩阵一起计算，每个品种都使用自己的全部K线
+        （新上线、K线较少的品种不会截短其他品种的数据）；
+        不足 2 * period + 1 根（ADX 的最短长度）的品种跳过。
+        """
+        min_bars = 2 * self.period + 1
+        groups: Dict[int, List[Tuple[str, str]]] = {}
+        for key, bars in klines.items():
+            if len(bars) >= min_bars:
+                groups.setdefault(len(bars), []).append(key)
+
+        rows = []
+        for keys in groups.values():
+            rows.extend(self._compute_group(keys, np.stack([klines[k] for k in keys]), spreads))
+        return RegimeTable(rows, generated_at=time.time(), interval=self.interval, period=self.period)
+
+    def _compute_group(
+        self,
+        keys: List[Tuple[str, str]],
+        data: np.ndarray,
+        spreads: Dict[Tuple[str, str], float],
+    ) -> List[RegimeRow]:
+        """计算一组K线根数相同的品种，data 为 [品种, N, 3]（high, low, close）"""
+        n = data.shape[1]
+        high, low, close = data[:, :, 0], data[:, :, 1], data[:, :, 2]
+
+        last_close = close[:, -1]
+        adx = ind.latest(ind.adx(high, low, close, self.period))
+        plus = ind.latest(ind.plus_di(high, low, close, self.period))
+        minus = ind.latest(ind.minus_di(high, low, close, self.period))
+        atr_pct = ind.latest(ind.atr(high, low, close, self.period)) / last_close * 100
+        vol = ind.latest(ind.realized_vol(close, min(self.period, n - 1)))
+        upper, middle, lower = ind.bbands(close, min(20, n))
+        bb_width_pct = ind.latest((upper - lower) / middle * 100)
+
+        rows = []
+        for i, (exchange, symbol) in enumerate(keys):
+            if np.isnan(adx[i]) or np.isnan(atr_pct[i]):
+                continue
+            spread_bps = spreads.get((exchange, symbol))
+            regime = self._classify(adx[i], atr_pct[i])
+            rows.append(RegimeRow(
+                exchange=exchange,
+                symbol=symbol,
+                price=float(last_close[i]),
+                adx=float(adx[i]),
+                plus_di=float(plus[i]),
+                minus_di=float(minus[i]),
+                atr_pct=float(atr_pct[i]),
+                realized_vol=float(vol[i]),
+                bb_width_pct=float(bb_width_pct[i]),
+                spread_bps=None if spread_bps is None else float(spread_bps),
+                regime=regime,
+                score=self._score(adx[i], atr_pct[i], spread_bps),
+            ))
+        return rows
+
+    def _classify(self, adx: float, atr_pct: float) -> str:
+        if adx >= self.trend_adx:
+            return REGIME_TREND
+        if atr_pct >= self.volatile_atr_pct:
+            return REGIME_VOLATILE
+        return REGIME_RANGE
+
+    @staticmethod
+    def _score(adx: float, atr_pct: float, spread_bps: Optional[float]) -> float:
+        """
+        网格适配度: 趋势越弱越好，单根K线波幅相对点差成本越大越好
+
+        score = (1 - min(ADX, 60) / 60) * ATR% / (ATR% + 点差%)
+        """
+        trend_penalty = 1 - min(float(adx), 60.0) / 60.0
+        spread_pct = (spread_bps or 0.0) / 100
+        if atr_pct <= 0:
+            return 0.0
+        return float(trend_penalty * atr_pct / (atr_pct + spread_pct))
+
+    # ---------- 扫描 ----------
+
+    def scan(self) -> RegimeTable:
+        """执行一次完整扫描，更新并发布结果表"""
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="regime") as pool:
+            klines, spreads = self._collect(pool)
+        table = self.compute(klines, spreads)
+        self._table = table
+        if self.publish_path:
+            try:
+                table.save(self.publish_path)
+            except OSError as e:
+                print(f"⚠️ 写入行情状态表失败: {e}")
+        print(f"行情扫描完成: {len(table)} 个品种，耗时 {time.time() - start:.1f}s")
+        return table
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.scan()
+            except Exception as e:
+                print(f"❌ 行情扫描异常: {e}")
+            self._stop_event.wait(self.refresh_interval)
+
+    def start(self):
+        """启动后台扫描线程（立即执行第一次扫描）"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="regime-scanner", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """停止后台扫描线程"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
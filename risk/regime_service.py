@@ -0,0 +1,106 @@
+"""
+Regime Scanner Service
+行情状态扫描服务
+
+常驻进程，按间隔扫描 GRVT / Nado / StandX 全部永续合约并把排序结果写入 JSON，
+策略进程通过 risk.read_regime_table 读取。
+
+运行（在项目根目录）:
+    python -m risk.regime_service --exchanges grvt,nado,standx --output logs/regime.json
+    python -m risk.regime_service --exchanges grvt --interval 15m --once --top 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+for sdk_path in (
+    project_root,
+    os.path.join(project_root, 'exchange', 'exchange_grvt', 'src'),
+    os.path.join(project_root, 'exchange', 'exchange_nado'),
+    os.path.join(project_root, 'exchange', 'exchange_standx'),
+):
+    if sdk_path not in sys.path:
+        sys.path.insert(0, sdk_path)
+
+from risk.regime_scanner import (
+    INTERVAL_SECONDS,
+    GrvtKlineSource,
+    NadoKlineSource,
+    RegimeScanner,
+    StandXKlineSource,
+)
+
+
+def build_source(exchange, grvt_env="prod"):
+    """按交易所名称创建数据源"""
+    if exchange == "grvt":
+        from pysdk.grvt_ccxt import GrvtCcxt
+        from pysdk.grvt_ccxt_env import GrvtEnv
+        return GrvtKlineSource(GrvtCcxt(GrvtEnv(grvt_env)))
+    if exchange == "nado":
+        return NadoKlineSource()
+    if exchange == "standx":
+        from standx_protocol.perp_http import StandXPerpHTTP
+        return StandXKlineSource(StandXPerpHTTP())
+    raise ValueError(f"不支持的交易所: {exchange}")
+
+
+def print_table(table, n):
+    print(f"{'交易所':<8}{'交易对':<18}{'状态':<10}{'得分':>7}{'ADX':>7}{'ATR%':>8}{'波动率':>9}{'BB宽%':>8}{'点差bp':>8}")
+    for row in table.top(n):
+        spread = f"{row.spread_bps:.1f}" if row.spread_bps is not None else "-"
+        print(
+            f"{row.exchange:<8}{row.symbol:<18}{row.regime:<10}{row.score:>7.3f}{row.adx:>7.1f}"
+            f"{row.atr_pct:>8.3f}{row.realized_vol:>9.5f}{row.bb_width_pct:>8.2f}{spread:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="全市场行情状态扫描服务")
+    parser.add_argument('--exchanges', default="grvt,nado,standx", help="逗号分隔的交易所列表")
+    parser.add_argument('--grvt-env', default="prod", help="GRVT 环境: prod, testnet, staging, dev")
+    parser.add_argument('--interval', default="5m", choices=sorted(INTERVAL_SECONDS), help="K线周期")
+    parser.add_argument('--bars', type=int, default=100, help="每个品种的K线数量")
+    parser.add_argument('--period', type=int, default=14, help="指标周期")
+    parser.add_argument('--workers', type=int, default=16, help="并发请求线程数")
+    parser.add_argument('--refresh', type=float, default=300, help="扫描间隔（秒）")
+    parser.add_argument('--output', default=os.path.join("logs", "regime.json"), help="结果 JSON 路径")
+    parser.add_argument('--top', type=int, default=10, help="每次扫描后打印得分最高的品种数")
+    parser.add_argument('--once', action='store_true', help="只扫描一次后退出")
+    args = parser.parse_args()
+
+    sources = []
+    for exchange in [e.strip().lower() for e in args.exchanges.split(",") if e.strip()]:
+        try:
+            sources.append(build_source(exchange, args.grvt_env))
+        except Exception as e:
+            print(f"❌ 初始化 {exchange} 数据源失败: {e}")
+    if not sources:
+        sys.exit(1)
+
+    scanner = RegimeScanner(
+        sources,
+        interval=args.interval,
+        bars=args.bars,
+        period=args.period,
+        max_workers=args.workers,
+        refresh_interval=args.refresh,
+        publish_path=args.output,
+    )
+    print(f"扫描 {', '.join(s.exchange for s in sources)}，结果写入 {args.output}")
+
+    try:
+        while True:
+            print_table(scanner.scan(), args.top)
+            if args.once:
+                break
+            time.sleep(args.refresh)
+    except KeyboardInterrupt:
+        print("\n停止扫描")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,8 +14,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.insert(0, project_root)
 
-from adapters import create_adapter
-from risk import IndicatorTool
+from adapters import create_adapter, OrderJournal, set_default_journal, Instrument
 
 # 全局配置变量
 EXCHANGE_CONFIG = None
@@ -25,6 +24,9 @@ RISK_CONFIG = None
 CANCEL_STALE_ORDERS_CONFIG = None
 STOP_CONFIG = {}
 VOL_GUARD_CONFIG = {}
+JOURNAL_CONFIG = {}
+INSTRUMENT = None  # 当前交易对的精度（价格 tick / 数量 lot），网格全部用整数 tick 运算
+ORDER_QUANTITY = None  # 每单数量（按 lot 取整后的 Decimal）
 STATS = {
     "placed": 0,
     "canceled": 0,
@@ -120,7 +122,7 @@ def initialize_config(config_file="config.yaml", active_exchange_override=None):
         config_file: 配置文件路径
         active_exchange_override: 通过命令行参数指定的交易所名称（必需）
     """
-    global EXCHANGE_CONFIG, SYMBOL, GRID_CONFIG, RISK_CONFIG, CANCEL_STALE_ORDERS_CONFIG, STOP_CONFIG, VOL_GUARD_CONFIG, STATS, PRICE_WINDOW, COOLING, COOLING_COUNT, COOL_DOWN_UNTIL
+    global EXCHANGE_CONFIG, SYMBOL, GRID_CONFIG, RISK_CONFIG, CANCEL_STALE_ORDERS_CONFIG, STOP_CONFIG, VOL_GUARD_CONFIG, JOURNAL_CONFIG, STATS, PRICE_WINDOW, COOLING, COOLING_COUNT, COOL_DOWN_UNTIL
     
     config = load_config(config_file)
     
@@ -151,6 +153,7 @@ def initialize_config(config_file="config.yaml", active_exchange_override=None):
     CANCEL_STALE_ORDERS_CONFIG = config.get('cancel_stale_orders', {})
     STOP_CONFIG = config.get('stop', {})
     VOL_GUARD_CONFIG = config.get('volatility_guard', {})
+    JOURNAL_CONFIG = config.get('order_journal', {})
     # reset runtime state
     STATS = {
         "placed": 0,
@@ -164,89 +167,86 @@ def initialize_config(config_file="config.yaml", active_exchange_override=None):
     COOL_DOWN_UNTIL = 0
 
 
-def generate_grid_arrays(current_price, price_step, grid_count, price_spread):
-    """根据当前价格和价格间距生成做多数组和做空数组，过滤超过当前价格上下1%的价格"""
-    if price_step <= 0:
+def generate_grid_arrays(mid_ticks, step_ticks, grid_count, spread_ticks):
+    """根据当前价格和网格间距生成做多数组和做空数组（整数 tick），过滤超过当前价格上下1%的价格
+    
+    Args:
+        mid_ticks: 当前价格（tick）
+        step_ticks: 网格间距（tick）
+        grid_count: 每侧网格数量
+        spread_ticks: 当前价格与网格起点的距离（tick）
+    """
+    if step_ticks <= 0:
         raise ValueError("price_step 必须大于 0")
     if grid_count < 0:
         raise ValueError("grid_count 必须大于等于 0")
-    if price_spread < 0:
+    if spread_ticks < 0:
         raise ValueError("price_spread 必须大于等于 0")
     
-    # 计算价格上下限（当前价格的上下1%）
-    price_upper_limit = current_price * 1.01  # 上限：当前价格 +1%
-    price_lower_limit = current_price * 0.99   # 下限：当前价格 -1%
-    
-    # 计算 bid 和 ask 价格
-    bid_price = current_price - price_spread
-    ask_price = current_price + price_spread
-    
-    # 将 bid 价格向下取整到最近的 price_step 倍数
-    bid_base = int(bid_price / price_step) * price_step
+    # bid 向下、ask 向上取整到 step 的整数倍
+    bid_base = Instrument.floor_to_step(mid_ticks - spread_ticks, step_ticks)
+    ask_base = Instrument.ceil_to_step(mid_ticks + spread_ticks, step_ticks)
     
-    # 将 ask 价格向上取整到最近的 price_step 倍数
-    ask_base = int((ask_price + price_step - 1) / price_step) * price_step
-    
-    # 做多数组：从 bid_base 向下 grid_count 个（包括 bid_base）
-    long_grid = []
-    for i in range(grid_count):
-        price = bid_base - i * price_step
-        # 过滤：做多价格不能低于当前价格的1%（即不能低于 price_lower_limit）
-        if price >= price_lower_limit:
-            long_grid.append(price)
-    long_grid = sorted(long_grid)
-    
-    # 做空数组：从 ask_base 向上 grid_count 个（包括 ask_base）
-    short_grid = []
-    for i in range(grid_count):
-        price = ask_base + i * price_step
-        # 过滤：做空价格不能超过当前价格的1%（即不能高于 price_upper_limit）
-        if price <= price_upper_limit:
-            short_grid.append(price)
-    short_grid = sorted(short_grid)
-    
-    return long_grid, short_grid
+    # 做多数组：从 bid_base 向下 grid_count 个，不能低于当前价格的 99%
+    long_grid = [
+        price for price in (bid_base - i * step_ticks for i in range(grid_count))
+        if price * 100 >= mid_ticks * 99
+    ]
+    # 做空数组：从 ask_base 向上 grid_count 个，不能高于当前价格的 101%
+    short_grid = [
+        price for price in (ask_base + i * step_ticks for i in range(grid_count))
+        if price * 100 <= mid_ticks * 101
+    ]
+    return sorted(long_grid), short_grid
+
+
+def format_ticks(ticks_list):
+    """tick 列表格式化为价格字符串列表（仅用于打印）"""
+    return [INSTRUMENT.ticks_to_str(t) for t in ticks_list] if INSTRUMENT else list(ticks_list)
+
+
+def resolve_instrument(adapter, symbol):
+    """获取交易对精度；交易所加载失败时退回配置中的 grid.price_tick / grid.qty_step"""
+    try:
+        instrument = adapter.get_instrument(symbol)
+        print(f"合约精度: {instrument}")
+        return instrument
+    except Exception as e:
+        price_tick = GRID_CONFIG.get('price_tick', GRID_CONFIG.get('price_step', 1))
+        qty_step = GRID_CONFIG.get('qty_step', GRID_CONFIG.get('order_quantity', 0.001))
+        instrument = Instrument(adapter.exchange_name, symbol, price_tick, qty_step)
+        print(f"获取合约精度失败（{e}），使用配置: {instrument}")
+        return instrument
 
 
 def get_pending_orders_arrays(adapter, symbol):
-    """获取当前账号未成交订单数组，按做多和做空分类，同时返回价格到订单ID的映射"""
+    """获取当前账号未成交订单数组（整数 tick），按做多和做空分类，同时返回价格到订单ID的映射"""
     try:
         open_orders = adapter.get_open_orders(symbol=symbol)
         
-        # 做多订单：side 为 "buy" 或 "long"
-        long_prices = []
-        long_price_to_ids = {}  # 价格 -> 订单ID列表
-        # 做空订单：side 为 "sell" 或 "short"
-        short_prices = []
-        short_price_to_ids = {}  # 价格 -> 订单ID列表
+        long_price_to_ids = {}  # 做多：价格(tick) -> 订单ID列表
+        short_price_to_ids = {}  # 做空：价格(tick) -> 订单ID列表
         has_partial = False
+        price_to_ticks = INSTRUMENT.price_to_ticks
         
         for order in open_orders:
             # 只处理未成交的订单（状态为 pending, open, partially_filled）
-            if order.status in ["pending", "open", "partially_filled"]:
+            if order.status in ("pending", "open", "partially_filled"):
                 if order.price is not None:
-                    price = int(float(order.price))
                     try:
                         order_id = int(order.order_id)
                     except (ValueError, TypeError):
                         continue  # 跳过无效的订单ID
+                    price = price_to_ticks(order.price)
                     
-                    if order.side in ["buy", "long"]:
-                        if price not in long_prices:
-                            long_prices.append(price)
-                        if price not in long_price_to_ids:
-                            long_price_to_ids[price] = []
-                        long_price_to_ids[price].append(order_id)
-                    elif order.side in ["sell", "short"]:
-                        if price not in short_prices:
-                            short_prices.append(price)
-                        if price not in short_price_to_ids:
-                            short_price_to_ids[price] = []
-                        short_price_to_ids[price].append(order_id)
+                    if order.side in ("buy", "long"):
+                        long_price_to_ids.setdefault(price, []).append(order_id)
+                    elif order.side in ("sell", "short"):
+                        short_price_to_ids.setdefault(price, []).append(order_id)
                 if order.status == "partially_filled":
                     has_partial = True
         
-        return sorted(long_prices), sorted(short_prices), long_price_to_ids, short_price_to_ids, has_partial
+        return sorted(long_price_to_ids), sorted(short_price_to_ids), long_price_to_ids, short_price_to_ids, has_partial
     except NotImplementedError:
         # 如果适配器未实现，返回空数组
         return [], [], {}, {}, False
@@ -345,70 +345,73 @@ def cancel_orders_by_prices(cancel_long, cancel_short, long_price_to_ids, short_
                     print(f"单笔撤单失败 {order_id}: {e}")
         # 【统计】累计撤单数量
         STATS["canceled"] += len(all_order_ids)
-        print(f"已提交撤单 {len(all_order_ids)} 笔，价格: {cancel_long + cancel_short}")
+        print(f"已提交撤单 {len(all_order_ids)} 笔，价格: {format_ticks(cancel_long + cancel_short)}")
         return True
     except Exception as e:
         print(f"批量撤单调用失败: {e}")
         return False
 
 
-def place_orders_by_prices(place_long, place_short, adapter, symbol, quantity, best_bid=None, best_ask=None, tick=None):
+def place_orders_by_prices(place_long, place_short, adapter, symbol, quantity, best_bid=None, best_ask=None):
     """根据价格列表下单
     
     Args:
-        place_long: 需要下单的做多价格列表
-        place_short: 需要下单的做空价格列表
+        place_long: 需要下单的做多价格列表（tick）
+        place_short: 需要下单的做空价格列表（tick）
         adapter: 适配器实例
         symbol: 交易对符号
-        quantity: 订单数量
+        quantity: 订单数量（Decimal，已按 lot 取整）
+        best_bid: 买一价（tick）
+        best_ask: 卖一价（tick）
     """
     if not place_long and not place_short:
         return
     
     global STATS
-    quantity_decimal = Decimal(str(quantity))
     
     # 做多订单：buy
     for price in place_long:
+        price_str = INSTRUMENT.ticks_to_str(price)
         # 被动价校验：必须低于卖一 - 1tick
-        if best_ask is not None and tick is not None and price >= best_ask - tick:
-            print(f"[下单跳过][多单] 价格过近 {price} >= 卖一 {best_ask} - tick {tick}")
+        if best_ask is not None and price >= best_ask - 1:
+            print(f"[下单跳过][多单] 价格过近 {price_str} >= 卖一 {INSTRUMENT.ticks_to_str(best_ask)} - 1tick")
             continue
         try:
             order = adapter.place_order(
                 symbol=symbol,
                 side="buy",
                 order_type="limit",
-                quantity=quantity_decimal,
-                price=Decimal(str(price)),
+                quantity=quantity,
+                price=INSTRUMENT.ticks_to_price(price),
                 time_in_force="gtc",
                 reduce_only=False
             )
-            print(f"[下单成功][多单] 价格={price}, 数量={quantity_decimal}, 订单ID={getattr(order, 'order_id', None)}")
+            print(f"[下单成功][多单] 价格={price_str}, 数量={quantity}, 订单ID={getattr(order, 'order_id', None)}")
             STATS["placed"] += 1
         except Exception as e:
-            print(f"[下单失败][多单] 价格={price}, 数量={quantity_decimal}, 错误={e}")
+            print(f"[下单失败][多单] 价格={price_str}, 数量={quantity}, 错误={e}")
     
     # 做空订单：sell
     for price in place_short:
+        price_str = INSTRUMENT.ticks_to_str(price)
         # 被动价校验：必须高于买一 + 1tick
-        if best_bid is not None and tick is not None and price <= best_bid + tick:
-            print(f"[下单跳过][空单] 价格过近 {price} <= 买一 {best_bid} + tick {tick}")
+        if best_bid is not None and price <= best_bid + 1:
+            print(f"[下单跳过][空单] 价格过近 {price_str} <= 买一 {INSTRUMENT.ticks_to_str(best_bid)} + 1tick")
             continue
         try:
             order = adapter.place_order(
                 symbol=symbol,
                 side="sell",
                 order_type="limit",
-                quantity=quantity_decimal,
-                price=Decimal(str(price)),
+                quantity=quantity,
+                price=INSTRUMENT.ticks_to_price(price),
                 time_in_force="gtc",
                 reduce_only=False
             )
-            print(f"[下单成功][空单] 价格={price}, 数量={quantity_decimal}, 订单ID={getattr(order, 'order_id', None)}")
+            print(f"[下单成功][空单] 价格={price_str}, 数量={quantity}, 订单ID={getattr(order, 'order_id', None)}")
             STATS["placed"] += 1
         except Exception as e:
-            print(f"[下单失败][空单] 价格={price}, 数量={quantity_decimal}, 错误={e}")
+            print(f"[下单失败][空单] 价格={price_str}, 数量={quantity}, 错误={e}")
 
 
 def calculate_cancel_orders(target_long, target_short, current_long, current_short):
@@ -473,7 +476,11 @@ def close_position_if_exists(adapter, symbol):
             had_position = True
             print(f"检测到持仓: {position.size} {position.side}")
             print("取消所有未成交订单...")
-            adapter.cancel_all_orders(symbol=symbol)
+            try:
+                if not adapter.cancel_all_orders(symbol=symbol):
+                    print("撤单未确认，继续平仓")
+            except Exception as e:
+                print(f"撤单失败，继续平仓: {e}")
             print("市价平仓中...")
             adapter.close_position(symbol, order_type="market")
             print("平仓完成")
@@ -566,6 +573,37 @@ def handle_detected_fill(adapter, reason: str, cool_sec: float):
     trigger_cooldown(reason, cool_sec)
 
 
+def get_cycle_adx():
+    """获取本轮使用的 ADX(5m)
+
+    配置了 risk.regime_table 时从行情扫描服务发布的表中读取（本地文件，无网络请求），
+    否则通过 IndicatorTool 请求币安K线计算。
+    """
+    # 风控模块依赖 numpy / requests，放到首次使用时导入，缩短启动时间
+    from risk import IndicatorTool, read_regime_table
+
+    table_path = RISK_CONFIG.get('regime_table')
+    if not table_path:
+        indicator_tool = IndicatorTool()
+        adx_symbol = convert_symbol_for_adx(SYMBOL)
+        return indicator_tool.get_adx(adx_symbol, "5m", period=14)
+
+    table = read_regime_table(table_path)
+    if table is None:
+        print(f"行情状态表不可用: {table_path}")
+        return None
+    max_age = RISK_CONFIG.get('regime_max_age', 900)
+    if table.age > max_age:
+        print(f"行情状态表已过期 ({table.age:.0f}s > {max_age}s)")
+        return None
+    exchange_name = EXCHANGE_CONFIG.get('exchange_name', '')
+    row = table.get(exchange_name, SYMBOL)
+    if row is None:
+        print(f"行情状态表中没有 {exchange_name}:{SYMBOL}")
+        return None
+    return row.adx
+
+
 def run_strategy_cycle(adapter):
     """执行一次策略循环
     
@@ -576,9 +614,13 @@ def run_strategy_cycle(adapter):
     last_price = price_info.get('last_price') or price_info.get('mid_price') or price_info.get('mark_price')
     best_bid = price_info.get('bid_price')
     best_ask = price_info.get('ask_price')
-    tick_size = GRID_CONFIG.get('price_step', 1)
     print(f"{SYMBOL} 价格: {last_price:.2f}")
 
+    # 进入策略时一次性换算为整数 tick，之后网格、对比、被动价校验都是整数运算
+    mid_ticks = INSTRUMENT.price_to_ticks(last_price)
+    bid_ticks = INSTRUMENT.price_to_ticks(best_bid) if best_bid else None
+    ask_ticks = INSTRUMENT.price_to_ticks(best_ask) if best_ask else None
+
     # 维护价格窗口，计算波幅
     price_range = update_price_window(last_price)
     price_range_ratio = (price_range / last_price) if (price_range is not None and last_price) else None
@@ -592,9 +634,7 @@ def run_strategy_cycle(adapter):
     default_spread = GRID_CONFIG['price_spread']
     
     if RISK_CONFIG.get('enable', False):
-        indicator_tool = IndicatorTool()
-        adx_symbol = convert_symbol_for_adx(SYMBOL)
-        adx = indicator_tool.get_adx(adx_symbol, "5m", period=14)
+        adx = get_cycle_adx()
         adx_threshold = RISK_CONFIG.get('adx_threshold', 25)
         adx_max = RISK_CONFIG.get('adx_max', 60)
         price_spread = calculate_dynamic_price_spread(adx, last_price, default_spread, adx_threshold, adx_max)
@@ -602,21 +642,21 @@ def run_strategy_cycle(adapter):
         price_spread = default_spread
     
     long_grid, short_grid = generate_grid_arrays(
-        last_price, 
-        GRID_CONFIG['price_step'], 
+        mid_ticks,
+        INSTRUMENT.price_distance_to_ticks(GRID_CONFIG['price_step']),
         GRID_CONFIG['grid_count'],
-        price_spread
+        INSTRUMENT.price_distance_to_ticks(price_spread, minimum=0),
     )
-    print(f"做多数组: {long_grid}")
-    print(f"做空数组: {short_grid}")
+    print(f"做多数组: {format_ticks(long_grid)}")
+    print(f"做空数组: {format_ticks(short_grid)}")
     
     # 持仓/成交基线
     pre_exposure = total_position_exposure(adapter, SYMBOL)
 
     # 获取未成交订单数组和价格到订单ID的映射
     long_pending, short_pending, long_price_to_ids, short_price_to_ids, has_partial = get_pending_orders_arrays(adapter, SYMBOL)
-    print(f"当前做多数组: {long_pending}")
-    print(f"当前做空数组: {short_pending}")
+    print(f"当前做多数组: {format_ticks(long_pending)}")
+    print(f"当前做空数组: {format_ticks(short_pending)}")
 
     # 如果发现部分成交，立即冷静期
     if has_partial:
@@ -627,8 +667,8 @@ def run_strategy_cycle(adapter):
     cancel_long, cancel_short = calculate_cancel_orders(
         long_grid, short_grid, long_pending, short_pending
     )
-    print(f"撤单做多数组: {cancel_long}")
-    print(f"撤单做空数组: {cancel_short}")
+    print(f"撤单做多数组: {format_ticks(cancel_long)}")
+    print(f"撤单做空数组: {format_ticks(cancel_short)}")
     
     # 执行撤单，若撤单失败则跳过新单
     cancel_ok = cancel_orders_by_prices(
@@ -649,8 +689,8 @@ def run_strategy_cycle(adapter):
         place_long = []
     if len(short_pending) >= 1:
         place_short = []
-    print(f"下单做多数组: {place_long}")
-    print(f"下单做空数组: {place_short}")
+    print(f"下单做多数组: {format_ticks(place_long)}")
+    print(f"下单做空数组: {format_ticks(place_short)}")
 
     # 冷静期：任何成交触发的时间冷静期结束后，再看波动是否低于恢复阈值
     global COOLING, COOLING_COUNT, COOL_DOWN_UNTIL
@@ -674,8 +714,8 @@ def run_strategy_cycle(adapter):
     # 如果不在冷静期且撤单成功，尝试下单（被动价校验）
     if not in_cooldown and cancel_ok:
         place_orders_by_prices(
-            place_long, place_short, adapter, SYMBOL, GRID_CONFIG.get('order_quantity', 0.001),
-            best_bid=best_bid, best_ask=best_ask, tick=tick_size
+            place_long, place_short, adapter, SYMBOL, ORDER_QUANTITY,
+            best_bid=bid_ticks, best_ask=ask_ticks
         )
     else:
         place_long, place_short = [], []
@@ -741,10 +781,23 @@ def main():
         print(f"加载配置文件失败: {e}")
         sys.exit(1)
     
+    # 订单日志：所有下单/撤单调用由后台线程批量写入文件，不阻塞交易
+    journal = None
+    if JOURNAL_CONFIG.get('enable', True):
+        journal = OrderJournal.from_config(JOURNAL_CONFIG).start()
+        set_default_journal(journal)
+        print(f"订单日志目录: {journal.directory}")
+
     try:
         adapter = create_adapter(EXCHANGE_CONFIG)
         adapter.connect()
         
+        global INSTRUMENT, ORDER_QUANTITY
+        INSTRUMENT = resolve_instrument(adapter, SYMBOL)
+        lots = max(INSTRUMENT.qty_to_lots(GRID_CONFIG.get('order_quantity', 0.001)), INSTRUMENT.min_lots)
+        ORDER_QUANTITY = INSTRUMENT.lots_to_qty(lots)
+        print(f"每单数量: {ORDER_QUANTITY}（{lots} lot）")
+        
         sleep_interval = GRID_CONFIG.get('sleep_interval', 60)
         
         print("策略开始运行，按 Ctrl+C 停止...")
@@ -769,6 +822,9 @@ def main():
     except Exception as e:
         print(f"错误: {e}")
         return None
+    finally:
+        if journal is not None:
+            journal.stop()
 
 
 if __name__ == "__main__":
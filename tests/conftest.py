@@ -0,0 +1,111 @@
+import threading
+from decimal import Decimal
+
+from adapters.base_adapter import BasePerpAdapter, Order, Position
+from adapters.instruments import Instrument
+
+
+class FakeAdapter(BasePerpAdapter):
+    """
+    内存中的交易所，供各测试共用
+
+    - 限价单挂在 orders 中（按 client_order_id），市价单和 IOC 单立即全部成交，fill() 模拟成交
+    - hidden 中的 client_order_id 在 get_order 中查不到（模拟超出最近订单范围）
+    - reject_cancels 中的 client_order_id 撤单时抛出异常；cancel_orders_by_ids 内部逐个调用 cancel_order（同 GrvtAdapter）
+    - REST 持仓由测试设置（position），get_positions 调用时可以先执行 on_fetch（模拟取数期间到达的推送）
+    - 下单后调用 on_order(side, quantity)；get_ticker 返回 REST 标记，rest_calls 记录调用次数
+    """
+
+    def __init__(self, exchange_name="fake", price_tick="0.1", qty_step="0.01", min_qty=None, **config):
+        super().__init__({"exchange_name": exchange_name, **config})
+        self.journal = None
+        self.price_tick = price_tick
+        self.qty_step = qty_step
+        self.min_qty = min_qty or qty_step
+        self.bid = Decimal("100.0")
+        self.ask = Decimal("100.2")
+        self.position = Decimal("0")
+        self.orders = {}
+        self.placed = []
+        self.cancels = []
+        self.hidden = set()
+        self.reject_cancels = set()
+        self.rest_calls = 0
+        self.on_fetch = None
+        self.on_order = None
+        self._lock = threading.Lock()
+
+    def get_instrument(self, symbol):
+        return Instrument(self.exchange_name, symbol, price_tick=self.price_tick, qty_step=self.qty_step,
+                          min_qty=self.min_qty)
+
+    def connect(self):
+        return True
+
+    def get_balance(self):
+        raise NotImplementedError
+
+    def get_positions(self, symbol=None):
+        if self.on_fetch is not None:
+            self.on_fetch()
+        if not self.position:
+            return []
+        side = "long" if self.position > 0 else "short"
+        return [Position(symbol, abs(self.position), side, Decimal("0"), Decimal("0"), Decimal("0"))]
+
+    def place_order(self, symbol, side, order_type, quantity, price=None, time_in_force="gtc",
+                    reduce_only=False, client_order_id=None, **kwargs):
+        with self._lock:
+            order = Order(order_id=str(len(self.placed) + 1), symbol=symbol, side=side, order_type=order_type,
+                          quantity=quantity, price=price, status="open", time_in_force=time_in_force,
+                          reduce_only=reduce_only, client_order_id=client_order_id)
+            if order_type == "market" or time_in_force == "ioc":
+                order.filled_quantity = quantity
+                order.status = "filled"
+            self.orders[client_order_id] = order
+            self.placed.append(order)
+        if self.on_order is not None:
+            self.on_order(side, quantity)
+        return order
+
+    def fill(self, order, qty=None):
+        order.filled_quantity += order.quantity - order.filled_quantity if qty is None else Decimal(qty)
+        if order.filled_quantity >= order.quantity:
+            order.status = "filled"
+
+    def cancel_order(self, order_id=None, symbol=None, client_order_id=None):
+        self.cancels.append(client_order_id)
+        if client_order_id in self.reject_cancels:
+            raise Exception("rejected")
+        order = self.orders.get(client_order_id)
+        if order is not None and order.status == "open":
+            order.status = "cancelled"
+        return True
+
+    def cancel_all_orders(self, symbol=None):
+        return True
+
+    def cancel_orders_by_ids(self, order_id_list, symbol=None):
+        success_count = 0
+        for order_id in order_id_list:
+            try:
+                if self.cancel_order(client_order_id=str(order_id), symbol=symbol):
+                    success_count += 1
+            except Exception:
+                continue
+        return success_count > 0
+
+    def get_order(self, order_id=None, symbol=None, client_order_id=None):
+        if client_order_id in self.hidden:
+            return None
+        return self.orders.get(client_order_id)
+
+    def get_open_orders(self, symbol=None):
+        return [order for order in self.orders.values() if order.status == "open"]
+
+    def get_ticker(self, symbol):
+        self.rest_calls += 1
+        return {"symbol": symbol, "source": "rest", "bid_price": self.bid, "ask_price": self.ask}
+
+    def get_orderbook(self, symbol, depth=20):
+        return {}
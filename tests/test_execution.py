@@ -0,0 +1,167 @@
+from decimal import Decimal
+
+import pytest
+
+from adapters import execution
+from adapters.execution import ExecutionEngine, Iceberg, Pov, Twap
+from tests.conftest import FakeAdapter
+
+
+class FakeClock:
+    """替换 execution 模块的 time（只用到 monotonic / sleep），测试中手动推进"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(execution, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def exchange():
+    return FakeAdapter()
+
+
+def filled(exchange):
+    return sum(order.filled_quantity for order in exchange.placed)
+
+
+def test_twap_slices_and_catches_up(clock, exchange):
+    engine = ExecutionEngine(ack_grace=1)
+    twap = engine.submit(Twap(exchange, "BTC-USD", "buy", "1", duration=100, slices=4))
+    engine.step()
+    child = exchange.placed[-1]
+    assert (child.quantity, child.price, child.time_in_force) == (Decimal("0.25"), Decimal("100.0"), "gtc")
+
+    exchange.fill(child)
+    clock.advance(1)
+    engine.step()                 # 子单成交并结算，本片已完成，不再下单
+    assert twap.filled_lots == 25 and twap.child is None
+    assert len(exchange.placed) == 1
+
+    clock.advance(74)             # 进入第 4 片，落后线性进度一片以上：主动吃单
+    engine.step()
+    child = exchange.placed[-1]
+    assert (child.quantity, child.price, child.time_in_force) == (Decimal("0.75"), Decimal("100.2"), "ioc")
+    engine.step()
+    assert twap.status == "done" and twap.filled_lots == 100
+    assert filled(exchange) == Decimal("1")
+
+
+def test_iceberg_replaces_when_price_moves(clock, exchange):
+    engine = ExecutionEngine(ack_grace=1)
+    iceberg = engine.submit(Iceberg(exchange, "BTC-USD", "sell", "0.3", display_qty="0.1"))
+    engine.step()
+    first = exchange.placed[-1]
+    assert (first.quantity, first.price) == (Decimal("0.1"), Decimal("100.2"))
+
+    exchange.fill(first, "0.04")
+    exchange.ask = Decimal("100.5")
+    clock.advance(0.5)
+    engine.step()                 # 记录部分成交，价格偏离：撤单
+    assert exchange.cancels == [first.client_order_id]
+    assert iceberg.replaces == 1 and iceberg.filled_lots == 4
+
+    clock.advance(0.5)
+    engine.step()                 # 撤单确认后按新价格只补挂剩余的展示数量
+    second = exchange.placed[-1]
+    assert (second.quantity, second.price) == (Decimal("0.1"), Decimal("100.5"))
+
+    for _ in range(10):
+        if not iceberg.active:
+            break
+        exchange.fill(exchange.placed[-1])
+        clock.advance(1)
+        engine.step()
+    assert iceberg.status == "done"
+    assert filled(exchange) == Decimal("0.3")
+    assert all(order.quantity <= Decimal("0.1") for order in exchange.placed)
+
+
+def test_pov_follows_market_volume(clock, exchange):
+    engine = ExecutionEngine(ack_grace=1)
+    engine.on_trade(exchange, "BTC-USD", "5")          # 开始之前的成交量不计入
+    pov = engine.submit(Pov(exchange, "BTC-USD", "buy", "1", participation=0.1, max_lag_qty="0.2"))
+    engine.step()
+    assert exchange.placed == []
+
+    engine.on_trade(exchange, "BTC-USD", "2")
+    engine.step()
+    child = exchange.placed[-1]
+    assert (child.quantity, child.time_in_force) == (Decimal("0.2"), "gtc")
+    exchange.fill(child)
+    clock.advance(1)
+    engine.step()
+    assert pov.filled_lots == 20
+
+    engine.on_trade(exchange, "BTC-USD", "3")          # 目标 0.5，落后 0.3 > max_lag：主动吃单
+    engine.step()
+    child = exchange.placed[-1]
+    assert (child.quantity, child.time_in_force) == (Decimal("0.3"), "ioc")
+    engine.step()
+    assert pov.filled_lots == 50 and pov.active
+
+
+def test_cancel_parent_cancels_child(clock, exchange):
+    engine = ExecutionEngine(ack_grace=1)
+    twap = engine.submit(Twap(exchange, "BTC-USD", "buy", "1", duration=100, slices=4))
+    engine.step()
+    child = exchange.placed[-1]
+    exchange.fill(child, "0.1")
+    assert engine.cancel(twap.id)
+    engine.step()
+    assert exchange.cancels == [child.client_order_id]
+    assert twap.status == "cancelling"
+    engine.step()
+    assert twap.status == "cancelled" and twap.filled_lots == 10
+    assert len(exchange.placed) == 1
+
+
+def test_missing_child_is_retried_not_resliced(clock, exchange):
+    """子单从未成交列表消失、get_order 暂时查不到：保留子单重试，查到后按实际成交结算"""
+    engine = ExecutionEngine(ack_grace=1, lookup_timeout=30)
+    iceberg = engine.submit(Iceberg(exchange, "BTC-USD", "buy", "0.3", display_qty="0.1"))
+    engine.step()
+    child = exchange.placed[-1]
+    exchange.fill(child)
+    exchange.hidden.add(child.client_order_id)
+    for _ in range(20):
+        clock.advance(1)
+        engine.step()
+    assert len(exchange.placed) == 1 and iceberg.child is not None
+
+    exchange.hidden.clear()
+    clock.advance(1)
+    engine.step()
+    assert iceberg.filled_lots == 10
+    assert len(exchange.placed) == 2
+
+
+def test_missing_child_fails_parent_after_lookup_timeout(clock, exchange):
+    """查不到的子单可能已成交：超时后母单标记为 failed，不再下新的子单"""
+    engine = ExecutionEngine(ack_grace=1, lookup_timeout=30)
+    iceberg = engine.submit(Iceberg(exchange, "BTC-USD", "buy", "0.3", display_qty="0.1"))
+    engine.step()
+    child = exchange.placed[-1]
+    exchange.fill(child)
+    exchange.hidden.add(child.client_order_id)
+    for _ in range(40):
+        clock.advance(1)
+        engine.step()
+    assert iceberg.status == "failed"
+    assert child.client_order_id in iceberg.last_error
+    assert len(exchange.placed) == 1
+    assert filled(exchange) == Decimal("0.1")
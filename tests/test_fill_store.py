@@ -0,0 +1,152 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from adapters.fill_store import FillStore, NadoFillSource, StandXFillSource
+
+nado_sdk_path = os.path.join(os.path.dirname(__file__), "..", "exchange", "exchange_nado")
+if nado_sdk_path not in sys.path:
+    sys.path.insert(0, nado_sdk_path)
+
+ONE = 10**18
+
+
+def require_nado_sdk():
+    # Nado SDK 需要 pydantic 1，在 pydantic 2 环境中导入时抛出的不是 ImportError
+    try:
+        import nado_protocol.indexer_client.types.query  # noqa: F401
+    except Exception as e:
+        pytest.skip(f"Nado SDK 依赖（eth-account 0.8、pydantic 1）不可用: {e.__class__.__name__}")
+
+
+class FakeStandXHttp:
+    """query_orders 按 ID 从新到旧、last_id 翻页，同 StandX /api/query_orders"""
+
+    def __init__(self):
+        self.orders = {}
+
+    def put(self, order_id, status, fill_qty="0"):
+        self.orders[order_id] = {
+            "id": order_id, "symbol": "BTC-USD", "side": "buy", "price": "100", "qty": "1",
+            "fill_qty": fill_qty, "status": status,
+            "created_at": "2026-01-01T00:00:00Z", "updated_at": "2026-01-01T00:00:00Z",
+        }
+
+    def query_orders(self, token, last_id=None, limit=500):
+        ids = sorted((i for i in self.orders if last_id is None or i < last_id), reverse=True)
+        return {"result": [dict(self.orders[i]) for i in ids[:limit]]}
+
+    def query_trades(self, token, last_id=None, limit=500):
+        return {"result": []}
+
+
+class FakePaginator:
+    def __init__(self, items, page_size):
+        self._items = items
+        self._page_size = page_size
+
+    def pages(self):
+        for i in range(0, len(self._items), self._page_size):
+            yield SimpleNamespace(items=self._items[i:i + self._page_size])
+
+
+class FakeIndexer:
+    """历史订单按 submission_idx 从新到旧分页，也可按 digest 查询"""
+
+    def __init__(self):
+        self.orders = {}
+        self.digest_queries = []
+
+    def put(self, idx, base_filled, amount=ONE):
+        self.orders[idx] = SimpleNamespace(
+            submission_idx=str(idx), digest=f"0x{idx:02x}", timestamp="1767225600",
+            product_id=2, amount=str(amount), price_x18=str(100 * ONE),
+            base_filled=str(base_filled), quote_filled=str(-base_filled * 100), fee="0",
+        )
+
+    def paginate_subaccount_historical_orders(self, params):
+        items = [self.orders[i] for i in sorted(self.orders, reverse=True)]
+        return FakePaginator(items, params.limit)
+
+    def get_historical_orders_by_digest(self, digests):
+        self.digest_queries.append(list(digests))
+        return SimpleNamespace(orders=[o for o in self.orders.values() if o.digest in digests])
+
+
+def order_status(store, venue):
+    return {row["order_id"]: (row["status"], row["filled_qty"]) for row in store._query(
+        "SELECT order_id, status, filled_qty FROM orders WHERE venue = ?", (venue,))}
+
+
+def test_standx_open_orders_are_refreshed_after_the_watermark_passes_them():
+    http = FakeStandXHttp()
+    source = StandXFillSource(http, token_getter=lambda: "token", page_size=2)
+    for order_id in (1, 2, 3):
+        http.put(order_id, "filled", "1")
+    http.put(4, "open")
+    http.put(5, "partially_filled", "0.5")
+
+    with FillStore(":memory:", open_order_max_age=10**10) as store:
+        store.sync(source, streams=["orders"])
+        assert order_status(store, "standx")["4"] == ("open", 0.0)
+
+        http.put(4, "canceled")
+        http.put(5, "filled", "1")
+        for order_id in range(6, 10):
+            http.put(order_id, "new")
+        counts = store.sync(source, streams=["orders"])
+
+        status = order_status(store, "standx")
+        assert status["4"] == ("canceled", 0.0)
+        assert status["5"] == ("filled", 1.0)
+        assert status["9"] == ("new", 0.0)
+        assert counts["orders"] == 2 + 4
+        assert store.get_hwm("standx", "", "orders") == 9
+        assert store.fill_rate(venue="standx")[0]["filled_qty"] == 4.0
+
+        # 没有未结束的旧订单时，只重新拉取新挂单，不再回翻已结束的订单
+        for order_id in range(6, 10):
+            http.put(order_id, "filled", "1")
+        store.sync(source, streams=["orders"])
+        assert set(order_status(store, "standx").values()) == {("filled", 1.0), ("canceled", 0.0)}
+
+
+def test_nado_partially_filled_orders_are_refreshed_by_digest():
+    require_nado_sdk()
+    indexer = FakeIndexer()
+    source = NadoFillSource(indexer, "0xsub", products={2: "BTC-PERP"}, page_size=2)
+    indexer.put(1, ONE)
+    indexer.put(2, ONE // 2)
+    indexer.put(3, 0)
+
+    with FillStore(":memory:", open_order_max_age=10**10) as store:
+        store.sync(source, streams=["orders"])
+        assert order_status(store, "nado")["0x02"] == ("partially_filled", 0.5)
+        assert indexer.digest_queries == []
+
+        indexer.put(2, ONE)
+        indexer.put(4, ONE // 4)
+        store.sync(source, streams=["orders"])
+
+        status = order_status(store, "nado")
+        assert indexer.digest_queries == [["0x02"]]
+        assert status["0x02"] == ("filled", 1.0)
+        assert status["0x03"] == ("cancelled", 0.0)
+        assert status["0x04"] == ("partially_filled", 0.25)
+        assert store.get_hwm("nado", "0xsub", "orders") == 4
+
+
+def test_open_orders_older_than_max_age_are_not_refreshed():
+    require_nado_sdk()
+    indexer = FakeIndexer()
+    source = NadoFillSource(indexer, "0xsub", products={2: "BTC-PERP"})
+    indexer.put(1, ONE // 2)
+
+    with FillStore(":memory:", open_order_max_age=60) as store:
+        store.sync(source, streams=["orders"])
+        indexer.put(1, ONE)
+        store.sync(source, streams=["orders"])
+        assert indexer.digest_queries == []
+        assert order_status(store, "nado")["0x01"] == ("partially_filled", 0.5)
@@ -0,0 +1,74 @@
+import pytest
+
+grvt_adapter = pytest.importorskip(
+    "adapters.grvt_adapter", reason="GRVT SDK 依赖（eth-account >= 0.13、pydantic 2）未安装", exc_type=ImportError,
+)
+from pysdk.grvt_ccxt_types import GrvtRpcError, GrvtRpcTimeout  # noqa: E402
+
+GrvtAdapter = grvt_adapter.GrvtAdapter
+
+
+class FakeRest:
+    """GrvtCcxt 的撤单接口：交易所未确认（拒绝）时返回 False"""
+
+    def __init__(self, ack):
+        self.ack = ack
+        self.calls = []
+
+    def cancel_order(self, id=None, symbol=None, params={}):
+        self.calls.append(dict(params))
+        return self.ack
+
+    def cancel_all_orders(self, params={}):
+        self.calls.append(dict(params))
+        return self.ack
+
+
+class FakeWsOrders:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def _reply(self, params):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    cancel_order = _reply
+    cancel_all_orders = _reply
+
+
+def make_adapter(rest_ack, ws_outcome=None):
+    # 不经过 __init__（GrvtCcxt 初始化会请求交易所），只设置撤单路径用到的属性
+    adapter = GrvtAdapter.__new__(GrvtAdapter)
+    adapter.exchange_name = "grvt"
+    adapter.journal = None
+    adapter.grvt_client = FakeRest(rest_ack)
+    adapter.ws_orders = FakeWsOrders(ws_outcome) if ws_outcome is not None else None
+    return adapter
+
+
+@pytest.mark.parametrize("method, args", [
+    ("cancel_order", {"client_order_id": "7"}),
+    ("cancel_all_orders", {"symbol": "BTC_USDT_Perp"}),
+])
+def test_rejected_cancel_returns_false_on_both_channels(method, args):
+    assert getattr(make_adapter(rest_ack=False), method)(**args) is False
+
+    ws = make_adapter(rest_ack=True, ws_outcome=GrvtRpcError({"code": 1000, "message": "order not found"}))
+    assert getattr(ws, method)(**args) is False
+    assert ws.grvt_client.calls == []  # 拒绝不回退 REST
+
+    assert getattr(make_adapter(rest_ack=True, ws_outcome=False), method)(**args) is False
+
+
+@pytest.mark.parametrize("method, args", [
+    ("cancel_order", {"client_order_id": "7"}),
+    ("cancel_all_orders", {"symbol": "BTC_USDT_Perp"}),
+])
+def test_acked_cancel_returns_true_and_timeout_falls_back_to_rest(method, args):
+    assert getattr(make_adapter(rest_ack=True), method)(**args) is True
+    assert getattr(make_adapter(rest_ack=False, ws_outcome=True), method)(**args) is True
+
+    adapter = make_adapter(rest_ack=True, ws_outcome=GrvtRpcTimeout("no response"))
+    assert getattr(adapter, method)(**args) is True
+    assert len(adapter.grvt_client.calls) == 1
@@ -0,0 +1,117 @@
+import threading
+import time
+from decimal import Decimal
+
+from adapters.hedge_engine import HedgeEngine
+from tests.conftest import FakeAdapter
+
+
+def make_engine(**kwargs):
+    primary = FakeAdapter("primary", qty_step="0.001")
+    hedge = FakeAdapter("hedge", qty_step="0.001")
+    kwargs.setdefault("reconcile_interval", 0)
+    engine = HedgeEngine(primary, hedge, "BTC-USD", "BTC_USDT_Perp", **kwargs)
+    return engine, primary, hedge
+
+
+def hedge_orders(adapter):
+    return [(order.side, order.quantity) for order in adapter.placed]
+
+
+def step(engine):
+    """对冲线程的一轮：计算并发出下一笔对冲单"""
+    with engine._cond:
+        order = engine._next_order()
+    if order is not None:
+        engine._send(*order)
+    return order
+
+
+def test_hedges_primary_fill():
+    engine, primary, hedge = make_engine()
+    engine.on_position("primary", "0.5")
+    assert step(engine)[:2] == ("sell", Decimal("0.5"))
+    assert engine.in_flight == Decimal("-0.5")
+    engine.on_position("hedge", "-0.5")
+    assert engine.in_flight == 0
+    assert step(engine) is None
+    assert hedge_orders(hedge) == [("sell", Decimal("0.5"))]
+
+
+def test_hedge_fill_pushed_during_reconcile_fetch():
+    """对冲单的成交推送在 REST 取数期间到达，REST 返回的仍是成交前的持仓"""
+    engine, primary, hedge = make_engine(settle=0)
+    primary.position = Decimal("0.5")
+    engine.on_position("primary", "0.5")
+    step(engine)
+    hedge.on_fetch = lambda: engine.on_position("hedge", "-0.5")
+    engine.reconcile()
+    assert engine.positions["hedge"] == Decimal("-0.5")
+    assert step(engine) is None
+    assert hedge_orders(hedge) == [("sell", Decimal("0.5"))]
+
+
+def test_rest_lagging_push_within_settle():
+    """推送已经到达、REST 仍未体现：settle 内不采用对冲腿的 REST 持仓"""
+    engine, primary, hedge = make_engine(settle=60)
+    primary.position = Decimal("0.5")
+    engine.on_position("primary", "0.5")
+    step(engine)
+    engine.on_position("hedge", "-0.5")
+    engine.reconcile()
+    assert engine.positions["hedge"] == Decimal("-0.5")
+    assert step(engine) is None
+    assert len(hedge.placed) == 1
+
+
+def test_primary_fill_during_fetch_keeps_push():
+    engine, primary, hedge = make_engine()
+    primary.on_fetch = lambda: engine.on_fill("primary", "buy", "0.2")
+    engine.reconcile()
+    assert engine.positions["primary"] == Decimal("0.2")
+    assert step(engine)[:2] == ("sell", Decimal("0.2"))
+
+
+def test_reconcile_recovers_lost_pushes_after_settle():
+    engine, primary, hedge = make_engine(settle=0)
+    engine.on_position("primary", "0.5")
+    step(engine)
+    # 对冲腿的推送丢失，主腿又有一笔未推送的成交
+    hedge.position = Decimal("-0.5")
+    primary.position = Decimal("0.7")
+    engine.reconcile()
+    assert engine.in_flight == 0
+    assert engine.positions == {"primary": Decimal("0.7"), "hedge": Decimal("-0.5")}
+    assert step(engine)[:2] == ("sell", Decimal("0.2"))
+
+
+def test_stale_in_flight_expires_after_settle():
+    engine, primary, hedge = make_engine(settle=0)
+    primary.position = Decimal("0.5")
+    engine.on_position("primary", "0.5")
+    step(engine)
+    # 对冲单没有成交（REST 对冲腿仍为 0），settle 后 in_flight 失效，重新下单
+    engine.reconcile()
+    assert engine.in_flight == 0
+    assert step(engine)[:2] == ("sell", Decimal("0.5"))
+
+
+def test_no_duplicate_hedge_with_background_reconcile():
+    """对冲线程 + 频繁校准：对冲腿推送先于 REST 到达时只下一笔对冲单"""
+    engine, primary, hedge = make_engine(settle=0.3, reconcile_interval=0.01)
+
+    def fill(side, qty):
+        # 成交推送立即到达，REST 持仓 0.1 秒后才体现
+        engine.on_fill("hedge", side, qty)
+        threading.Timer(0.1, lambda: setattr(hedge, "position", hedge.position - qty)).start()
+
+    hedge.on_order = fill
+    engine.start()
+    try:
+        primary.position = Decimal("0.5")
+        engine.on_position("primary", "0.5")
+        time.sleep(0.6)
+    finally:
+        engine.stop()
+    assert hedge_orders(hedge) == [("sell", Decimal("0.5"))]
+    assert engine.net_exposure() == 0
@@ -0,0 +1,158 @@
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from multiprocessing import shared_memory
+
+import pytest
+
+from adapters.market_table import _SEQ, _SEQ_OFFSET, HEADER_SIZE, MarketTable, MarketTableReader
+from tests.conftest import FakeAdapter
+
+
+@pytest.fixture
+def table():
+    table = MarketTable.create(f"test_mkt_{os.getpid()}_{uuid.uuid4().hex[:8]}", capacity=4)
+    yield table
+    table.close()
+
+
+def write_quotes(name, rounds, started):
+    """写入方：每轮的 5 个字段都由同一个 i 推出，读取方据此检查是否读到两次写入拼出的记录"""
+    shm = shared_memory.SharedMemory(name=name)
+    table = MarketTable(shm)
+    started.set()
+    for i in range(1, rounds + 1):
+        table.update("standx", "BTC-USD", bid=float(i), ask=i + 0.5, mark=i + 0.25, index=i + 0.125, last=float(i))
+    shm.close()
+
+
+def check_consistent(quote):
+    i = quote.bid
+    assert (quote.ask, quote.mark, quote.index, quote.last) == (i + 0.5, i + 0.25, i + 0.125, i)
+
+
+def read_until_done(reader, done):
+    reads = 0
+    last_seq = 0
+    while not done():
+        quote = reader.get("standx", "BTC-USD")
+        if quote is None:
+            continue
+        check_consistent(quote)
+        assert quote.seq % 2 == 0 and quote.seq >= last_seq
+        last_seq = quote.seq
+        reads += 1
+    return reads
+
+
+def test_no_torn_reads_with_writer_process(table):
+    table.update("standx", "BTC-USD", bid=0.0, ask=0.5, mark=0.25, index=0.125, last=0.0)
+    ctx = multiprocessing.get_context("fork")
+    started = ctx.Event()
+    writer = ctx.Process(target=write_quotes, args=(table.name, 200_000, started))
+    writer.start()
+    reader = MarketTableReader(table.name)
+    try:
+        assert started.wait(10)
+        reads = read_until_done(reader, lambda: not writer.is_alive())
+        writer.join(10)
+        assert writer.exitcode == 0
+        assert reads > 0
+        quote = reader.get("standx", "BTC-USD")
+        assert quote.bid == 200_000.0 and quote.seq == 2 * 200_001
+    finally:
+        reader.close()
+
+
+def test_no_torn_reads_with_writer_thread(table):
+    """同进程的写入线程可能在两次 pack_into 之间被切走，读取方必须看到奇数 seq 并重试"""
+    table.update("standx", "BTC-USD", bid=0.0, ask=0.5, mark=0.25, index=0.125, last=0.0)
+    reader = MarketTableReader(table.name)
+
+    def write():
+        for i in range(1, 50_001):
+            table.update("standx", "BTC-USD", bid=float(i), ask=i + 0.5, mark=i + 0.25, index=i + 0.125, last=float(i))
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        reads = read_until_done(reader, lambda: not writer.is_alive())
+        writer.join()
+        assert reads > 0
+        check_consistent(reader.get("standx", "BTC-USD"))
+    finally:
+        reader.close()
+
+
+def test_read_retries_while_write_in_progress(table):
+    table.update("standx", "BTC-USD", bid=1.0, ask=1.5)
+    reader = MarketTableReader(table.name, max_retries=10)
+    try:
+        seq_offset = HEADER_SIZE + _SEQ_OFFSET
+        seq = _SEQ.unpack_from(table.buf, seq_offset)[0]
+        _SEQ.pack_into(table.buf, seq_offset, seq + 1)  # 写入方停在写入中途
+        with pytest.raises(RuntimeError):
+            reader.read("standx", "BTC-USD")
+        _SEQ.pack_into(table.buf, seq_offset, seq + 2)
+        assert reader.get("standx", "BTC-USD").bid == 1.0
+    finally:
+        reader.close()
+
+
+def test_unknown_and_unwritten_symbols(table):
+    reader = MarketTableReader(table.name)
+    try:
+        assert reader.get("standx", "ETH-USD") is None
+        table.update("standx", "ETH-USD", mark=3000.0)
+        quote = reader.get("standx", "ETH-USD")
+        assert quote.mark == 3000.0 and quote.bid is None and quote.mid is None
+        assert reader.symbols() == [("standx", "ETH-USD")]
+    finally:
+        reader.close()
+
+
+def write_stale(table, monkeypatch, age, **fields):
+    stale_ns = time.time_ns() - int(age * 1e9)
+    with monkeypatch.context() as m:
+        m.setattr(time, "time_ns", lambda: stale_ns)
+        table.update("standx", "BTC-USD", **fields)
+
+
+def test_ticker_max_age(table, monkeypatch):
+    reader = MarketTableReader(table.name)
+    try:
+        write_stale(table, monkeypatch, 5.0, bid=100.0, ask=101.0)
+        assert reader.ticker("standx", "BTC-USD", max_age=2.0) is None
+        assert reader.ticker("standx", "BTC-USD")["mid_price"] == 100.5
+        table.update("standx", "BTC-USD", last=100.7)
+        ticker = reader.ticker("standx", "BTC-USD", max_age=2.0)
+        assert ticker["bid_price"] == 100.0 and ticker["last_price"] == 100.7
+    finally:
+        reader.close()
+
+
+def test_adapter_falls_back_to_rest_when_stale(table, monkeypatch):
+    adapter = FakeAdapter("standx", market_table=table.name, market_table_max_age=2.0)
+    try:
+        table.update("standx", "BTC-USD", bid=100.0, ask=101.0)
+        assert adapter.get_ticker("BTC-USD")["mid_price"] == 100.5
+        assert adapter.rest_calls == 0
+
+        write_stale(table, monkeypatch, 5.0, bid=99.0)
+        assert adapter.get_ticker("BTC-USD")["source"] == "rest"
+        assert adapter.rest_calls == 1
+
+        table.update("standx", "BTC-USD", bid=100.0)
+        assert adapter.get_ticker("BTC-USD")["bid_price"] == 100.0
+        assert adapter.rest_calls == 1
+    finally:
+        if adapter._market_reader is not None:
+            adapter._market_reader.close()
+
+
+def test_adapter_falls_back_to_rest_without_gateway():
+    adapter = FakeAdapter("standx", market_table=f"missing_{uuid.uuid4().hex[:8]}")
+    assert adapter.get_ticker("BTC-USD")["source"] == "rest"
+    assert adapter.rest_calls == 1
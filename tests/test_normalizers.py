@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+import pytest
+
+from adapters.normalizers import OrderNormalizer, scaled_int
+
+
+@pytest.mark.parametrize("value, decimals, expected", [
+    ("3012.5", 2, 301250),
+    ("-0.015", 3, -15),
+    ("+7", 2, 700),
+    (".5", 1, 5),
+    ("1.2300", 2, 123),
+    ("0.125", 2, 12),  # 超出精度按银行家舍入
+    ("0.135", 2, 14),
+    ("1e-05", 6, 10),
+    ("1E-05", 5, 1),
+    ("-2.5e-3", 4, -25),
+    ("1.5e+2", 0, 150),
+    ("1e-07", 6, 0),
+    (1e-05, 8, 1000),
+    (Decimal("1E+1"), 2, 1000),
+    (42, 3, 42000),
+])
+def test_scaled_int(value, decimals, expected):
+    assert scaled_int(value, decimals) == expected
+
+
+def test_ticks_match_scaled_int_for_every_number_format():
+    normalizer = OrderNormalizer("standx", price_decimals=2, qty_decimals=4)
+    for price, qty, filled in [
+        ("3012.55", "0.0100", "0"),
+        ("3e3", "1e-04", "5E-05"),
+        ("3012.555", "0.00125", "0.00015"),
+    ]:
+        order = normalizer.order({
+            "id": 1, "symbol": "ETH-USD", "side": "buy", "order_type": "limit",
+            "price": price, "qty": qty, "fill_qty": filled, "status": "new",
+        })
+        assert order.price == Decimal(price)
+        assert order.price_ticks == scaled_int(price, 2)
+        assert order.quantity_lots == scaled_int(qty, 4)
+        assert order.filled_lots == scaled_int(filled, 4)
+        arrays = normalizer.arrays([{
+            "id": 1, "side": "buy", "price": price, "qty": qty, "fill_qty": filled, "status": "new",
+        }])
+        assert (arrays.price_ticks[0], arrays.qty_lots[0], arrays.filled_lots[0]) == (
+            order.price_ticks, order.quantity_lots, order.filled_lots,
+        )
@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from adapters.order_journal import OrderJournal, read_journal
+from tests.conftest import FakeAdapter
+
+
+def make_adapter(journal):
+    adapter = FakeAdapter("test")
+    adapter.reject_cancels.add("bad")
+    adapter.journal = journal
+    return adapter
+
+
+def test_nested_journaled_calls_record_only_outer_call(tmp_path):
+    with OrderJournal(str(tmp_path), fmt="csv") as journal:
+        adapter = make_adapter(journal)
+        adapter.cancel_orders_by_ids(["1", "bad", "3"], symbol="BTC-USD")
+        adapter.cancel_order(client_order_id="4", symbol="BTC-USD")
+        assert journal.flush()
+
+    rows = list(read_journal(str(tmp_path)))
+    assert [row["event"] for row in rows] == ["cancel_orders_by_ids", "cancel_order"]
+    assert rows[0]["extra"] == "['1', 'bad', '3']"
+    assert rows[1]["client_order_id"] == "4"
+
+
+def test_nested_guard_is_released_after_errors(tmp_path):
+    with OrderJournal(str(tmp_path), fmt="csv") as journal:
+        adapter = make_adapter(journal)
+        try:
+            adapter.cancel_order(client_order_id="bad")
+        except Exception:
+            pass
+        adapter.place_order("BTC-USD", "buy", "limit", Decimal("1"), Decimal("100"))
+        assert journal.flush()
+
+    rows = list(read_journal(str(tmp_path)))
+    assert [(row["event"], row["status"]) for row in rows] == [("cancel_order", "error"), ("place_order", "open")]
+
+
+def test_bin_format_round_trips_arbitrary_text(tmp_path):
+    error = "bad\x1ffield,\"quoted\"\n\x00end 中文"
+    with OrderJournal(str(tmp_path), fmt="bin") as journal:
+        journal.record("place_order", exchange="grvt", symbol="BTC_USDT_Perp", side="buy",
+                       quantity=Decimal("0.01"), price=Decimal("68000"), status="error",
+                       latency_us=12, error=error, extra="a\x1fb")
+        journal.record("cancel_order", exchange="grvt", order_id="0x01")
+        assert journal.flush()
+
+    rows = list(read_journal(str(tmp_path)))
+    assert len(rows) == 2
+    assert rows[0]["error"] == error
+    assert rows[0]["extra"] == "a\x1fb"
+    assert rows[0]["price"] == "68000"
+    assert rows[0]["latency_us"] == 12
+    assert rows[1]["order_id"] == "0x01"
+    assert rows[1]["latency_us"] is None
+    assert list(read_journal(str(tmp_path), status="error"))[0]["symbol"] == "BTC_USDT_Perp"
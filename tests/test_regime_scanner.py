@@ -0,0 +1,32 @@
+import numpy as np
+
+from risk.regime_scanner import RegimeScanner
+
+
+def make_klines(seed, bars):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, bars))
+    high = close + rng.uniform(0.1, 1.0, bars)
+    low = close - rng.uniform(0.1, 1.0, bars)
+    return np.stack([high, low, close], axis=1)
+
+
+def test_short_series_does_not_truncate_other_symbols():
+    scanner = RegimeScanner([], period=14)
+    long_a, long_b = make_klines(1, 200), make_klines(2, 200)
+    new_listing = make_klines(3, 2 * 14 + 1)
+
+    alone = scanner.compute({("x", "A"): long_a, ("x", "B"): long_b}, {})
+    mixed = scanner.compute({("x", "A"): long_a, ("x", "B"): long_b, ("y", "NEW"): new_listing}, {})
+
+    assert len(mixed) == 3
+    for symbol in ("A", "B"):
+        assert mixed.get("x", symbol).adx == alone.get("x", symbol).adx
+        assert mixed.get("x", symbol).realized_vol == alone.get("x", symbol).realized_vol
+    assert mixed.get("y", "NEW").adx == scanner.compute({("y", "NEW"): new_listing}, {}).get("y", "NEW").adx
+
+
+def test_series_shorter_than_adx_window_are_skipped():
+    scanner = RegimeScanner([], period=14)
+    table = scanner.compute({("x", "A"): make_klines(1, 100), ("x", "TINY"): make_klines(2, 2 * 14)}, {})
+    assert [row.symbol for row in table] == ["A"]
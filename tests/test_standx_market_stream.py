@@ -0,0 +1,54 @@
+import asyncio
+import json
+
+from exchange.exchange_standx.standx_protocol.perps_wss import PRIVATE_CHANNELS, StandXMarketStream
+
+
+class NullSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        pass
+
+
+def run_flood(channel, queue_size, count):
+    async def main():
+        stream = StandXMarketStream(queue_size=queue_size, reconnect=False)
+        stream.ws, stream.connected = NullSocket(), True
+        release = asyncio.Event()
+        seen = []
+
+        async def slow_callback(message):
+            await release.wait()
+            seen.append(message["seq"])
+
+        await stream.subscribe(channel, "BTC-USD", slow_callback)
+        for seq in range(count):
+            stream._route({"seq": seq, "channel": channel, "data": {"symbol": "BTC-USD"}})
+        stats = stream.stats()["subscriptions"][f"{channel}:BTC-USD"]
+        release.set()
+        while len(seen) < count - stats["dropped"]:
+            await asyncio.sleep(0.001)
+        await stream.close()
+        return seen, stats
+
+    return asyncio.run(main())
+
+
+def test_market_data_flood_drops_oldest():
+    seen, stats = run_flood("depth_book", queue_size=4, count=100)
+    assert stats["dropped"] == 96
+    assert seen == [96, 97, 98, 99]
+
+
+def test_private_channel_flood_delivers_every_message_in_order():
+    assert {"order", "trade", "position", "balance"} <= PRIVATE_CHANNELS
+    for channel in ("order", "position"):
+        seen, stats = run_flood(channel, queue_size=4, count=1000)
+        assert stats["dropped"] == 0
+        assert stats["queued"] == 1000
+        assert seen == list(range(1000))
@@ -0,0 +1,295 @@
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+from adapters.loop_thread import LoopThread
+from adapters.standx_adapter import StandXAdapter
+from adapters.standx_ws_orders import StandXWsOrderEntry
+from exchange.exchange_standx.standx_protocol import perps_wss
+from exchange.exchange_standx.standx_protocol.perps_wss import (
+    StandXOrderStream,
+    StandXRpcError,
+    StandXRpcTimeout,
+    StandXRpcUnavailable,
+)
+
+
+class FakeAuth:
+    def sign_request(self, payload, request_id, timestamp):
+        return {"x-request-id": request_id, "x-request-timestamp": str(timestamp), "x-request-signature": "sig"}
+
+
+class FakeConnection:
+    """ws-api/v1 连接：send 记录请求并交给 responder 生成响应，迭代返回响应直到连接关闭"""
+
+    def __init__(self, server):
+        self.server = server
+        self.sent = []
+        self.closed = False
+        self._inbox = asyncio.Queue()
+
+    def reply(self, request, code=0):
+        self._inbox.put_nowait(json.dumps({"code": code, "message": "", "request_id": request["request_id"]}))
+
+    async def send(self, message):
+        request = json.loads(message)
+        request["params"] = json.loads(request["params"])
+        self.sent.append(request)
+        self.server.responder(self, request)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self._inbox.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+    async def close(self):
+        self.closed = True
+        self._inbox.put_nowait(None)
+
+
+class FakeServer:
+    """替换 websockets.connect，记录每个连接；responder(conn, request) 决定如何响应"""
+
+    def __init__(self, responder=None):
+        self.connections = []
+        self.responder = responder or (lambda conn, request: conn.reply(request))
+
+    async def connect(self, url, **kwargs):
+        conn = FakeConnection(self)
+        self.connections.append(conn)
+        return conn
+
+    def methods(self, index=-1):
+        return [(r["method"], r["params"]) for r in self.connections[index].sent]
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+    monkeypatch.setattr(perps_wss.websockets, "connect", server.connect)
+    return server
+
+
+def make_stream(**kwargs):
+    stream = StandXOrderStream("ws://fake/ws-api/v1", reconnect_delay=0.01, **kwargs)
+    stream.auth = FakeAuth()
+    return stream
+
+
+def new_order(stream, cl_ord_id, timeout=None):
+    return stream.new_order("BTC-USD", "buy", "limit", "0.01", "gtc", False, "68000", cl_ord_id, timeout=timeout)
+
+
+def test_responses_complete_their_own_request_in_any_order(server):
+    held = []
+
+    def responder(conn, request):
+        if request["method"] != "order:new":
+            return conn.reply(request)
+        held.append(request)
+        if len(held) == 3:
+            for r, code in zip(reversed(held), (0, 400, 0)):
+                conn.reply(r, code)
+
+    server.responder = responder
+
+    async def main():
+        stream = make_stream(token_getter=lambda: "jwt-1")
+        await stream.connect()
+        results = await asyncio.gather(
+            new_order(stream, "a"), new_order(stream, "b"), new_order(stream, "c"), return_exceptions=True,
+        )
+        assert stream.in_flight == 0
+        await stream.close()
+        return results
+
+    first, second, third = asyncio.run(main())
+    assert server.methods(0)[0] == ("auth:login", {"token": "jwt-1"})
+    assert first["request_id"] == held[0]["request_id"]
+    assert isinstance(second, StandXRpcError)
+    assert third["request_id"] == held[2]["request_id"]
+
+
+def test_timeout_and_in_flight_limit(server):
+    server.responder = lambda conn, request: None  # 从不响应
+
+    async def main():
+        stream = make_stream(max_in_flight=2, reconnect=False)
+        await stream.connect()
+        waiting = [asyncio.ensure_future(new_order(stream, f"o{i}", timeout=1.0)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        assert stream.in_flight == 2
+
+        with pytest.raises(StandXRpcUnavailable, match="在途请求已满"):
+            await new_order(stream, "full", timeout=0.05)
+        assert len(server.connections[0].sent) == 2
+
+        # 在途请求超时后释放空位
+        for task in waiting:
+            with pytest.raises(StandXRpcTimeout):
+                await task
+        assert stream.in_flight == 0
+        server.responder = lambda conn, request: conn.reply(request)
+        assert (await new_order(stream, "after", timeout=1.0))["code"] == 0
+        await stream.close()
+
+    asyncio.run(main())
+
+
+def test_disconnect_fails_pending_then_reconnects_and_relogs_in(server):
+    tokens = iter(["jwt-1", "jwt-2", "jwt-3"])
+    current = {"token": next(tokens)}
+    server.responder = lambda conn, request: conn.reply(request) if request["method"] == "auth:login" else None
+
+    async def main():
+        stream = make_stream(token_getter=lambda: current["token"])
+        await stream.connect()
+        pending = asyncio.ensure_future(new_order(stream, "lost", timeout=5.0))
+        await asyncio.sleep(0.01)
+
+        current["token"] = next(tokens)  # 后台刷新了 JWT
+        await server.connections[0].close()  # 服务端断开
+        with pytest.raises(StandXRpcUnavailable):
+            await pending
+
+        for _ in range(300):
+            if stream.connected and stream.reconnects:
+                break
+            await asyncio.sleep(0.01)
+        assert stream.reconnects == 1
+        assert server.methods(1)[0] == ("auth:login", {"token": "jwt-2"})
+
+        server.responder = lambda conn, request: conn.reply(request)
+        response = await new_order(stream, "again", timeout=1.0)
+        assert response["request_id"] == server.connections[1].sent[-1]["request_id"]
+        await stream.close()
+        assert server.connections[1].closed
+
+    asyncio.run(main())
+
+
+def test_requests_wait_for_reconnect_within_their_deadline(server):
+    async def main():
+        stream = make_stream(token_getter=lambda: "jwt")
+        await stream.connect()
+        await server.connections[0].close()
+        await asyncio.sleep(0)
+        assert not stream.connected
+        # 重连期间发出的请求等待连接恢复后送达
+        response = await new_order(stream, "queued", timeout=3.0)
+        assert len(server.connections) == 2
+        assert server.methods(1) == [
+            ("auth:login", {"token": "jwt"}),
+            ("order:new", server.connections[1].sent[1]["params"]),
+        ]
+        assert response["code"] == 0
+        await stream.close()
+
+    asyncio.run(main())
+
+
+def test_sync_entry_runs_requests_on_the_loop_thread(server):
+    entry = StandXWsOrderEntry("ws://fake/ws-api/v1", FakeAuth(), token_getter=lambda: "jwt", timeout=1.0)
+    with pytest.raises(StandXRpcUnavailable):
+        entry.cancel_order(cl_ord_id_list=["x"])
+
+    assert entry.start()
+    try:
+        response = entry.new_order("BTC-USD", "buy", "limit", "0.01", "gtc", False, price="68000", cl_ord_id="a")
+        assert response["code"] == 0
+        entry.relogin("jwt-2")
+        assert entry.cancel_order(cl_ord_id_list=["a"])["code"] == 0
+
+        server.responder = lambda conn, request: conn.reply(request, code=400)
+        with pytest.raises(StandXRpcError):
+            entry.cancel_order(cl_ord_id_list=["a"])
+    finally:
+        entry.close()
+
+    methods = [method for method, _ in server.methods(0)]
+    assert methods == ["auth:login", "order:new", "auth:login", "order:cancel", "order:cancel"]
+    assert server.methods(0)[2] == ("auth:login", {"token": "jwt-2"})
+    assert not entry.connected
+
+
+def test_loop_thread_run_timeout_cancels_the_coroutine():
+    loop_thread = LoopThread("test-loop")
+    loop_thread.start()
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    try:
+        assert loop_thread.run(asyncio.sleep(0, result=42), 1) == 42
+        with pytest.raises(TimeoutError):
+            loop_thread.run(slow(), 0.05)
+        loop_thread.run(asyncio.sleep(0.01), 1)
+        assert cancelled == [True]
+    finally:
+        loop_thread.stop()
+    assert not loop_thread.running
+
+
+class TimeoutWsOrders:
+    def new_order(self, **kwargs):
+        raise StandXRpcTimeout("no response")
+
+
+class RecentOrdersHttp:
+    """query_orders 从第 visible_after 次调用起才返回已创建的订单；记录 REST 下单"""
+
+    def __init__(self, visible_after):
+        self.visible_after = visible_after
+        self.queries = 0
+        self.placed = []
+
+    def query_orders(self, token, symbol, limit):
+        self.queries += 1
+        if self.queries < self.visible_after:
+            return {"result": []}
+        return {"result": [{"id": 7, "cl_ord_id": "slow"}]}
+
+    def place_order(self, **kwargs):
+        self.placed.append(kwargs)
+        return {"code": 0, "request_id": "rest"}
+
+
+def make_standx_adapter(http, lookup_timeout):
+    # 不经过 __init__（登录会请求交易所），只设置下单路径用到的属性
+    adapter = StandXAdapter.__new__(StandXAdapter)
+    adapter.exchange_name = "standx"
+    adapter.journal = None
+    adapter.token = "jwt"
+    adapter.auth = None
+    adapter.http_client = http
+    adapter.ws_orders = TimeoutWsOrders()
+    adapter.ws_lookup_timeout = lookup_timeout
+    adapter.ws_lookup_interval = 0.01
+    return adapter
+
+
+def test_ws_timeout_waits_for_slow_ack_instead_of_resending():
+    http = RecentOrdersHttp(visible_after=3)
+    adapter = make_standx_adapter(http, lookup_timeout=1.0)
+    order = adapter.place_order("BTC-USD", "buy", "limit", Decimal("0.01"), Decimal("68000"), client_order_id="slow")
+    assert order.order_id == 7
+    assert http.queries == 3 and http.placed == []
+
+
+def test_ws_timeout_with_unknown_state_raises():
+    http = RecentOrdersHttp(visible_after=10 ** 6)
+    adapter = make_standx_adapter(http, lookup_timeout=0.05)
+    with pytest.raises(Exception, match="状态未知"):
+        adapter.place_order("BTC-USD", "buy", "limit", Decimal("0.01"), Decimal("68000"), client_order_id="slow")
+    assert http.queries > 1 and http.placed == []
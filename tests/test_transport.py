@@ -0,0 +1,77 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from adapters.transport import HttpTransport
+
+
+class RateLimitedHandler(BaseHTTPRequestHandler):
+    """每个路径的前 server.limited 次 POST 返回 429，之后返回请求体"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        with self.server.lock:
+            count = self.server.calls[self.path] = self.server.calls.get(self.path, 0) + 1
+        if count <= self.server.limited:
+            self.send_response(429)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler)
+    server.lock = threading.Lock()
+    server.calls = {}
+    server.limited = 2
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport():
+    transport = HttpTransport(query_retries=3, query_backoff=0)
+    yield transport
+    transport.close()
+
+
+def test_query_session_retries_rate_limited_post(server, transport):
+    session = transport.session(query=True)
+    response = session.post(f"{server.url}/query", json={"type": "symbols"})
+    assert response.status_code == 200
+    assert response.json() == {"type": "symbols"}
+    assert server.calls["/query"] == 3
+
+
+def test_default_session_never_retries_post(server, transport):
+    session = transport.session()
+    response = session.post(f"{server.url}/execute", data=json.dumps({"type": "place_order"}))
+    assert response.status_code == 429
+    assert server.calls["/execute"] == 1
+
+
+def test_query_sessions_share_one_pool(server, transport):
+    server.limited = 0
+    sessions = [transport.session(query=True) for _ in range(3)]
+    for session in sessions:
+        assert session.get_adapter(server.url) is transport.query_adapter
+        assert session.post(f"{server.url}/query", json={}).status_code == 200
+    assert transport.session().get_adapter(server.url) is transport.http_adapter
+    assert transport.stats()["pools"] == {f"http://127.0.0.1:{server.server_address[1]}": 1}